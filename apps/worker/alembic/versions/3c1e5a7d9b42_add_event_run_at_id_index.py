@@ -0,0 +1,31 @@
+"""add event run_id/at/id index
+
+Revision ID: 3c1e5a7d9b42
+Revises: 0f0c72d0b94f
+Create Date: 2026-10-17 09:12:04.118204
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c1e5a7d9b42"
+down_revision: str | Sequence[str] | None = "0f0c72d0b94f"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("event", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_event_run_id_at_id", ["run_id", "at", "id"], unique=False
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("event", schema=None) as batch_op:
+        batch_op.drop_index("ix_event_run_id_at_id")
@@ -0,0 +1,90 @@
+"""backfill run event summaries
+
+Revision ID: 8d2f4b6a1c37
+Revises: 615c453d536c
+Create Date: 2026-10-17 10:05:41.622093
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8d2f4b6a1c37"
+down_revision: str | Sequence[str] | None = "615c453d536c"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+SQLITE_BACKFILL = """
+INSERT INTO run_event_summary (
+    run_id, event_counts, event_count, first_event_at,
+    last_event_at, last_error, updated_at
+)
+SELECT
+    c.run_id,
+    json_group_object(c.type, c.n),
+    sum(c.n),
+    min(c.first_at),
+    max(c.last_at),
+    (
+        SELECT coalesce(json_extract(e.payload, '$.error'), e.message)
+        FROM event AS e
+        WHERE e.run_id = c.run_id AND e.type = 'error'
+        ORDER BY e.at DESC
+        LIMIT 1
+    ),
+    datetime('now')
+FROM (
+    SELECT run_id, type, count(*) AS n, min(at) AS first_at,
+        max(at) AS last_at
+    FROM event
+    GROUP BY run_id, type
+) AS c
+WHERE c.run_id NOT IN (SELECT run_id FROM run_event_summary)
+GROUP BY c.run_id
+"""
+
+POSTGRESQL_BACKFILL = """
+INSERT INTO run_event_summary (
+    run_id, event_counts, event_count, first_event_at,
+    last_event_at, last_error, updated_at
+)
+SELECT
+    c.run_id,
+    json_object_agg(c.type, c.n),
+    sum(c.n),
+    min(c.first_at),
+    max(c.last_at),
+    (
+        SELECT coalesce(e.payload ->> 'error', e.message)
+        FROM event AS e
+        WHERE e.run_id = c.run_id AND e.type = 'error'
+        ORDER BY e.at DESC
+        LIMIT 1
+    ),
+    now()
+FROM (
+    SELECT run_id, type, count(*) AS n, min(at) AS first_at,
+        max(at) AS last_at
+    FROM event
+    GROUP BY run_id, type
+) AS c
+WHERE c.run_id NOT IN (SELECT run_id FROM run_event_summary)
+GROUP BY c.run_id
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Summaries are maintained on insert from now on; roll up existing events
+    postgresql = op.get_bind().dialect.name == "postgresql"
+    op.execute(sa.text(POSTGRESQL_BACKFILL if postgresql else SQLITE_BACKFILL))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Backfilled rows are indistinguishable from maintained ones; keep them
@@ -3,9 +3,14 @@ Centralized configuration management for the YeetFlow worker application.
 All environment variables are loaded and validated here.
 """
 
+import os
+import re
+import socket
+from datetime import timedelta
 from pathlib import Path
 from typing import Literal
 from urllib.parse import urlsplit
+from uuid import uuid4
 
 from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -27,11 +32,62 @@ DEFAULT_ARTIFACTS_DIR = Path(__file__).parent / "artifacts"
 DEFAULT_SOCKETIO_CORS = "*"
 DEFAULT_CORS_ALLOW_ORIGINS = "*"
 DEFAULT_FLOWS_DIR = Path(__file__).parent / "flows"
+DEFAULT_EVENT_SINK_MAX_BATCH_SIZE = 100
+DEFAULT_EVENT_SINK_FLUSH_INTERVAL_MS = 250
+DEFAULT_EVENT_SINK_MAX_QUEUE_SIZE = 10_000
+DEFAULT_EVENT_SINK_RETRY_ATTEMPTS = 3
+DEFAULT_EVENT_SINK_RETRY_DELAY_MS = 100
+DEFAULT_EVENT_RETENTION_DAYS = "log:7,step_start:7,step_end:7"
+DEFAULT_EVENT_COMPACTION_INTERVAL_SECONDS = 3600
+DEFAULT_EVENT_COMPACTION_BATCH_SIZE = 500
+DEFAULT_EVENT_COMPACTION_BATCH_PAUSE_MS = 50
+DEFAULT_STEEL_BASE_URL = "https://api.steel.dev/v1"
+DEFAULT_STEEL_POOL_MIN_SIZE = 2
+DEFAULT_STEEL_POOL_MAX_SIZE = 8
+DEFAULT_STEEL_POOL_IDLE_TTL_SECONDS = 15
+DEFAULT_STEEL_POOL_REPLENISH_INTERVAL_SECONDS = 5
+DEFAULT_STEEL_POOL_INTERACTIVE_RESERVE = 1
+DEFAULT_STEEL_POOL_HEALTH_CHECK_SIZE = 2
+DEFAULT_STEEL_HTTP_MAX_CONNECTIONS = 20
+DEFAULT_STEEL_HTTP_MAX_KEEPALIVE_CONNECTIONS = 10
+DEFAULT_STEEL_HTTP_KEEPALIVE_EXPIRY_SECONDS = 30.0
+DEFAULT_STEEL_HTTP_CONNECT_TIMEOUT_SECONDS = 5.0
+DEFAULT_STEEL_HTTP_POOL_TIMEOUT_SECONDS = 5.0
+DEFAULT_STEEL_CREATE_TIMEOUT_SECONDS = 30.0
+DEFAULT_STEEL_INFO_TIMEOUT_SECONDS = 10.0
+DEFAULT_STEEL_RELEASE_TIMEOUT_SECONDS = 10.0
+DEFAULT_RUN_HEARTBEAT_INTERVAL_SECONDS = 15
+DEFAULT_RUN_HEARTBEAT_TIMEOUT_SECONDS = 90
+DEFAULT_RUN_REAPER_BATCH_SIZE = 100
+DEFAULT_RUN_REAPER_RELEASE_CONCURRENCY = 8
+DEFAULT_RUN_QUEUE_LEASE_SECONDS = 60
+DEFAULT_RUN_QUEUE_POLL_INTERVAL_SECONDS = 1.0
+DEFAULT_RUN_QUEUE_MAX_ATTEMPTS = 3
+DEFAULT_RUN_QUEUE_CAPACITY = 8
+DEFAULT_RUN_PRIORITY_AGING_SECONDS = 60.0
+DEFAULT_RUN_ADMISSION_TIMEOUT_SECONDS = 10.0
+DEFAULT_RUN_RESUME_POLL_INTERVAL_SECONDS = 0.05
+DEFAULT_RUN_RESUME_RECONNECT_SECONDS = 5.0
+DEFAULT_RUN_RESUME_SWEEP_INTERVAL_SECONDS = 5.0
+DEFAULT_ENGINE_SOCKETS = "./engine.sock"
+DEFAULT_ENGINE_COMMAND_TIMEOUT_SECONDS = 20.0
+DEFAULT_ENGINE_RECONNECT_SECONDS = 1.0
+DEFAULT_REDACT_KEYS = (
+    "api_key,apikey,password,secret,token,authorization,cookie,set-cookie"
+)
+DEFAULT_REDACT_KEY_PATTERNS = (r"[_-](token|secret|password)$",)
+DEFAULT_REDACT_VALUE_DETECTORS = "jwt,bearer"
 
 # CORS configuration constants
 ALLOWED_METHODS = ["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS", "HEAD"]
-ALLOWED_HEADERS = ["Authorization", "Content-Type", "Accept", "Accept-Language"]
-EXPOSE_HEADERS = ["WWW-Authenticate", "Authorization"]
+ALLOWED_HEADERS = [
+    "Authorization",
+    "Content-Type",
+    "Accept",
+    "Accept-Language",
+    "If-None-Match",
+]
+EXPOSE_HEADERS = ["WWW-Authenticate", "Authorization", "X-Next-Cursor", "ETag"]
 MINUTES_PER_DAY = 24 * 60
 
 
@@ -62,6 +118,11 @@ def normalize_origins(raw: str) -> str | list[str]:
     return sorted(set(cleaned))
 
 
+def _default_worker_id() -> str:
+    """Build a worker id unique to this process, e.g. `host-1234-9f2c1a`."""
+    return f"{socket.gethostname()}-{os.getpid()}-{uuid4().hex[:6]}"
+
+
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
 
@@ -76,6 +137,92 @@ class Settings(BaseSettings):
         default=None,
         description="Steel.dev API key for browser automation",
     )
+    steel_base_url: str = Field(
+        default=DEFAULT_STEEL_BASE_URL,
+        description="Steel.dev API base URL",
+    )
+
+    # Shared HTTP client for the Steel.dev API
+    steel_http2: bool = Field(
+        default=False,
+        description="Negotiate HTTP/2 with Steel.dev (requires httpx[http2])",
+    )
+    steel_http_max_connections: int = Field(
+        ge=1,
+        default=DEFAULT_STEEL_HTTP_MAX_CONNECTIONS,
+        description="Maximum concurrent connections to Steel.dev",
+    )
+    steel_http_max_keepalive_connections: int = Field(
+        ge=0,
+        default=DEFAULT_STEEL_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        description="Idle connections kept open for reuse",
+    )
+    steel_http_keepalive_expiry_seconds: float = Field(
+        gt=0,
+        default=DEFAULT_STEEL_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        description="Time an idle connection is kept open (seconds)",
+    )
+    steel_http_connect_timeout_seconds: float = Field(
+        gt=0,
+        default=DEFAULT_STEEL_HTTP_CONNECT_TIMEOUT_SECONDS,
+        description="Timeout for establishing a connection (seconds)",
+    )
+    steel_http_pool_timeout_seconds: float = Field(
+        gt=0,
+        default=DEFAULT_STEEL_HTTP_POOL_TIMEOUT_SECONDS,
+        description="Timeout waiting for a free pooled connection (seconds)",
+    )
+    steel_create_timeout_seconds: float = Field(
+        gt=0,
+        default=DEFAULT_STEEL_CREATE_TIMEOUT_SECONDS,
+        description="Read/write timeout for creating a session (seconds)",
+    )
+    steel_info_timeout_seconds: float = Field(
+        gt=0,
+        default=DEFAULT_STEEL_INFO_TIMEOUT_SECONDS,
+        description="Read/write timeout for fetching session info (seconds)",
+    )
+    steel_release_timeout_seconds: float = Field(
+        gt=0,
+        default=DEFAULT_STEEL_RELEASE_TIMEOUT_SECONDS,
+        description="Read/write timeout for releasing a session (seconds)",
+    )
+
+    # Pre-warmed Steel browser session pool
+    steel_pool_enabled: bool = Field(
+        default=False,
+        description="Lease browser sessions from a pool of warm Steel sessions",
+    )
+    steel_pool_min_size: int = Field(
+        ge=0,
+        default=DEFAULT_STEEL_POOL_MIN_SIZE,
+        description="Warm sessions the pool keeps ready",
+    )
+    steel_pool_max_size: int = Field(
+        ge=1,
+        default=DEFAULT_STEEL_POOL_MAX_SIZE,
+        description="Upper bound on idle plus provisioning pooled sessions",
+    )
+    steel_pool_idle_ttl_seconds: int = Field(
+        ge=1,
+        default=DEFAULT_STEEL_POOL_IDLE_TTL_SECONDS,
+        description="Age after which an unleased session is released",
+    )
+    steel_pool_replenish_interval_seconds: int = Field(
+        ge=1,
+        default=DEFAULT_STEEL_POOL_REPLENISH_INTERVAL_SECONDS,
+        description="Seconds between pool health checks and replenishment",
+    )
+    steel_pool_interactive_reserve: int = Field(
+        ge=0,
+        default=DEFAULT_STEEL_POOL_INTERACTIVE_RESERVE,
+        description="Warm sessions only interactive runs may lease",
+    )
+    steel_pool_health_check_size: int = Field(
+        ge=0,
+        default=DEFAULT_STEEL_POOL_HEALTH_CHECK_SIZE,
+        description="Idle sessions health-checked with the provider per pass",
+    )
 
     # Application settings
     debug: bool = Field(
@@ -205,6 +352,202 @@ class Settings(BaseSettings):
         ),
     )
 
+    # Event sink (write-behind batching of run events)
+    event_sink_enabled: bool = Field(
+        default=True,
+        description="Buffer run events and persist them in batched INSERTs",
+    )
+    event_sink_max_batch_size: int = Field(
+        ge=1,
+        le=1000,
+        default=DEFAULT_EVENT_SINK_MAX_BATCH_SIZE,
+        description="Flush buffered events once this many are queued",
+    )
+    event_sink_flush_interval_ms: int = Field(
+        ge=1,
+        default=DEFAULT_EVENT_SINK_FLUSH_INTERVAL_MS,
+        description="Maximum time an event may wait in the buffer (milliseconds)",
+    )
+    event_sink_max_queue_size: int = Field(
+        ge=1,
+        default=DEFAULT_EVENT_SINK_MAX_QUEUE_SIZE,
+        description="Bound on buffered events; producers wait when it is reached",
+    )
+    event_sink_retry_attempts: int = Field(
+        ge=0,
+        default=DEFAULT_EVENT_SINK_RETRY_ATTEMPTS,
+        description=(
+            "Retries for a failed batch before falling back to per-event inserts"
+        ),
+    )
+    event_sink_retry_delay_ms: int = Field(
+        ge=0,
+        default=DEFAULT_EVENT_SINK_RETRY_DELAY_MS,
+        description="Initial backoff between batch retries (milliseconds, doubles)",
+    )
+
+    # Event retention and compaction
+    event_compaction_enabled: bool = Field(
+        default=True,
+        description="Periodically delete expired events of terminal runs",
+    )
+    event_retention_days: str = Field(
+        default=DEFAULT_EVENT_RETENTION_DAYS,
+        description=(
+            "Per-type retention as comma-separated type:days pairs. "
+            "Types not listed are kept forever."
+        ),
+    )
+    event_compaction_interval_seconds: int = Field(
+        ge=1,
+        default=DEFAULT_EVENT_COMPACTION_INTERVAL_SECONDS,
+        description="Time between compaction passes (seconds)",
+    )
+    event_compaction_batch_size: int = Field(
+        ge=1,
+        le=10_000,
+        default=DEFAULT_EVENT_COMPACTION_BATCH_SIZE,
+        description="Events deleted per compaction transaction",
+    )
+    event_compaction_batch_pause_ms: int = Field(
+        ge=0,
+        default=DEFAULT_EVENT_COMPACTION_BATCH_PAUSE_MS,
+        description="Pause between compaction batches so writers can proceed",
+    )
+
+    # Worker identity, run heartbeats and the orphaned-run reaper
+    worker_id: str = Field(
+        default_factory=_default_worker_id,
+        description="Identifies this worker process as the owner of its runs",
+    )
+    run_reaper_enabled: bool = Field(
+        default=True,
+        description="Heartbeat owned runs and reap runs whose worker is gone",
+    )
+    run_reaper_action: Literal["fail", "requeue"] = Field(
+        default="fail",
+        description="Mark orphaned runs failed, or reset them to pending and rerun",
+    )
+    run_heartbeat_interval_seconds: int = Field(
+        ge=1,
+        default=DEFAULT_RUN_HEARTBEAT_INTERVAL_SECONDS,
+        description="Time between heartbeat and reaper passes (seconds)",
+    )
+    run_heartbeat_timeout_seconds: int = Field(
+        ge=1,
+        default=DEFAULT_RUN_HEARTBEAT_TIMEOUT_SECONDS,
+        description="Heartbeat age after which a run is considered orphaned",
+    )
+    run_reaper_batch_size: int = Field(
+        ge=1,
+        le=10_000,
+        default=DEFAULT_RUN_REAPER_BATCH_SIZE,
+        description="Orphaned runs reaped per transaction",
+    )
+    run_reaper_release_concurrency: int = Field(
+        ge=1,
+        default=DEFAULT_RUN_REAPER_RELEASE_CONCURRENCY,
+        description="Browser sessions released in parallel while reaping",
+    )
+
+    # Durable run queue drained by leasing workers
+    run_queue_enabled: bool = Field(
+        default=False,
+        description="Queue runs accepted as pending in the DB for workers to claim",
+    )
+    run_queue_lease_seconds: int = Field(
+        ge=1,
+        default=DEFAULT_RUN_QUEUE_LEASE_SECONDS,
+        description="Lease a worker holds on a claimed run between renewals",
+    )
+    run_queue_poll_interval_seconds: float = Field(
+        gt=0,
+        default=DEFAULT_RUN_QUEUE_POLL_INTERVAL_SECONDS,
+        description="Time between claim and lease renewal passes (seconds)",
+    )
+    run_queue_max_attempts: int = Field(
+        ge=1,
+        default=DEFAULT_RUN_QUEUE_MAX_ATTEMPTS,
+        description="Deliveries of a run before it is failed",
+    )
+    run_queue_capacity: int = Field(
+        ge=1,
+        default=DEFAULT_RUN_QUEUE_CAPACITY,
+        description="Queued runs a worker executes at once",
+    )
+
+    # Run concurrency limits of each executing process (0 disables a limit);
+    # the effective cluster-wide cap is the limit times the number of processes
+    run_worker_max_concurrent: int = Field(
+        ge=0,
+        default=0,
+        description="Runs executing at once in this worker",
+    )
+    run_worker_max_concurrent_per_user: int = Field(
+        ge=0,
+        default=0,
+        description="Runs of one user executing at once in this worker",
+    )
+    run_worker_max_concurrent_per_flow: int = Field(
+        ge=0,
+        default=0,
+        description="Runs of one flow executing at once in this worker",
+    )
+    run_priority_aging_seconds: float = Field(
+        gt=0,
+        default=DEFAULT_RUN_PRIORITY_AGING_SECONDS,
+        description="Wait after which a run is admitted as one priority class higher",
+    )
+    run_admission_timeout_seconds: float = Field(
+        gt=0,
+        default=DEFAULT_RUN_ADMISSION_TIMEOUT_SECONDS,
+        description="Longest a synchronous run creation waits for admission",
+    )
+
+    # Delivery of checkpoint resumes and cancels accepted by another process
+    run_resume_poll_interval_seconds: float = Field(
+        gt=0,
+        default=DEFAULT_RUN_RESUME_POLL_INTERVAL_SECONDS,
+        description="Time between resume and cancel checks of live runs (seconds)",
+    )
+    run_resume_sweep_interval_seconds: float = Field(
+        gt=0,
+        default=DEFAULT_RUN_RESUME_SWEEP_INTERVAL_SECONDS,
+        description="Time between those checks while NOTIFY is delivered (seconds)",
+    )
+
+    # Execution plane: runs execute in the API process, or in engine workers
+    engine_mode: Literal["embedded", "remote"] = Field(
+        default="embedded",
+        description="Execute runs in this process, or hand them to engine workers",
+    )
+    engine_sockets: str = Field(
+        default=DEFAULT_ENGINE_SOCKETS,
+        description="Unix socket paths of engine workers (comma-separated)",
+    )
+    engine_command_timeout_seconds: float = Field(
+        gt=0,
+        default=DEFAULT_ENGINE_COMMAND_TIMEOUT_SECONDS,
+        description="Time to wait for an engine worker to answer a command",
+    )
+
+    # Event payload redaction
+    redact_keys: str = Field(
+        default=DEFAULT_REDACT_KEYS,
+        description="Payload keys whose values are masked (comma-separated)",
+    )
+    redact_key_patterns: list[str] = Field(
+        default_factory=lambda: list(DEFAULT_REDACT_KEY_PATTERNS),
+        description=(
+            "Regexes matched against payload keys, as a JSON list so patterns "
+            "may contain commas"
+        ),
+    )
+    redact_value_detectors: str = Field(
+        default=DEFAULT_REDACT_VALUE_DETECTORS,
+        description="Value shapes masked anywhere in events: jwt, bearer",
+    )
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -220,6 +563,32 @@ class Settings(BaseSettings):
         self._validate_cookie_settings()
         return self
 
+    @model_validator(mode="after")
+    def validate_run_liveness(self) -> "Settings":
+        if self.run_heartbeat_timeout_seconds <= self.run_heartbeat_interval_seconds:
+            msg = (
+                "RUN_HEARTBEAT_TIMEOUT_SECONDS must exceed "
+                "RUN_HEARTBEAT_INTERVAL_SECONDS so live runs are never reaped"
+            )
+            raise ValueError(msg)
+        if self.run_queue_lease_seconds <= self.run_queue_poll_interval_seconds:
+            msg = (
+                "RUN_QUEUE_LEASE_SECONDS must exceed "
+                "RUN_QUEUE_POLL_INTERVAL_SECONDS so leases are renewed in time"
+            )
+            raise ValueError(msg)
+        return self
+
+    @model_validator(mode="after")
+    def validate_redaction(self) -> "Settings":
+        for pattern in self.redact_key_patterns:
+            try:
+                re.compile(pattern)
+            except re.error as exc:
+                msg = f"Invalid REDACT_KEY_PATTERNS entry {pattern!r}: {exc}"
+                raise ValueError(msg) from exc
+        return self
+
     def _validate_secret_key(self) -> None:
         """Validate secret key configuration."""
         if not self.secret_key or not self.secret_key.strip():
@@ -302,7 +671,7 @@ def get_steel_config() -> dict:
     """Get Steel.dev configuration."""
     return {
         "api_key": settings.steel_api_key,
-        "base_url": "https://api.steel.dev/v1",
+        "base_url": settings.steel_base_url,
         "enabled": bool(settings.steel_api_key),
     }
 
@@ -316,6 +685,136 @@ def get_retry_config() -> dict:
     }
 
 
+def get_event_sink_config() -> dict:
+    """Get write-behind event sink configuration."""
+    return {
+        "enabled": settings.event_sink_enabled,
+        "max_batch_size": settings.event_sink_max_batch_size,
+        "flush_interval": settings.event_sink_flush_interval_ms / 1000,
+        "max_queue_size": settings.event_sink_max_queue_size,
+        "retry_attempts": settings.event_sink_retry_attempts,
+        "retry_delay": settings.event_sink_retry_delay_ms / 1000,
+    }
+
+
+def _split_csv(raw: str) -> list[str]:
+    return [item.strip() for item in raw.split(",") if item.strip()]
+
+
+def parse_retention_days(raw: str) -> dict[str, timedelta]:
+    """Parse comma-separated `type:days` pairs into retention windows."""
+    retention: dict[str, timedelta] = {}
+    for item in _split_csv(raw):
+        event_type, sep, days = item.partition(":")
+        if not sep or not days.strip().isdigit():
+            msg = f"Invalid event retention entry: {item!r}"
+            raise ValueError(msg)
+        retention[event_type.strip().lower()] = timedelta(days=int(days))
+    return retention
+
+
+def get_event_compaction_config() -> dict:
+    """Get event retention and compaction configuration."""
+    return {
+        "enabled": settings.event_compaction_enabled,
+        "retention": parse_retention_days(settings.event_retention_days),
+        "interval": settings.event_compaction_interval_seconds,
+        "batch_size": settings.event_compaction_batch_size,
+        "batch_pause": settings.event_compaction_batch_pause_ms / 1000,
+    }
+
+
+def get_steel_http_config() -> dict:
+    """Get shared Steel.dev HTTP client configuration."""
+    return {
+        "http2": settings.steel_http2,
+        "max_connections": settings.steel_http_max_connections,
+        "max_keepalive_connections": settings.steel_http_max_keepalive_connections,
+        "keepalive_expiry": settings.steel_http_keepalive_expiry_seconds,
+        "connect_timeout": settings.steel_http_connect_timeout_seconds,
+        "pool_timeout": settings.steel_http_pool_timeout_seconds,
+        "timeouts": {
+            "create_session": settings.steel_create_timeout_seconds,
+            "get_session_info": settings.steel_info_timeout_seconds,
+            "release_session": settings.steel_release_timeout_seconds,
+        },
+    }
+
+
+def get_steel_pool_config() -> dict:
+    """Get pre-warmed Steel session pool configuration."""
+    return {
+        "enabled": settings.steel_pool_enabled,
+        "min_size": settings.steel_pool_min_size,
+        "max_size": settings.steel_pool_max_size,
+        "idle_ttl": settings.steel_pool_idle_ttl_seconds,
+        "interval": settings.steel_pool_replenish_interval_seconds,
+        "interactive_reserve": settings.steel_pool_interactive_reserve,
+        "health_check_size": settings.steel_pool_health_check_size,
+    }
+
+
+def get_run_reaper_config() -> dict:
+    """Get run heartbeat and orphaned-run reaper configuration."""
+    return {
+        "enabled": settings.run_reaper_enabled,
+        "worker_id": settings.worker_id,
+        "action": settings.run_reaper_action,
+        "interval": settings.run_heartbeat_interval_seconds,
+        "heartbeat_timeout": settings.run_heartbeat_timeout_seconds,
+        "batch_size": settings.run_reaper_batch_size,
+        "release_concurrency": settings.run_reaper_release_concurrency,
+    }
+
+
+def get_run_queue_config() -> dict:
+    """Get durable run queue configuration."""
+    return {
+        "enabled": settings.run_queue_enabled,
+        "worker_id": settings.worker_id,
+        "lease": settings.run_queue_lease_seconds,
+        "interval": settings.run_queue_poll_interval_seconds,
+        "max_attempts": settings.run_queue_max_attempts,
+        "capacity": settings.run_queue_capacity,
+    }
+
+
+def get_run_admission_config() -> dict:
+    """Get run concurrency limit configuration."""
+    return {
+        "max_runs": settings.run_worker_max_concurrent,
+        "max_runs_per_user": settings.run_worker_max_concurrent_per_user,
+        "max_runs_per_flow": settings.run_worker_max_concurrent_per_flow,
+        "aging": settings.run_priority_aging_seconds,
+    }
+
+
+def get_run_resume_config() -> dict:
+    """Get checkpoint resume and cancel delivery configuration."""
+    return {
+        "interval": settings.run_resume_poll_interval_seconds,
+        "sweep_interval": settings.run_resume_sweep_interval_seconds,
+    }
+
+
+def get_engine_config() -> dict:
+    """Get execution plane configuration."""
+    return {
+        "mode": settings.engine_mode,
+        "sockets": _split_csv(settings.engine_sockets),
+        "timeout": settings.engine_command_timeout_seconds,
+    }
+
+
+def get_redaction_config() -> dict:
+    """Get event payload redaction configuration."""
+    return {
+        "keys": _split_csv(settings.redact_keys),
+        "key_patterns": list(settings.redact_key_patterns),
+        "value_detectors": _split_csv(settings.redact_value_detectors),
+    }
+
+
 def get_socketio_config() -> dict:
     """Get Socket.IO configuration."""
     raw = settings.socketio_cors.strip()
@@ -10,6 +10,35 @@ API_VERSION = "0.1.0"
 # Pagination Configuration
 MAX_RUN_LIST_LIMIT = 200
 MAX_FLOW_LIST_LIMIT = 200
+DEFAULT_EVENT_PAGE_LIMIT = 200
+MAX_EVENT_PAGE_LIMIT = 1000
+
+# Live event streaming (SSE)
+EVENT_STREAM_HEARTBEAT_SECONDS = 15.0
+EVENT_SUBSCRIBER_QUEUE_SIZE = 1000
+
+# Bulk event ingestion
+MAX_EVENT_BATCH_SIZE = 1000
+
+# Event history export (NDJSON)
+EVENT_EXPORT_CHUNK_SIZE = 1000
+
+# Asynchronous run provisioning (RFC 7240 preference)
+PREFER_RESPOND_ASYNC = "respond-async"
+
+# Bulk run submission
+MAX_RUN_BATCH_SIZE = 500
+RUN_BATCH_PROVISION_CONCURRENCY = 8
+
+# Run cancellation: how long the API waits for a run's task to wind down
+RUN_CANCEL_TIMEOUT_SECONDS = 15.0
+
+# Postgres NOTIFY channel announcing runs continued from a checkpoint or canceled
+RUN_SIGNAL_CHANNEL = "yeetflow_run_signal"
+
+# Run status aggregates (dashboard stats)
+RUN_STATS_CACHE_TTL_SECONDS = 10.0
+RUN_STATS_CACHE_MAX_ENTRIES = 1024
 
 # Authentication Configuration
 BOOTSTRAP_USER_EMAIL = "system@yeetflow.local"
@@ -14,22 +14,40 @@ logger = logging.getLogger(__name__)
 # Database configuration
 ASYNC_DATABASE_URL = get_database_url()
 
+# Seconds a SQLite connection waits for another writer's lock before failing
+SQLITE_BUSY_TIMEOUT_SECONDS = 30.0
+
 # Create async engine
 engine = create_async_engine(
     ASYNC_DATABASE_URL,
     echo=False,
-    connect_args={"check_same_thread": False} if "sqlite" in ASYNC_DATABASE_URL else {},
+    connect_args=(
+        {"check_same_thread": False, "timeout": SQLITE_BUSY_TIMEOUT_SECONDS}
+        if "sqlite" in ASYNC_DATABASE_URL
+        else {}
+    ),
 )
 
 
-# Register event listener for SQLite foreign keys
+def configure_sqlite_connection(dbapi_connection) -> None:
+    """Enable foreign keys and write-ahead logging on a SQLite connection.
+
+    In WAL mode readers, such as long event exports and SSE backlogs, do
+    not block the event sink and other writers, nor writers them.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys = ON")
+    cursor.execute("PRAGMA journal_mode = WAL")
+    cursor.execute("PRAGMA synchronous = NORMAL")
+    cursor.close()
+
+
+# Register event listener for SQLite foreign keys and WAL
 @event.listens_for(engine.sync_engine, "connect")
 def set_sqlite_pragma(dbapi_connection, _):
-    """Enable foreign key constraints for every SQLite connection."""
+    """Configure every SQLite connection."""
     if "sqlite" in ASYNC_DATABASE_URL:
-        cursor = dbapi_connection.cursor()
-        cursor.execute("PRAGMA foreign_keys = ON")
-        cursor.close()
+        configure_sqlite_connection(dbapi_connection)
 
 
 # Create session maker
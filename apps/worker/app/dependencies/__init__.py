@@ -1,5 +1,50 @@
-from .run_scheduler import get_run_scheduler
+from .engine import get_engine_client, start_engine_client, stop_engine_client
+from .event_compaction import start_event_compaction, stop_event_compaction
+from .event_sink import get_event_sink, start_event_sink, stop_event_sink
+from .run_reaper import start_run_reaper, stop_run_reaper
+from .run_resume import start_resume_listener, stop_resume_listener
+from .run_scheduler import (
+    get_local_run_scheduler,
+    get_run_admission,
+    get_run_coordinator,
+    get_run_scheduler,
+    start_run_queue,
+    stop_run_queue,
+)
+from .steel_http import (
+    get_steel_http_client,
+    start_steel_http_client,
+    stop_steel_http_client,
+)
+from .steel_pool import (
+    get_steel_session_pool,
+    start_steel_session_pool,
+    stop_steel_session_pool,
+)
 
 __all__ = [
+    "get_engine_client",
+    "get_event_sink",
+    "get_local_run_scheduler",
+    "get_run_admission",
+    "get_run_coordinator",
     "get_run_scheduler",
+    "get_steel_http_client",
+    "get_steel_session_pool",
+    "start_engine_client",
+    "start_event_compaction",
+    "start_event_sink",
+    "start_resume_listener",
+    "start_run_queue",
+    "start_run_reaper",
+    "start_steel_http_client",
+    "start_steel_session_pool",
+    "stop_engine_client",
+    "stop_event_compaction",
+    "stop_event_sink",
+    "stop_resume_listener",
+    "stop_run_queue",
+    "stop_run_reaper",
+    "stop_steel_http_client",
+    "stop_steel_session_pool",
 ]
@@ -0,0 +1,39 @@
+"""Process-wide client for engine workers when runs execute out of process."""
+
+from app.config import get_engine_config
+from app.models import EventRead
+from app.runtime.ipc import EngineClient
+from app.runtime.remote import MESSAGE_EVENT
+from app.services.event.broadcaster import event_broadcaster
+
+_engine_client: EngineClient | None = None
+
+
+def get_engine_client() -> EngineClient | None:
+    """Return the engine client, or None when runs execute in this process."""
+    global _engine_client  # noqa: PLW0603
+    config = get_engine_config()
+    if config["mode"] != "remote":
+        return None
+    if _engine_client is None:
+        _engine_client = EngineClient(config["sockets"], timeout=config["timeout"])
+    return _engine_client
+
+
+def start_engine_client() -> EngineClient | None:
+    """Relay run events published by engine workers to local subscribers."""
+    client = get_engine_client()
+    if client is not None:
+        client.watch(_relay_message)
+    return client
+
+
+async def stop_engine_client() -> None:
+    """Stop relaying engine worker events."""
+    if _engine_client is not None:
+        await _engine_client.aclose()
+
+
+def _relay_message(message: dict) -> None:
+    if message.get("type") == MESSAGE_EVENT:
+        event_broadcaster.publish(EventRead.model_validate(message["event"]))
@@ -0,0 +1,29 @@
+"""Process-wide background event compaction."""
+
+from app.config import get_event_compaction_config
+from app.services.event.compaction import EventCompactor
+
+_event_compactor: EventCompactor | None = None
+
+
+def start_event_compaction() -> EventCompactor | None:
+    """Create and start the periodic event compactor if enabled in settings."""
+    global _event_compactor  # noqa: PLW0603
+    config = get_event_compaction_config()
+    if not config["enabled"] or not config["retention"]:
+        return None
+    if _event_compactor is None:
+        _event_compactor = EventCompactor(
+            config["retention"],
+            batch_size=config["batch_size"],
+            batch_pause=config["batch_pause"],
+            interval=config["interval"],
+        )
+    _event_compactor.start()
+    return _event_compactor
+
+
+async def stop_event_compaction() -> None:
+    """Stop the periodic event compactor."""
+    if _event_compactor is not None:
+        await _event_compactor.stop()
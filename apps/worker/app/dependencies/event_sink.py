@@ -0,0 +1,37 @@
+"""Process-wide write-behind event sink."""
+
+from app.config import get_event_sink_config
+from app.services.event.sink import EventSink
+
+_event_sink: EventSink | None = None
+
+
+def get_event_sink() -> EventSink | None:
+    """Return the running event sink, or None when events are written inline."""
+    if _event_sink is not None and _event_sink.running:
+        return _event_sink
+    return None
+
+
+async def start_event_sink() -> EventSink | None:
+    """Create and start the process event sink if enabled in settings."""
+    global _event_sink  # noqa: PLW0603
+    config = get_event_sink_config()
+    if not config["enabled"]:
+        return None
+    if _event_sink is None:
+        _event_sink = EventSink(
+            max_batch_size=config["max_batch_size"],
+            flush_interval=config["flush_interval"],
+            max_queue_size=config["max_queue_size"],
+            retry_attempts=config["retry_attempts"],
+            retry_delay=config["retry_delay"],
+        )
+    await _event_sink.start()
+    return _event_sink
+
+
+async def stop_event_sink() -> None:
+    """Flush buffered events and stop the process event sink."""
+    if _event_sink is not None:
+        await _event_sink.stop()
@@ -0,0 +1,42 @@
+"""Process-wide run heartbeats and orphaned-run reaping."""
+
+from app.config import get_run_reaper_config
+from app.runtime.reaper import RunReaper
+
+from .run_scheduler import get_local_run_scheduler, get_run_coordinator
+
+_run_reaper: RunReaper | None = None
+
+
+def start_run_reaper() -> RunReaper | None:
+    """Create and start the run reaper if enabled in settings.
+
+    Start it after `start_run_queue`: with `RUN_REAPER_ACTION=requeue` the
+    reaper hands runs back through a scheduler that uses the queue
+    dispatcher existing when the reaper is created.
+    """
+    global _run_reaper  # noqa: PLW0603
+    config = get_run_reaper_config()
+    if not config["enabled"]:
+        return None
+    if _run_reaper is None:
+        _run_reaper = RunReaper(
+            get_run_coordinator(),
+            worker_id=config["worker_id"],
+            action=config["action"],
+            scheduler=(
+                get_local_run_scheduler() if config["action"] == "requeue" else None
+            ),
+            interval=config["interval"],
+            heartbeat_timeout=config["heartbeat_timeout"],
+            batch_size=config["batch_size"],
+            release_concurrency=config["release_concurrency"],
+        )
+    _run_reaper.start()
+    return _run_reaper
+
+
+async def stop_run_reaper() -> None:
+    """Stop heartbeating and reaping runs."""
+    if _run_reaper is not None:
+        await _run_reaper.stop()
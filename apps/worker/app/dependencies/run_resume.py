@@ -0,0 +1,34 @@
+"""Process-wide delivery of resumes and cancels accepted by other processes."""
+
+from app import db
+from app.config import get_run_resume_config
+from app.runtime.resume import ResumeListener
+
+from .run_scheduler import get_run_coordinator
+
+_resume_listener: ResumeListener | None = None
+
+
+def start_resume_listener() -> ResumeListener:
+    """Create and start the resume listener for runs executing in this process.
+
+    On Postgres with asyncpg it also LISTENs for continued and canceled runs.
+    """
+    global _resume_listener  # noqa: PLW0603
+    if _resume_listener is None:
+        notify = db.engine.dialect.driver == "asyncpg"
+        config = get_run_resume_config()
+        _resume_listener = ResumeListener(
+            get_run_coordinator(),
+            interval=config["interval"],
+            sweep_interval=config["sweep_interval"],
+            notify_engine=db.engine if notify else None,
+        )
+    _resume_listener.start()
+    return _resume_listener
+
+
+async def stop_resume_listener() -> None:
+    """Stop delivering resumes and cancels from other processes."""
+    if _resume_listener is not None:
+        await _resume_listener.stop()
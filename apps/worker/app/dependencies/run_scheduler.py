@@ -5,17 +5,97 @@ from collections.abc import Callable
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import db
+from app.config import get_run_admission_config, get_run_queue_config
+from app.runtime.admission import AdmissionController
 from app.runtime.core import RunnerCoordinator
+from app.runtime.queue import RunQueueDispatcher
+from app.runtime.remote import RemoteRunScheduler
 from app.runtime.scheduler import RunScheduler
+from app.services.run.service import RunService
+
+from .engine import get_engine_client
+from .event_sink import get_event_sink
+from .steel_pool import get_steel_session_pool
 
 # Global singleton coordinator for pause/resume orchestration
 _coordinator = RunnerCoordinator()
 
+# Concurrency limits shared by every scheduler in this process
+_admission = AdmissionController(**get_run_admission_config())
+
+_run_queue_dispatcher: RunQueueDispatcher | None = None
+
+
+def get_run_coordinator() -> RunnerCoordinator:
+    """Return the process-wide coordinator of the runs executing here."""
+    return _coordinator
+
+
+def get_run_admission() -> AdmissionController:
+    """Return the process-wide run admission controller."""
+    return _admission
+
+
+def get_run_scheduler() -> RunScheduler | RemoteRunScheduler:
+    """Return the scheduler runs are handed to from API requests.
+
+    With `ENGINE_MODE=remote` runs are sent to engine workers; otherwise they
+    execute in this process.
+    """
+    client = get_engine_client()
+    if client is not None:
+        return RemoteRunScheduler(client, queued=get_run_queue_config()["enabled"])
+    return get_local_run_scheduler()
 
-def get_run_scheduler() -> RunScheduler:
-    """Create a RunScheduler with the global coordinator and session factory."""
+
+def _pooled_run_service() -> RunService:
+    """Create a RunService that leases browser sessions from the session pool."""
+    return RunService(steel_pool=get_steel_session_pool())
+
+
+def get_local_run_scheduler() -> RunScheduler:
+    """Create a RunScheduler with the global coordinator and session factory.
+
+    Runs it provisions, e.g. claimed from the run queue or requeued by the
+    reaper, lease their browser sessions from the session pool.
+    """
     session_factory: Callable[[], AsyncSession] = db.AsyncSessionLocal
     return RunScheduler(
         coordinator=_coordinator,
         session_factory=session_factory,
+        run_service_factory=_pooled_run_service,
+        event_sink=get_event_sink(),
+        dispatcher=_run_queue_dispatcher,
+        admission=_admission,
     )
+
+
+def start_run_queue() -> RunQueueDispatcher | None:
+    """Create and start the run queue dispatcher if enabled in settings.
+
+    The dispatcher executes claimed runs through its own scheduler, which
+    provisions them directly instead of queuing them again.
+    """
+    global _run_queue_dispatcher  # noqa: PLW0603
+    config = get_run_queue_config()
+    if not config["enabled"]:
+        return None
+    if _run_queue_dispatcher is None:
+        _run_queue_dispatcher = RunQueueDispatcher(
+            get_local_run_scheduler(),
+            _coordinator,
+            run_service_factory=_pooled_run_service,
+            worker_id=config["worker_id"],
+            lease=config["lease"],
+            interval=config["interval"],
+            max_attempts=config["max_attempts"],
+            capacity=config["capacity"],
+        )
+    _run_queue_dispatcher.start()
+    return _run_queue_dispatcher
+
+
+async def stop_run_queue() -> None:
+    """Stop claiming queued runs and release this worker's leases."""
+    if _run_queue_dispatcher is not None:
+        await _run_queue_dispatcher.stop()
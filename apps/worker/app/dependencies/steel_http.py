@@ -0,0 +1,19 @@
+"""Process-wide pooled HTTP client for the Steel.dev API."""
+
+from app.services.steel_http import SteelHttpClient, steel_http_client
+
+
+def get_steel_http_client() -> SteelHttpClient:
+    """Return the shared Steel.dev HTTP client."""
+    return steel_http_client
+
+
+def start_steel_http_client() -> SteelHttpClient:
+    """Open the shared client's keep-alive connection pool."""
+    steel_http_client.start()
+    return steel_http_client
+
+
+async def stop_steel_http_client() -> None:
+    """Close the shared client and its pooled connections."""
+    await steel_http_client.aclose()
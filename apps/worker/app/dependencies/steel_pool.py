@@ -0,0 +1,36 @@
+"""Process-wide pre-warmed Steel session pool."""
+
+from app.config import get_steel_pool_config
+from app.services.steel_pool import SteelSessionPool
+
+_steel_session_pool: SteelSessionPool | None = None
+
+
+def get_steel_session_pool() -> SteelSessionPool | None:
+    """Return the running session pool, or None when pooling is disabled."""
+    return _steel_session_pool
+
+
+def start_steel_session_pool() -> SteelSessionPool | None:
+    """Create and start the session pool if enabled in settings."""
+    global _steel_session_pool  # noqa: PLW0603
+    config = get_steel_pool_config()
+    if not config["enabled"]:
+        return None
+    if _steel_session_pool is None:
+        _steel_session_pool = SteelSessionPool(
+            min_size=config["min_size"],
+            max_size=config["max_size"],
+            idle_ttl=config["idle_ttl"],
+            interval=config["interval"],
+            interactive_reserve=config["interactive_reserve"],
+            health_check_size=config["health_check_size"],
+        )
+    _steel_session_pool.start()
+    return _steel_session_pool
+
+
+async def stop_steel_session_pool() -> None:
+    """Stop the session pool and release its idle sessions."""
+    if _steel_session_pool is not None:
+        await _steel_session_pool.stop()
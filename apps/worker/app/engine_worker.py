@@ -0,0 +1,113 @@
+"""Engine worker: executes runs handed over by API processes.
+
+Run API processes with `ENGINE_MODE=remote` and start one or more engine
+workers with `yeetflow-engine --socket <path>`, listing every worker's
+socket in `ENGINE_SOCKETS`. A worker executes runs on its own event loop,
+answers start/provision/resume/cancel commands from the API over its Unix
+socket, and forwards the run events it persists to the API processes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import logging
+import signal
+
+from app import db
+from app.config import get_engine_config, settings
+from app.dependencies import (
+    get_local_run_scheduler,
+    get_run_admission,
+    get_run_coordinator,
+    start_event_sink,
+    start_resume_listener,
+    start_run_queue,
+    start_run_reaper,
+    start_steel_http_client,
+    start_steel_session_pool,
+    stop_event_sink,
+    stop_resume_listener,
+    stop_run_queue,
+    stop_run_reaper,
+    stop_steel_http_client,
+    stop_steel_session_pool,
+)
+from app.models import EventRead
+from app.runtime.engine.redaction import get_redaction_policy
+from app.runtime.ipc import EngineServer
+from app.runtime.remote import MESSAGE_EVENT, EngineCommandHandler
+from app.services.event.broadcaster import event_broadcaster
+
+logger = logging.getLogger(__name__)
+
+
+async def serve(socket_path: str) -> None:
+    """Execute runs and serve commands on `socket_path` until signalled."""
+    # Compile the redaction policy now so a bad rule fails startup, not a run
+    get_redaction_policy()
+    handler = EngineCommandHandler(
+        get_local_run_scheduler(),
+        get_run_coordinator(),
+        db.AsyncSessionLocal,
+        worker_id=settings.worker_id,
+        admission=get_run_admission(),
+    )
+    server = EngineServer(socket_path, handler)
+
+    def forward_event(event: EventRead) -> None:
+        if server.watching:
+            server.broadcast(
+                {"type": MESSAGE_EVENT, "event": event.model_dump(mode="json")}
+            )
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    await start_event_sink()
+    start_steel_http_client()
+    start_steel_session_pool()
+    # The reaper requeues through the scheduler the queue dispatcher is part of
+    start_run_queue()
+    start_run_reaper()
+    start_resume_listener()
+    event_broadcaster.add_listener(forward_event)
+    await server.start()
+    logger.info("Engine worker %s ready", settings.worker_id)
+    try:
+        await stop.wait()
+    finally:
+        await server.stop()
+        event_broadcaster.remove_listener(forward_event)
+        await stop_resume_listener()
+        await stop_run_reaper()
+        await stop_run_queue()
+        await stop_steel_session_pool()
+        await stop_steel_http_client()
+        await stop_event_sink()
+        await db.engine.dispose()
+        logger.info("Engine worker %s stopped", settings.worker_id)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Execute YeetFlow runs")
+    parser.add_argument(
+        "--socket",
+        help="Unix socket to serve commands on (default: first of ENGINE_SOCKETS)",
+    )
+    args = parser.parse_args()
+    socket_path = args.socket or get_engine_config()["sockets"][0]
+    logging.basicConfig(
+        level=logging.DEBUG if settings.debug else logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(serve(socket_path))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -7,20 +7,66 @@ from app.bootstrap.e2e_data import seed_e2e_flows
 from app.config import settings
 from app.constants import API_TITLE, API_V1_PREFIX, API_VERSION, SERVICE_NAME
 from app.db import engine, init_db
+from app.dependencies import (
+    get_engine_client,
+    get_event_sink,
+    get_run_admission,
+    get_steel_http_client,
+    get_steel_session_pool,
+    start_engine_client,
+    start_event_compaction,
+    start_event_sink,
+    start_resume_listener,
+    start_run_queue,
+    start_run_reaper,
+    start_steel_http_client,
+    start_steel_session_pool,
+    stop_engine_client,
+    stop_event_compaction,
+    stop_event_sink,
+    stop_resume_listener,
+    stop_run_queue,
+    stop_run_reaper,
+    stop_steel_http_client,
+    stop_steel_session_pool,
+)
 from app.middleware.auth import AuthMiddleware
 from app.middleware.auth import CORSMiddleware as WorkerCORSMiddleware
 from app.routers import artifacts, auth, flows, runs
+from app.runtime.engine.redaction import get_redaction_policy
 
 
 @asynccontextmanager
 async def lifespan(_: FastAPI):
     """Manage application Lifecycle with startup and shutdown events."""
     # Startup
+    # Compile the redaction policy now so a bad rule fails startup, not a run
+    get_redaction_policy()
     await init_db()
     if os.getenv("E2E_SEED") == "true":
         await seed_e2e_flows()
+    await start_event_sink()
+    start_event_compaction()
+    start_steel_http_client()
+    start_steel_session_pool()
+    if get_engine_client() is not None:
+        # Runs execute in engine workers (`yeetflow-engine`), which own them
+        start_engine_client()
+    else:
+        # The reaper requeues through the scheduler the queue dispatcher is part of
+        start_run_queue()
+        start_run_reaper()
+        start_resume_listener()
     yield
     # Shutdown
+    await stop_engine_client()
+    await stop_resume_listener()
+    await stop_run_reaper()
+    await stop_run_queue()
+    await stop_steel_session_pool()
+    await stop_steel_http_client()
+    await stop_event_compaction()
+    await stop_event_sink()
     await engine.dispose()
 
 
@@ -57,4 +103,20 @@ app.include_router(flows.router, prefix=API_V1_PREFIX, tags=["flows"])
 @app.get("/health")
 async def health_check():
     """Health check endpoint for the worker service."""
-    return {"status": "healthy", "service": SERVICE_NAME}
+    health = {"status": "healthy", "service": SERVICE_NAME}
+    sink = get_event_sink()
+    if sink is not None:
+        health["event_sink"] = sink.stats.as_dict()
+    pool = get_steel_session_pool()
+    if pool is not None:
+        health["steel_pool"] = pool.stats.as_dict() | {"idle": pool.idle_count}
+    admission = get_run_admission()
+    health["run_admission"] = admission.stats.as_dict() | {
+        "running": admission.running,
+        "waiting": admission.waiting,
+        "waiting_users": len(admission.queue_depths()),
+    }
+    steel_http = get_steel_http_client()
+    if steel_http.started:
+        health["steel_http"] = steel_http.stats.as_dict()
+    return health
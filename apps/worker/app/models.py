@@ -11,6 +11,8 @@ from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.dialects.sqlite import JSON
 from sqlmodel import Column, Field, ForeignKey, Relationship, SQLModel
 
+from app.constants import MAX_RUN_BATCH_SIZE
+
 
 class UserRole(str, Enum):
     USER = "user"
@@ -54,6 +56,27 @@ class RunStatus(str, Enum):
     CANCELED = "canceled"
 
 
+TERMINAL_RUN_STATUSES = frozenset(
+    {RunStatus.COMPLETED, RunStatus.FAILED, RunStatus.CANCELED}
+)
+
+# Statuses in which a run is executing on, and heartbeated by, one worker
+OWNED_RUN_STATUSES = frozenset({RunStatus.RUNNING, RunStatus.AWAITING_INPUT})
+
+
+class RunPriority(str, Enum):
+    """Scheduling class of a run, from most to least urgent."""
+
+    INTERACTIVE = "interactive"
+    NORMAL = "normal"
+    BULK = "bulk"
+
+
+class RunStatsBucket(str, Enum):
+    HOUR = "hour"
+    DAY = "day"
+
+
 class SessionStatus(str, Enum):
     STARTING = "starting"
     ACTIVE = "active"
@@ -61,6 +84,13 @@ class SessionStatus(str, Enum):
     ENDED = "ended"
 
 
+class CheckpointStatus(str, Enum):
+    AWAITING_INPUT = "awaiting_input"
+    RESUMED = "resumed"
+    EXPIRED = "expired"
+    CANCELED = "canceled"
+
+
 class EventType(str, Enum):
     STATUS = "status"
     LOG = "log"
@@ -194,6 +224,24 @@ class Flow(FlowBase, table=True):
 
 class Run(RunBase, table=True):
     id: UUID = Field(default_factory=uuid4, primary_key=True)
+    input_payload: dict[str, Any] | None = Field(default=None, sa_type=JSON)
+    priority: RunPriority = Field(
+        default=RunPriority.NORMAL,
+        sa_column=Column(
+            SQLEnum(
+                RunPriority,
+                values_callable=lambda enum: [member.value for member in enum],
+            ),
+            server_default=RunPriority.NORMAL.value,
+            nullable=False,
+        ),
+    )
+    # Worker executing the run and the last time it confirmed it was alive
+    owner_id: str | None = None
+    heartbeat_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=True),
+    )
     created_at: datetime = Field(
         default_factory=lambda: datetime.now(UTC),
         sa_column=Column(DateTime(timezone=True), nullable=False),
@@ -224,6 +272,24 @@ class Run(RunBase, table=True):
     __table_args__ = (
         Index("ix_run_user_created_at_id", "user_id", "created_at", "id"),
         Index("idx_runs_user_id_created_at", "user_id", "created_at"),
+        # Keyset pagination of run listings, unfiltered and by status/flow
+        Index("ix_run_created_at_id", "created_at", "id"),
+        Index("ix_run_status_created_at_id", "status", "created_at", "id"),
+        Index(
+            "ix_run_user_status_created_at_id", "user_id", "status", "created_at", "id"
+        ),
+        Index("ix_run_flow_created_at_id", "flow_id", "created_at", "id"),
+        # Covering indexes for status aggregates, per user and for everyone
+        Index(
+            "ix_run_user_status_flow_created_at",
+            "user_id",
+            "status",
+            "flow_id",
+            "created_at",
+        ),
+        Index("ix_run_status_flow_created_at", "status", "flow_id", "created_at"),
+        # Orphaned-run reaper scans active runs by heartbeat age
+        Index("ix_run_status_heartbeat_at", "status", "heartbeat_at"),
     )
 
 
@@ -248,6 +314,111 @@ class Event(EventBase, table=True):
     )
     run: Run | None = Relationship(back_populates="events")
 
+    __table_args__ = (
+        Index("ix_event_run_id_at_id", "run_id", "at", "id"),
+        Index("ix_event_type_at", "type", "at"),
+    )
+
+
+class RunEventSummary(SQLModel, table=True):
+    """Roll-up of a run's events, kept when old events are compacted away."""
+
+    __tablename__ = "run_event_summary"
+
+    run_id: UUID = Field(
+        sa_column=Column(
+            ForeignKey("run.id", ondelete="CASCADE"), primary_key=True, nullable=False
+        )
+    )
+    event_counts: dict[str, int] = Field(default_factory=dict, sa_type=JSON)
+    event_count: int = Field(default=0)
+    first_event_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=True),
+    )
+    last_event_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=True),
+    )
+    last_error: str | None = None
+    updated_at: datetime = Field(
+        default_factory=lambda: datetime.now(UTC),
+        sa_column=Column(DateTime(timezone=True), nullable=False),
+    )
+
+
+class RunCheckpoint(SQLModel, table=True):
+    """A checkpoint a run paused at; at most one per run is awaiting input."""
+
+    __tablename__ = "run_checkpoint"
+
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    run_id: UUID = Field(
+        sa_column=Column(ForeignKey("run.id", ondelete="CASCADE"), nullable=False)
+    )
+    checkpoint_id: str
+    step_index: int
+    reason: str | None = None
+    expected_action: str | None = None
+    # Input the run was continued with, for the engine holding it to pick up
+    input_payload: dict[str, Any] | None = Field(default=None, sa_type=JSON)
+    status: CheckpointStatus = Field(
+        default=CheckpointStatus.AWAITING_INPUT,
+        sa_column=Column(
+            SQLEnum(
+                CheckpointStatus,
+                values_callable=lambda enum: [member.value for member in enum],
+            ),
+            server_default=CheckpointStatus.AWAITING_INPUT.value,
+            nullable=False,
+        ),
+    )
+    expires_at: datetime = Field(
+        sa_column=Column(DateTime(timezone=True), nullable=False),
+    )
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(UTC),
+        sa_column=Column(DateTime(timezone=True), nullable=False),
+    )
+    resolved_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=True),
+    )
+
+    __table_args__ = (
+        Index("ix_run_checkpoint_run_id_status", "run_id", "status"),
+        Index("ix_run_checkpoint_status_expires_at", "status", "expires_at"),
+    )
+
+
+class RunQueueEntry(SQLModel, table=True):
+    """A PENDING run waiting for, or leased by, a worker to execute it.
+
+    A lease is held while `leased_until` is in the future; an expired lease
+    makes the entry claimable again. The entry is removed once the run's
+    execution ends.
+    """
+
+    __tablename__ = "run_queue"
+
+    run_id: UUID = Field(
+        sa_column=Column(
+            ForeignKey("run.id", ondelete="CASCADE"), primary_key=True, nullable=False
+        )
+    )
+    available_at: datetime = Field(
+        default_factory=lambda: datetime.now(UTC),
+        sa_column=Column(DateTime(timezone=True), nullable=False),
+    )
+    attempts: int = 0
+    lease_owner: str | None = None
+    leased_until: datetime | None = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=True),
+    )
+
+    __table_args__ = (Index("ix_run_queue_available_at", "available_at"),)
+
 
 # API models
 class UserCreate(PydanticBaseModel):
@@ -303,6 +474,27 @@ class FlowListResponse(PydanticBaseModel):
 class RunCreate(PydanticBaseModel):
     model_config = ConfigDict(from_attributes=True)
     flow_id: UUID
+    input_payload: dict[str, Any] | None = None
+    priority: RunPriority | None = PydField(
+        default=None,
+        description=(
+            "Scheduling class; defaults to interactive, or to normal with "
+            "`Prefer: respond-async`"
+        ),
+    )
+
+
+class RunBatchCreate(PydanticBaseModel):
+    """Runs of one flow submitted together, one per input payload."""
+
+    flow_id: UUID
+    inputs: list[dict[str, Any]] = PydField(min_length=1, max_length=MAX_RUN_BATCH_SIZE)
+    priority: RunPriority = RunPriority.BULK
+
+
+class RunBatchCreateResponse(PydanticBaseModel):
+    count: int
+    run_ids: list[UUID]
 
 
 class RunRead(PydanticBaseModel):
@@ -311,6 +503,7 @@ class RunRead(PydanticBaseModel):
     flow_id: UUID
     user_id: UUID
     status: RunStatus
+    priority: RunPriority
     started_at: datetime | None = None
     ended_at: datetime | None = None
     error: str | None = None
@@ -319,12 +512,40 @@ class RunRead(PydanticBaseModel):
     updated_at: datetime
 
 
+class RunEventSummaryRead(PydanticBaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    event_counts: dict[str, int]
+    event_count: int
+    first_event_at: datetime | None = None
+    last_event_at: datetime | None = None
+    last_error: str | None = None
+
+
+class RunListItem(RunRead):
+    event_summary: RunEventSummaryRead | None = None
+
+
+class RunStatsGroup(PydanticBaseModel):
+    model_config = ConfigDict(use_enum_values=True)
+    status: RunStatus
+    flow_id: UUID | None = None
+    bucket: datetime | None = None
+    count: int
+
+
+class RunStatsRead(PydanticBaseModel):
+    total: int
+    groups: list[RunStatsGroup]
+    generated_at: datetime
+
+
 class RunCreateResponse(PydanticBaseModel):
     model_config = ConfigDict(from_attributes=True, use_enum_values=True)
     id: UUID
     flow_id: UUID
     user_id: UUID
     status: RunStatus
+    priority: RunPriority
     started_at: datetime | None = None
     ended_at: datetime | None = None
     error: str | None = None
@@ -393,6 +614,19 @@ class EventCreate(PydanticBaseModel):
     payload: dict = PydField(default_factory=dict)
 
 
+class EventBatchItem(PydanticBaseModel):
+    """An event appended through the bulk ingestion endpoint."""
+
+    type: EventType
+    message: str | None = None
+    payload: dict = PydField(default_factory=dict)
+
+
+class EventBatchCreateResponse(PydanticBaseModel):
+    count: int
+    event_ids: list[UUID]
+
+
 class EventRead(PydanticBaseModel):
     model_config = ConfigDict(from_attributes=True, use_enum_values=True)
     id: UUID
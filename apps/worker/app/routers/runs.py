@@ -1,35 +1,82 @@
+import asyncio
 import logging
+import math
+from datetime import datetime
 from http import HTTPStatus
+from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+)
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
+from pydantic import Field, TypeAdapter, ValidationError
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.constants import MAX_RUN_LIST_LIMIT
+from app.config import settings
+from app.constants import (
+    DEFAULT_EVENT_PAGE_LIMIT,
+    MAX_EVENT_BATCH_SIZE,
+    MAX_EVENT_PAGE_LIMIT,
+    MAX_RUN_LIST_LIMIT,
+    PREFER_RESPOND_ASYNC,
+)
 from app.db import get_db_session
-from app.dependencies import get_run_scheduler
+from app.dependencies import get_run_scheduler, get_steel_session_pool
 from app.models import (
+    TERMINAL_RUN_STATUSES,
+    EventBatchCreateResponse,
+    EventBatchItem,
     EventRead,
+    EventType,
+    Run,
+    RunBatchCreate,
+    RunBatchCreateResponse,
     RunContinue,
     RunCreate,
     RunCreateResponse,
+    RunListItem,
+    RunPriority,
     RunRead,
+    RunStatsBucket,
+    RunStatsRead,
+    RunStatus,
     RunUpdate,
     SessionRead,
     User,
     UserRole,
 )
+from app.runtime.admission import AdmissionTicket
+from app.runtime.engine.redaction import get_redaction_policy
 from app.runtime.scheduler import RunScheduler
+from app.services.event.broadcaster import event_broadcaster
+from app.services.event.export import (
+    GZIP_MEDIA_TYPE,
+    NDJSON_MEDIA_TYPE,
+    iter_event_ndjson,
+)
+from app.services.event.service import EventService
+from app.services.event.stream import RunEventStream
 from app.services.flow.errors import FlowAccessDeniedError, FlowNotFoundError
 from app.services.run.errors import (
     MissingSessionURLError,
+    RunAlreadyFinishedError,
     RunFinalizationError,
     SessionCreationFailedError,
 )
 from app.services.run.service import RunService
 from app.utils.auth import get_current_user
-from app.utils.run import ensure_run_access
+from app.utils.etag import etag_matches
+from app.utils.pagination import NEXT_CURSOR_HEADER, InvalidCursorError
+from app.utils.run import ensure_run_access, ensure_run_etag_access
 
 db_dependency = Depends(get_db_session)
 current_user_dependency = Depends(get_current_user)
@@ -39,35 +86,126 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Validates a whole ingestion batch straight from the JSON body in one pass
+event_batch_adapter = TypeAdapter(
+    Annotated[
+        list[EventBatchItem], Field(min_length=1, max_length=MAX_EVENT_BATCH_SIZE)
+    ]
+)
+
+
+def _prefers_respond_async(prefer: str | None) -> bool:
+    """Check a `Prefer` header for the `respond-async` preference."""
+    if not prefer:
+        return False
+    return any(
+        token.split(";", 1)[0].strip().lower() == PREFER_RESPOND_ASYNC
+        for token in prefer.split(",")
+    )
+
+
+def _run_create_response(run: Run, session_url: str | None) -> RunCreateResponse:
+    return RunCreateResponse(
+        id=run.id,
+        flow_id=run.flow_id,
+        user_id=run.user_id,
+        status=run.status,
+        priority=run.priority,
+        started_at=run.started_at,
+        ended_at=run.ended_at,
+        error=run.error,
+        created_at=run.created_at,
+        updated_at=run.updated_at,
+        session_url=session_url,
+    )
 
-@router.post("/runs", response_model=RunCreateResponse, status_code=HTTPStatus.CREATED)
-async def create_run(
+
+async def _admit_or_unavailable(
+    scheduler: RunScheduler, request: RunCreate, user: User
+) -> AdmissionTicket | None:
+    """Wait for a concurrency slot, or raise 503 once the wait times out."""
+    timeout = settings.run_admission_timeout_seconds
+    try:
+        async with asyncio.timeout(timeout):
+            return await scheduler.admit(
+                user.id, request.flow_id, request.priority or RunPriority.INTERACTIVE
+            )
+    except TimeoutError as e:
+        raise HTTPException(
+            status_code=HTTPStatus.SERVICE_UNAVAILABLE,
+            detail="Run concurrency limit reached; retry later or create the "
+            "run with Prefer: respond-async",
+            headers={"Retry-After": str(math.ceil(timeout))},
+        ) from e
+
+
+@router.post(
+    "/runs",
+    response_model=RunCreateResponse,
+    status_code=HTTPStatus.CREATED,
+    responses={
+        HTTPStatus.ACCEPTED: {
+            "model": RunCreateResponse,
+            "description": (
+                "Run accepted as pending (`Prefer: respond-async`, or always "
+                "with `ENGINE_MODE=remote`); the browser session is provisioned "
+                "in the background"
+            ),
+        },
+        HTTPStatus.SERVICE_UNAVAILABLE: {
+            "description": "No concurrency slot freed up in time; see `Retry-After`"
+        },
+    },
+)
+async def create_run(  # noqa: PLR0913
     request: RunCreate,
+    http_request: Request,
+    response: Response,
+    *,
+    prefer: Annotated[str | None, Header()] = None,
     current_user: User = current_user_dependency,
     session: AsyncSession = db_dependency,
     scheduler: RunScheduler = scheduler_dependency,
 ):
-    """Create a new run, init browser session, start flow exec, return run."""
-    service = RunService()
+    """Create a new run, init browser session, start flow exec, return run.
+
+    With `Prefer: respond-async`, or when runs are admitted by engine
+    workers (`ENGINE_MODE=remote`), the run is returned as PENDING with 202
+    and its browser session is provisioned in the background once admitted.
+    Otherwise the run waits up to `RUN_ADMISSION_TIMEOUT_SECONDS` for a
+    concurrency slot, and 503 with `Retry-After` is returned when none frees
+    up.
+    """
+    service = RunService(steel_pool=get_steel_session_pool())
     try:
-        run, session_url = await service.create_run_with_user(
-            request, current_user, session
-        )
+        respond_async = _prefers_respond_async(prefer)
+        if respond_async or not scheduler.admits_locally:
+            run = await service.create_pending_run(
+                request, current_user, session, queued=scheduler.queued
+            )
+            scheduler.provision(run, service)
+            response.status_code = HTTPStatus.ACCEPTED
+            if respond_async:
+                response.headers["Preference-Applied"] = PREFER_RESPOND_ASYNC
+            response.headers["Location"] = str(
+                http_request.url_for("get_run", run_id=str(run.id))
+            )
+            return _run_create_response(run, None)
 
-        await scheduler.schedule(run, input_payload={})
-
-        return RunCreateResponse(
-            id=run.id,
-            flow_id=run.flow_id,
-            user_id=run.user_id,
-            status=run.status,
-            started_at=run.started_at,
-            ended_at=run.ended_at,
-            error=run.error,
-            created_at=run.created_at,
-            updated_at=run.updated_at,
-            session_url=session_url,
-        )
+        # Give back the connection used for authentication while waiting
+        await session.commit()
+        admission = await _admit_or_unavailable(scheduler, request, current_user)
+        try:
+            run, session_url = await service.create_run_with_user(
+                request, current_user, session
+            )
+        except BaseException:
+            scheduler.release(admission)
+            raise
+
+        await scheduler.schedule(run, admission=admission)
+
+        return _run_create_response(run, session_url)
     except FlowNotFoundError as e:
         raise HTTPException(
             status_code=HTTPStatus.BAD_REQUEST,
@@ -106,57 +244,312 @@ async def create_run(
         ) from e
 
 
-@router.get("/runs/{run_id}", response_model=RunRead)
+@router.post(
+    "/runs:batch",
+    response_model=RunBatchCreateResponse,
+    status_code=HTTPStatus.ACCEPTED,
+)
+async def create_runs_batch(
+    request: RunBatchCreate,
+    current_user: User = current_user_dependency,
+    session: AsyncSession = db_dependency,
+    scheduler: RunScheduler = scheduler_dependency,
+):
+    """Create one PENDING run per input payload and provision them in background.
+
+    Flow access is checked once and all runs are inserted in one statement;
+    browser sessions are provisioned with bounded concurrency.
+    """
+    service = RunService(steel_pool=get_steel_session_pool())
+    try:
+        runs = await service.create_pending_runs(
+            request.flow_id,
+            request.inputs,
+            current_user,
+            session,
+            queued=scheduler.queued,
+            priority=request.priority,
+        )
+    except FlowNotFoundError as e:
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST,
+            detail=str(e),
+        ) from e
+    except FlowAccessDeniedError as e:
+        logger.info("Access denied to flow: %s", str(e))
+        raise HTTPException(
+            status_code=HTTPStatus.FORBIDDEN,
+            detail="Access denied to flow",
+        ) from e
+    scheduler.provision_many(runs, service)
+    return RunBatchCreateResponse(count=len(runs), run_ids=[run.id for run in runs])
+
+
+@router.get("/runs/stats", response_model=RunStatsRead)
+async def get_run_stats(  # noqa: PLR0913
+    *,
+    all_users: bool = Query(
+        default=False, description="Count every user's runs (admin only)"
+    ),
+    group_by_flow: bool = False,
+    bucket: RunStatsBucket | None = None,
+    since: Annotated[
+        datetime | None, Query(description="Runs created at/after")
+    ] = None,
+    until: Annotated[datetime | None, Query(description="Runs created before")] = None,
+    current_user: User = current_user_dependency,
+    session: AsyncSession = db_dependency,
+):
+    """Count runs per status, optionally per flow and per hour/day bucket.
+
+    Counts cover the current user's runs, or every run with `all_users` for
+    admins. Results may be up to a few seconds old; `generated_at` tells
+    when they were computed.
+    """
+    if all_users and current_user.role != UserRole.ADMIN:
+        raise HTTPException(
+            status_code=HTTPStatus.FORBIDDEN,
+            detail="Only administrators can view stats for all users",
+        )
+    return await RunService().get_run_stats(
+        session,
+        user_id=None if all_users else current_user.id,
+        group_by_flow=group_by_flow,
+        bucket=bucket,
+        since=since,
+        until=until,
+    )
+
+
+def _not_modified(etag: str) -> Response:
+    return Response(status_code=HTTPStatus.NOT_MODIFIED, headers={"ETag": etag})
+
+
+@router.get(
+    "/runs/{run_id}",
+    response_model=RunRead,
+    responses={HTTPStatus.NOT_MODIFIED: {"description": "Run unchanged"}},
+)
 async def get_run(
     run_id: UUID,
+    response: Response,
+    *,
+    if_none_match: Annotated[str | None, Header()] = None,
     current_user: User = current_user_dependency,
     session: AsyncSession = db_dependency,
 ):
-    """Get details of a specific run by ID."""
+    """Get details of a specific run by ID.
+
+    The response carries a weak `ETag`; a matching `If-None-Match` returns
+    304 after a single projection query, without loading the run.
+    """
     service = RunService()
-    return await ensure_run_access(run_id, current_user, session, service)
+    run_etag = await ensure_run_etag_access(run_id, current_user, session, service)
+    if etag_matches(if_none_match, run_etag.etag):
+        return _not_modified(run_etag.etag)
+    response.headers["ETag"] = run_etag.etag
+    return await service.get_run(run_id, session)
 
 
-@router.get("/runs", response_model=list[RunRead])
-async def list_runs(
-    skip: int = Query(0, ge=0, le=1_000_000),
+@router.get("/runs", response_model=list[RunListItem])
+async def list_runs(  # noqa: PLR0913
+    response: Response,
+    *,
+    cursor: str | None = Query(None, description="Opaque cursor from X-Next-Cursor"),
+    status: Annotated[list[RunStatus] | None, Query()] = None,
+    flow_id: UUID | None = None,
+    skip: int = Query(
+        0,
+        ge=0,
+        le=1_000_000,
+        deprecated=True,
+        description="Offset fallback; use `cursor` instead",
+    ),
     limit: int = Query(100, ge=1, le=MAX_RUN_LIST_LIMIT),
     current_user: User = current_user_dependency,
     session: AsyncSession = db_dependency,
 ):
-    """List runs with pagination. Regular users see only their runs, admins see all."""
-    service = RunService()
+    """List runs, newest first. Regular users see only their runs, admins see all.
 
-    # Filter runs based on user role
-    if current_user.role == UserRole.ADMIN:
-        # Admins can see all runs
-        return await service.list_runs(session, skip, limit)
-    # Regular users can only see their own runs
-    return await service.list_runs_for_user(current_user.id, session, skip, limit)
+    Each run carries its event summary (counts per type, first/last event
+    time and last error). When more runs are available the `X-Next-Cursor`
+    response header holds the cursor for the next page.
+    """
+    if cursor and skip:
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST,
+            detail="Use either cursor or skip, not both",
+        )
+    service = RunService()
+    try:
+        runs, next_cursor = await service.list_runs_page(
+            session,
+            # Admins can see all runs, regular users only their own
+            user_id=None if current_user.role == UserRole.ADMIN else current_user.id,
+            cursor=cursor,
+            statuses=status,
+            flow_id=flow_id,
+            skip=skip,
+            limit=limit,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e)) from e
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return await service.with_event_summaries(runs, session)
 
 
-@router.get("/runs/{run_id}/sessions", response_model=list[SessionRead])
+@router.get(
+    "/runs/{run_id}/sessions",
+    response_model=list[SessionRead],
+    responses={HTTPStatus.NOT_MODIFIED: {"description": "Sessions unchanged"}},
+)
 async def get_run_sessions(
     run_id: UUID,
+    response: Response,
+    *,
+    if_none_match: Annotated[str | None, Header()] = None,
     current_user: User = current_user_dependency,
     session: AsyncSession = db_dependency,
 ):
-    """Get all sessions for a specific run."""
+    """Get all sessions for a specific run.
+
+    The response carries a weak `ETag`; a matching `If-None-Match` returns
+    304 without loading the sessions.
+    """
     service = RunService()
-    await ensure_run_access(run_id, current_user, session, service)
+    await ensure_run_etag_access(run_id, current_user, session, service)
+    etag = await service.get_run_sessions_etag(run_id, session)
+    if etag_matches(if_none_match, etag):
+        return _not_modified(etag)
+    response.headers["ETag"] = etag
     return await service.get_run_sessions(run_id, session)
 
 
 @router.get("/runs/{run_id}/events", response_model=list[EventRead])
-async def get_run_events(
+async def get_run_events(  # noqa: PLR0913
+    run_id: UUID,
+    response: Response,
+    *,
+    cursor: str | None = Query(None, description="Opaque cursor from X-Next-Cursor"),
+    event_type: Annotated[list[EventType] | None, Query(alias="type")] = None,
+    since: Annotated[datetime | None, Query(description="Events at/after")] = None,
+    limit: int = Query(DEFAULT_EVENT_PAGE_LIMIT, ge=1, le=MAX_EVENT_PAGE_LIMIT),
+    current_user: User = current_user_dependency,
+    session: AsyncSession = db_dependency,
+):
+    """Get a page of events for a run, oldest first.
+
+    When more events are available the `X-Next-Cursor` response header holds
+    the cursor for the next page.
+    """
+    service = RunService()
+    await ensure_run_access(run_id, current_user, session, service)
+    try:
+        events, next_cursor = await service.get_run_events(
+            run_id,
+            session,
+            cursor=cursor,
+            event_types=event_type,
+            since=since,
+            limit=limit,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e)) from e
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return events
+
+
+@router.post(
+    "/runs/{run_id}/events:batch",
+    response_model=EventBatchCreateResponse,
+    status_code=HTTPStatus.CREATED,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {"schema": event_batch_adapter.json_schema()}
+            },
+        }
+    },
+)
+async def create_run_events_batch(
+    run_id: UUID,
+    http_request: Request,
+    current_user: User = current_user_dependency,
+    session: AsyncSession = db_dependency,
+):
+    """Append a batch of events to a run, preserving their order.
+
+    Intended for agents running outside the worker. Events are redacted with
+    the engine's rules and inserted with a single statement.
+    """
+    await ensure_run_access(run_id, current_user, session, RunService())
+    try:
+        items = event_batch_adapter.validate_json(await http_request.body())
+    except ValidationError as e:
+        raise RequestValidationError(e.errors(include_url=False)) from e
+    events = await EventService().create_events(
+        run_id, items, session, redaction=get_redaction_policy()
+    )
+    for event in events:
+        event_broadcaster.publish(event)
+    return EventBatchCreateResponse(
+        count=len(events), event_ids=[event.id for event in events]
+    )
+
+
+@router.get("/runs/{run_id}/events/stream")
+async def stream_run_events(
+    run_id: UUID,
+    last_event_id: Annotated[str | None, Header()] = None,
+    current_user: User = current_user_dependency,
+    session: AsyncSession = db_dependency,
+):
+    """Stream a run's events as Server-Sent Events.
+
+    Events after `Last-Event-ID` are replayed first, then new events are
+    pushed as they are persisted. The stream closes once the run reaches a
+    terminal status.
+    """
+    service = RunService()
+    await ensure_run_access(run_id, current_user, session, service)
+    try:
+        stream = RunEventStream(run_id, last_event_id=last_event_id)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e)) from e
+    return StreamingResponse(
+        stream,
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
+@router.get("/runs/{run_id}/events/export")
+async def export_run_events(
     run_id: UUID,
+    gzip: bool = False,  # noqa: FBT001, FBT002
     current_user: User = current_user_dependency,
     session: AsyncSession = db_dependency,
 ):
-    """Get all events for a specific run."""
+    """Export a run's full event history as NDJSON, optionally gzip-compressed.
+
+    Events are read in `(at, id)` order a chunk at a time by keyset, each
+    chunk in its own short transaction, so memory use does not grow with
+    the size of the run and a slow client holds no transaction open.
+    """
     service = RunService()
     await ensure_run_access(run_id, current_user, session, service)
-    return await service.get_run_events(run_id, session)
+    filename = f"run-{run_id}-events.ndjson" + (".gz" if gzip else "")
+    return StreamingResponse(
+        iter_event_ndjson(run_id, gzip=gzip),
+        media_type=GZIP_MEDIA_TYPE if gzip else NDJSON_MEDIA_TYPE,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
 
 
 @router.patch("/runs/{run_id}", response_model=RunRead)
@@ -177,17 +570,51 @@ async def update_run(
         raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e)) from e
 
 
+@router.post("/runs/{run_id}/cancel", response_model=RunRead)
+async def cancel_run(
+    run_id: UUID,
+    current_user: User = current_user_dependency,
+    session: AsyncSession = db_dependency,
+    scheduler: RunScheduler = scheduler_dependency,
+):
+    """Cancel a run, releasing its agent and browser session.
+
+    Works for running, paused and pending runs; canceling a canceled run is
+    a no-op and canceling a completed or failed run returns 409.
+    """
+    service = RunService()
+    run = await ensure_run_access(run_id, current_user, session, service)
+    if run.status in TERMINAL_RUN_STATUSES and run.status != RunStatus.CANCELED:
+        raise HTTPException(
+            status_code=HTTPStatus.CONFLICT,
+            detail=f"Run already finished with status {run.status.value}",
+        )
+    await scheduler.cancel(run_id)
+    try:
+        return await service.cancel_run(run_id, session)
+    except RunAlreadyFinishedError as e:
+        raise HTTPException(status_code=HTTPStatus.CONFLICT, detail=str(e)) from e
+
+
 @router.post("/runs/{run_id}/continue", response_model=RunRead)
 async def continue_run(
     run_id: UUID,
     request: RunContinue,
     current_user: User = current_user_dependency,
     session: AsyncSession = db_dependency,
+    scheduler: RunScheduler = scheduler_dependency,
 ):
-    """Continue a run that is awaiting input."""
+    """Continue a run that is awaiting input.
+
+    The run is signalled directly when it is paused in this process or an
+    engine worker; otherwise the worker holding it finds it continued in
+    the DB.
+    """
     service = RunService()
     await ensure_run_access(run_id, current_user, session, service)
     try:
-        return await service.continue_run(run_id, request, session)
+        run = await service.continue_run(run_id, request, session)
     except ValueError as e:
         raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e)) from e
+    await scheduler.resume(run_id, request.input_payload)
+    return run
@@ -0,0 +1,262 @@
+"""Concurrency limits for run execution, with fair queuing across users."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import time
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from app.config import DEFAULT_RUN_PRIORITY_AGING_SECONDS
+from app.models import RunPriority
+
+logger = logging.getLogger(__name__)
+
+LIMIT_GLOBAL = "global"
+LIMIT_USER = "user"
+LIMIT_FLOW = "flow"
+
+# Admission order of priority classes, most urgent first
+PRIORITY_RANKS = {
+    RunPriority.INTERACTIVE: 0,
+    RunPriority.NORMAL: 1,
+    RunPriority.BULK: 2,
+}
+
+
+@dataclass(eq=False)
+class AdmissionTicket:
+    """A slot held by one admitted run until its execution ends."""
+
+    user_id: UUID
+    flow_id: UUID
+    priority: RunPriority = RunPriority.NORMAL
+    waited: float = 0.0
+    released: bool = False
+
+
+@dataclass(eq=False)
+class _Waiter:
+    finish: float
+    seq: int
+    user_id: UUID
+    flow_id: UUID
+    priority: RunPriority
+    start: float
+    enqueued_at: float
+    future: asyncio.Future
+
+
+@dataclass
+class AdmissionStats:
+    """Counters describing admission decisions and time spent waiting."""
+
+    admitted: int = 0
+    queued: int = 0
+    abandoned: int = 0
+    blocked: Counter = field(default_factory=Counter)
+    admitted_by_priority: Counter = field(default_factory=Counter)
+    aged: int = 0
+    wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    @property
+    def avg_wait_seconds(self) -> float:
+        return self.wait_seconds / self.queued if self.queued else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "abandoned": self.abandoned,
+            "blocked": dict(self.blocked),
+            "admitted_by_priority": dict(self.admitted_by_priority),
+            "aged": self.aged,
+            "wait_seconds": round(self.wait_seconds, 4),
+            "avg_wait_seconds": round(self.avg_wait_seconds, 4),
+            "max_wait_seconds": round(self.max_wait_seconds, 4),
+        }
+
+
+class AdmissionController:
+    """Caps runs executing at once globally, per user and per flow.
+
+    A run must be admitted before its browser session is provisioned and
+    holds its slot until its execution ends. Runs over a limit wait, and
+    freed slots go to waiting runs in weighted fair queuing order: each
+    user's runs get consecutive virtual finish tags starting from the
+    current virtual time, so a user who queued 500 runs is served in turn
+    with a user who queued one instead of ahead of them. A waiting run
+    blocked only by its own user or flow limit does not hold back others.
+    A limit of 0 disables it.
+
+    Fair order applies within a priority class: waiting interactive runs
+    are admitted before normal ones, and normal before bulk. Every `aging`
+    seconds a run waits it is ranked one class higher, so bulk work still
+    gets through while interactive runs keep arriving.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_runs: int = 0,
+        max_runs_per_user: int = 0,
+        max_runs_per_flow: int = 0,
+        aging: float = DEFAULT_RUN_PRIORITY_AGING_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_runs = max_runs
+        self.max_runs_per_user = max_runs_per_user
+        self.max_runs_per_flow = max_runs_per_flow
+        self.aging = aging
+        self.stats = AdmissionStats()
+        self._clock = clock
+        self._running = 0
+        self._running_per_user: Counter[UUID] = Counter()
+        self._running_per_flow: Counter[UUID] = Counter()
+        # Waiting runs in arrival order
+        self._waiters: list[_Waiter] = []
+        self._virtual_time = 0.0
+        self._last_finish: dict[UUID, float] = {}
+        self._seq = itertools.count()
+
+    @property
+    def running(self) -> int:
+        return self._running
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    def queue_depths(self) -> dict[UUID, int]:
+        """Number of waiting runs per user."""
+        return dict(Counter(waiter.user_id for waiter in self._waiters))
+
+    async def acquire(
+        self,
+        user_id: UUID,
+        flow_id: UUID,
+        priority: RunPriority = RunPriority.NORMAL,
+    ) -> AdmissionTicket:
+        """Wait until a `priority` run of `flow_id` for `user_id` may execute."""
+        start = max(self._virtual_time, self._last_finish.get(user_id, 0.0))
+        finish = start + 1.0
+        self._last_finish[user_id] = finish
+        blocked = self._blocked_by(user_id, flow_id)
+        if blocked is None:
+            return self._admit(
+                AdmissionTicket(user_id=user_id, flow_id=flow_id, priority=priority),
+                start,
+            )
+
+        self.stats.queued += 1
+        self.stats.blocked[blocked] += 1
+        waiter = _Waiter(
+            finish=finish,
+            seq=next(self._seq),
+            user_id=user_id,
+            flow_id=flow_id,
+            priority=priority,
+            start=start,
+            enqueued_at=self._clock(),
+            future=asyncio.get_running_loop().create_future(),
+        )
+        self._waiters.append(waiter)
+        logger.debug(
+            "%s run for user %s queued for admission (%s limit reached, %d waiting)",
+            priority.value.capitalize(),
+            user_id,
+            blocked,
+            len(self._waiters),
+        )
+        try:
+            return await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Admitted just as the caller gave up
+                self.release(waiter.future.result())
+            else:
+                self._waiters.remove(waiter)
+                self.stats.abandoned += 1
+            raise
+
+    def release(self, ticket: AdmissionTicket) -> None:
+        """Free the ticket's slot and admit waiting runs that now fit."""
+        if ticket.released:
+            return
+        ticket.released = True
+        self._running -= 1
+        _decrement(self._running_per_user, ticket.user_id)
+        _decrement(self._running_per_flow, ticket.flow_id)
+        self._admit_waiting()
+        if (
+            ticket.user_id not in self._running_per_user
+            and self._last_finish.get(ticket.user_id, 0.0) <= self._virtual_time
+        ):
+            # A tag at or behind virtual time no longer affects ordering
+            self._last_finish.pop(ticket.user_id, None)
+
+    def _admit_waiting(self) -> None:
+        if not self._waiters:
+            return
+        now = self._clock()
+        ranked = sorted(
+            (self._rank(waiter, now), waiter.finish, waiter.seq, waiter)
+            for waiter in self._waiters
+        )
+        for rank, _, _, waiter in ranked:
+            if self.max_runs and self._running >= self.max_runs:
+                return
+            if self._blocked_by(waiter.user_id, waiter.flow_id) is not None:
+                continue
+            self._waiters.remove(waiter)
+            if rank < PRIORITY_RANKS[waiter.priority]:
+                self.stats.aged += 1
+            waited = now - waiter.enqueued_at
+            self.stats.wait_seconds += waited
+            self.stats.max_wait_seconds = max(self.stats.max_wait_seconds, waited)
+            ticket = AdmissionTicket(
+                user_id=waiter.user_id,
+                flow_id=waiter.flow_id,
+                priority=waiter.priority,
+                waited=waited,
+            )
+            waiter.future.set_result(self._admit(ticket, waiter.start))
+
+    def _rank(self, waiter: _Waiter, now: float) -> int:
+        promotions = int((now - waiter.enqueued_at) // self.aging)
+        return max(0, PRIORITY_RANKS[waiter.priority] - promotions)
+
+    def _admit(self, ticket: AdmissionTicket, start: float) -> AdmissionTicket:
+        self._virtual_time = max(self._virtual_time, start)
+        self._running += 1
+        self._running_per_user[ticket.user_id] += 1
+        self._running_per_flow[ticket.flow_id] += 1
+        self.stats.admitted += 1
+        self.stats.admitted_by_priority[ticket.priority.value] += 1
+        return ticket
+
+    def _blocked_by(self, user_id: UUID, flow_id: UUID) -> str | None:
+        if self.max_runs and self._running >= self.max_runs:
+            return LIMIT_GLOBAL
+        if (
+            self.max_runs_per_user
+            and self._running_per_user[user_id] >= self.max_runs_per_user
+        ):
+            return LIMIT_USER
+        if (
+            self.max_runs_per_flow
+            and self._running_per_flow[flow_id] >= self.max_runs_per_flow
+        ):
+            return LIMIT_FLOW
+        return None
+
+
+def _decrement(counter: Counter, key: UUID) -> None:
+    counter[key] -= 1
+    if counter[key] <= 0:
+        del counter[key]
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import itertools
 import logging
 from collections.abc import Awaitable
 from typing import Any
@@ -16,6 +17,12 @@ class RunnerCoordinator:
         self._events: dict[UUID, asyncio.Event] = {}
         self._latest_inputs: dict[UUID, dict[str, Any]] = {}
         self._tasks: dict[UUID, asyncio.Task] = {}
+        self._cancel_requested: set[UUID] = set()
+        # Runs whose task is recording its outcome and releasing resources
+        self._finishing: set[UUID] = set()
+        # Runs paused in `await_resume`, each with a token for that wait
+        self._waiting: dict[UUID, int] = {}
+        self._wait_tokens = itertools.count()
 
     def _get_event(self, run_id: UUID) -> asyncio.Event:
         evt = self._events.get(run_id)
@@ -42,11 +49,16 @@ class RunnerCoordinator:
         Returns True if resumed, False if timeout.
         """
         evt = self._get_event(run_id)
+        token = next(self._wait_tokens)
+        self._waiting[run_id] = token
         try:
             await asyncio.wait_for(evt.wait(), timeout=timeout_s)
             evt.clear()
         except TimeoutError:
             return False
+        finally:
+            if self._waiting.get(run_id) == token:
+                del self._waiting[run_id]
         return True
 
     def resume(self, run_id: UUID, input_payload: dict[str, Any] | None = None) -> None:
@@ -55,9 +67,63 @@ class RunnerCoordinator:
             self._latest_inputs[run_id] = input_payload
         self._get_event(run_id).set()
 
+    def waiting_runs(self) -> dict[UUID, int]:
+        """Runs paused awaiting resume, with a token identifying each wait."""
+        return dict(self._waiting)
+
+    def resume_waiting(
+        self, run_id: UUID, token: int, input_payload: dict[str, Any] | None = None
+    ) -> bool:
+        """Resume a run only if it is still in the wait `token` was taken from.
+
+        Guards against a stale resume reaching a later checkpoint of the run.
+        """
+        if self._waiting.get(run_id) != token:
+            return False
+        self.resume(run_id, input_payload)
+        return True
+
+    async def cancel(self, run_id: UUID, timeout_s: float) -> bool:
+        """Cancel a run's task and wait up to `timeout_s` for it to wind down.
+
+        A task already finishing, or already being canceled, is waited for
+        without being interrupted. Returns False if the run has no active
+        task.
+        """
+        task = self._tasks.get(run_id)
+        if task is None or task.done():
+            return False
+        if not self.finishing(run_id):
+            self._cancel_requested.add(run_id)
+            task.cancel()
+        _, pending = await asyncio.wait({task}, timeout=timeout_s)
+        if pending:
+            logger.warning("Run %s task still winding down after cancel", run_id)
+        return True
+
+    def cancel_requested(self, run_id: UUID) -> bool:
+        """Whether the run's task is being canceled through `cancel`.
+
+        Distinguishes a requested cancellation from tasks torn down with
+        their event loop, e.g. at shutdown.
+        """
+        return run_id in self._cancel_requested
+
+    def mark_finishing(self, run_id: UUID) -> None:
+        """Keep `cancel` from interrupting a run that is winding down."""
+        self._finishing.add(run_id)
+
+    def finishing(self, run_id: UUID) -> bool:
+        """Whether the run's task is winding down or being canceled."""
+        return run_id in self._finishing or run_id in self._cancel_requested
+
     def latest_input(self, run_id: UUID) -> dict[str, Any] | None:
         return self._latest_inputs.get(run_id)
 
+    def active_run_ids(self) -> list[UUID]:
+        """Ids of runs whose task is still executing in this process."""
+        return [run_id for run_id, task in self._tasks.items() if not task.done()]
+
     def has_task(self, run_id: UUID) -> bool:
         return run_id in self._tasks
 
@@ -68,6 +134,9 @@ class RunnerCoordinator:
         """Remove stored state for a finished run."""
         self._events.pop(run_id, None)
         self._latest_inputs.pop(run_id, None)
+        self._cancel_requested.discard(run_id)
+        self._finishing.discard(run_id)
+        self._waiting.pop(run_id, None)
         task = self._tasks.pop(run_id, None)
         if task is not None and not task.done():
             current = asyncio.current_task()
@@ -9,47 +9,56 @@ from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import Event, EventType
+from app.models import EventCreate, EventRead, EventType
 from app.runtime.core import RunContext
+from app.runtime.engine.redaction import RedactionPolicy, get_redaction_policy
+from app.services.event.broadcaster import EventBroadcaster, event_broadcaster
+from app.services.event.repository import build_event_row
 from app.services.event.service import EventService
+from app.services.event.sink import EventSink
 
 logger = logging.getLogger(__name__)
 
 
-def _redact(obj: Any) -> Any:
-    sensitive = {
-        "api_key",
-        "apikey",
-        "password",
-        "secret",
-        "token",
-        "authorization",
-        "cookie",
-        "set-cookie",
-    }
-    if isinstance(obj, dict):
-        return {
-            k: ("***" if k.lower() in sensitive else _redact(v)) for k, v in obj.items()
-        }
-    if isinstance(obj, list):
-        return [_redact(v) for v in obj]
-    return obj
+class EventEmitter:
+    """Emits events during flow execution.
 
+    When an `EventSink` is provided, events are buffered and written in
+    batches. Status transitions and checkpoints force a flush so the events
+    that drive run state are durable before execution moves on.
 
-class EventEmitter:
-    """Emits events during flow execution."""
+    Messages and payloads are masked by the redaction policy, except for
+    the fixed-shape payloads built here from engine-owned values, which are
+    emitted as trusted and skip the traversal.
+    """
 
     def __init__(
         self,
         session: AsyncSession,
         event_service: EventService,
+        sink: EventSink | None = None,
+        broadcaster: EventBroadcaster | None = None,
+        redaction: RedactionPolicy | None = None,
     ) -> None:
         self.session = session
         self.event_service = event_service
+        self.sink = sink
+        self.broadcaster = broadcaster or event_broadcaster
+        self.redaction = redaction or get_redaction_policy()
+
+    async def flush(self) -> None:
+        """Persist any buffered events."""
+        if self.sink is not None:
+            await self.sink.flush()
 
     async def emit_run_started(self, context: RunContext) -> None:
         await self._emit_event(
-            context.run_id, EventType.STATUS, "run_started", {"status": "running"}
+            context.run_id,
+            EventType.STATUS,
+            "run_started",
+            {"status": "running"},
+            flush=True,
+            trusted=True,
         )
 
     async def emit_run_completed(self, context: RunContext) -> None:
@@ -58,6 +67,8 @@ class EventEmitter:
             EventType.STATUS,
             "run_completed",
             {"status": "completed"},
+            flush=True,
+            trusted=True,
         )
 
     async def emit_run_failed(self, context: RunContext, error: str) -> None:
@@ -66,6 +77,17 @@ class EventEmitter:
             EventType.ERROR,
             "run_failed",
             {"status": "failed", "error": error},
+            flush=True,
+        )
+
+    async def emit_run_canceled(self, context: RunContext) -> None:
+        await self._emit_event(
+            context.run_id,
+            EventType.STATUS,
+            "run_canceled",
+            {"status": "canceled"},
+            flush=True,
+            trusted=True,
         )
 
     async def emit_step_started(self, context: RunContext, step_name: str) -> None:
@@ -74,6 +96,7 @@ class EventEmitter:
             EventType.STEP_START,
             f"step_started: {step_name}",
             {"step": step_name, "index": context.current_step, "status": "running"},
+            trusted=True,
         )
 
     async def emit_step_completed(self, context: RunContext, step_name: str) -> None:
@@ -86,6 +109,7 @@ class EventEmitter:
                 "index": context.current_step,
                 "status": "completed",
             },
+            trusted=True,
         )
 
     async def emit_step_failed(
@@ -127,6 +151,7 @@ class EventEmitter:
             EventType.CHECKPOINT,
             f"checkpoint_reached: {checkpoint_id}",
             {"checkpoint": checkpoint_payload},
+            flush=True,
         )
 
     async def emit_prompt_required(
@@ -180,16 +205,42 @@ class EventEmitter:
             {"screenshot": screenshot_id, "reference_id": reference_id},
         )
 
-    async def _emit_event(
-        self, run_id: UUID, event_type: EventType, message: str, payload: dict[str, Any]
-    ) -> Event | None:
-        safe_message = _redact(message)
-        safe_payload = _redact(payload)
-
-        return await self.event_service.create_event(
-            run_id=run_id,
-            event_type=event_type,
-            message=safe_message,
-            payload=safe_payload,
-            session=self.session,
+    async def _emit_event(  # noqa: PLR0913
+        self,
+        run_id: UUID,
+        event_type: EventType,
+        message: str,
+        payload: dict[str, Any],
+        *,
+        flush: bool = False,
+        trusted: bool = False,
+    ) -> EventRead | None:
+        if trusted:
+            safe_message, safe_payload = message, payload
+        else:
+            safe_message = self.redaction.redact_text(message)
+            safe_payload = self.redaction.redact(payload)
+
+        if self.sink is None:
+            event = await self.event_service.create_event(
+                run_id=run_id,
+                event_type=event_type,
+                message=safe_message,
+                payload=safe_payload,
+                session=self.session,
+            )
+            self.broadcaster.publish(event)
+            return event
+
+        row = build_event_row(
+            EventCreate(
+                run_id=run_id,
+                type=event_type,
+                message=safe_message,
+                payload=safe_payload,
+            )
         )
+        await self.sink.enqueue(row)
+        if flush:
+            await self.sink.flush()
+        return EventRead.model_validate(row)
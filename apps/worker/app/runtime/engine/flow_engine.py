@@ -6,6 +6,7 @@ This class owns the flow lifecycle and coordinates:
 - run status updates via RunService and RunStateMachine
 - step execution via ActionExecutor + Middleware
 - checkpoint pause/resume via RunnerCoordinator and context mementos
+- active checkpoint state via CheckpointService
 
 Controllers should depend on this engine instead of runner.py.
 """
@@ -14,13 +15,14 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime, timedelta
 from typing import Any
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import Run, RunStatus
+from app.models import CheckpointStatus, Run, RunCheckpoint, RunStatus
 from app.runtime.adapters import AgentFactory
 from app.runtime.core import (
     ActionStep,
@@ -36,29 +38,38 @@ from app.runtime.core import (
     snapshot_context,
 )
 from app.runtime.engine import ActionExecutor, EventEmitter
+from app.services.checkpoint.service import CheckpointService
+from app.services.run.errors import RunAlreadyFinishedError
 from app.services.run.service import RunService
 
 logger = logging.getLogger(__name__)
 
 
 class FlowEngine:
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         run_service: RunService,
         session_provider: SessionProvider,
         session: AsyncSession,
         event_emitter: EventEmitter,
         coordinator: RunnerCoordinator | None = None,
+        *,
+        checkpoint_service: CheckpointService | None = None,
+        on_finished: Callable[[], Awaitable[None]] | None = None,
     ) -> None:
         self.run_service = run_service
         self.session = session
         self.event_emitter = event_emitter
         self.session_provider = session_provider
         self._coordinator = coordinator or RunnerCoordinator()
+        self.checkpoint_service = checkpoint_service or CheckpointService()
 
         self._agents: dict[UUID, Agent] = {}
         self._executors: dict[UUID, ActionExecutor] = {}
         self._fsms: dict[UUID, RunStateMachine] = {}
+        self._checkpoints: dict[UUID, RunCheckpoint] = {}
+        # Awaited inside the run task once it finishes, e.g. to close `session`
+        self._on_finished = on_finished
 
     async def start(
         self, run: Run, manifest: dict[str, Any], input_payload: dict[str, Any]
@@ -92,14 +103,36 @@ class FlowEngine:
 
             flow_completed = await self._execute_steps(context)
             if flow_completed:
+                self._coordinator.mark_finishing(context.run_id)
                 await self._handle_completion(context)
+        except asyncio.CancelledError:
+            # Only a requested cancellation ends the run; a task torn down
+            # with its event loop leaves the run to be recovered
+            if self._coordinator.cancel_requested(context.run_id):
+                failed = True
+                await self._handle_cancellation(context)
+            else:
+                # Release any write the task was interrupted in
+                await self.session.rollback()
+            raise
+        except RunAlreadyFinishedError as e:
+            # Canceled or reaped by another process: keep its recorded outcome
+            failed = True
+            self._coordinator.mark_finishing(context.run_id)
+            logger.info("Stopping run %s: %s", context.run_id, e)
+            await self.session.rollback()
         except Exception as e:  # noqa: BLE001
             failed = True
+            self._coordinator.mark_finishing(context.run_id)
             await self._handle_error(context, e)
         finally:
-            await self._cleanup(
-                context.run_id, failed=failed, flow_completed=flow_completed
-            )
+            try:
+                await self._cleanup(
+                    context.run_id, failed=failed, flow_completed=flow_completed
+                )
+            finally:
+                if self._on_finished is not None:
+                    await self._on_finished()
 
     def _make_context(
         self, run: Run, manifest: dict[str, Any], input_payload: dict[str, Any]
@@ -154,6 +187,16 @@ class FlowEngine:
             memento = snapshot_context(context)
             context.add_checkpoint(checkpoint_id, memento)
 
+            # Staged here, committed together with the status change
+            self._checkpoints[context.run_id] = self.checkpoint_service.open_checkpoint(
+                self.session,
+                context.run_id,
+                checkpoint_id,
+                step_index=context.current_step,
+                reason=reason,
+                expected_action=expected_action,
+                expires_at=expires_at,
+            )
             await self._update_run_status(context.run_id, RunStatus.AWAITING_INPUT)
             await self.event_emitter.emit_checkpoint_reached(
                 context, checkpoint_id, reason, expected_action, expires_at
@@ -166,6 +209,7 @@ class FlowEngine:
                 restore_context(context, memento)
                 latest = self._coordinator.latest_input(context.run_id)
                 context.input_payload = merge_inputs(context.input_payload, latest)
+                self._resolve_checkpoint(context.run_id, CheckpointStatus.RESUMED)
                 await self._update_run_status(context.run_id, RunStatus.RUNNING)
                 return True
             logger.info(
@@ -174,6 +218,8 @@ class FlowEngine:
                 checkpoint_id,
             )
             self._coordinator.cleanup(context.run_id)
+            # Committed with the FAILED status in _handle_error
+            self._resolve_checkpoint(context.run_id, CheckpointStatus.EXPIRED)
             timeout_error = TimeoutError(
                 f"Run {context.run_id} checkpoint {checkpoint_id} timed out"
             )
@@ -196,14 +242,20 @@ class FlowEngine:
         error_message = (
             "Run execution timed out" if isinstance(error, TimeoutError) else str(error)
         )
-        await self.run_service.update_run(
-            context.run_id,
-            {
-                "status": RunStatus.FAILED,
-                "error": error_message,
-            },
-            self.session,
-        )
+        try:
+            await self.run_service.update_active_run(
+                context.run_id,
+                {
+                    "status": RunStatus.FAILED,
+                    "error": error_message,
+                },
+                self.session,
+            )
+        except RunAlreadyFinishedError:
+            logger.info(
+                "Run %s already finished; not marking it failed", context.run_id
+            )
+            return
         try:
             await self.event_emitter.emit_run_failed(context, error_message)
         except Exception as emit_error:
@@ -214,6 +266,24 @@ class FlowEngine:
                 exc_info=emit_error,
             )
 
+    async def _handle_cancellation(self, context: RunContext) -> None:
+        logger.info("Run %s canceled", context.run_id)
+        # The task may have been interrupted mid-transaction
+        await self.session.rollback()
+        self._resolve_checkpoint(context.run_id, CheckpointStatus.CANCELED)
+        try:
+            await self._update_run_status(
+                context.run_id,
+                RunStatus.CANCELED,
+                ended_at=datetime.now(UTC),
+            )
+            await self.event_emitter.emit_run_canceled(context)
+        except RunAlreadyFinishedError:
+            # Canceled through the DB, which recorded the cancellation
+            logger.debug("Run %s cancellation already recorded", context.run_id)
+        except Exception:
+            logger.exception("Failed to record cancellation of run %s", context.run_id)
+
     async def _cleanup(
         self, run_id: UUID, *, failed: bool, flow_completed: bool
     ) -> None:
@@ -255,12 +325,22 @@ class FlowEngine:
                 self._agents.pop(run_id, None)
                 self._executors.pop(run_id, None)
                 self._fsms.pop(run_id, None)
+                self._checkpoints.pop(run_id, None)
 
-    async def _update_run_status(self, run_id: UUID, status: RunStatus) -> None:
+    async def _update_run_status(
+        self, run_id: UUID, status: RunStatus, **fields: Any
+    ) -> None:
         fsm = self._fsms.get(run_id)
         if fsm is not None:
             fsm.transition(status.value)
-        await self.run_service.update_run(run_id, {"status": status}, self.session)
+        await self.run_service.update_active_run(
+            run_id, {"status": status, **fields}, self.session
+        )
+
+    def _resolve_checkpoint(self, run_id: UUID, status: CheckpointStatus) -> None:
+        checkpoint = self._checkpoints.pop(run_id, None)
+        if checkpoint is not None:
+            self.checkpoint_service.resolve_checkpoint(self.session, checkpoint, status)
 
     def _init_fsm(self, run_id: UUID) -> None:
         self._fsms[run_id] = RunStateMachine("pending")
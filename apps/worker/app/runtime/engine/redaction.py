@@ -0,0 +1,124 @@
+"""Redaction of sensitive data in run event messages and payloads."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import Any
+
+from app.config import get_redaction_config
+
+REDACTED = "***"
+
+# Value shapes that are masked wherever they appear in a string
+VALUE_DETECTORS: dict[str, str] = {
+    "jwt": r"\beyJ[\w-]+\.eyJ[\w-]+\.[\w-]*",
+    "bearer": r"\b(?i:bearer)\s+[\w.~+/-]+=*",
+}
+
+# Upper bound on memoized key decisions; payload keys are a small, stable set
+_KEY_CACHE_SIZE = 4096
+
+
+class RedactionPolicy:
+    """A compiled set of rules deciding what to mask in event data.
+
+    Keys are matched case-insensitively, first against an exact set and then
+    against the combined key patterns; each decision is memoized. String
+    values are scanned with one alternation of the enabled value detectors.
+    Containers are only copied when something inside them was redacted.
+    """
+
+    def __init__(
+        self,
+        keys: Iterable[str] = (),
+        key_patterns: Iterable[str] = (),
+        value_detectors: Iterable[str] = (),
+    ) -> None:
+        self._keys = frozenset(key.lower() for key in keys)
+        self._key_pattern = _compile_alternation(key_patterns, re.IGNORECASE)
+        detectors = list(value_detectors)
+        unknown = [name for name in detectors if name not in VALUE_DETECTORS]
+        if unknown:
+            msg = f"Unknown redaction value detectors: {', '.join(unknown)}"
+            raise ValueError(msg)
+        self._value_pattern = _compile_alternation(
+            VALUE_DETECTORS[name] for name in detectors
+        )
+        self._key_decisions: dict[str, bool] = {}
+
+    @classmethod
+    def from_config(cls, config: dict[str, list[str]]) -> RedactionPolicy:
+        return cls(
+            keys=config["keys"],
+            key_patterns=config["key_patterns"],
+            value_detectors=config["value_detectors"],
+        )
+
+    def is_sensitive_key(self, key: str) -> bool:
+        decision = self._key_decisions.get(key)
+        if decision is None:
+            lowered = key.lower()
+            decision = lowered in self._keys or bool(
+                self._key_pattern and self._key_pattern.search(lowered)
+            )
+            if len(self._key_decisions) < _KEY_CACHE_SIZE:
+                self._key_decisions[key] = decision
+        return decision
+
+    def redact_text(self, text: str) -> str:
+        if self._value_pattern is None:
+            return text
+        redacted, count = self._value_pattern.subn(REDACTED, text)
+        return redacted if count else text
+
+    def redact(self, obj: Any) -> Any:
+        """Return `obj` with sensitive keys and values masked."""
+        if isinstance(obj, str):
+            return self.redact_text(obj)
+        if isinstance(obj, dict):
+            return self._redact_dict(obj)
+        if isinstance(obj, list):
+            return self._redact_list(obj)
+        return obj
+
+    def _redact_dict(self, obj: dict) -> dict:
+        result = None
+        for index, (key, value) in enumerate(obj.items()):
+            if isinstance(key, str) and self.is_sensitive_key(key):
+                new_value = REDACTED
+            else:
+                new_value = self.redact(value)
+            if result is None:
+                if new_value is value:
+                    continue
+                result = dict(list(obj.items())[:index])
+            result[key] = new_value
+        return obj if result is None else result
+
+    def _redact_list(self, obj: list) -> list:
+        result = None
+        for index, value in enumerate(obj):
+            new_value = self.redact(value)
+            if result is None:
+                if new_value is value:
+                    continue
+                result = obj[:index]
+            result.append(new_value)
+        return obj if result is None else result
+
+
+def _compile_alternation(
+    patterns: Iterable[str], flags: int = 0
+) -> re.Pattern[str] | None:
+    parts = [f"(?:{pattern})" for pattern in patterns]
+    if not parts:
+        return None
+    return re.compile("|".join(parts), flags)
+
+
+@lru_cache(maxsize=1)
+def get_redaction_policy() -> RedactionPolicy:
+    """Return the process redaction policy compiled from settings."""
+    return RedactionPolicy.from_config(get_redaction_config())
@@ -0,0 +1,290 @@
+"""Command channel between API processes and engine workers over Unix sockets.
+
+Messages are JSON objects, one per line. A client sends
+`{"id": ..., "command": ..., "args": {...}}` and reads back
+`{"id": ..., "ok": true, "result": ...}` or `{"id": ..., "ok": false,
+"error": ...}`. A client that sends the `watch` command keeps its connection
+open and receives every message the server broadcasts, e.g. run events.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import itertools
+import json
+import logging
+from collections.abc import Awaitable, Callable, Sequence
+from pathlib import Path
+from typing import Any
+
+from app.config import (
+    DEFAULT_ENGINE_COMMAND_TIMEOUT_SECONDS,
+    DEFAULT_ENGINE_RECONNECT_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+WATCH_COMMAND = "watch"
+# Longest message line accepted on either side
+MAX_MESSAGE_BYTES = 4 * 1024 * 1024
+# Broadcasts queued for a watcher before it is dropped as too slow
+MAX_WATCHER_BUFFER_BYTES = 8 * 1024 * 1024
+
+CommandHandler = Callable[[str, dict[str, Any]], Awaitable[Any]]
+
+
+class EngineCommandError(Exception):
+    """Raised when an engine worker rejects a command or cannot be reached."""
+
+
+def encode_message(message: dict[str, Any]) -> bytes:
+    return json.dumps(message, default=str, separators=(",", ":")).encode() + b"\n"
+
+
+class EngineServer:
+    """Serves commands from API processes on a Unix socket.
+
+    Each request line is passed to `handler(command, args)` and answered on
+    the same connection; requests on one connection are handled in order.
+    """
+
+    def __init__(self, path: str, handler: CommandHandler) -> None:
+        self.path = path
+        self._handler = handler
+        self._server: asyncio.Server | None = None
+        self._watchers: set[asyncio.StreamWriter] = set()
+
+    @property
+    def running(self) -> bool:
+        return self._server is not None
+
+    @property
+    def watching(self) -> bool:
+        return bool(self._watchers)
+
+    async def start(self) -> None:
+        """Listen on `path`, replacing a socket file left by a dead worker."""
+        if self._server is not None:
+            return
+        with contextlib.suppress(FileNotFoundError):
+            Path(self.path).unlink()
+        self._server = await asyncio.start_unix_server(
+            self._serve, path=self.path, limit=MAX_MESSAGE_BYTES
+        )
+        # Commands are trusted: only the owning user may connect
+        Path(self.path).chmod(0o600)
+        logger.info("Engine command server listening on %s", self.path)
+
+    async def stop(self) -> None:
+        """Stop accepting commands and disconnect watchers."""
+        if self._server is None:
+            return
+        self._server.close()
+        for writer in tuple(self._watchers):
+            writer.close()
+        self._watchers.clear()
+        await self._server.wait_closed()
+        self._server = None
+        with contextlib.suppress(FileNotFoundError):
+            Path(self.path).unlink()
+        logger.info("Engine command server stopped")
+
+    def broadcast(self, message: dict[str, Any]) -> None:
+        """Send a message to every watching client without waiting."""
+        if not self._watchers:
+            return
+        data = encode_message(message)
+        for writer in tuple(self._watchers):
+            if writer.transport.get_write_buffer_size() > MAX_WATCHER_BUFFER_BYTES:
+                logger.warning("Dropping engine watcher that stopped reading")
+                self._watchers.discard(writer)
+                writer.close()
+                continue
+            writer.write(data)
+
+    async def _serve(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while line := await reader.readline():
+                request = json.loads(line)
+                if request.get("command") == WATCH_COMMAND:
+                    self._watchers.add(writer)
+                    writer.write(encode_message({"id": request.get("id"), "ok": True}))
+                    continue
+                writer.write(encode_message(await self._respond(request)))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError) as e:
+            logger.debug("Engine command connection closed: %s", e)
+        finally:
+            self._watchers.discard(writer)
+            writer.close()
+
+    async def _respond(self, request: dict[str, Any]) -> dict[str, Any]:
+        request_id = request.get("id")
+        try:
+            result = await self._handler(
+                request.get("command", ""), request.get("args") or {}
+            )
+        except EngineCommandError as e:
+            return {"id": request_id, "ok": False, "error": str(e)}
+        except Exception as e:
+            logger.exception("Engine command %s failed", request.get("command"))
+            return {"id": request_id, "ok": False, "error": str(e)}
+        return {"id": request_id, "ok": True, "result": result}
+
+
+class EngineClient:
+    """Sends commands to engine workers listening on `paths`.
+
+    `call` tries the engines in round-robin order and fails over to the next
+    one when an engine cannot be connected to; `call_all` reaches every
+    engine, for commands aimed at whichever one holds a run.
+    """
+
+    def __init__(
+        self,
+        paths: Sequence[str],
+        *,
+        timeout: float = DEFAULT_ENGINE_COMMAND_TIMEOUT_SECONDS,
+        reconnect: float = DEFAULT_ENGINE_RECONNECT_SECONDS,
+    ) -> None:
+        if not paths:
+            msg = "EngineClient needs at least one engine socket path"
+            raise ValueError(msg)
+        self.paths = list(paths)
+        self.timeout = timeout
+        self.reconnect = reconnect
+        self._ids = itertools.count(1)
+        self._next = itertools.cycle(range(len(self.paths)))
+        self._watchers: list[asyncio.Task] = []
+
+    @property
+    def watching(self) -> bool:
+        return any(not task.done() for task in self._watchers)
+
+    async def call(self, command: str, args: dict[str, Any] | None = None) -> Any:
+        """Send a command to one reachable engine and return its result.
+
+        Only a failed connection moves on to the next engine: a command that
+        was sent may have been carried out, so losing its reply raises
+        instead of sending it again.
+        """
+        first = next(self._next)
+        order = self.paths[first:] + self.paths[:first]
+        for path in order:
+            try:
+                reader, writer = await self._connect(path)
+            except (ConnectionError, FileNotFoundError, TimeoutError) as e:
+                logger.warning("Engine at %s unavailable for %s: %s", path, command, e)
+                continue
+            try:
+                return await self._request(path, reader, writer, command, args)
+            except (ConnectionError, TimeoutError) as e:
+                msg = f"Engine at {path} did not answer {command}: {e!r}"
+                raise EngineCommandError(msg) from e
+        msg = f"No engine worker reachable for {command}"
+        raise EngineCommandError(msg)
+
+    async def call_all(
+        self, command: str, args: dict[str, Any] | None = None
+    ) -> list[Any]:
+        """Send a command to every engine; unreachable engines are skipped."""
+        results = await asyncio.gather(
+            *(self.call_path(path, command, args) for path in self.paths),
+            return_exceptions=True,
+        )
+        answered = []
+        for path, result in zip(self.paths, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.warning("Engine at %s failed %s: %s", path, command, result)
+            else:
+                answered.append(result)
+        return answered
+
+    async def call_path(
+        self, path: str, command: str, args: dict[str, Any] | None = None
+    ) -> Any:
+        """Send a command to the engine listening on `path`."""
+        reader, writer = await self._connect(path)
+        return await self._request(path, reader, writer, command, args)
+
+    async def _connect(
+        self, path: str
+    ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        async with asyncio.timeout(self.timeout):
+            return await asyncio.open_unix_connection(path, limit=MAX_MESSAGE_BYTES)
+
+    async def _request(
+        self,
+        path: str,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        command: str,
+        args: dict[str, Any] | None,
+    ) -> Any:
+        request_id = next(self._ids)
+        try:
+            async with asyncio.timeout(self.timeout):
+                writer.write(
+                    encode_message(
+                        {"id": request_id, "command": command, "args": args or {}}
+                    )
+                )
+                await writer.drain()
+                line = await reader.readline()
+        finally:
+            writer.close()
+        if not line:
+            msg = f"Engine at {path} closed the connection"
+            raise ConnectionError(msg)
+        response = json.loads(line)
+        if not response.get("ok"):
+            raise EngineCommandError(response.get("error") or "Engine command failed")
+        return response.get("result")
+
+    def watch(self, on_message: Callable[[dict[str, Any]], None]) -> None:
+        """Receive every engine's broadcasts, reconnecting when one goes away."""
+        if self.watching:
+            return
+        self._watchers = [
+            asyncio.create_task(self._watch(path, on_message)) for path in self.paths
+        ]
+
+    async def aclose(self) -> None:
+        """Stop watching engines."""
+        for task in self._watchers:
+            task.cancel()
+        for task in self._watchers:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._watchers = []
+
+    async def _watch(
+        self, path: str, on_message: Callable[[dict[str, Any]], None]
+    ) -> None:
+        while True:
+            try:
+                reader, writer = await asyncio.open_unix_connection(
+                    path, limit=MAX_MESSAGE_BYTES
+                )
+            except (ConnectionError, FileNotFoundError) as e:
+                logger.debug("Engine at %s not watchable yet: %s", path, e)
+                await asyncio.sleep(self.reconnect)
+                continue
+            logger.info("Watching engine at %s", path)
+            try:
+                writer.write(encode_message({"id": 0, "command": WATCH_COMMAND}))
+                await writer.drain()
+                await reader.readline()
+                while line := await reader.readline():
+                    try:
+                        on_message(json.loads(line))
+                    except Exception:
+                        logger.exception("Failed to handle message from %s", path)
+            except (ConnectionError, ValueError) as e:
+                logger.warning("Lost engine at %s: %s", path, e)
+            finally:
+                writer.close()
+            await asyncio.sleep(self.reconnect)
@@ -0,0 +1,207 @@
+"""Worker side of the durable run queue: claim, execute and settle runs."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import db
+from app.config import (
+    DEFAULT_RUN_QUEUE_CAPACITY,
+    DEFAULT_RUN_QUEUE_LEASE_SECONDS,
+    DEFAULT_RUN_QUEUE_MAX_ATTEMPTS,
+    DEFAULT_RUN_QUEUE_POLL_INTERVAL_SECONDS,
+)
+from app.models import OWNED_RUN_STATUSES, TERMINAL_RUN_STATUSES, Run, RunQueueEntry
+from app.runtime.core import RunnerCoordinator
+from app.services.run.queue import RunQueueRepository
+from app.services.run.service import RunService
+
+if TYPE_CHECKING:
+    from app.runtime.scheduler import RunScheduler
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DispatchReport:
+    """Outcome of one dispatcher pass."""
+
+    completed: list[UUID] = field(default_factory=list)
+    renewed: int = 0
+    claimed: list[UUID] = field(default_factory=list)
+    retried: list[UUID] = field(default_factory=list)
+    failed: list[UUID] = field(default_factory=list)
+
+
+class RunQueueDispatcher:
+    """Drains the `run_queue` table into this worker's scheduler.
+
+    Each pass settles runs whose execution ended (removing their entries),
+    renews the leases on runs still executing here, then claims entries up
+    to `capacity`. A claimed run that is PENDING is provisioned and
+    started; one left RUNNING or AWAITING_INPUT by a worker whose lease
+    expired is reset and retried, and after `max_attempts` deliveries it is
+    failed. Several worker processes can drain the same queue.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        scheduler: RunScheduler,
+        coordinator: RunnerCoordinator,
+        session_factory: Callable[[], AsyncSession] | None = None,
+        run_service_factory: Callable[[], RunService] | None = None,
+        *,
+        worker_id: str,
+        lease: float = DEFAULT_RUN_QUEUE_LEASE_SECONDS,
+        interval: float = DEFAULT_RUN_QUEUE_POLL_INTERVAL_SECONDS,
+        max_attempts: int = DEFAULT_RUN_QUEUE_MAX_ATTEMPTS,
+        capacity: int = DEFAULT_RUN_QUEUE_CAPACITY,
+    ) -> None:
+        self._scheduler = scheduler
+        self._coordinator = coordinator
+        self._session_factory = session_factory
+        self._run_service_factory = run_service_factory or RunService
+        self.worker_id = worker_id
+        self.lease = timedelta(seconds=lease)
+        self.interval = interval
+        self.max_attempts = max_attempts
+        self.capacity = capacity
+        self.repository = RunQueueRepository()
+        # Runs leased by this worker, with the task delivering each of them
+        self._held: dict[UUID, asyncio.Task] = {}
+        self._wakeup = asyncio.Event()
+        self._worker: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._worker is not None and not self._worker.done()
+
+    @property
+    def held(self) -> list[UUID]:
+        return list(self._held)
+
+    def start(self) -> None:
+        """Start claiming queued runs every `interval` seconds."""
+        if self.running:
+            return
+        self._worker = asyncio.create_task(self._run())
+        logger.info(
+            "Run queue dispatcher started (worker=%s, capacity=%s)",
+            self.worker_id,
+            self.capacity,
+        )
+
+    async def stop(self) -> None:
+        """Stop claiming and hand this worker's leases back to the queue."""
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._worker
+        self._worker = None
+        if self._held:
+            async with self._new_session() as session:
+                await self.repository.release(session, self.held, self.worker_id)
+            self._held.clear()
+        logger.info("Run queue dispatcher stopped")
+
+    def wake(self) -> None:
+        """Run the next pass now, e.g. after runs were queued."""
+        self._wakeup.set()
+
+    async def wait_delivered(self) -> None:
+        """Wait until every claimed run has been handed to the scheduler."""
+        if self._held:
+            await asyncio.wait(list(self._held.values()))
+
+    async def dispatch(self, now: datetime | None = None) -> DispatchReport:
+        """Run one pass: settle finished runs, renew leases, claim new runs."""
+        now = now or datetime.now(UTC)
+        report = DispatchReport()
+        async with self._new_session() as session:
+            report.completed = [run_id for run_id in self._held if self._done(run_id)]
+            if report.completed:
+                await self.repository.complete(
+                    session, report.completed, self.worker_id
+                )
+                for run_id in report.completed:
+                    del self._held[run_id]
+            report.renewed = await self.repository.renew(
+                session, self.held, self.worker_id, now + self.lease
+            )
+            room = self.capacity - len(self._held)
+            if room <= 0:
+                return report
+            entries = await self.repository.claim(
+                session, self.worker_id, now, now + self.lease, room
+            )
+        for entry in entries:
+            report.claimed.append(entry.run_id)
+            if entry.attempts > 1:
+                report.retried.append(entry.run_id)
+            if entry.attempts > self.max_attempts:
+                report.failed.append(entry.run_id)
+            self._held[entry.run_id] = asyncio.create_task(self._deliver(entry))
+        if report.claimed:
+            logger.info(
+                "Claimed %d queued runs (%d retries)",
+                len(report.claimed),
+                len(report.retried),
+            )
+        return report
+
+    async def _deliver(self, entry: RunQueueEntry) -> None:
+        run_service = self._run_service_factory()
+        try:
+            async with self._new_session() as session:
+                run = await session.get(Run, entry.run_id)
+                if run is None or run.status in TERMINAL_RUN_STATUSES:
+                    return
+                if entry.attempts > self.max_attempts:
+                    await run_service.fail_undeliverable_run(
+                        run.id,
+                        session,
+                        f"Run not completed after {self.max_attempts} attempts",
+                    )
+                    return
+                if run.status in OWNED_RUN_STATUSES:
+                    # The worker holding the previous lease is gone
+                    logger.warning(
+                        "Retrying run %s abandoned as %s (attempt %d)",
+                        run.id,
+                        run.status.value,
+                        entry.attempts,
+                    )
+                    run = await run_service.requeue_abandoned_run(run.id, session)
+            await self._scheduler.provision(run, run_service)
+        except Exception:
+            logger.exception("Failed to deliver queued run %s", entry.run_id)
+
+    def _done(self, run_id: UUID) -> bool:
+        if not self._held[run_id].done():
+            return False
+        task = self._coordinator.get_task(run_id)
+        return task is None or task.done()
+
+    def _new_session(self) -> AsyncSession:
+        session_factory = self._session_factory or db.AsyncSessionLocal
+        return session_factory()
+
+    async def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            try:
+                await self.dispatch()
+            except Exception:
+                logger.exception("Run queue dispatch pass failed")
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.interval)
@@ -0,0 +1,250 @@
+"""Heartbeats for live runs and reaping of runs left behind by dead workers."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any, Literal
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import db
+from app.config import (
+    DEFAULT_RUN_HEARTBEAT_INTERVAL_SECONDS,
+    DEFAULT_RUN_HEARTBEAT_TIMEOUT_SECONDS,
+    DEFAULT_RUN_REAPER_BATCH_SIZE,
+    DEFAULT_RUN_REAPER_RELEASE_CONCURRENCY,
+)
+from app.models import CheckpointStatus, EventCreate, EventType, Run, RunStatus
+from app.runtime.core import RunnerCoordinator
+from app.services.checkpoint.repository import CheckpointRepository
+from app.services.event.repository import EventRepository, build_event_row
+from app.services.run.repository import RunRepository
+from app.services.steel_service import SteelService
+
+if TYPE_CHECKING:
+    from app.runtime.scheduler import RunScheduler
+
+logger = logging.getLogger(__name__)
+
+ReapAction = Literal["fail", "requeue"]
+
+ORPHANED_RUN_ERROR = "Run abandoned: its worker stopped heartbeating"
+
+
+@dataclass
+class ReapReport:
+    """Outcome of one reaper pass."""
+
+    heartbeats: int = 0
+    reaped: list[UUID] = field(default_factory=list)
+    released_sessions: int = 0
+    failed_releases: int = 0
+    elapsed: float = 0.0
+
+
+class RunReaper:
+    """Keeps this worker's runs alive and reaps runs whose worker is gone.
+
+    Runs executing in a worker carry its `owner_id` and a `heartbeat_at`
+    that the owner refreshes every `interval` seconds for the runs its
+    coordinator still has tasks for. Active runs whose heartbeat is older
+    than `heartbeat_timeout` have lost their worker: they are found through
+    the `(status, heartbeat_at)` index, a batch at a time, and claimed with
+    a conditional UPDATE so concurrent reapers never reap the same run.
+    Claimed runs are failed, or reset to PENDING and provisioned again,
+    and their browser sessions are released with bounded parallelism once
+    the claim is committed.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        coordinator: RunnerCoordinator,
+        session_factory: Callable[[], AsyncSession] | None = None,
+        steel_service: SteelService | None = None,
+        *,
+        worker_id: str,
+        action: ReapAction = "fail",
+        scheduler: RunScheduler | None = None,
+        interval: float = DEFAULT_RUN_HEARTBEAT_INTERVAL_SECONDS,
+        heartbeat_timeout: float = DEFAULT_RUN_HEARTBEAT_TIMEOUT_SECONDS,
+        batch_size: int = DEFAULT_RUN_REAPER_BATCH_SIZE,
+        release_concurrency: int = DEFAULT_RUN_REAPER_RELEASE_CONCURRENCY,
+    ) -> None:
+        if action == "requeue" and scheduler is None:
+            msg = "Requeuing orphaned runs requires a scheduler"
+            raise ValueError(msg)
+        self._coordinator = coordinator
+        self._session_factory = session_factory
+        self.steel_service = steel_service or SteelService()
+        self.worker_id = worker_id
+        self.action = action
+        self._scheduler = scheduler
+        self.interval = interval
+        self.heartbeat_timeout = timedelta(seconds=heartbeat_timeout)
+        self.batch_size = batch_size
+        self.release_concurrency = release_concurrency
+        self.repository = RunRepository()
+        self.checkpoint_repository = CheckpointRepository()
+        self.event_repository = EventRepository()
+        self._worker: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._worker is not None and not self._worker.done()
+
+    def start(self) -> None:
+        """Start heartbeating and reaping every `interval` seconds."""
+        if self.running:
+            return
+        self._worker = asyncio.create_task(self._run())
+        logger.info(
+            "Run reaper started (worker=%s, interval=%ss, action=%s)",
+            self.worker_id,
+            self.interval,
+            self.action,
+        )
+
+    async def stop(self) -> None:
+        """Cancel the periodic task, abandoning any pass in progress."""
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._worker
+        self._worker = None
+        logger.info("Run reaper stopped")
+
+    async def heartbeat(self, now: datetime | None = None) -> int:
+        """Refresh the heartbeat of every run this worker is executing."""
+        run_ids = self._coordinator.active_run_ids()
+        if not run_ids:
+            return 0
+        async with self._new_session() as session:
+            return await self.repository.touch_heartbeats(
+                session, run_ids, self.worker_id, now or datetime.now(UTC)
+            )
+
+    async def reap(self, now: datetime | None = None) -> ReapReport:
+        """Run one pass: heartbeat live runs, then reap orphans batch by batch."""
+        now = now or datetime.now(UTC)
+        report = ReapReport()
+        start = time.perf_counter()
+        report.heartbeats = await self.heartbeat(now)
+        cutoff = now - self.heartbeat_timeout
+        while True:
+            found, claimed, provider_ids = await self._reap_batch(cutoff, now)
+            if claimed:
+                report.reaped.extend(run.id for run in claimed)
+                released = await self._release_sessions(provider_ids)
+                report.released_sessions += released
+                report.failed_releases += len(provider_ids) - released
+                if self.action == "requeue" and self._scheduler is not None:
+                    self._scheduler.provision_many(claimed)
+            if found < self.batch_size:
+                break
+        report.elapsed = time.perf_counter() - start
+        if report.reaped:
+            logger.warning(
+                "Reaped %d orphaned runs (%s), released %d sessions in %.3fs",
+                len(report.reaped),
+                self.action,
+                report.released_sessions,
+                report.elapsed,
+            )
+        return report
+
+    async def _reap_batch(
+        self, cutoff: datetime, now: datetime
+    ) -> tuple[int, list[Run], list[str]]:
+        async with self._new_session() as session:
+            run_ids = await self.repository.get_orphaned_run_ids(
+                session, cutoff, self.batch_size
+            )
+            claimed = await self.repository.claim_orphaned_runs(
+                session, run_ids, cutoff, self._claim_values(now)
+            )
+            if not claimed:
+                await session.rollback()
+                return len(run_ids), [], []
+            claimed_ids = [run.id for run in claimed]
+            await self.checkpoint_repository.resolve_open(
+                session, claimed_ids, CheckpointStatus.EXPIRED, now
+            )
+            provider_ids = await self.repository.end_open_sessions(
+                session, claimed_ids, now
+            )
+            # Inserts the events and commits the whole batch
+            await self.event_repository.create_events(
+                session, [build_event_row(self._reap_event(run)) for run in claimed]
+            )
+        return len(run_ids), claimed, provider_ids
+
+    def _claim_values(self, now: datetime) -> dict[str, Any]:
+        if self.action == "requeue":
+            return {
+                "status": RunStatus.PENDING,
+                "started_at": None,
+                "owner_id": None,
+                "heartbeat_at": None,
+                "updated_at": now,
+            }
+        return {
+            "status": RunStatus.FAILED,
+            "error": ORPHANED_RUN_ERROR,
+            "ended_at": now,
+            "updated_at": now,
+        }
+
+    def _reap_event(self, run: Run) -> EventCreate:
+        if self.action == "requeue":
+            return EventCreate(
+                run_id=run.id,
+                type=EventType.STATUS,
+                message="run_requeued",
+                payload={"status": "pending", "reason": ORPHANED_RUN_ERROR},
+            )
+        return EventCreate(
+            run_id=run.id,
+            type=EventType.ERROR,
+            message="run_failed",
+            payload={"status": "failed", "error": ORPHANED_RUN_ERROR},
+        )
+
+    async def _release_sessions(self, provider_ids: Sequence[str]) -> int:
+        """Release provider sessions, at most `release_concurrency` at a time.
+
+        Returns the number of sessions released.
+        """
+        semaphore = asyncio.Semaphore(self.release_concurrency)
+
+        async def release(provider_id: str) -> bool:
+            async with semaphore:
+                try:
+                    return await self.steel_service.release_session(provider_id)
+                except Exception:
+                    logger.exception(
+                        "Failed to release browser session %s", provider_id
+                    )
+                    return False
+
+        results = await asyncio.gather(*(release(pid) for pid in provider_ids))
+        return sum(results)
+
+    def _new_session(self) -> AsyncSession:
+        session_factory = self._session_factory or db.AsyncSessionLocal
+        return session_factory()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.reap()
+            except Exception:
+                logger.exception("Run reaper pass failed")
+            await asyncio.sleep(self.interval)
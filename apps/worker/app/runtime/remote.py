@@ -0,0 +1,243 @@
+"""Split execution plane: API processes hand runs to engine worker processes."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Callable, Sequence
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.constants import RUN_CANCEL_TIMEOUT_SECONDS
+from app.models import TERMINAL_RUN_STATUSES, Run, RunStatus
+from app.runtime.admission import AdmissionController
+from app.runtime.core import RunnerCoordinator
+from app.runtime.ipc import EngineClient, EngineCommandError
+from app.runtime.scheduler import RunScheduler
+from app.services.run.repository import RunRepository
+from app.services.run.service import RunService
+
+logger = logging.getLogger(__name__)
+
+COMMAND_START = "start"
+COMMAND_PROVISION = "provision"
+COMMAND_RESUME = "resume"
+COMMAND_CANCEL = "cancel"
+COMMAND_STATS = "stats"
+MESSAGE_EVENT = "event"
+
+# Strong references to in-flight command tasks so they are not collected
+_command_tasks: set[asyncio.Task] = set()
+
+
+class RemoteRunScheduler:
+    """API-side stand-in for `RunScheduler` that commands engine workers.
+
+    Nothing executes in the API process: runs are started, provisioned,
+    resumed and canceled by sending commands over the engine client, and
+    concurrency limits are applied by the engines before they provision a
+    run's browser session. When no engine answers,
+    PENDING runs stay pending; with the durable run queue enabled an engine
+    claims them once one is up.
+    """
+
+    def __init__(self, client: EngineClient, *, queued: bool = False) -> None:
+        self._client = client
+        self._queued = queued
+
+    @property
+    def queued(self) -> bool:
+        return self._queued
+
+    @property
+    def admits_locally(self) -> bool:
+        """Runs are admitted by the engine that provisions them, never here."""
+        return False
+
+    async def schedule(
+        self,
+        run: Run,
+        *,
+        input_payload: dict[str, Any] | None = None,
+        admission: None = None,  # noqa: ARG002
+    ) -> None:
+        """Have an engine start a run whose browser session is provisioned."""
+        args: dict[str, Any] = {"run_id": str(run.id), "provisioned_by": run.owner_id}
+        if input_payload is not None:
+            args["input_payload"] = input_payload
+        try:
+            started = await self._client.call(COMMAND_START, args)
+        except EngineCommandError:
+            logger.exception("Failed to hand run %s to an engine worker", run.id)
+            raise
+        if not started:
+            logger.warning(
+                "Engine worker did not start run %s: finished or taken over", run.id
+            )
+
+    def provision(
+        self, run: Run, run_service: RunService | None = None
+    ) -> asyncio.Task:
+        """Have an engine provision and start a PENDING run."""
+        return self.provision_many([run], run_service)
+
+    def provision_many(
+        self,
+        runs: Sequence[Run],
+        run_service: RunService | None = None,  # noqa: ARG002
+        **_kwargs: Any,
+    ) -> asyncio.Task:
+        """Have an engine provision and start PENDING runs, in the background."""
+        run_ids = [str(run.id) for run in runs]
+
+        async def provision() -> None:
+            try:
+                await self._client.call(COMMAND_PROVISION, {"run_ids": run_ids})
+            except Exception:
+                logger.exception(
+                    "Failed to hand %d pending runs to an engine worker", len(run_ids)
+                )
+
+        task = asyncio.create_task(provision())
+        _command_tasks.add(task)
+        task.add_done_callback(_command_tasks.discard)
+        return task
+
+    async def resume(
+        self, run_id: UUID, input_payload: dict[str, Any] | None = None
+    ) -> bool:
+        """Signal the engine holding a paused run. False if none holds it."""
+        args = {"run_id": str(run_id), "input_payload": input_payload}
+        return any(await self._client.call_all(COMMAND_RESUME, args))
+
+    async def cancel(
+        self, run_id: UUID, *, timeout: float = RUN_CANCEL_TIMEOUT_SECONDS
+    ) -> bool:
+        """Cancel a run on whichever engine executes it."""
+        args = {"run_id": str(run_id), "timeout": timeout}
+        return any(await self._client.call_all(COMMAND_CANCEL, args))
+
+
+class EngineCommandHandler:
+    """Executes commands from API processes on an engine worker's scheduler."""
+
+    def __init__(
+        self,
+        scheduler: RunScheduler,
+        coordinator: RunnerCoordinator,
+        session_factory: Callable[[], AsyncSession],
+        *,
+        worker_id: str,
+        admission: AdmissionController | None = None,
+    ) -> None:
+        self._scheduler = scheduler
+        self._coordinator = coordinator
+        self._session_factory = session_factory
+        self._admission = admission
+        self.worker_id = worker_id
+        self.repository = RunRepository()
+        self._commands = {
+            COMMAND_START: self.start,
+            COMMAND_PROVISION: self.provision,
+            COMMAND_RESUME: self.resume,
+            COMMAND_CANCEL: self.cancel,
+            COMMAND_STATS: self.stats,
+        }
+
+    async def __call__(self, command: str, args: dict[str, Any]) -> Any:
+        handler = self._commands.get(command)
+        if handler is None:
+            msg = f"Unknown engine command: {command}"
+            raise EngineCommandError(msg)
+        return await handler(**args)
+
+    async def start(
+        self,
+        run_id: str,
+        input_payload: dict[str, Any] | None = None,
+        provisioned_by: str | None = None,
+    ) -> bool:
+        """Start a run in the background; PENDING runs are provisioned first.
+
+        A run the API already provisioned is adopted from `provisioned_by`
+        by this worker, so its heartbeats come from here, and then waits for
+        admission. Returns False when the run finished or another worker
+        adopted it first.
+        """
+        async with self._session_factory() as session:
+            run = await session.get(Run, UUID(run_id))
+            if run is None or run.status in TERMINAL_RUN_STATUSES:
+                return False
+            if run.status == RunStatus.PENDING:
+                self._scheduler.provision(run)
+                return True
+            adopted = await self.repository.adopt_run(
+                session, run.id, self.worker_id, provisioned_by, datetime.now(UTC)
+            )
+            if not adopted:
+                logger.info("Not starting run %s: finished or taken over", run.id)
+                return False
+
+        async def admit_and_schedule() -> None:
+            try:
+                ticket = await self._scheduler.admit(
+                    run.user_id, run.flow_id, run.priority
+                )
+                # Scheduling failures are logged by `schedule` itself
+                with contextlib.suppress(Exception):
+                    await self._scheduler.schedule(
+                        run, input_payload=input_payload, admission=ticket
+                    )
+            finally:
+                if self._coordinator.get_task(run.id) is asyncio.current_task():
+                    self._coordinator.cleanup(run.id)
+
+        task = asyncio.create_task(admit_and_schedule())
+        # Until the engine starts the run this task stands in for it, so the
+        # reaper heartbeats the run and cancels reach it while it waits
+        self._coordinator.set_task(run.id, task)
+        _command_tasks.add(task)
+        task.add_done_callback(_command_tasks.discard)
+        return True
+
+    async def provision(self, run_ids: list[str]) -> int:
+        """Provision and start PENDING runs in the background."""
+        async with self._session_factory() as session:
+            runs = [
+                run
+                for run_id in run_ids
+                if (run := await session.get(Run, UUID(run_id))) is not None
+                and run.status == RunStatus.PENDING
+            ]
+        if runs:
+            self._scheduler.provision_many(runs)
+        return len(runs)
+
+    async def resume(
+        self, run_id: str, input_payload: dict[str, Any] | None = None
+    ) -> bool:
+        """Signal a paused run executing here; False if it is not here."""
+        return await self._scheduler.resume(UUID(run_id), input_payload)
+
+    async def cancel(
+        self, run_id: str, timeout: float = RUN_CANCEL_TIMEOUT_SECONDS
+    ) -> bool:
+        """Cancel a run executing here; False if it is not here."""
+        return await self._scheduler.cancel(UUID(run_id), timeout=timeout)
+
+    async def stats(self) -> dict[str, Any]:
+        """Describe this worker's load."""
+        stats: dict[str, Any] = {
+            "worker_id": self.worker_id,
+            "active_runs": len(self._coordinator.active_run_ids()),
+        }
+        if self._admission is not None:
+            stats["admission"] = self._admission.stats.as_dict() | {
+                "running": self._admission.running,
+                "waiting": self._admission.waiting,
+            }
+        return stats
@@ -0,0 +1,199 @@
+"""Deliver checkpoint resumes and cancellations accepted by other processes."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Callable
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app import db
+from app.config import (
+    DEFAULT_RUN_RESUME_POLL_INTERVAL_SECONDS,
+    DEFAULT_RUN_RESUME_RECONNECT_SECONDS,
+    DEFAULT_RUN_RESUME_SWEEP_INTERVAL_SECONDS,
+)
+from app.constants import RUN_CANCEL_TIMEOUT_SECONDS, RUN_SIGNAL_CHANNEL
+from app.runtime.core import RunnerCoordinator
+from app.services.checkpoint.service import CheckpointService
+from app.services.run.repository import RunRepository
+
+logger = logging.getLogger(__name__)
+
+
+class ResumeListener:
+    """Delivers resumes and cancels accepted by other processes to runs here.
+
+    `/runs/{run_id}/continue` and `/runs/{run_id}/cancel` signal the run
+    directly when it executes in the API process that served the request
+    or in an engine worker. When it executes in another process, e.g.
+    another API worker, the request only reaches the DB: a continued run
+    is RUNNING while the checkpoint it paused at still awaits input and
+    carries the input it was continued with, and a canceled run is
+    CANCELED. The listener checks the runs executing here for those states
+    every `interval` seconds. With `notify_engine` it checks immediately on
+    a Postgres notification on `RUN_SIGNAL_CHANNEL` instead, and while the
+    notifications arrive only sweeps the DB every `sweep_interval` seconds
+    for signals lost across reconnects. The DB is only queried while runs
+    execute here.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        coordinator: RunnerCoordinator,
+        session_factory: Callable[[], AsyncSession] | None = None,
+        *,
+        interval: float = DEFAULT_RUN_RESUME_POLL_INTERVAL_SECONDS,
+        sweep_interval: float = DEFAULT_RUN_RESUME_SWEEP_INTERVAL_SECONDS,
+        notify_engine: AsyncEngine | None = None,
+        reconnect: float = DEFAULT_RUN_RESUME_RECONNECT_SECONDS,
+    ) -> None:
+        self._coordinator = coordinator
+        self._session_factory = session_factory
+        self.interval = interval
+        self.sweep_interval = sweep_interval
+        self.reconnect = reconnect
+        self.checkpoint_service = CheckpointService()
+        self.run_repository = RunRepository()
+        self._notify_engine = notify_engine
+        self._wakeup = asyncio.Event()
+        self._worker: asyncio.Task | None = None
+        self._listener: asyncio.Task | None = None
+        self._notified = False
+
+    @property
+    def running(self) -> bool:
+        return self._worker is not None and not self._worker.done()
+
+    @property
+    def notified(self) -> bool:
+        """Whether Postgres notifications are being received."""
+        return self._notified
+
+    @property
+    def wait_interval(self) -> float:
+        """Seconds between checks not triggered by a notification."""
+        return self.sweep_interval if self._notified else self.interval
+
+    def start(self) -> None:
+        """Start checking runs executing here for resumes and cancellations."""
+        if self.running:
+            return
+        self._worker = asyncio.create_task(self._run())
+        if self._notify_engine is not None:
+            self._listener = asyncio.create_task(self._listen())
+        logger.info(
+            "Run resume listener started (interval=%ss, notify=%s)",
+            self.interval,
+            self._notify_engine is not None,
+        )
+
+    async def stop(self) -> None:
+        """Stop checking for resumes and cancellations."""
+        for task in (self._listener, self._worker):
+            if task is None:
+                continue
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._worker = self._listener = None
+        logger.info("Run resume listener stopped")
+
+    def wake(self) -> None:
+        """Check now instead of at the next interval."""
+        self._wakeup.set()
+
+    async def check(self) -> list[UUID]:
+        """Resume the runs paused here that were continued; returns their ids."""
+        waiting = self._coordinator.waiting_runs()
+        if not waiting:
+            return []
+        async with self._new_session() as session:
+            continued = await self.checkpoint_service.get_continued_runs(
+                session, list(waiting)
+            )
+        resumed = [
+            run_id
+            for run_id, input_payload in continued.items()
+            if self._coordinator.resume_waiting(run_id, waiting[run_id], input_payload)
+        ]
+        if resumed:
+            logger.info("Resumed %d runs continued from other processes", len(resumed))
+        return resumed
+
+    async def check_finished(self) -> list[UUID]:
+        """Stop the runs executing here that finished elsewhere; returns their ids.
+
+        Covers runs canceled through another process as well as runs the
+        reaper failed; the engine leaves their recorded outcome in place.
+        """
+        active = [
+            run_id
+            for run_id in self._coordinator.active_run_ids()
+            if not self._coordinator.finishing(run_id)
+        ]
+        if not active:
+            return []
+        async with self._new_session() as session:
+            finished = await self.run_repository.get_finished_run_ids(session, active)
+        if finished:
+            await asyncio.gather(
+                *(
+                    self._coordinator.cancel(run_id, RUN_CANCEL_TIMEOUT_SECONDS)
+                    for run_id in finished
+                )
+            )
+            logger.info("Stopped %d runs finished by other processes", len(finished))
+        return finished
+
+    def _new_session(self) -> AsyncSession:
+        session_factory = self._session_factory or db.AsyncSessionLocal
+        return session_factory()
+
+    async def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            try:
+                await self.check()
+                await self.check_finished()
+            except Exception:
+                logger.exception("Run resume check failed")
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.wait_interval)
+
+    async def _listen(self) -> None:
+        """LISTEN for run signals, reconnecting when the connection drops."""
+        while True:
+            try:
+                async with self._notify_engine.connect() as conn:
+                    raw = await conn.get_raw_connection()
+                    driver = raw.driver_connection
+                    await driver.add_listener(RUN_SIGNAL_CHANNEL, self._on_notify)
+                    logger.info("Listening for run signals on %s", RUN_SIGNAL_CHANNEL)
+                    self._notified = True
+                    try:
+                        # Catch up on signals sent while not listening
+                        self.wake()
+                        while not driver.is_closed():
+                            await asyncio.sleep(self.reconnect)
+                    finally:
+                        # Poll at the normal interval until reconnected
+                        self._notified = False
+                        self.wake()
+                        with contextlib.suppress(Exception):
+                            await driver.remove_listener(
+                                RUN_SIGNAL_CHANNEL, self._on_notify
+                            )
+            except Exception:
+                logger.warning(
+                    "Run resume notifications unavailable; polling only",
+                    exc_info=True,
+                )
+            await asyncio.sleep(self.reconnect)
+
+    def _on_notify(self, *_args: Any) -> None:
+        self.wake()
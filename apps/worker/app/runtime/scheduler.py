@@ -3,45 +3,110 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
-from collections.abc import Callable
-from typing import Any
+from collections.abc import Callable, Sequence
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import Flow, Run
+from app.constants import RUN_BATCH_PROVISION_CONCURRENCY, RUN_CANCEL_TIMEOUT_SECONDS
+from app.models import Flow, Run, RunPriority
 from app.runtime.adapters.steel import SteelBrowserAdapter
 from app.runtime.core import RunnerCoordinator
 from app.runtime.engine import EventEmitter
 from app.runtime.engine.flow_engine import FlowEngine
 from app.services.event.service import EventService
+from app.services.event.sink import EventSink
+from app.services.run.errors import RunCanceledError, RunNotPendingError
+from app.services.run.queue import RunQueueRepository
 from app.services.run.service import RunService
 from app.services.steel_service import SteelService
 
+if TYPE_CHECKING:
+    from app.runtime.admission import AdmissionController, AdmissionTicket
+    from app.runtime.queue import RunQueueDispatcher
+
 logger = logging.getLogger(__name__)
 
+# Strong references to in-flight provisioning tasks so they are not collected
+_provisioning_tasks: set[asyncio.Task] = set()
+
 
 class RunScheduler:
     """Coordinates background execution of runs via FlowEngine."""
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         coordinator: RunnerCoordinator,
         session_factory: Callable[[], AsyncSession],
         run_service_factory: Callable[[], RunService] | None = None,
         steel_service_factory: Callable[[], SteelService] | None = None,
         event_service_factory: Callable[[], EventService] | None = None,
+        *,
+        event_sink: EventSink | None = None,
+        dispatcher: RunQueueDispatcher | None = None,
+        admission: AdmissionController | None = None,
     ) -> None:
         self._coordinator = coordinator
         self._session_factory = session_factory
         self._run_service_factory = run_service_factory or RunService
         self._steel_service_factory = steel_service_factory or SteelService
         self._event_service_factory = event_service_factory or EventService
+        self._event_sink = event_sink
+        self._dispatcher = dispatcher
+        self._admission = admission
+
+    @property
+    def queued(self) -> bool:
+        """Whether PENDING runs are handed over through the durable run queue.
+
+        Queued runs should be created with their queue entries; `provision`
+        and `provision_many` then only make sure the runs are queued and
+        leave execution to whichever worker claims them.
+        """
+        return self._dispatcher is not None
+
+    @property
+    def admits_locally(self) -> bool:
+        """Whether runs are admitted in this process before being provisioned."""
+        return True
+
+    async def admit(
+        self,
+        user_id: UUID,
+        flow_id: UUID,
+        priority: RunPriority = RunPriority.NORMAL,
+    ) -> AdmissionTicket | None:
+        """Wait for a concurrency slot before provisioning a run's session.
+
+        The ticket is handed to `schedule`, which holds it until the run's
+        execution ends; release it with `release` if the run never gets there.
+        """
+        if self._admission is None:
+            return None
+        return await self._admission.acquire(user_id, flow_id, priority)
+
+    def release(self, ticket: AdmissionTicket | None) -> None:
+        """Give back a concurrency slot obtained from `admit`."""
+        if ticket is not None and self._admission is not None:
+            self._admission.release(ticket)
 
     async def schedule(
-        self, run: Run, *, input_payload: dict[str, Any] | None = None
+        self,
+        run: Run,
+        *,
+        input_payload: dict[str, Any] | None = None,
+        admission: AdmissionTicket | None = None,
     ) -> None:
-        """Start background execution for a run."""
+        """Start background execution for a run.
+
+        Without an explicit `input_payload` the run's stored input is used.
+        An `admission` ticket is released once the run's task finishes, or
+        right away when the run cannot be started.
+        """
 
         session = self._session_factory()
         try:
@@ -53,6 +118,7 @@ class RunScheduler:
                     run.flow_id,
                 )
                 await session.close()
+                self.release(admission)
                 return
 
             manifest_payload: dict[str, Any] = {
@@ -64,15 +130,20 @@ class RunScheduler:
             }
 
             steel_adapter = SteelBrowserAdapter(session, self._steel_service_factory())
-            event_emitter = EventEmitter(session, self._event_service_factory())
+            event_emitter = EventEmitter(
+                session, self._event_service_factory(), sink=self._event_sink
+            )
             flow_engine = FlowEngine(
                 run_service=self._run_service_factory(),
                 session_provider=steel_adapter,
                 session=session,
                 event_emitter=event_emitter,
                 coordinator=self._coordinator,
+                on_finished=session.close,
             )
 
+            if input_payload is None:
+                input_payload = run.input_payload
             await flow_engine.start(run, manifest_payload, input_payload or {})
             task = self._coordinator.get_task(run.id)
             if task is None:
@@ -81,14 +152,129 @@ class RunScheduler:
                     run.id,
                 )
                 await session.close()
+                self.release(admission)
                 return
+            if admission is not None:
+                task.add_done_callback(lambda _: self.release(admission))
 
-            def _close_session(t: asyncio.Task) -> None:
-                loop = t.get_loop()
-                loop.create_task(session.close())
-
-            task.add_done_callback(_close_session)
         except Exception:
             logger.exception("Failed to schedule FlowEngine for run %s", run.id)
             await session.close()
+            self.release(admission)
             raise
+
+    async def resume(
+        self, run_id: UUID, input_payload: dict[str, Any] | None = None
+    ) -> bool:
+        """Signal a paused run to continue with `input_payload`.
+
+        Returns False when the run is not paused in this process.
+        """
+        if not self._coordinator.has_task(run_id) or not self._coordinator.has_event(
+            run_id
+        ):
+            return False
+        self._coordinator.resume(run_id, input_payload)
+        return True
+
+    async def cancel(
+        self, run_id: UUID, *, timeout: float = RUN_CANCEL_TIMEOUT_SECONDS
+    ) -> bool:
+        """Cancel a run's background task, waiting at most `timeout` seconds.
+
+        The engine marks the run CANCELED, stops its agent and releases its
+        browser session as the task unwinds. Returns False when the run has
+        no task in this process.
+        """
+        return await self._coordinator.cancel(run_id, timeout)
+
+    def provision(
+        self, run: Run, run_service: RunService | None = None
+    ) -> asyncio.Task:
+        """Provision a PENDING run's browser session, then start it, in the background.
+
+        Progress and failures are reported through run status and progress
+        events; the caller does not wait for the browser provider.
+        """
+        if self._dispatcher is not None:
+            return self._enqueue([run])
+        run_service = run_service or self._run_service_factory()
+        return _track(
+            asyncio.create_task(self._provision_and_schedule(run, run_service))
+        )
+
+    def provision_many(
+        self,
+        runs: Sequence[Run],
+        run_service: RunService | None = None,
+        *,
+        concurrency: int = RUN_BATCH_PROVISION_CONCURRENCY,
+    ) -> asyncio.Task:
+        """Like `provision`, for many runs with at most `concurrency` in flight."""
+        if self._dispatcher is not None:
+            return self._enqueue(runs)
+        run_service = run_service or self._run_service_factory()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def provision_all() -> None:
+            await asyncio.gather(
+                *(
+                    self._provision_and_schedule(run, run_service, semaphore)
+                    for run in runs
+                )
+            )
+
+        return _track(asyncio.create_task(provision_all()))
+
+    def _enqueue(self, runs: Sequence[Run]) -> asyncio.Task:
+        dispatcher = self._dispatcher
+
+        async def enqueue() -> None:
+            async with self._session_factory() as session:
+                await RunQueueRepository().enqueue(
+                    session, [run.id for run in runs], datetime.now(UTC)
+                )
+            dispatcher.wake()
+
+        return _track(asyncio.create_task(enqueue()))
+
+    async def _provision_and_schedule(
+        self,
+        run: Run,
+        run_service: RunService,
+        semaphore: asyncio.Semaphore | None = None,
+    ) -> None:
+        run_id = run.id
+        # Wait for a slot before holding a provisioning slot or a session
+        ticket = await self.admit(run.user_id, run.flow_id, run.priority)
+        try:
+            async with (
+                semaphore or contextlib.nullcontext(),
+                self._session_factory() as session,
+            ):
+                run, _ = await run_service.provision_run(run_id, session)
+        except RunCanceledError:
+            logger.info("Run %s canceled before it started", run_id)
+            self.release(ticket)
+            return
+        except RunNotPendingError as e:
+            # Another provisioner claimed the run first, or it already ended
+            logger.info("Skipping provisioning: %s", e)
+            self.release(ticket)
+            return
+        except Exception:
+            logger.exception("Failed to provision run %s", run_id)
+            self.release(ticket)
+            return
+        except asyncio.CancelledError:
+            self.release(ticket)
+            raise
+        # Scheduling failures are logged by `schedule` itself
+        with contextlib.suppress(Exception):
+            await self.schedule(run, admission=ticket)
+
+
+def _track(task: asyncio.Task) -> asyncio.Task:
+    _provisioning_tasks.add(task)
+    task.add_done_callback(_provisioning_tasks.discard)
+    return task
@@ -0,0 +1,6 @@
+"""Run checkpoint service package."""
+
+from .repository import CheckpointRepository
+from .service import CheckpointService
+
+__all__ = ["CheckpointRepository", "CheckpointService"]
@@ -0,0 +1,94 @@
+"""Checkpoint repository for data access operations."""
+
+import logging
+from collections.abc import Sequence
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import CheckpointStatus, Run, RunCheckpoint, RunStatus
+
+logger = logging.getLogger(__name__)
+
+
+class CheckpointRepository:
+    """Repository for run checkpoint persistence operations."""
+
+    async def get_active(
+        self, session: AsyncSession, run_id: UUID, now: datetime
+    ) -> RunCheckpoint | None:
+        """Get the run's checkpoint awaiting input, if it has not expired."""
+        result = await session.execute(
+            select(RunCheckpoint)
+            .where(RunCheckpoint.run_id == run_id)
+            .where(RunCheckpoint.status == CheckpointStatus.AWAITING_INPUT)
+            .where(RunCheckpoint.expires_at > now)
+            .order_by(RunCheckpoint.created_at.desc())
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+
+    async def resolve_open(
+        self,
+        session: AsyncSession,
+        run_ids: Sequence[UUID],
+        status: CheckpointStatus,
+        now: datetime,
+    ) -> int:
+        """Resolve the runs' checkpoints awaiting input to `status`, without commit."""
+        if not run_ids:
+            return 0
+        result = await session.execute(
+            update(RunCheckpoint)
+            .where(RunCheckpoint.run_id.in_(run_ids))
+            .where(RunCheckpoint.status == CheckpointStatus.AWAITING_INPUT)
+            .values(status=status, resolved_at=now)
+        )
+        return result.rowcount
+
+    async def record_input(
+        self, session: AsyncSession, run_id: UUID, input_payload: dict | None
+    ) -> int:
+        """Store a run's continue input on its open checkpoint, without commit."""
+        result = await session.execute(
+            update(RunCheckpoint)
+            .where(RunCheckpoint.run_id == run_id)
+            .where(RunCheckpoint.status == CheckpointStatus.AWAITING_INPUT)
+            .values(input_payload=input_payload)
+        )
+        return result.rowcount
+
+    async def get_continued(
+        self, session: AsyncSession, run_ids: Sequence[UUID]
+    ) -> list[tuple[UUID, dict | None]]:
+        """Get runs continued while their checkpoint still awaits its engine.
+
+        Such a run is RUNNING in the DB while the checkpoint it paused at is
+        still awaiting input; the checkpoint carries the input it was
+        continued with.
+        """
+        if not run_ids:
+            return []
+        result = await session.execute(
+            select(RunCheckpoint.run_id, RunCheckpoint.input_payload)
+            .join(Run, Run.id == RunCheckpoint.run_id)
+            .where(RunCheckpoint.run_id.in_(run_ids))
+            .where(RunCheckpoint.status == CheckpointStatus.AWAITING_INPUT)
+            .where(Run.status == RunStatus.RUNNING)
+        )
+        return [(row.run_id, row.input_payload) for row in result]
+
+    async def get_expired(
+        self, session: AsyncSession, now: datetime, limit: int = 100
+    ) -> list[RunCheckpoint]:
+        """Get checkpoints still awaiting input whose deadline has passed."""
+        result = await session.execute(
+            select(RunCheckpoint)
+            .where(RunCheckpoint.status == CheckpointStatus.AWAITING_INPUT)
+            .where(RunCheckpoint.expires_at <= now)
+            .order_by(RunCheckpoint.expires_at)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
@@ -0,0 +1,112 @@
+"""Checkpoint service tracking where runs are paused for human input."""
+
+import logging
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import CheckpointStatus, RunCheckpoint
+from app.services.checkpoint.repository import CheckpointRepository
+from app.utils.pagination import as_utc
+
+logger = logging.getLogger(__name__)
+
+
+class CheckpointService:
+    """Service for the active-checkpoint state of runs.
+
+    `open_checkpoint` and `resolve_checkpoint` only stage changes on the
+    session; they are committed together with the run status update that
+    accompanies them, so checkpoint state and run status change atomically.
+    """
+
+    def __init__(self, repository: CheckpointRepository | None = None):
+        self.repository = repository or CheckpointRepository()
+
+    def open_checkpoint(  # noqa: PLR0913
+        self,
+        session: AsyncSession,
+        run_id: UUID,
+        checkpoint_id: str,
+        *,
+        step_index: int,
+        reason: str,
+        expected_action: str,
+        expires_at: datetime,
+    ) -> RunCheckpoint:
+        """Stage a new checkpoint awaiting input for a run."""
+        checkpoint = RunCheckpoint(
+            run_id=run_id,
+            checkpoint_id=checkpoint_id,
+            step_index=step_index,
+            reason=reason,
+            expected_action=expected_action,
+            expires_at=expires_at,
+        )
+        session.add(checkpoint)
+        return checkpoint
+
+    def resolve_checkpoint(
+        self,
+        session: AsyncSession,
+        checkpoint: RunCheckpoint,
+        status: CheckpointStatus,
+    ) -> None:
+        """Stage the transition of a checkpoint out of awaiting input."""
+        checkpoint.status = status
+        checkpoint.resolved_at = datetime.now(UTC)
+        session.add(checkpoint)
+
+    async def resolve_open_checkpoints(
+        self,
+        session: AsyncSession,
+        run_ids: Sequence[UUID],
+        status: CheckpointStatus,
+    ) -> int:
+        """Stage resolving the runs' checkpoints awaiting input to `status`."""
+        return await self.repository.resolve_open(
+            session, run_ids, status, datetime.now(UTC)
+        )
+
+    async def record_resume_input(
+        self, session: AsyncSession, run_id: UUID, input_payload: dict | None
+    ) -> None:
+        """Stage the input a run is continued with on its open checkpoint."""
+        await self.repository.record_input(session, run_id, input_payload)
+
+    async def get_continued_runs(
+        self, session: AsyncSession, run_ids: Sequence[UUID]
+    ) -> dict[UUID, dict | None]:
+        """Get which of the paused runs were continued, with their input."""
+        return dict(await self.repository.get_continued(session, run_ids))
+
+    async def get_active_checkpoint(
+        self, run_id: UUID, session: AsyncSession
+    ) -> dict | None:
+        """Get the run's unexpired checkpoint awaiting input.
+
+        Returns:
+            Checkpoint data dict shaped like the `checkpoint_reached` event
+            payload, or None if the run is not paused at a checkpoint.
+        """
+        checkpoint = await self.repository.get_active(
+            session, run_id, datetime.now(UTC)
+        )
+        if checkpoint is None:
+            return None
+        return {
+            "id": checkpoint.checkpoint_id,
+            "index": checkpoint.step_index,
+            "reason": checkpoint.reason,
+            "expected_action": checkpoint.expected_action,
+            "expires_at": as_utc(checkpoint.expires_at).isoformat(),
+            "status": checkpoint.status.value,
+        }
+
+    async def get_expired_checkpoints(
+        self, session: AsyncSession, limit: int = 100
+    ) -> list[RunCheckpoint]:
+        """Get checkpoints awaiting input whose deadline has passed."""
+        return await self.repository.get_expired(session, datetime.now(UTC), limit)
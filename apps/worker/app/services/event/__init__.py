@@ -1,13 +1,20 @@
 """Event service for managing flow execution events."""
 
+from .broadcaster import EventBroadcaster, event_broadcaster
+from .compaction import EventCompactor
 from .errors import EventAccessDeniedError, EventError, EventNotFoundError
 from .repository import EventRepository
 from .service import EventService
+from .sink import EventSink
 
 __all__ = [
     "EventAccessDeniedError",
+    "EventBroadcaster",
+    "EventCompactor",
     "EventError",
     "EventNotFoundError",
     "EventRepository",
     "EventService",
+    "EventSink",
+    "event_broadcaster",
 ]
@@ -0,0 +1,89 @@
+"""In-process fan-out of persisted run events to live subscribers."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import defaultdict
+from collections.abc import Callable
+from uuid import UUID
+
+from app.constants import EVENT_SUBSCRIBER_QUEUE_SIZE
+from app.models import EventRead
+
+logger = logging.getLogger(__name__)
+
+
+class EventSubscription:
+    """A bounded queue of events for one live subscriber of a run.
+
+    A subscriber that falls `max_queue_size` events behind is marked as
+    lagged instead of growing its queue; consumers should then drop the
+    connection and resume from their last seen cursor.
+    """
+
+    def __init__(self, run_id: UUID, max_queue_size: int) -> None:
+        self.run_id = run_id
+        self.lagged = False
+        self._queue: asyncio.Queue[EventRead] = asyncio.Queue(maxsize=max_queue_size)
+
+    def offer(self, event: EventRead) -> None:
+        if self.lagged:
+            return
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.lagged = True
+            logger.warning("Event subscriber for run %s lagged; dropping", self.run_id)
+
+    async def get(self) -> EventRead:
+        return await self._queue.get()
+
+    def get_nowait(self) -> EventRead | None:
+        try:
+            return self._queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return None
+
+
+class EventBroadcaster:
+    """Publishes events to subscribers of the run they belong to."""
+
+    def __init__(self, max_queue_size: int = EVENT_SUBSCRIBER_QUEUE_SIZE) -> None:
+        self.max_queue_size = max_queue_size
+        self._subscribers: dict[UUID, set[EventSubscription]] = defaultdict(set)
+        # Callbacks receiving every run's events, e.g. to forward them
+        self._listeners: list[Callable[[EventRead], None]] = []
+
+    def subscribe(self, run_id: UUID) -> EventSubscription:
+        subscription = EventSubscription(run_id, self.max_queue_size)
+        self._subscribers[run_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: EventSubscription) -> None:
+        subscribers = self._subscribers.get(subscription.run_id)
+        if subscribers is None:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            self._subscribers.pop(subscription.run_id, None)
+
+    def add_listener(self, listener: Callable[[EventRead], None]) -> None:
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[EventRead], None]) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def has_subscribers(self, run_id: UUID) -> bool:
+        return bool(self._listeners) or bool(self._subscribers.get(run_id))
+
+    def publish(self, event: EventRead) -> None:
+        for subscription in tuple(self._subscribers.get(event.run_id, ())):
+            subscription.offer(event)
+        for listener in tuple(self._listeners):
+            listener(event)
+
+
+# Process-wide broadcaster shared by the event writers and the SSE endpoint
+event_broadcaster = EventBroadcaster()
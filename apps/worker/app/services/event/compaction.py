@@ -0,0 +1,167 @@
+"""Background retention and compaction of run events."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import db
+from app.config import (
+    DEFAULT_EVENT_COMPACTION_BATCH_PAUSE_MS,
+    DEFAULT_EVENT_COMPACTION_BATCH_SIZE,
+    DEFAULT_EVENT_COMPACTION_INTERVAL_SECONDS,
+)
+from app.models import EventType
+from app.services.event.repository import EventRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CompactionBatch:
+    """Outcome of one compaction transaction."""
+
+    event_type: EventType
+    deleted: int
+    summarized_runs: int
+    elapsed: float
+
+
+@dataclass
+class CompactionReport:
+    """Outcome of one compaction pass over every retention window."""
+
+    batches: list[CompactionBatch] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def deleted(self) -> int:
+        return sum(batch.deleted for batch in self.batches)
+
+    @property
+    def summarized_runs(self) -> int:
+        return sum(batch.summarized_runs for batch in self.batches)
+
+
+class EventCompactor:
+    """Deletes events past their per-type retention window in small batches.
+
+    Only events of terminal runs are compacted. Each run's `RunEventSummary`
+    (counts per type, first/last timestamp and final error) is maintained on
+    insert and is left untouched, so the run's history stays answerable;
+    runs whose events predate summaries are rolled up before any deletion.
+    Each batch is its own short transaction, followed by a pause, so
+    compaction never holds the write lock for long.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        retention: dict[str, timedelta],
+        session_factory: Callable[[], AsyncSession] | None = None,
+        repository: EventRepository | None = None,
+        *,
+        batch_size: int = DEFAULT_EVENT_COMPACTION_BATCH_SIZE,
+        batch_pause: float = DEFAULT_EVENT_COMPACTION_BATCH_PAUSE_MS / 1000,
+        interval: float = DEFAULT_EVENT_COMPACTION_INTERVAL_SECONDS,
+    ) -> None:
+        self.retention = {EventType(key): value for key, value in retention.items()}
+        self._session_factory = session_factory
+        self.repository = repository or EventRepository()
+        self.batch_size = batch_size
+        self.batch_pause = batch_pause
+        self.interval = interval
+        self._worker: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._worker is not None and not self._worker.done()
+
+    def start(self) -> None:
+        """Start running compaction passes every `interval` seconds."""
+        if self.running:
+            return
+        self._worker = asyncio.create_task(self._run())
+        logger.info("Event compaction started (interval=%ss)", self.interval)
+
+    async def stop(self) -> None:
+        """Cancel the periodic task, abandoning any pass in progress."""
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._worker
+        self._worker = None
+        logger.info("Event compaction stopped")
+
+    async def compact(self, now: datetime | None = None) -> CompactionReport:
+        """Run one pass, draining every retention window batch by batch."""
+        now = now or datetime.now(UTC)
+        report = CompactionReport()
+        start = time.perf_counter()
+        for event_type, window in self.retention.items():
+            cutoff = now - window
+            while True:
+                batch = await self._compact_batch(event_type, cutoff)
+                if batch.deleted:
+                    report.batches.append(batch)
+                    logger.info(
+                        "Compacted %d %s events (%d runs summarized) in %.3fs",
+                        batch.deleted,
+                        event_type.value,
+                        batch.summarized_runs,
+                        batch.elapsed,
+                    )
+                if batch.deleted < self.batch_size:
+                    break
+                await asyncio.sleep(self.batch_pause)
+        report.elapsed = time.perf_counter() - start
+        if report.batches:
+            logger.info(
+                "Event compaction pass deleted %d events in %d batches (%.3fs)",
+                report.deleted,
+                len(report.batches),
+                report.elapsed,
+            )
+        return report
+
+    async def _compact_batch(
+        self, event_type: EventType, cutoff: datetime
+    ) -> CompactionBatch:
+        start = time.perf_counter()
+        session_factory = self._session_factory or db.AsyncSessionLocal
+        async with session_factory() as session:
+            expired = await self.repository.get_expired_events(
+                session, event_type, cutoff, self.batch_size
+            )
+            summarized = 0
+            deleted = 0
+            if expired:
+                run_ids = {run_id for _, run_id in expired}
+                summarized = await self.repository.create_missing_summaries(
+                    session, run_ids
+                )
+                deleted = await self.repository.delete_events(
+                    session, [event_id for event_id, _ in expired]
+                )
+                await session.commit()
+        return CompactionBatch(
+            event_type=event_type,
+            deleted=deleted,
+            summarized_runs=summarized,
+            elapsed=time.perf_counter() - start,
+        )
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.compact()
+            except Exception:
+                logger.exception("Event compaction pass failed")
+            await asyncio.sleep(self.interval)
@@ -0,0 +1,61 @@
+"""Streaming NDJSON export of a run's full event history."""
+
+from __future__ import annotations
+
+import zlib
+from collections.abc import AsyncIterator, Callable
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import db
+from app.constants import EVENT_EXPORT_CHUNK_SIZE
+from app.models import EventRead
+from app.services.run.repository import RunRepository
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+GZIP_MEDIA_TYPE = "application/gzip"
+
+# zlib window bits selecting the gzip container format
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+async def iter_event_ndjson(
+    run_id: UUID,
+    *,
+    gzip: bool = False,
+    session_factory: Callable[[], AsyncSession] | None = None,
+    chunk_size: int = EVENT_EXPORT_CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    """Yield a run's events as NDJSON, one encoded chunk per fetched batch.
+
+    Events are read `chunk_size` at a time by keyset, each batch in its own
+    short transaction, so a slow client never holds a read transaction open
+    against event writers. When `gzip` is set output is compressed
+    incrementally, so at most one chunk of rows and its encoded bytes are
+    held in memory at a time.
+    """
+    compressor = zlib.compressobj(wbits=_GZIP_WBITS) if gzip else None
+    repository = RunRepository()
+    session_factory = session_factory or db.AsyncSessionLocal
+    after = None
+    while True:
+        async with session_factory() as session:
+            rows = await repository.get_event_rows(
+                session, run_id, after=after, limit=chunk_size
+            )
+        if not rows:
+            break
+        after = (rows[-1]["at"], rows[-1]["id"])
+        data = b"".join(
+            EventRead.model_validate(row).model_dump_json().encode() + b"\n"
+            for row in rows
+        )
+        if compressor is not None:
+            data = compressor.compress(data)
+        if data:
+            yield data
+        if len(rows) < chunk_size:
+            break
+    if compressor is not None:
+        yield compressor.flush()
@@ -1,30 +1,226 @@
 """Event repository for data access operations."""
 
 import logging
-from uuid import UUID
+import threading
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from datetime import UTC, datetime, timedelta
+from itertools import chain
+from typing import Any
+from uuid import UUID, uuid4
 
-from sqlalchemy import desc, select
+from sqlalchemy import JSON, Integer, cast, delete, desc, func, insert, select
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import Event, EventCreate, EventType
+from app.models import (
+    TERMINAL_RUN_STATUSES,
+    Event,
+    EventCreate,
+    EventRead,
+    EventType,
+    Run,
+    RunEventSummary,
+)
 
 logger = logging.getLogger(__name__)
 
+_EVENT_COLUMNS = tuple(Event.__table__.c)
+_clock_lock = threading.Lock()
+_last_event_at = datetime.min.replace(tzinfo=UTC)
+
+
+def next_event_timestamp() -> datetime:
+    """Return a UTC timestamp strictly greater than any previously issued one.
+
+    Events are ordered by `(at, id)`; keeping `at` monotonic per process
+    preserves emission order even when several events share a clock tick.
+    """
+    global _last_event_at  # noqa: PLW0603
+    with _clock_lock:
+        now = datetime.now(UTC)
+        if now <= _last_event_at:
+            now = _last_event_at + timedelta(microseconds=1)
+        _last_event_at = now
+        return now
+
+
+def build_event_row(event_data: EventCreate) -> dict[str, Any]:
+    """Build an insertable event row with client-generated id and timestamp."""
+    return {
+        "id": uuid4(),
+        "run_id": event_data.run_id,
+        "type": event_data.type,
+        "message": event_data.message,
+        "payload": event_data.payload,
+        "at": next_event_timestamp(),
+    }
+
+
+def _summary_upserts(
+    rows: Iterable[Mapping[str, Any]], dialect: str = "sqlite"
+) -> list[Any]:
+    """Build one `run_event_summary` upsert per run touched by `rows`.
+
+    Each statement adds the rows' per-type counts to the stored JSON counts,
+    widens the first/last timestamps and replaces the last error, all in SQL,
+    so concurrent writers never lose an update. `dialect` selects the SQLite
+    or Postgres form of the upsert and JSON functions.
+    """
+    by_run: dict[UUID, list[Mapping[str, Any]]] = {}
+    for row in rows:
+        by_run.setdefault(row["run_id"], []).append(row)
+
+    postgresql = dialect == "postgresql"
+    table = RunEventSummary.__table__
+    now = datetime.now(UTC)
+    statements = []
+    for run_id, run_rows in by_run.items():
+        counts = Counter(EventType(row["type"]).value for row in run_rows)
+        last_error = None
+        for row in run_rows:
+            if EventType(row["type"]) == EventType.ERROR:
+                last_error = (row.get("payload") or {}).get("error") or row.get(
+                    "message"
+                )
+        stmt = (postgresql_insert if postgresql else sqlite_insert)(table).values(
+            run_id=run_id,
+            event_counts=dict(counts),
+            event_count=len(run_rows),
+            first_event_at=min(row["at"] for row in run_rows),
+            last_event_at=max(row["at"] for row in run_rows),
+            last_error=last_error,
+            updated_at=now,
+        )
+        excluded = stmt.excluded
+        first_event_at = func.coalesce(table.c.first_event_at, excluded.first_event_at)
+        last_event_at = func.coalesce(table.c.last_event_at, excluded.last_event_at)
+        if postgresql:
+            merged_counts = _merge_counts_postgresql(table.c.event_counts, counts)
+            first_event_at = func.least(first_event_at, excluded.first_event_at)
+            last_event_at = func.greatest(last_event_at, excluded.last_event_at)
+        else:
+            merged_counts = _merge_counts_sqlite(table.c.event_counts, counts)
+            first_event_at = func.min(first_event_at, excluded.first_event_at)
+            last_event_at = func.max(last_event_at, excluded.last_event_at)
+        statements.append(
+            stmt.on_conflict_do_update(
+                index_elements=[table.c.run_id],
+                set_={
+                    "event_counts": merged_counts,
+                    "event_count": table.c.event_count + excluded.event_count,
+                    "first_event_at": first_event_at,
+                    "last_event_at": last_event_at,
+                    "last_error": func.coalesce(
+                        excluded.last_error, table.c.last_error
+                    ),
+                    "updated_at": excluded.updated_at,
+                },
+            )
+        )
+    return statements
+
+
+def _merge_counts_sqlite(current: Any, counts: Mapping[str, int]) -> Any:
+    return func.json_set(
+        current,
+        *chain.from_iterable(
+            (
+                f'$."{event_type}"',
+                func.coalesce(func.json_extract(current, f'$."{event_type}"'), 0)
+                + count,
+            )
+            for event_type, count in counts.items()
+        ),
+    )
+
+
+def _merge_counts_postgresql(current: Any, counts: Mapping[str, int]) -> Any:
+    stored = cast(current, JSONB)
+    added = func.jsonb_build_object(
+        *chain.from_iterable(
+            (
+                event_type,
+                func.coalesce(cast(stored.op("->>")(event_type), Integer), 0) + count,
+            )
+            for event_type, count in counts.items()
+        )
+    )
+    return cast(stored.op("||")(added), JSON)
+
 
 class EventRepository:
     """Repository for event persistence operations."""
 
+    async def insert_event(
+        self, session: AsyncSession, event_data: EventCreate
+    ) -> EventRead:
+        """Insert a single event with one Core statement and commit.
+
+        Uses `INSERT ... RETURNING` when the dialect supports it; otherwise the
+        result is built from the client-generated values that were inserted.
+        No ORM object is created and no refresh round trip is made.
+        """
+        row = build_event_row(event_data)
+        stmt = insert(Event.__table__).values(row)
+        if session.get_bind().dialect.insert_returning:
+            result = await session.execute(stmt.returning(*_EVENT_COLUMNS))
+            values: Any = result.mappings().one()
+        else:
+            await session.execute(stmt)
+            values = row
+        await self.update_summaries(session, [row])
+        await session.commit()
+        logger.debug("Inserted event: %s for run %s", row["type"], row["run_id"])
+        return EventRead.model_validate(values)
+
     async def create_event(
         self, session: AsyncSession, event_data: EventCreate
     ) -> Event:
-        """Create a new event in the database."""
+        """Create a new event through the ORM (add, commit and refresh)."""
         event = Event(**event_data.model_dump())
         session.add(event)
+        await self.update_summaries(session, [event.model_dump()])
         await session.commit()
         await session.refresh(event)
         logger.debug("Created event: %s for run %s", event.type.value, event.run_id)
         return event
 
+    async def create_events(
+        self, session: AsyncSession, rows: list[dict[str, Any]]
+    ) -> int:
+        """Insert many event rows with a single multi-row INSERT and commit.
+
+        Rows are expected to be built with `build_event_row` so ids and
+        timestamps are already assigned. Returns the number of inserted rows.
+        """
+        if not rows:
+            return 0
+        await session.execute(insert(Event.__table__).values(rows))
+        await self.update_summaries(session, rows)
+        await session.commit()
+        logger.debug("Inserted batch of %d events", len(rows))
+        return len(rows)
+
+    async def update_summaries(
+        self, session: AsyncSession, rows: Iterable[Mapping[str, Any]]
+    ) -> None:
+        """Fold new event rows into their runs' summaries. Does not commit."""
+        dialect = session.get_bind().dialect.name
+        for stmt in _summary_upserts(rows, dialect):
+            await session.execute(stmt)
+
+    async def get_event_summaries(
+        self, session: AsyncSession, run_ids: Iterable[UUID]
+    ) -> dict[UUID, RunEventSummary]:
+        """Get the event summaries of many runs with one primary-key lookup."""
+        result = await session.execute(
+            select(RunEventSummary).where(RunEventSummary.run_id.in_(list(run_ids)))
+        )
+        return {summary.run_id: summary for summary in result.scalars()}
+
     async def get_event_by_id(
         self, session: AsyncSession, event_id: UUID
     ) -> Event | None:
@@ -72,3 +268,86 @@ class EventRepository:
         deleted_count = result.rowcount
         logger.info("Deleted %d events for run %s", deleted_count, run_id)
         return deleted_count
+
+    async def get_expired_events(
+        self,
+        session: AsyncSession,
+        event_type: EventType,
+        cutoff: datetime,
+        limit: int,
+    ) -> list[tuple[UUID, UUID]]:
+        """Get `(event_id, run_id)` pairs of a type older than `cutoff`.
+
+        Only events of runs in a terminal status are returned, oldest first.
+        """
+        stmt = (
+            select(Event.id, Event.run_id)
+            .join(Run, Run.id == Event.run_id)
+            .where(Event.type == event_type)
+            .where(Event.at < cutoff)
+            .where(Run.status.in_(TERMINAL_RUN_STATUSES))
+            .order_by(Event.at)
+            .limit(limit)
+        )
+        result = await session.execute(stmt)
+        return [(row.id, row.run_id) for row in result]
+
+    async def create_missing_summaries(
+        self, session: AsyncSession, run_ids: set[UUID]
+    ) -> int:
+        """Roll up all events of runs that have no summary yet.
+
+        Summaries are maintained on insert; this backfills runs whose events
+        predate that. Does not commit. Returns the number of summaries created.
+        """
+        existing = await session.execute(
+            select(RunEventSummary.run_id).where(RunEventSummary.run_id.in_(run_ids))
+        )
+        missing = run_ids - set(existing.scalars())
+        if not missing:
+            return 0
+
+        summaries = {run_id: RunEventSummary(run_id=run_id) for run_id in missing}
+        counts = await session.execute(
+            select(
+                Event.run_id,
+                Event.type,
+                func.count(),
+                func.min(Event.at),
+                func.max(Event.at),
+            )
+            .where(Event.run_id.in_(missing))
+            .group_by(Event.run_id, Event.type)
+        )
+        for run_id, event_type, count, first_at, last_at in counts:
+            summary = summaries[run_id]
+            summary.event_counts = {
+                **summary.event_counts,
+                EventType(event_type).value: count,
+            }
+            summary.event_count += count
+            if summary.first_event_at is None or first_at < summary.first_event_at:
+                summary.first_event_at = first_at
+            if summary.last_event_at is None or last_at > summary.last_event_at:
+                summary.last_event_at = last_at
+
+        errors = await session.execute(
+            select(Event.run_id, Event.message, Event.payload)
+            .where(Event.run_id.in_(missing))
+            .where(Event.type == EventType.ERROR)
+            .order_by(desc(Event.at))
+        )
+        for run_id, message, payload in errors:
+            summary = summaries[run_id]
+            if summary.last_error is None:
+                summary.last_error = (payload or {}).get("error") or message
+
+        session.add_all(summaries.values())
+        return len(summaries)
+
+    async def delete_events(self, session: AsyncSession, event_ids: list[UUID]) -> int:
+        """Delete events by id. Does not commit. Returns the number deleted."""
+        if not event_ids:
+            return 0
+        result = await session.execute(delete(Event).where(Event.id.in_(event_ids)))
+        return result.rowcount
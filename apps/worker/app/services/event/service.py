@@ -1,14 +1,20 @@
 """Event service for managing flow execution events."""
 
+from __future__ import annotations
+
 import logging
-from datetime import UTC, datetime
+from typing import TYPE_CHECKING
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import EventCreate, EventRead, EventType
+from app.models import EventBatchItem, EventCreate, EventRead, EventType
+from app.services.checkpoint.service import CheckpointService
 from app.services.event.errors import EventNotFoundError
-from app.services.event.repository import EventRepository
+from app.services.event.repository import EventRepository, build_event_row
+
+if TYPE_CHECKING:
+    from app.runtime.engine.redaction import RedactionPolicy
 
 logger = logging.getLogger(__name__)
 
@@ -16,8 +22,13 @@ logger = logging.getLogger(__name__)
 class EventService:
     """Service for managing flow execution events with business logic."""
 
-    def __init__(self, repository: EventRepository | None = None):
+    def __init__(
+        self,
+        repository: EventRepository | None = None,
+        checkpoint_service: CheckpointService | None = None,
+    ):
         self.repository = repository or EventRepository()
+        self.checkpoint_service = checkpoint_service or CheckpointService()
 
     async def create_event(
         self,
@@ -53,13 +64,54 @@ class EventService:
         )
 
         try:
-            event = await self.repository.create_event(session, event_data)
-            return EventRead.model_validate(event)
+            return await self.repository.insert_event(session, event_data)
         except Exception:
             await session.rollback()
             logger.exception("Failed to create event")
             raise
 
+    async def create_events(
+        self,
+        run_id: UUID,
+        items: list[EventBatchItem],
+        session: AsyncSession,
+        *,
+        redaction: RedactionPolicy,
+    ) -> list[EventRead]:
+        """Redact and insert a batch of events for a run in one statement.
+
+        Args:
+            run_id: UUID of the run the events belong to
+            items: Validated events, in the order they should be recorded
+            redaction: Policy applied to every message and payload
+
+        Returns:
+            The inserted events, in batch order
+        """
+        # Items are already validated; skip a second validation per event
+        rows = [
+            build_event_row(
+                EventCreate.model_construct(
+                    run_id=run_id,
+                    type=item.type,
+                    message=(
+                        redaction.redact_text(item.message)
+                        if item.message is not None
+                        else None
+                    ),
+                    payload=redaction.redact(item.payload),
+                )
+            )
+            for item in items
+        ]
+        try:
+            await self.repository.create_events(session, rows)
+        except Exception:
+            await session.rollback()
+            logger.exception("Failed to create event batch for run %s", run_id)
+            raise
+        return [EventRead.model_validate(row) for row in rows]
+
     async def get_event_by_id(self, event_id: UUID, session: AsyncSession) -> EventRead:
         """Get an event by its ID.
 
@@ -118,7 +170,10 @@ class EventService:
     async def get_active_checkpoint(
         self, run_id: UUID, session: AsyncSession
     ) -> dict | None:
-        """Get the most recent active checkpoint for a run.
+        """Get the active checkpoint for a run.
+
+        Reads the indexed `run_checkpoint` state rather than scanning the
+        run's checkpoint events.
 
         Args:
             run_id: UUID of the run to check for active checkpoints
@@ -126,23 +181,7 @@ class EventService:
         Returns:
             Checkpoint data dict if found and not expired, None otherwise
         """
-        checkpoints = await self.get_run_checkpoints(run_id, session)
-
-        # Find the most recent checkpoint that hasn't expired
-        now = datetime.now(UTC)
-        for checkpoint in sorted(
-            checkpoints, key=lambda x: x.get("created_at", 0), reverse=True
-        ):
-            expires_at_str = checkpoint.get("expires_at")
-            if expires_at_str:
-                try:
-                    expires_at = datetime.fromisoformat(expires_at_str)
-                    if expires_at > now:
-                        return checkpoint
-                except (ValueError, TypeError):
-                    continue
-
-        return None
+        return await self.checkpoint_service.get_active_checkpoint(run_id, session)
 
     async def delete_run_events(self, run_id: UUID, session: AsyncSession) -> int:
         """Delete all events for a run.
@@ -0,0 +1,241 @@
+"""Write-behind sink that persists run events in batches."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import db
+from app.config import (
+    DEFAULT_EVENT_SINK_FLUSH_INTERVAL_MS,
+    DEFAULT_EVENT_SINK_MAX_BATCH_SIZE,
+    DEFAULT_EVENT_SINK_MAX_QUEUE_SIZE,
+    DEFAULT_EVENT_SINK_RETRY_ATTEMPTS,
+    DEFAULT_EVENT_SINK_RETRY_DELAY_MS,
+)
+from app.models import EventRead
+from app.services.event.broadcaster import EventBroadcaster, event_broadcaster
+from app.services.event.repository import EventRepository
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+@dataclass
+class EventSinkStats:
+    """Counters describing how reliably buffered events reach the database."""
+
+    batches: int = 0
+    written: int = 0
+    retries: int = 0
+    fallback_batches: int = 0
+    dropped: int = 0
+
+    def as_dict(self) -> dict:
+        return {
+            "batches": self.batches,
+            "written": self.written,
+            "retries": self.retries,
+            "fallback_batches": self.fallback_batches,
+            "dropped": self.dropped,
+        }
+
+
+class EventSink:
+    """Buffers event rows on an asyncio queue and flushes them in batches.
+
+    A single background task drains the queue, so rows are written in the
+    order they were enqueued. A batch is written once `max_batch_size` rows are
+    buffered, once the oldest buffered row has waited `flush_interval` seconds,
+    or as soon as a caller requests an explicit `flush()`. Rows are published
+    to live subscribers only after their batch has been committed.
+
+    A batch that fails to persist is retried `retry_attempts` times with
+    exponential backoff, then written row by row so one bad row cannot sink
+    its neighbours. Rows that still fail are dropped and counted in `stats`.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        session_factory: Callable[[], AsyncSession] | None = None,
+        repository: EventRepository | None = None,
+        *,
+        max_batch_size: int = DEFAULT_EVENT_SINK_MAX_BATCH_SIZE,
+        flush_interval: float = DEFAULT_EVENT_SINK_FLUSH_INTERVAL_MS / 1000,
+        max_queue_size: int = DEFAULT_EVENT_SINK_MAX_QUEUE_SIZE,
+        broadcaster: EventBroadcaster | None = None,
+        retry_attempts: int = DEFAULT_EVENT_SINK_RETRY_ATTEMPTS,
+        retry_delay: float = DEFAULT_EVENT_SINK_RETRY_DELAY_MS / 1000,
+    ) -> None:
+        self._session_factory = session_factory
+        self.broadcaster = broadcaster or event_broadcaster
+        self.repository = repository or EventRepository()
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self.max_queue_size = max_queue_size
+        self.retry_attempts = retry_attempts
+        self.retry_delay = retry_delay
+        self.stats = EventSinkStats()
+        self._queue: asyncio.Queue[Any] | None = None
+        self._worker: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._worker is not None and not self._worker.done()
+
+    async def start(self) -> None:
+        """Start the background flush task."""
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._worker = asyncio.create_task(self._run())
+        logger.info(
+            "Event sink started (batch=%d, interval=%.3fs)",
+            self.max_batch_size,
+            self.flush_interval,
+        )
+
+    async def stop(self) -> None:
+        """Flush everything still buffered and stop the background task."""
+        if not self.running or self._queue is None or self._worker is None:
+            return
+        await self._queue.put(_STOP)
+        await self._worker
+        self._worker = None
+        self._queue = None
+        logger.info("Event sink stopped")
+
+    async def enqueue(self, row: dict[str, Any]) -> None:
+        """Queue an event row; waits when the buffer is full (backpressure)."""
+        if self._queue is None:
+            msg = "Event sink is not running"
+            raise RuntimeError(msg)
+        await self._queue.put(row)
+
+    async def flush(self) -> None:
+        """Wait until every row queued before this call has been persisted."""
+        if self._queue is None:
+            return
+        marker: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        await self._queue.put(marker)
+        await marker
+
+    async def _run(self) -> None:
+        queue = self._queue
+        if queue is None:
+            return
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            item = await queue.get()
+            batch: list[dict[str, Any]] = []
+            markers: list[asyncio.Future[None]] = []
+            stopping = self._collect(item, batch, markers)
+            deadline = loop.time() + self.flush_interval
+            while not stopping and not markers and len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout=timeout)
+                except TimeoutError:
+                    break
+                stopping = self._collect(item, batch, markers)
+            await self._write(batch, markers)
+
+    @staticmethod
+    def _collect(
+        item: Any,
+        batch: list[dict[str, Any]],
+        markers: list[asyncio.Future[None]],
+    ) -> bool:
+        """Add a queue item to the current batch. Returns True on stop."""
+        if item is _STOP:
+            return True
+        if isinstance(item, asyncio.Future):
+            markers.append(item)
+        else:
+            batch.append(item)
+        return False
+
+    def _publish(self, batch: list[dict[str, Any]]) -> None:
+        for row in batch:
+            if self.broadcaster.has_subscribers(row["run_id"]):
+                self.broadcaster.publish(EventRead.model_validate(row))
+
+    async def _insert(self, rows: list[dict[str, Any]]) -> None:
+        # Resolve lazily so a swapped db.AsyncSessionLocal is picked up
+        session_factory = self._session_factory or db.AsyncSessionLocal
+        async with session_factory() as session:
+            await self.repository.create_events(session, rows)
+
+    async def _persist(self, batch: list[dict[str, Any]]) -> Exception | None:
+        """Write a batch, retrying then falling back to per-row inserts.
+
+        Publishes every row that was committed and returns the last error when
+        any row had to be dropped.
+        """
+        delay = self.retry_delay
+        for attempt in range(self.retry_attempts + 1):
+            try:
+                await self._insert(batch)
+            except Exception as exc:  # noqa: BLE001
+                error = exc
+                if attempt == self.retry_attempts:
+                    break
+                self.stats.retries += 1
+                logger.warning(
+                    "Failed to persist batch of %d events (attempt %d): %s",
+                    len(batch),
+                    attempt + 1,
+                    exc,
+                )
+                await asyncio.sleep(delay)
+                delay *= 2
+            else:
+                self.stats.written += len(batch)
+                self._publish(batch)
+                return None
+
+        logger.error(
+            "Batch of %d events failed after %d attempts; inserting row by row",
+            len(batch),
+            self.retry_attempts + 1,
+            exc_info=error,
+        )
+        self.stats.fallback_batches += 1
+        failed: Exception | None = None
+        for row in batch:
+            try:
+                await self._insert([row])
+            except Exception as exc:
+                failed = exc
+                self.stats.dropped += 1
+                logger.exception(
+                    "Dropping %s event for run %s", row.get("type"), row["run_id"]
+                )
+            else:
+                self.stats.written += 1
+                self._publish([row])
+        return failed
+
+    async def _write(
+        self, batch: list[dict[str, Any]], markers: list[asyncio.Future[None]]
+    ) -> None:
+        error: Exception | None = None
+        if batch:
+            self.stats.batches += 1
+            error = await self._persist(batch)
+        for marker in markers:
+            if marker.done():
+                continue
+            if error is not None:
+                marker.set_exception(error)
+            else:
+                marker.set_result(None)
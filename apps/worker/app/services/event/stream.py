@@ -0,0 +1,119 @@
+"""Server-Sent Events stream of a run's event history and live tail."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Callable
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import db
+from app.constants import EVENT_STREAM_HEARTBEAT_SECONDS, MAX_EVENT_PAGE_LIMIT
+from app.models import TERMINAL_RUN_STATUSES, EventRead, EventType
+from app.services.event.broadcaster import EventBroadcaster, event_broadcaster
+from app.services.run.repository import RunRepository
+from app.utils.pagination import as_utc, decode_cursor, encode_cursor
+
+logger = logging.getLogger(__name__)
+
+# Event types that may accompany a run status change
+_STATUS_EVENT_TYPES = frozenset({EventType.STATUS.value, EventType.ERROR.value})
+
+
+def format_sse(event: EventRead) -> str:
+    """Serialize an event as an SSE message whose id is its keyset cursor."""
+    cursor = encode_cursor(event.at, event.id)
+    return f"id: {cursor}\nevent: {event.type}\ndata: {event.model_dump_json()}\n\n"
+
+
+class RunEventStream:
+    """Replays a run's events after a cursor, then tails new ones.
+
+    The live subscription is opened before the replay so no event can slip
+    between the two phases; anything already replayed is skipped by comparing
+    `(at, id)` positions. The stream ends once the run is in a terminal state,
+    or early when the subscriber lags behind (the client reconnects with its
+    `Last-Event-ID` and resumes from the database).
+    """
+
+    def __init__(
+        self,
+        run_id: UUID,
+        *,
+        last_event_id: str | None = None,
+        session_factory: Callable[[], AsyncSession] | None = None,
+        broadcaster: EventBroadcaster | None = None,
+        heartbeat_interval: float = EVENT_STREAM_HEARTBEAT_SECONDS,
+    ) -> None:
+        self.run_id = run_id
+        self._session_factory = session_factory
+        self._broadcaster = broadcaster or event_broadcaster
+        self._heartbeat_interval = heartbeat_interval
+        self._repository = RunRepository()
+        self._position: tuple[datetime, UUID] | None = None
+        if last_event_id:
+            at, event_id = decode_cursor(last_event_id)
+            self._position = (as_utc(at), event_id)
+
+    async def __aiter__(self) -> AsyncIterator[str]:
+        subscription = self._broadcaster.subscribe(self.run_id)
+        try:
+            async for message in self._replay():
+                yield message
+            if await self._run_finished():
+                return
+            while not subscription.lagged:
+                try:
+                    event = await asyncio.wait_for(
+                        subscription.get(), timeout=self._heartbeat_interval
+                    )
+                except TimeoutError:
+                    yield ": keep-alive\n\n"
+                    if await self._run_finished():
+                        return
+                    continue
+                message = self._accept(event)
+                if message is not None:
+                    yield message
+                if event.type in _STATUS_EVENT_TYPES and await self._run_finished():
+                    while (pending := subscription.get_nowait()) is not None:
+                        if (message := self._accept(pending)) is not None:
+                            yield message
+                    return
+        finally:
+            self._broadcaster.unsubscribe(subscription)
+
+    def _accept(self, event: EventRead) -> str | None:
+        """Format an event unless it is at or before the current position."""
+        position = (as_utc(event.at), event.id)
+        if self._position is not None and position <= self._position:
+            return None
+        self._position = position
+        return format_sse(event)
+
+    async def _replay(self) -> AsyncIterator[str]:
+        session_factory = self._session_factory or db.AsyncSessionLocal
+        async with session_factory() as session:
+            while True:
+                events = await self._repository.get_events(
+                    session,
+                    self.run_id,
+                    after=self._position,
+                    limit=MAX_EVENT_PAGE_LIMIT,
+                )
+                for event in events:
+                    message = self._accept(EventRead.model_validate(event))
+                    if message is not None:
+                        yield message
+                session.expunge_all()
+                if len(events) < MAX_EVENT_PAGE_LIMIT:
+                    return
+
+    async def _run_finished(self) -> bool:
+        session_factory = self._session_factory or db.AsyncSessionLocal
+        async with session_factory() as session:
+            run = await self._repository.get_by_id(session, self.run_id)
+        return run is None or run.status in TERMINAL_RUN_STATUSES
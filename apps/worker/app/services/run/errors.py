@@ -23,6 +23,27 @@ class RunNotFoundError(RunError):
         super().__init__(f"Run {run_id} not found")
 
 
+class RunAlreadyFinishedError(RunError):
+    """Raised when a run is changed after reaching a terminal status."""
+
+    def __init__(self, run_id: str, status: str) -> None:
+        super().__init__(f"Run {run_id} already finished with status {status}")
+
+
+class RunCanceledError(RunError):
+    """Raised when a run is canceled while its browser session is provisioned."""
+
+    def __init__(self, run_id: str) -> None:
+        super().__init__(f"Run {run_id} was canceled during provisioning")
+
+
+class RunNotPendingError(RunError):
+    """Raised when provisioning finds a run already started, claimed or finished."""
+
+    def __init__(self, run_id: str, status: str) -> None:
+        super().__init__(f"Run {run_id} is no longer pending (status {status})")
+
+
 class RunFinalizationError(RunError):
     """Raised when a run cannot be finalized after session creation."""
 
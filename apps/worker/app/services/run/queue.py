@@ -0,0 +1,138 @@
+"""Durable run queue: PENDING runs claimed by workers under time-limited leases."""
+
+import logging
+from collections.abc import Sequence
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import delete, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import RunQueueEntry
+
+logger = logging.getLogger(__name__)
+
+
+class RunQueueRepository:
+    """Repository for run queue entries and their leases."""
+
+    async def enqueue(
+        self, session: AsyncSession, run_ids: Sequence[UUID], available_at: datetime
+    ) -> int:
+        """Queue runs that are not queued yet and commit.
+
+        Runs accepted as pending are queued together with their insert;
+        this covers runs that become PENDING again later, e.g. requeued.
+        """
+        if not run_ids:
+            return 0
+        postgresql = session.get_bind().dialect.name == "postgresql"
+        insert = postgresql_insert if postgresql else sqlite_insert
+        result = await session.execute(
+            insert(RunQueueEntry.__table__)
+            .values(
+                [{"run_id": run_id, "available_at": available_at} for run_id in run_ids]
+            )
+            .on_conflict_do_nothing(index_elements=["run_id"])
+        )
+        await session.commit()
+        return result.rowcount
+
+    async def claim(
+        self,
+        session: AsyncSession,
+        owner: str,
+        now: datetime,
+        leased_until: datetime,
+        limit: int,
+    ) -> list[RunQueueEntry]:
+        """Lease up to `limit` available entries to `owner` and commit.
+
+        Entries never leased or whose lease expired are claimable, oldest
+        first. The candidate rows are selected `FOR UPDATE SKIP LOCKED` on
+        Postgres so concurrent workers claim disjoint entries; SQLite
+        serializes writers, which makes the single UPDATE atomic there.
+        Every claim counts as a delivery attempt.
+        """
+        claimable = (
+            select(RunQueueEntry.run_id)
+            .where(RunQueueEntry.available_at <= now)
+            .where(
+                or_(
+                    RunQueueEntry.leased_until.is_(None),
+                    RunQueueEntry.leased_until < now,
+                )
+            )
+            .order_by(RunQueueEntry.available_at.asc())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await session.execute(
+            update(RunQueueEntry)
+            .where(RunQueueEntry.run_id.in_(claimable.scalar_subquery()))
+            .values(
+                lease_owner=owner,
+                leased_until=leased_until,
+                attempts=RunQueueEntry.attempts + 1,
+            )
+            .returning(RunQueueEntry)
+            .execution_options(synchronize_session=False)
+        )
+        entries = sorted(result.scalars().all(), key=lambda e: e.available_at)
+        await session.commit()
+        return entries
+
+    async def renew(
+        self,
+        session: AsyncSession,
+        run_ids: Sequence[UUID],
+        owner: str,
+        leased_until: datetime,
+    ) -> int:
+        """Extend the owner's leases on `run_ids` and commit.
+
+        Returns the number of leases still held by the owner.
+        """
+        if not run_ids:
+            return 0
+        result = await session.execute(
+            update(RunQueueEntry)
+            .where(RunQueueEntry.run_id.in_(run_ids))
+            .where(RunQueueEntry.lease_owner == owner)
+            .values(leased_until=leased_until)
+            .execution_options(synchronize_session=False)
+        )
+        await session.commit()
+        return result.rowcount
+
+    async def release(
+        self, session: AsyncSession, run_ids: Sequence[UUID], owner: str
+    ) -> int:
+        """Give up the owner's leases so other workers can claim them, and commit."""
+        if not run_ids:
+            return 0
+        result = await session.execute(
+            update(RunQueueEntry)
+            .where(RunQueueEntry.run_id.in_(run_ids))
+            .where(RunQueueEntry.lease_owner == owner)
+            .values(lease_owner=None, leased_until=None)
+            .execution_options(synchronize_session=False)
+        )
+        await session.commit()
+        return result.rowcount
+
+    async def complete(
+        self, session: AsyncSession, run_ids: Sequence[UUID], owner: str
+    ) -> int:
+        """Remove the owner's entries for runs whose execution ended, and commit."""
+        if not run_ids:
+            return 0
+        result = await session.execute(
+            delete(RunQueueEntry)
+            .where(RunQueueEntry.run_id.in_(run_ids))
+            .where(RunQueueEntry.lease_owner == owner)
+        )
+        await session.commit()
+        return result.rowcount
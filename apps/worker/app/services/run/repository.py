@@ -1,31 +1,101 @@
 import logging
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
 from uuid import UUID
 
+from sqlalchemy import RowMapping, Select, and_, func, insert, or_, text, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
-from app.constants import MAX_RUN_LIST_LIMIT
-from app.models import Event, Run
+from app.constants import (
+    DEFAULT_EVENT_PAGE_LIMIT,
+    EVENT_EXPORT_CHUNK_SIZE,
+    MAX_EVENT_PAGE_LIMIT,
+    MAX_RUN_LIST_LIMIT,
+    RUN_SIGNAL_CHANNEL,
+)
+from app.models import (
+    OWNED_RUN_STATUSES,
+    TERMINAL_RUN_STATUSES,
+    Event,
+    EventType,
+    Run,
+    RunQueueEntry,
+    RunStatsBucket,
+    RunStatus,
+    SessionStatus,
+)
 from app.models import Session as SessionModel
 
 logger = logging.getLogger(__name__)
 
+# SQLite strftime formats truncating created_at to the start of a bucket
+_BUCKET_FORMATS = {
+    RunStatsBucket.HOUR: "%Y-%m-%d %H:00:00",
+    RunStatsBucket.DAY: "%Y-%m-%d 00:00:00",
+}
+# Postgres date_trunc fields for the same buckets, rendered as the same text
+_BUCKET_FIELDS = {
+    RunStatsBucket.HOUR: "hour",
+    RunStatsBucket.DAY: "day",
+}
+_POSTGRES_BUCKET_FORMAT = "YYYY-MM-DD HH24:MI:SS"
+
 
 class RunRepository:
     """Repository for run persistence operations."""
 
-    async def create(self, session: AsyncSession, run: Run) -> Run:
-        """Create a new run record."""
+    async def create(
+        self, session: AsyncSession, run: Run, *, queued: bool = False
+    ) -> Run:
+        """Create a new run record, with its run queue entry when `queued`."""
         session.add(run)
+        if queued:
+            session.add(RunQueueEntry(run_id=run.id, available_at=run.created_at))
         await session.commit()
         await session.refresh(run)
         return run
 
+    async def create_runs(
+        self, session: AsyncSession, runs: Sequence[Run], *, queued: bool = False
+    ) -> int:
+        """Insert many runs with a single multi-row INSERT and commit.
+
+        The runs keep their client-side ids and timestamps and are not
+        refreshed. When `queued`, their run queue entries are inserted in
+        the same transaction. Returns the number of inserted rows.
+        """
+        if not runs:
+            return 0
+        rows = [run.model_dump() for run in runs]
+        await session.execute(insert(Run.__table__).values(rows))
+        if queued:
+            await session.execute(
+                insert(RunQueueEntry.__table__).values(
+                    [{"run_id": run.id, "available_at": run.created_at} for run in runs]
+                )
+            )
+        await session.commit()
+        return len(rows)
+
     async def get_by_id(self, session: AsyncSession, run_id: UUID) -> Run | None:
         """Get a run by its ID."""
         result = await session.execute(select(Run).where(Run.id == run_id))
         return result.scalar_one_or_none()
 
+    async def get_version(
+        self, session: AsyncSession, run_id: UUID
+    ) -> RowMapping | None:
+        """Get the columns that version a run, without loading the row.
+
+        Returns a mapping with `user_id`, `status` and `updated_at`.
+        """
+        result = await session.execute(
+            select(Run.user_id, Run.status, Run.updated_at).where(Run.id == run_id)
+        )
+        return result.mappings().one_or_none()
+
     async def update(self, session: AsyncSession, run: Run) -> Run:
         """Update an existing run record."""
         session.add(run)
@@ -33,41 +103,81 @@ class RunRepository:
         await session.refresh(run)
         return run
 
-    async def list_runs(
-        self, session: AsyncSession, skip: int | None = 0, limit: int | None = 100
+    async def list_runs(  # noqa: PLR0913
+        self,
+        session: AsyncSession,
+        skip: int | None = 0,
+        limit: int | None = 100,
+        *,
+        after: tuple[datetime, UUID] | None = None,
+        statuses: Sequence[RunStatus] | None = None,
+        flow_id: UUID | None = None,
     ) -> list[Run]:
-        """List runs with pagination."""
-        # Normalize pagination params
-        skip = max(0, int(skip or 0))
-        limit = max(1, min(int(limit or 100), MAX_RUN_LIST_LIMIT))
-        result = await session.execute(
-            select(Run)
-            .order_by(Run.created_at.desc(), Run.id.desc())
-            .offset(skip)
-            .limit(limit)
+        """List runs newest first, optionally filtered by status and flow.
+
+        `after` is the keyset position of the last run of the previous page;
+        with the `(..., created_at, id)` indexes each page costs O(limit).
+        `skip` is the deprecated offset fallback.
+        """
+        stmt = _filter_runs(
+            select(Run), after=after, statuses=statuses, flow_id=flow_id
         )
-        return list(result.scalars().all())
+        return await _fetch_page(session, stmt, skip, limit)
 
-    async def list_runs_for_user(
+    async def list_runs_for_user(  # noqa: PLR0913
         self,
         session: AsyncSession,
         user_id: UUID,
         skip: int | None = 0,
         limit: int | None = 100,
+        *,
+        after: tuple[datetime, UUID] | None = None,
+        statuses: Sequence[RunStatus] | None = None,
+        flow_id: UUID | None = None,
     ) -> list[Run]:
-        """List runs for a specific user with pagination."""
-        # Normalize pagination params
-        skip = max(0, int(skip or 0))
-        # Enforce a server-side cap to avoid unbounded fetches
-        limit = max(1, min(int(limit or 100), MAX_RUN_LIST_LIMIT))
-        result = await session.execute(
-            select(Run)
-            .where(Run.user_id == user_id)
-            .order_by(Run.created_at.desc(), Run.id.desc())
-            .offset(skip)
-            .limit(limit)
+        """List a user's runs newest first; see `list_runs` for the filters."""
+        stmt = _filter_runs(
+            select(Run).where(Run.user_id == user_id),
+            after=after,
+            statuses=statuses,
+            flow_id=flow_id,
         )
-        return list(result.scalars().all())
+        return await _fetch_page(session, stmt, skip, limit)
+
+    async def count_runs_by_status(  # noqa: PLR0913
+        self,
+        session: AsyncSession,
+        *,
+        user_id: UUID | None = None,
+        group_by_flow: bool = False,
+        bucket: RunStatsBucket | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[RowMapping]:
+        """Count runs per status, optionally also per flow and time bucket.
+
+        Rows have `status` and `count`, plus `flow_id` and `bucket` (the
+        bucket's start as text) when grouped by them. One GROUP BY query,
+        answered from the `(user_id?, status, flow_id, created_at)` indexes
+        without touching the table.
+        """
+        columns = [Run.status]
+        if group_by_flow:
+            columns.append(Run.flow_id)
+        if bucket is not None:
+            columns.append(
+                _bucket_start(bucket, session.get_bind().dialect.name).label("bucket")
+            )
+        stmt = select(*columns, func.count().label("count"))
+        if user_id is not None:
+            stmt = stmt.where(Run.user_id == user_id)
+        if since is not None:
+            stmt = stmt.where(Run.created_at >= since)
+        if until is not None:
+            stmt = stmt.where(Run.created_at < until)
+        stmt = stmt.group_by(*columns).order_by(*columns)
+        result = await session.execute(stmt)
+        return list(result.mappings().all())
 
     async def get_sessions(
         self, session: AsyncSession, run_id: UUID
@@ -78,6 +188,23 @@ class RunRepository:
         )
         return list(result.scalars().all())
 
+    async def get_sessions_version(
+        self, session: AsyncSession, run_id: UUID
+    ) -> RowMapping:
+        """Summarize a run's sessions as `count`, `last_created_at`, `last_ended_at`.
+
+        Session rows are only inserted or ended, never otherwise rewritten,
+        so these aggregates change whenever the session list does.
+        """
+        result = await session.execute(
+            select(
+                func.count().label("count"),
+                func.max(SessionModel.created_at).label("last_created_at"),
+                func.max(SessionModel.ended_at).label("last_ended_at"),
+            ).where(SessionModel.run_id == run_id)
+        )
+        return result.mappings().one()
+
     async def create_session(
         self, session: AsyncSession, session_model: SessionModel
     ) -> SessionModel:
@@ -87,11 +214,305 @@ class RunRepository:
         await session.refresh(session_model)
         return session_model
 
-    async def get_events(self, session: AsyncSession, run_id: UUID) -> list[Event]:
-        """Get all events for a specific run."""
+    async def save_with_session(
+        self, session: AsyncSession, run: Run, session_model: SessionModel
+    ) -> Run:
+        """Persist a run and its new browser session in a single transaction.
+
+        Nothing is refreshed afterwards: both rows are fully populated
+        client-side and the session factory does not expire on commit.
+        """
+        session.add_all([run, session_model])
+        await session.commit()
+        return run
+
+    async def touch_heartbeats(
+        self,
+        session: AsyncSession,
+        run_ids: Sequence[UUID],
+        owner_id: str,
+        now: datetime,
+    ) -> int:
+        """Record a heartbeat for the owner's active runs and commit.
+
+        Returns the number of runs touched.
+        """
+        if not run_ids:
+            return 0
+        result = await session.execute(
+            update(Run)
+            .where(Run.id.in_(run_ids))
+            .where(Run.owner_id == owner_id)
+            .where(Run.status.in_(OWNED_RUN_STATUSES))
+            .values(heartbeat_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        await session.commit()
+        return result.rowcount
+
+    async def claim_pending_run(
+        self, session: AsyncSession, run_id: UUID, owner_id: str, now: datetime
+    ) -> bool:
+        """Move a PENDING run to RUNNING under `owner_id`, heartbeat it, and commit.
+
+        The PENDING check is part of the UPDATE, so when several processes
+        provision the same run only one of them claims it.
+        """
+        result = await session.execute(
+            update(Run)
+            .where(Run.id == run_id)
+            .where(Run.status == RunStatus.PENDING)
+            .values(
+                status=RunStatus.RUNNING,
+                started_at=now,
+                updated_at=now,
+                owner_id=owner_id,
+                heartbeat_at=now,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await session.commit()
+        return result.rowcount == 1
+
+    async def adopt_run(
+        self,
+        session: AsyncSession,
+        run_id: UUID,
+        owner_id: str,
+        previous_owner_id: str | None,
+        now: datetime,
+    ) -> bool:
+        """Make `owner_id` the owner of an executing run, heartbeat it, and commit.
+
+        Used when the run was provisioned by another process than the one
+        executing it. The run is only taken over from `previous_owner_id`, so
+        of several workers told to start it exactly one adopts it. Returns
+        False if the run finished or another worker already owns it.
+        """
+        result = await session.execute(
+            update(Run)
+            .where(Run.id == run_id)
+            .where(Run.status.in_(OWNED_RUN_STATUSES))
+            .where(Run.owner_id == previous_owner_id)
+            .values(owner_id=owner_id, heartbeat_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        await session.commit()
+        return result.rowcount == 1
+
+    async def update_unfinished(
+        self, session: AsyncSession, run_id: UUID, values: dict[str, Any]
+    ) -> bool:
+        """Update a run unless it already reached a terminal status.
+
+        Checking and writing in one statement keeps a run canceled or reaped
+        by another process from being reopened. Returns False if the run is
+        missing or finished.
+        """
+        result = await session.execute(
+            update(Run)
+            .where(Run.id == run_id)
+            .where(Run.status.notin_(TERMINAL_RUN_STATUSES))
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        await session.commit()
+        return result.rowcount > 0
+
+    async def get_finished_run_ids(
+        self, session: AsyncSession, run_ids: Sequence[UUID]
+    ) -> list[UUID]:
+        """Get which of `run_ids` reached a terminal status."""
+        if not run_ids:
+            return []
+        result = await session.execute(
+            select(Run.id)
+            .where(Run.id.in_(run_ids))
+            .where(Run.status.in_(TERMINAL_RUN_STATUSES))
+        )
+        return list(result.scalars().all())
+
+    async def notify_run_signal(self, session: AsyncSession, run_id: UUID) -> None:
+        """Announce a continued or canceled run to listening workers on commit.
+
+        Only Postgres delivers notifications; elsewhere workers find the run
+        by polling.
+        """
+        if session.get_bind().dialect.name != "postgresql":
+            return
+        await session.execute(
+            text("SELECT pg_notify(:channel, :run_id)"),
+            {"channel": RUN_SIGNAL_CHANNEL, "run_id": str(run_id)},
+        )
+
+    async def get_orphaned_run_ids(
+        self, session: AsyncSession, cutoff: datetime, limit: int
+    ) -> list[UUID]:
+        """Get active runs whose last heartbeat is older than `cutoff`.
+
+        Served by the `(status, heartbeat_at)` index, oldest heartbeat first.
+        """
+        result = await session.execute(
+            select(Run.id)
+            .where(Run.status.in_(OWNED_RUN_STATUSES))
+            .where(Run.heartbeat_at < cutoff)
+            .order_by(Run.heartbeat_at.asc())
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def claim_orphaned_runs(
+        self,
+        session: AsyncSession,
+        run_ids: Sequence[UUID],
+        cutoff: datetime,
+        values: dict[str, Any],
+    ) -> list[Run]:
+        """Apply `values` to the runs that are still orphaned, without commit.
+
+        The orphan condition is re-checked in the UPDATE itself, so a run
+        that heartbeated or finished since it was found, or that another
+        reaper already claimed, is left alone. Returns the claimed runs.
+        """
+        if not run_ids:
+            return []
+        result = await session.execute(
+            update(Run)
+            .where(Run.id.in_(run_ids))
+            .where(Run.status.in_(OWNED_RUN_STATUSES))
+            .where(Run.heartbeat_at < cutoff)
+            .values(**values)
+            .returning(Run)
+            .execution_options(synchronize_session=False)
+        )
+        return list(result.scalars().all())
+
+    async def end_open_sessions(
+        self, session: AsyncSession, run_ids: Sequence[UUID], now: datetime
+    ) -> list[str]:
+        """Mark the runs' unended browser sessions ENDED, without commit.
+
+        Returns the provider session ids that still need to be released.
+        """
+        if not run_ids:
+            return []
         result = await session.execute(
-            select(Event)
-            .where(Event.run_id == run_id)
-            .order_by(Event.at.asc(), Event.id.asc())
+            update(SessionModel)
+            .where(SessionModel.run_id.in_(run_ids))
+            .where(SessionModel.status != SessionStatus.ENDED)
+            .values(status=SessionStatus.ENDED, ended_at=now)
+            .returning(SessionModel.browser_provider_session_id)
+            .execution_options(synchronize_session=False)
+        )
+        return [provider_id for provider_id in result.scalars() if provider_id]
+
+    async def get_events(  # noqa: PLR0913
+        self,
+        session: AsyncSession,
+        run_id: UUID,
+        *,
+        after: tuple[datetime, UUID] | None = None,
+        event_types: Sequence[EventType] | None = None,
+        since: datetime | None = None,
+        limit: int | None = DEFAULT_EVENT_PAGE_LIMIT,
+    ) -> list[Event]:
+        """Get a page of events for a run in `(at, id)` order.
+
+        `after` is the keyset position of the last event of the previous page;
+        together with the `(run_id, at, id)` index each page costs O(limit).
+        """
+        # Leave room for the caller's one-row look-ahead past a full page
+        limit = max(
+            1, min(int(limit or DEFAULT_EVENT_PAGE_LIMIT), MAX_EVENT_PAGE_LIMIT + 1)
+        )
+        stmt = select(Event).where(Event.run_id == run_id)
+        if after is not None:
+            after_at, after_id = after
+            stmt = stmt.where(
+                or_(
+                    Event.at > after_at,
+                    and_(Event.at == after_at, Event.id > after_id),
+                )
+            )
+        if since is not None:
+            stmt = stmt.where(Event.at >= since)
+        if event_types:
+            stmt = stmt.where(Event.type.in_(list(event_types)))
+        result = await session.execute(
+            stmt.order_by(Event.at.asc(), Event.id.asc()).limit(limit)
         )
         return list(result.scalars().all())
+
+    async def get_event_rows(
+        self,
+        session: AsyncSession,
+        run_id: UUID,
+        *,
+        after: tuple[datetime, UUID] | None = None,
+        limit: int = EVENT_EXPORT_CHUNK_SIZE,
+    ) -> Sequence[RowMapping]:
+        """Get the next `limit` events of a run after `after`, in `(at, id)` order.
+
+        Rows are returned as plain column mappings, so no ORM objects are
+        built; exports page through a run with the `(run_id, at, id)` index.
+        """
+        stmt = Event.__table__.select().where(Event.run_id == run_id)
+        if after is not None:
+            after_at, after_id = after
+            stmt = stmt.where(
+                or_(
+                    Event.at > after_at,
+                    and_(Event.at == after_at, Event.id > after_id),
+                )
+            )
+        result = await session.execute(
+            stmt.order_by(Event.at.asc(), Event.id.asc()).limit(limit)
+        )
+        return result.mappings().all()
+
+
+def _bucket_start(bucket: RunStatsBucket, dialect: str) -> Any:
+    """`created_at` truncated to the start of its bucket, as UTC text."""
+    if dialect == "postgresql":
+        utc = func.timezone("UTC", Run.created_at)
+        return func.to_char(
+            func.date_trunc(_BUCKET_FIELDS[bucket], utc), _POSTGRES_BUCKET_FORMAT
+        )
+    return func.strftime(_BUCKET_FORMATS[bucket], Run.created_at)
+
+
+def _filter_runs(
+    stmt: Select,
+    *,
+    after: tuple[datetime, UUID] | None,
+    statuses: Sequence[RunStatus] | None,
+    flow_id: UUID | None,
+) -> Select:
+    if after is not None:
+        after_at, after_id = after
+        stmt = stmt.where(
+            or_(
+                Run.created_at < after_at,
+                and_(Run.created_at == after_at, Run.id < after_id),
+            )
+        )
+    if statuses:
+        stmt = stmt.where(Run.status.in_(list(statuses)))
+    if flow_id is not None:
+        stmt = stmt.where(Run.flow_id == flow_id)
+    return stmt
+
+
+async def _fetch_page(
+    session: AsyncSession, stmt: Select, skip: int | None, limit: int | None
+) -> list[Run]:
+    # Normalize pagination params
+    skip = max(0, int(skip or 0))
+    # Enforce a server-side cap to avoid unbounded fetches, leaving room for
+    # the caller's one-row look-ahead past a full page
+    limit = max(1, min(int(limit or 100), MAX_RUN_LIST_LIMIT + 1))
+    stmt = stmt.order_by(Run.created_at.desc(), Run.id.desc())
+    if skip:
+        stmt = stmt.offset(skip)
+    result = await session.execute(stmt.limit(limit))
+    return list(result.scalars().all())
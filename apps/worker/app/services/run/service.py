@@ -1,52 +1,103 @@
 import logging
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import partial
+from typing import Any
 from uuid import UUID, uuid4
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
+from app.constants import (
+    DEFAULT_EVENT_PAGE_LIMIT,
+    MAX_EVENT_PAGE_LIMIT,
+    MAX_RUN_LIST_LIMIT,
+)
 from app.models import (
+    OWNED_RUN_STATUSES,
+    TERMINAL_RUN_STATUSES,
+    CheckpointStatus,
     Event,
+    EventRead,
     EventType,
     Flow,
     Run,
     RunContinue,
     RunCreate,
+    RunListItem,
+    RunPriority,
+    RunRead,
+    RunStatsBucket,
+    RunStatsGroup,
+    RunStatsRead,
     RunStatus,
     SessionStatus,
     User,
     UserRole,
 )
 from app.models import Session as SessionModel
+from app.services.checkpoint.service import CheckpointService
+from app.services.event.broadcaster import event_broadcaster
+from app.services.event.repository import EventRepository
 from app.services.flow.errors import FlowAccessDeniedError, FlowNotFoundError
 from app.services.run.errors import (
     MissingSessionURLError,
-    RunFinalizationError,
+    RunAlreadyFinishedError,
+    RunCanceledError,
     RunNotFoundError,
+    RunNotPendingError,
     SessionCreationFailedError,
 )
 from app.services.run.repository import RunRepository
+from app.services.run.stats import RunStatsCache, run_stats_cache
+from app.services.steel_pool import SteelSessionPool
 from app.services.steel_service import SteelService
 from app.sockets import emit_progress
+from app.utils.etag import weak_etag
+from app.utils.pagination import as_utc, decode_cursor, encode_cursor
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class RunETag:
+    """A run's weak ETag and the owner needed to authorize serving it."""
+
+    user_id: UUID
+    etag: str
+
+
 class RunService:
     """Service for managing run lifecycle and business logic."""
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         steel_service: SteelService | None = None,
         repository: RunRepository | None = None,
+        event_repository: EventRepository | None = None,
+        *,
+        steel_pool: SteelSessionPool | None = None,
+        stats_cache: RunStatsCache | None = None,
+        checkpoint_service: CheckpointService | None = None,
     ):
         self.steel_service = steel_service or SteelService()
+        self.steel_pool = steel_pool
+        self.stats_cache = stats_cache or run_stats_cache
+        self.checkpoint_service = checkpoint_service or CheckpointService()
         self.repository = repository or RunRepository()
+        self.event_repository = event_repository or EventRepository()
 
     async def create_run_with_user(
         self, request: RunCreate, user: User, session: AsyncSession
     ) -> tuple[Run, str]:
         """Create a new run with authenticated user.
+
+        The browser session is provisioned before any write, then the run and
+        its session record are inserted together with a single commit. When
+        provisioning fails, the failed run is recorded in one commit instead.
+
         Returns:
             tuple: (run, session_url) where session_url is the browser session URL
         """
@@ -54,53 +105,178 @@ class RunService:
         await self._validate_flow_exists_and_access(request.flow_id, user, session)
 
         run_id = uuid4()
+        priority = request.priority or RunPriority.INTERACTIVE
+        await self._emit_progress_safe(
+            run_id,
+            {
+                "status": RunStatus.PENDING.value,
+                "message": "Run created, initializing session",
+            },
+        )
 
+        browser_session_id = None
+        stored = False
         try:
-            # Create initial run record with authenticated user's ID
-            run = await self._create_run_record_with_user(
-                request, run_id, user, session
+            # Phase 1: provision the browser session, no write transaction open
+            session_url, browser_session_id = await self._lease_session_or_fail(
+                partial(self._record_failed_run, request, run_id, user, session),
+                priority,
+            )
+
+            # Phase 2: one unit of work for the run and its session record
+            run = Run(
+                id=run_id,
+                flow_id=request.flow_id,
+                user_id=user.id,  # Use authenticated user's ID
+                status=RunStatus.RUNNING,
+                started_at=datetime.now(UTC),
+                input_payload=request.input_payload,
+                priority=priority,
+                owner_id=settings.worker_id,
+                heartbeat_at=datetime.now(UTC),
             )
+            db_session = SessionModel(
+                id=uuid4(),
+                run_id=run_id,
+                browser_provider_session_id=browser_session_id,
+                session_url=session_url,
+                status=SessionStatus.ACTIVE,
+            )
+            run = await self.repository.save_with_session(session, run, db_session)
+            stored = True
 
-            # Create Steel session
-            session_data = await self.steel_service.create_session()
+            # Emit final progress event
+            await self._emit_session_initialized(run_id, session_url)
 
-            if not session_data:
-                await self._handle_session_creation_failure(
-                    run_id, session, "Failed to create browser session"
-                )
-                self._fail_session_creation()
+        except Exception:
+            # Handle any other errors
+            logger.exception("Error creating run")
+            await session.rollback()
+            if not stored:
+                # No session record references the leased session; end it here
+                await self._release_browser_session(browser_session_id)
+            raise
+        else:
+            return run, session_url
 
-            session_url = session_data.get("debugUrl")
-            browser_session_id = session_data.get("id")
+    async def create_pending_run(
+        self,
+        request: RunCreate,
+        user: User,
+        session: AsyncSession,
+        *,
+        queued: bool = False,
+    ) -> Run:
+        """Insert a PENDING run without provisioning its browser session.
 
-            if not session_url:
-                await self._handle_session_creation_failure(
-                    run_id, session, "Session created without viewer URL"
-                )
-                self._fail_missing_url()
+        The caller finishes the run with `provision_run`, typically in the
+        background, so run creation never waits on the browser provider.
+        With `queued` the run is also added to the durable run queue.
+        """
+        await self._validate_flow_exists_and_access(request.flow_id, user, session)
+        run = Run(
+            id=uuid4(),
+            flow_id=request.flow_id,
+            user_id=user.id,
+            status=RunStatus.PENDING,
+            input_payload=request.input_payload,
+            priority=request.priority or RunPriority.NORMAL,
+        )
+        run = await self.repository.create(session, run, queued=queued)
+        await self._emit_progress_safe(
+            run.id,
+            {
+                "status": RunStatus.PENDING.value,
+                "message": "Run created, initializing session",
+            },
+        )
+        return run
 
-            # Create session record and finalize run
-            run = await self._create_session_and_finalize_run(
-                run_id, session_url, browser_session_id, session
-            )
+    async def create_pending_runs(  # noqa: PLR0913
+        self,
+        flow_id: UUID,
+        inputs: Sequence[dict[str, Any]],
+        user: User,
+        session: AsyncSession,
+        *,
+        queued: bool = False,
+        priority: RunPriority = RunPriority.BULK,
+    ) -> list[Run]:
+        """Insert one PENDING run per input payload for a single flow.
 
-            # Emit final progress event
+        Flow access is validated once and every run is inserted with a single
+        multi-row INSERT and commit; provisioning is left to the caller.
+        With `queued` the runs are also added to the durable run queue.
+        """
+        await self._validate_flow_exists_and_access(flow_id, user, session)
+        runs = [
+            Run(
+                flow_id=flow_id,
+                user_id=user.id,
+                status=RunStatus.PENDING,
+                input_payload=input_payload,
+                priority=priority,
+            )
+            for input_payload in inputs
+        ]
+        await self.repository.create_runs(session, runs, queued=queued)
+        for run in runs:
             await self._emit_progress_safe(
-                run_id,
+                run.id,
                 {
-                    "status": RunStatus.RUNNING.value,
-                    "session_url": session_url,
-                    "message": "Session initialized",
+                    "status": RunStatus.PENDING.value,
+                    "message": "Run created, initializing session",
                 },
             )
+        return runs
+
+    async def provision_run(
+        self, run_id: UUID, session: AsyncSession
+    ) -> tuple[Run, str]:
+        """Claim a PENDING run, provision its browser session and record it.
+
+        The run is moved to RUNNING with a conditional UPDATE before any
+        session is leased, so a run is only ever provisioned once even when
+        several processes try. When provisioning fails the run is marked
+        FAILED and the error re-raised.
+
+        Returns:
+            tuple: (run, session_url) where session_url is the browser session URL
 
+        Raises:
+            RunNotPendingError: If the run was not PENDING when claimed
+            RunCanceledError: If the run was canceled while being provisioned
+        """
+        run = await self.get_run(run_id, session)
+        claimed = await self.repository.claim_pending_run(
+            session, run_id, settings.worker_id, datetime.now(UTC)
+        )
+        await session.refresh(run)
+        if not claimed:
+            raise RunNotPendingError(str(run_id), run.status.value)
+        session_url, browser_session_id = await self._lease_session_or_fail(
+            partial(self._fail_pending_run, run, session), run.priority
+        )
+        # The run may have been canceled while the session was leased
+        await session.refresh(run)
+        if run.status != RunStatus.RUNNING:
+            await self._release_browser_session(browser_session_id)
+            raise RunCanceledError(str(run_id))
+        db_session = SessionModel(
+            id=uuid4(),
+            run_id=run_id,
+            browser_provider_session_id=browser_session_id,
+            session_url=session_url,
+            status=SessionStatus.ACTIVE,
+        )
+        try:
+            run = await self.repository.save_with_session(session, run, db_session)
         except Exception:
-            # Handle any other errors
-            logger.exception("Error creating run")
             await session.rollback()
+            await self._release_browser_session(browser_session_id)
             raise
-        else:
-            return run, session_url
+        await self._emit_session_initialized(run_id, session_url)
+        return run, session_url
 
     async def list_runs_for_user(
         self, user_id: UUID, session: AsyncSession, skip: int = 0, limit: int = 100
@@ -115,69 +291,233 @@ class RunService:
             raise RunNotFoundError(str(run_id))
         return run
 
+    async def get_run_etag(self, run_id: UUID, session: AsyncSession) -> RunETag:
+        """Get a run's owner and weak ETag with a projection query.
+
+        The ETag changes whenever the run is updated, so conditional polls
+        can be answered without loading or serializing the run.
+        """
+        version = await self.repository.get_version(session, run_id)
+        if version is None:
+            raise RunNotFoundError(str(run_id))
+        return RunETag(
+            user_id=version["user_id"],
+            etag=weak_etag(run_id, version["status"].value, version["updated_at"]),
+        )
+
+    async def get_run_sessions_etag(self, run_id: UUID, session: AsyncSession) -> str:
+        """Get a weak ETag for a run's session list from one aggregate query."""
+        version = await self.repository.get_sessions_version(session, run_id)
+        return weak_etag(
+            run_id,
+            version["count"],
+            version["last_created_at"] or "",
+            version["last_ended_at"] or "",
+        )
+
     async def list_runs(
         self, session: AsyncSession, skip: int = 0, limit: int = 100
     ) -> list[Run]:
         """List runs with pagination."""
         return await self.repository.list_runs(session, skip, limit)
 
+    async def list_runs_page(  # noqa: PLR0913
+        self,
+        session: AsyncSession,
+        *,
+        user_id: UUID | None = None,
+        cursor: str | None = None,
+        statuses: Sequence[RunStatus] | None = None,
+        flow_id: UUID | None = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> tuple[list[Run], str | None]:
+        """Get a page of runs, newest first, for one user or for everyone.
+
+        Returns:
+            tuple: (runs, next_cursor) where next_cursor is None on the last page
+
+        Raises:
+            InvalidCursorError: If `cursor` cannot be decoded
+        """
+        after = None
+        if cursor:
+            after_at, after_id = decode_cursor(cursor)
+            after = (as_utc(after_at), after_id)
+        filters = {"after": after, "statuses": statuses, "flow_id": flow_id}
+        # Clamp the page size here so the extra row below still detects a next page
+        limit = max(1, min(int(limit), MAX_RUN_LIST_LIMIT))
+        if user_id is None:
+            runs = await self.repository.list_runs(session, skip, limit + 1, **filters)
+        else:
+            runs = await self.repository.list_runs_for_user(
+                session, user_id, skip, limit + 1, **filters
+            )
+        if len(runs) <= limit:
+            return runs, None
+        page = runs[:limit]
+        last = page[-1]
+        return page, encode_cursor(last.created_at, last.id)
+
+    async def get_run_stats(  # noqa: PLR0913
+        self,
+        session: AsyncSession,
+        *,
+        user_id: UUID | None = None,
+        group_by_flow: bool = False,
+        bucket: RunStatsBucket | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> RunStatsRead:
+        """Count runs per status for one user or for everyone.
+
+        Results are cached for a short TTL per query shape, so repeated
+        dashboard refreshes cost at most one GROUP BY query per TTL.
+        """
+        since = as_utc(since) if since else None
+        until = as_utc(until) if until else None
+        key = (user_id, group_by_flow, bucket, since, until)
+        cached = self.stats_cache.get(key)
+        if cached is not None:
+            return cached
+        rows = await self.repository.count_runs_by_status(
+            session,
+            user_id=user_id,
+            group_by_flow=group_by_flow,
+            bucket=bucket,
+            since=since,
+            until=until,
+        )
+        groups = [
+            RunStatsGroup(
+                status=row["status"],
+                flow_id=row.get("flow_id"),
+                bucket=(
+                    datetime.fromisoformat(row["bucket"]).replace(tzinfo=UTC)
+                    if bucket is not None
+                    else None
+                ),
+                count=row["count"],
+            )
+            for row in rows
+        ]
+        stats = RunStatsRead(
+            total=sum(group.count for group in groups),
+            groups=groups,
+            generated_at=datetime.now(UTC),
+        )
+        self.stats_cache.set(key, stats)
+        return stats
+
+    async def with_event_summaries(
+        self, runs: list[Run], session: AsyncSession
+    ) -> list[RunListItem]:
+        """Attach each run's event summary, fetched with one indexed query."""
+        summaries = await self.event_repository.get_event_summaries(
+            session, [run.id for run in runs]
+        )
+        return [
+            RunListItem(
+                **RunRead.model_validate(run).model_dump(),
+                event_summary=summaries.get(run.id),
+            )
+            for run in runs
+        ]
+
     async def get_run_sessions(
         self, run_id: UUID, session: AsyncSession
     ) -> list[SessionModel]:
         """Get all sessions for a specific run."""
         return await self.repository.get_sessions(session, run_id)
 
-    async def get_run_events(self, run_id: UUID, session: AsyncSession) -> list[Event]:
-        """Get all events for a specific run."""
-        return await self.repository.get_events(session, run_id)
+    async def get_run_events(  # noqa: PLR0913
+        self,
+        run_id: UUID,
+        session: AsyncSession,
+        *,
+        cursor: str | None = None,
+        event_types: Sequence[EventType] | None = None,
+        since: datetime | None = None,
+        limit: int = DEFAULT_EVENT_PAGE_LIMIT,
+    ) -> tuple[list[Event], str | None]:
+        """Get a page of events for a run.
 
-    async def _handle_session_creation_failure(
-        self, run_id: UUID, session: AsyncSession, error_message: str
-    ) -> None:
-        """Handle session creation failure."""
-        run = await self.repository.get_by_id(session, run_id)
-        if run:
-            run.status = RunStatus.FAILED
-            run.error = error_message
-            run.ended_at = datetime.now(UTC)
-            run.updated_at = datetime.now(UTC)
-            await self.repository.update(session, run)
+        Returns:
+            tuple: (events, next_cursor) where next_cursor is None on the last page
 
-            await self._emit_progress_safe(
-                run_id,
-                {
-                    "status": RunStatus.FAILED.value,
-                    "message": error_message,
-                },
-            )
+        Raises:
+            InvalidCursorError: If `cursor` cannot be decoded
+        """
+        after = None
+        if cursor:
+            after_at, after_id = decode_cursor(cursor)
+            after = (as_utc(after_at), after_id)
+        # Clamp the page size here so the extra row below still detects a next page
+        limit = max(1, min(int(limit), MAX_EVENT_PAGE_LIMIT))
+        events = await self.repository.get_events(
+            session,
+            run_id,
+            after=after,
+            event_types=event_types,
+            since=as_utc(since) if since is not None else None,
+            limit=limit + 1,
+        )
+        if len(events) <= limit:
+            return events, None
+        page = events[:limit]
+        last = page[-1]
+        return page, encode_cursor(last.at, last.id)
+
+    async def _lease_browser_session(self, priority: RunPriority) -> dict | None:
+        """Take a warm session from the pool, or create one when not pooling."""
+        if self.steel_pool is not None:
+            return await self.steel_pool.acquire(priority)
+        return await self.steel_service.create_session()
+
+    async def _release_browser_session(self, browser_session_id: str | None) -> None:
+        if not browser_session_id:
+            return
+        try:
+            await self.steel_service.release_session(browser_session_id)
+        except Exception:
+            logger.exception("Failed to release browser session %s", browser_session_id)
 
-    async def _create_session_and_finalize_run(
+    async def _lease_session_or_fail(
         self,
-        run_id: UUID,
-        session_url: str,
-        browser_session_id: str,
-        session: AsyncSession,
-    ) -> Run:
-        """Create session record and finalize the run."""
-        # Ensure run exists before creating related records
-        run = await self.repository.get_by_id(session, run_id)
-        if not run:
-            self._handle_run_finalization_failure(run_id, browser_session_id)
+        record_failure: Callable[[str], Awaitable[None]],
+        priority: RunPriority,
+    ) -> tuple[str, str | None]:
+        """Lease a browser session, recording the failure before raising.
 
-        # Create session record
-        db_session = SessionModel(
-            id=uuid4(),
-            run_id=run_id,
-            browser_provider_session_id=browser_session_id,
-            session_url=session_url,
-            status=SessionStatus.ACTIVE,
+        Returns:
+            tuple: (session_url, browser_session_id)
+        """
+        try:
+            session_data = await self._lease_browser_session(priority)
+        except Exception as e:
+            await record_failure(str(e))
+            raise
+
+        if not session_data:
+            await record_failure("Failed to create browser session")
+            self._fail_session_creation()
+
+        session_url = session_data.get("debugUrl")
+        if not session_url:
+            await record_failure("Session created without viewer URL")
+            self._fail_missing_url()
+
+        return session_url, session_data.get("id")
+
+    async def _emit_session_initialized(self, run_id: UUID, session_url: str) -> None:
+        await self._emit_progress_safe(
+            run_id,
+            {
+                "status": RunStatus.RUNNING.value,
+                "session_url": session_url,
+                "message": "Session initialized",
+            },
         )
-        await self.repository.create_session(session, db_session)
-        run.status = RunStatus.RUNNING
-        run.started_at = datetime.now(UTC)
-        run.updated_at = datetime.now(UTC)
-        await self.repository.update(session, run)
-        return run
 
     def _fail_session_creation(self) -> None:
         """Raise session creation failure."""
@@ -187,17 +527,6 @@ class RunService:
         """Raise missing URL failure."""
         raise MissingSessionURLError
 
-    def _handle_run_finalization_failure(
-        self, run_id: UUID, browser_session_id: str | None
-    ) -> None:
-        """Handle run finalization failures by logging and raising explicit error."""
-        logger.error(
-            "Run finalization failed for run_id=%s session_id=%s",
-            run_id,
-            browser_session_id,
-        )
-        raise RunFinalizationError(str(run_id), browser_session_id)
-
     async def _emit_progress_safe(self, run_id: UUID, data: dict) -> None:
         """Safely emit progress events."""
         try:
@@ -223,27 +552,55 @@ class RunService:
         if flow.created_by != user.id and user.role != UserRole.ADMIN:
             raise FlowAccessDeniedError(str(flow_id))
 
-    async def _create_run_record_with_user(
-        self, request: RunCreate, run_id: UUID, user: User, session: AsyncSession
-    ) -> Run:
-        """Create the initial run record with authenticated user."""
+    async def _record_failed_run(
+        self,
+        request: RunCreate,
+        run_id: UUID,
+        user: User,
+        session: AsyncSession,
+        error_message: str,
+    ) -> None:
+        """Persist a run whose browser session could not be provisioned."""
         run = Run(
             id=run_id,
             flow_id=request.flow_id,
-            user_id=user.id,  # Use authenticated user's ID
-            status=RunStatus.PENDING,
+            user_id=user.id,
+            status=RunStatus.FAILED,
+            error=error_message,
+            ended_at=datetime.now(UTC),
+            input_payload=request.input_payload,
+            priority=request.priority or RunPriority.INTERACTIVE,
         )
-        run = await self.repository.create(session, run)
+        await self.repository.create(session, run)
 
-        # Emit pending status event
         await self._emit_progress_safe(
             run_id,
             {
-                "status": RunStatus.PENDING.value,
-                "message": "Run created, initializing session",
+                "status": RunStatus.FAILED.value,
+                "message": error_message,
+            },
+        )
+
+    async def _fail_pending_run(
+        self, run: Run, session: AsyncSession, error_message: str
+    ) -> None:
+        """Mark a pending or claimed run FAILED when it cannot be provisioned."""
+        await session.refresh(run)
+        if run.status in TERMINAL_RUN_STATUSES:
+            return
+        run.status = RunStatus.FAILED
+        run.error = error_message
+        run.ended_at = datetime.now(UTC)
+        run.updated_at = datetime.now(UTC)
+        await self.repository.update(session, run)
+
+        await self._emit_progress_safe(
+            run.id,
+            {
+                "status": RunStatus.FAILED.value,
+                "message": error_message,
             },
         )
-        return run
 
     async def update_run(
         self, run_id: UUID, request: dict, session: AsyncSession
@@ -266,6 +623,120 @@ class RunService:
         run.updated_at = datetime.now(UTC)
         return await self.repository.update(session, run)
 
+    async def update_active_run(
+        self, run_id: UUID, request: dict, session: AsyncSession
+    ) -> Run:
+        """Update a run the engine is executing, unless it already finished.
+
+        Raises:
+            RunNotFoundError: If the run does not exist
+            RunAlreadyFinishedError: If the run was completed, failed or
+                canceled, e.g. by another process
+        """
+        values: dict[str, Any] = {
+            key: request[key]
+            for key in ("result_uri", "error", "ended_at")
+            if key in request
+        }
+        if "status" in request:
+            values["status"] = RunStatus(request["status"])
+        values["updated_at"] = datetime.now(UTC)
+        run = await self.get_run(run_id, session)
+        updated = await self.repository.update_unfinished(session, run_id, values)
+        await session.refresh(run)
+        if not updated:
+            raise RunAlreadyFinishedError(str(run_id), run.status.value)
+        return run
+
+    async def cancel_run(self, run_id: UUID, session: AsyncSession) -> Run:
+        """Mark a run CANCELED, closing any checkpoint it is paused at.
+
+        Used for runs without a live engine task, and to confirm the engine's
+        own cancellation; a run already CANCELED is returned unchanged.
+
+        Raises:
+            RunNotFoundError: If the run does not exist
+            RunAlreadyFinishedError: If the run completed or failed
+        """
+        run = await self.get_run(run_id, session)
+        # The engine may have committed the cancellation in its own session
+        await session.refresh(run)
+        if run.status == RunStatus.CANCELED:
+            return run
+        if run.status in TERMINAL_RUN_STATUSES:
+            raise RunAlreadyFinishedError(str(run_id), run.status.value)
+
+        await self.checkpoint_service.resolve_open_checkpoints(
+            session, [run_id], CheckpointStatus.CANCELED
+        )
+        event = Event(
+            run_id=run_id,
+            type=EventType.STATUS,
+            message="run_canceled",
+            payload={"status": RunStatus.CANCELED.value},
+        )
+        session.add(event)
+        await self.event_repository.update_summaries(session, [event.model_dump()])
+        await session.flush()
+        published = EventRead.model_validate(event)
+        now = datetime.now(UTC)
+        run.status = RunStatus.CANCELED
+        run.ended_at = now
+        run.updated_at = now
+        # The process executing the run stops it when it sees the signal
+        await self.repository.notify_run_signal(session, run_id)
+        run = await self.repository.update(session, run)
+
+        event_broadcaster.publish(published)
+        await self._emit_progress_safe(
+            run_id,
+            {"status": RunStatus.CANCELED.value, "message": "Run canceled"},
+        )
+        return run
+
+    async def requeue_abandoned_run(self, run_id: UUID, session: AsyncSession) -> Run:
+        """Reset a run whose worker died mid-execution to PENDING.
+
+        Its open checkpoint is expired and its browser sessions are ended
+        and released, so the run can be provisioned and executed afresh.
+        """
+        run = await self.get_run(run_id, session)
+        await self.checkpoint_service.resolve_open_checkpoints(
+            session, [run_id], CheckpointStatus.EXPIRED
+        )
+        now = datetime.now(UTC)
+        provider_ids = await self.repository.end_open_sessions(session, [run_id], now)
+        event = Event(
+            run_id=run_id,
+            type=EventType.STATUS,
+            message="run_requeued",
+            payload={"status": RunStatus.PENDING.value, "previous": run.status.value},
+        )
+        session.add(event)
+        await self.event_repository.update_summaries(session, [event.model_dump()])
+        await session.flush()
+        published = EventRead.model_validate(event)
+        run.status = RunStatus.PENDING
+        run.started_at = None
+        run.owner_id = None
+        run.heartbeat_at = None
+        run.updated_at = now
+        run = await self.repository.update(session, run)
+
+        event_broadcaster.publish(published)
+        for provider_id in provider_ids:
+            await self._release_browser_session(provider_id)
+        return run
+
+    async def fail_undeliverable_run(
+        self, run_id: UUID, session: AsyncSession, error_message: str
+    ) -> None:
+        """Mark a run FAILED once the run queue gives up on delivering it."""
+        run = await self.get_run(run_id, session)
+        if run.status in OWNED_RUN_STATUSES:
+            run = await self.requeue_abandoned_run(run_id, session)
+        await self._fail_pending_run(run, session, error_message)
+
     async def continue_run(
         self, run_id: UUID, request: RunContinue, session: AsyncSession
     ) -> Run:
@@ -293,6 +764,14 @@ class RunService:
                 },
             )
             session.add(event)
+            await self.event_repository.update_summaries(session, [event.model_dump()])
+
+        # The engine holding the paused run picks the input up from its
+        # checkpoint when the resume signal does not reach it directly
+        await self.checkpoint_service.record_resume_input(
+            session, run_id, request.input_payload
+        )
+        await self.repository.notify_run_signal(session, run_id)
 
         # Set run status to running
         run.status = RunStatus.RUNNING
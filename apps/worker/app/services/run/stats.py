@@ -0,0 +1,54 @@
+"""Short-lived cache for run status aggregates."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Hashable
+
+from app.constants import RUN_STATS_CACHE_MAX_ENTRIES, RUN_STATS_CACHE_TTL_SECONDS
+from app.models import RunStatsRead
+
+
+class RunStatsCache:
+    """Keeps computed run stats for `ttl` seconds, keyed by query shape.
+
+    Dashboards poll the same few aggregates, so within the TTL a refresh is
+    served from memory and the GROUP BY query runs at most once per key.
+    Expired entries are dropped lazily; past `max_entries` the oldest entry
+    is evicted.
+    """
+
+    def __init__(
+        self,
+        ttl: float = RUN_STATS_CACHE_TTL_SECONDS,
+        max_entries: int = RUN_STATS_CACHE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: dict[Hashable, tuple[float, RunStatsRead]] = {}
+
+    def get(self, key: Hashable) -> RunStatsRead | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, stats = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        return stats
+
+    def set(self, key: Hashable, stats: RunStatsRead) -> None:
+        self._entries.pop(key, None)
+        if len(self._entries) >= self.max_entries:
+            # Dicts keep insertion order, so the first key is the oldest
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (self._clock() + self.ttl, stats)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+# Process-wide cache shared by every request to the stats endpoint
+run_stats_cache = RunStatsCache()
@@ -0,0 +1,240 @@
+"""Shared, instrumented HTTP client for the Steel.dev API."""
+
+from __future__ import annotations
+
+import importlib.util
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+from app.config import (
+    DEFAULT_STEEL_HTTP_CONNECT_TIMEOUT_SECONDS,
+    DEFAULT_STEEL_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+    DEFAULT_STEEL_HTTP_MAX_CONNECTIONS,
+    DEFAULT_STEEL_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    DEFAULT_STEEL_HTTP_POOL_TIMEOUT_SECONDS,
+    DEFAULT_STEEL_INFO_TIMEOUT_SECONDS,
+    get_steel_http_config,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SteelEndpointStats:
+    """Latency and connection-pool counters for one Steel.dev operation."""
+
+    requests: int = 0
+    errors: int = 0
+    new_connections: int = 0
+    latency_seconds: float = 0.0
+    max_latency_seconds: float = 0.0
+    pool_wait_seconds: float = 0.0
+    max_pool_wait_seconds: float = 0.0
+    connect_seconds: float = 0.0
+
+    @property
+    def avg_latency_seconds(self) -> float:
+        return self.latency_seconds / self.requests if self.requests else 0.0
+
+    @property
+    def avg_pool_wait_seconds(self) -> float:
+        return self.pool_wait_seconds / self.requests if self.requests else 0.0
+
+    def record(self, trace: RequestTrace, *, failed: bool) -> None:
+        self.requests += 1
+        self.errors += int(failed)
+        self.latency_seconds += trace.latency
+        self.max_latency_seconds = max(self.max_latency_seconds, trace.latency)
+        self.pool_wait_seconds += trace.pool_wait
+        self.max_pool_wait_seconds = max(self.max_pool_wait_seconds, trace.pool_wait)
+        self.connect_seconds += trace.connect
+        self.new_connections += int(trace.connected)
+
+    def as_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "new_connections": self.new_connections,
+            "avg_latency_seconds": round(self.avg_latency_seconds, 4),
+            "max_latency_seconds": round(self.max_latency_seconds, 4),
+            "avg_pool_wait_seconds": round(self.avg_pool_wait_seconds, 4),
+            "max_pool_wait_seconds": round(self.max_pool_wait_seconds, 4),
+            "connect_seconds": round(self.connect_seconds, 4),
+        }
+
+
+@dataclass
+class SteelHttpStats:
+    """Per-operation counters of the shared Steel.dev client."""
+
+    endpoints: dict[str, SteelEndpointStats] = field(default_factory=dict)
+
+    def endpoint(self, name: str) -> SteelEndpointStats:
+        return self.endpoints.setdefault(name, SteelEndpointStats())
+
+    def as_dict(self) -> dict:
+        return {name: stats.as_dict() for name, stats in self.endpoints.items()}
+
+
+class RequestTrace:
+    """Timings of one request, collected from httpcore trace events.
+
+    httpcore only starts emitting events once the request holds a pooled
+    connection, so the time until the first event is the pool wait. A
+    `connect_tcp` event means no idle connection was reusable.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self._clock = clock
+        self.started = clock()
+        self.first_event: float | None = None
+        self.connected = False
+        self.connect = 0.0
+        self.latency = 0.0
+        self._connect_started: float | None = None
+
+    @property
+    def pool_wait(self) -> float:
+        if self.first_event is None:
+            return 0.0
+        return self.first_event - self.started
+
+    async def __call__(self, event_name: str, _info: dict[str, Any]) -> None:
+        now = self._clock()
+        if self.first_event is None:
+            self.first_event = now
+        if event_name == "connection.connect_tcp.started":
+            self.connected = True
+            self._connect_started = now
+        elif (
+            event_name
+            in (
+                "connection.connect_tcp.complete",
+                "connection.start_tls.complete",
+            )
+            and self._connect_started is not None
+        ):
+            self.connect = now - self._connect_started
+
+    def finish(self) -> None:
+        self.latency = self._clock() - self.started
+
+
+class SteelHttpClient:
+    """One keep-alive connection pool to Steel.dev shared by the process.
+
+    `start` opens the pooled client and `aclose` closes it; both are driven
+    by the application lifespan. Outside of it (scripts, tests) requests
+    fall back to a short-lived client per call. Every request is timed per
+    operation, including the wait for a pooled connection.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        http2: bool = False,
+        max_connections: int = DEFAULT_STEEL_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_STEEL_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = DEFAULT_STEEL_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        connect_timeout: float = DEFAULT_STEEL_HTTP_CONNECT_TIMEOUT_SECONDS,
+        pool_timeout: float = DEFAULT_STEEL_HTTP_POOL_TIMEOUT_SECONDS,
+        timeouts: dict[str, float] | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self.http2 = http2
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.connect_timeout = connect_timeout
+        self.pool_timeout = pool_timeout
+        self.timeouts = timeouts or {}
+        self.stats = SteelHttpStats()
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+
+    @property
+    def started(self) -> bool:
+        return self._client is not None
+
+    def start(self) -> None:
+        """Open the shared connection pool."""
+        if self._client is not None:
+            return
+        http2 = self.http2
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP/2 requested but h2 is not installed; using HTTP/1.1")
+            http2 = False
+        self._client = self._new_client(http2=http2)
+        logger.info(
+            "Steel HTTP client started (http2=%s, max_connections=%s)",
+            http2,
+            self.limits.max_connections,
+        )
+
+    async def aclose(self) -> None:
+        """Close the shared connection pool."""
+        if self._client is None:
+            return
+        client, self._client = self._client, None
+        await client.aclose()
+        logger.info("Steel HTTP client closed")
+
+    async def request(
+        self, endpoint: str, method: str, url: str, **kwargs: Any
+    ) -> httpx.Response:
+        """Send a request timed under `endpoint`, with its operation timeout."""
+        timeout = httpx.Timeout(
+            self.timeouts.get(endpoint, DEFAULT_STEEL_INFO_TIMEOUT_SECONDS),
+            connect=self.connect_timeout,
+            pool=self.pool_timeout,
+        )
+        trace = RequestTrace()
+        request = httpx.Request(
+            method,
+            url,
+            extensions={"trace": trace, "timeout": timeout.as_dict()},
+            **kwargs,
+        )
+        if self._client is None:
+            async with self._new_client() as client:
+                return await self._send(client, endpoint, request, trace)
+        return await self._send(self._client, endpoint, request, trace)
+
+    async def _send(
+        self,
+        client: httpx.AsyncClient,
+        endpoint: str,
+        request: httpx.Request,
+        trace: RequestTrace,
+    ) -> httpx.Response:
+        failed = True
+        try:
+            response = await client.send(request)
+            failed = response.is_server_error
+            return response
+        finally:
+            trace.finish()
+            self.stats.endpoint(endpoint).record(trace, failed=failed)
+            logger.debug(
+                "Steel %s took %.3fs (pool wait %.3fs, new connection: %s)",
+                endpoint,
+                trace.latency,
+                trace.pool_wait,
+                trace.connected,
+            )
+
+    def _new_client(self, *, http2: bool = False) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            http2=http2, limits=self.limits, transport=self._transport
+        )
+
+
+# Process-wide client, opened and closed by the application lifespan
+steel_http_client = SteelHttpClient(**get_steel_http_config())
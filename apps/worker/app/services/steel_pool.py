@@ -0,0 +1,273 @@
+"""Pre-warmed pool of Steel.dev browser sessions."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import math
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from app.config import (
+    DEFAULT_STEEL_POOL_HEALTH_CHECK_SIZE,
+    DEFAULT_STEEL_POOL_IDLE_TTL_SECONDS,
+    DEFAULT_STEEL_POOL_INTERACTIVE_RESERVE,
+    DEFAULT_STEEL_POOL_MAX_SIZE,
+    DEFAULT_STEEL_POOL_MIN_SIZE,
+    DEFAULT_STEEL_POOL_REPLENISH_INTERVAL_SECONDS,
+)
+from app.models import RunPriority
+from app.services.steel_service import STEEL_SESSION_TIMEOUT_MS, SteelService
+
+logger = logging.getLogger(__name__)
+
+LIVE_SESSION_STATUS = "live"
+
+
+@dataclass(eq=False)
+class PooledSession:
+    """A provisioned session waiting to be leased."""
+
+    data: dict
+    created_at: float
+    checked_at: float = -math.inf
+
+    @property
+    def id(self) -> str | None:
+        return self.data.get("id")
+
+
+@dataclass
+class SteelPoolStats:
+    """Counters describing how well the pool absorbs lease demand."""
+
+    leases: int = 0
+    hits: int = 0
+    misses: int = 0
+    reserved: int = 0
+    discarded: int = 0
+    lease_wait_seconds: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.leases if self.leases else 0.0
+
+    @property
+    def avg_lease_wait_seconds(self) -> float:
+        return self.lease_wait_seconds / self.leases if self.leases else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "leases": self.leases,
+            "hits": self.hits,
+            "misses": self.misses,
+            "reserved": self.reserved,
+            "discarded": self.discarded,
+            "hit_rate": round(self.hit_rate, 4),
+            "lease_wait_seconds": round(self.lease_wait_seconds, 4),
+            "avg_lease_wait_seconds": round(self.avg_lease_wait_seconds, 4),
+        }
+
+
+class SteelSessionPool:
+    """Keeps warm Steel sessions ready so run creation skips provisioning.
+
+    A background task tops the pool up to `min_size` idle sessions, plus one
+    per lease that missed since the previous pass, never holding more than
+    `max_size` idle or provisioning sessions. Each pass releases sessions
+    older than `idle_ttl` and health-checks up to `health_check_size` of the
+    rest with `get_session_info`, least recently checked first, so a lease is
+    a local pop. Pooled sessions are created with `idle_ttl` added to the
+    provider timeout, so a leased session always has at least the lifetime
+    of an inline one. When the pool is empty a lease falls back to
+    creating a session inline. The last `interactive_reserve` warm sessions
+    are only leased to interactive runs; other runs create theirs inline.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        steel_service: SteelService | None = None,
+        *,
+        min_size: int = DEFAULT_STEEL_POOL_MIN_SIZE,
+        max_size: int = DEFAULT_STEEL_POOL_MAX_SIZE,
+        idle_ttl: float = DEFAULT_STEEL_POOL_IDLE_TTL_SECONDS,
+        interval: float = DEFAULT_STEEL_POOL_REPLENISH_INTERVAL_SECONDS,
+        interactive_reserve: int = DEFAULT_STEEL_POOL_INTERACTIVE_RESERVE,
+        health_check_size: int = DEFAULT_STEEL_POOL_HEALTH_CHECK_SIZE,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if min_size > max_size:
+            msg = f"Pool min_size ({min_size}) exceeds max_size ({max_size})"
+            raise ValueError(msg)
+        self.steel_service = steel_service or SteelService()
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_ttl = idle_ttl
+        self.interval = interval
+        self.interactive_reserve = interactive_reserve
+        self.health_check_size = health_check_size
+        # A session may idle for up to idle_ttl before its lease starts
+        self.session_timeout_ms = STEEL_SESSION_TIMEOUT_MS + math.ceil(idle_ttl * 1000)
+        self.stats = SteelPoolStats()
+        self._clock = clock
+        self._idle: deque[PooledSession] = deque()
+        self._provisioning = 0
+        self._recent_misses = 0
+        self._wake = asyncio.Event()
+        self._releases: set[asyncio.Task] = set()
+        self._worker: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._worker is not None and not self._worker.done()
+
+    @property
+    def idle_count(self) -> int:
+        return len(self._idle)
+
+    def start(self) -> None:
+        """Start the background replenishment task."""
+        if self.running:
+            return
+        self._worker = asyncio.create_task(self._run())
+        logger.info(
+            "Steel session pool started (min=%d, max=%d)", self.min_size, self.max_size
+        )
+
+    async def stop(self) -> None:
+        """Stop replenishing and release every idle session."""
+        if self._worker is not None:
+            self._worker.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._worker
+            self._worker = None
+        idle = list(self._idle)
+        self._idle.clear()
+        await asyncio.gather(
+            *(self._release(pooled) for pooled in idle), *self._releases
+        )
+        logger.info("Steel session pool stopped (%s)", self.stats.as_dict())
+
+    async def acquire(self, priority: RunPriority | None = None) -> dict | None:
+        """Lease a session, creating one inline when no warm session is ready.
+
+        Runs below the interactive class leave the reserved warm sessions in
+        place. The returned session belongs to the caller, who releases it
+        when done.
+        """
+        start = time.perf_counter()
+        keep = 0
+        if priority not in {None, RunPriority.INTERACTIVE}:
+            keep = self.interactive_reserve
+        try:
+            session_data = self._pop_fresh(keep)
+            if session_data is not None:
+                self.stats.hits += 1
+                return session_data
+            if self._idle:
+                self.stats.reserved += 1
+            self.stats.misses += 1
+            self._recent_misses += 1
+            return await self.steel_service.create_session()
+        finally:
+            self.stats.leases += 1
+            self.stats.lease_wait_seconds += time.perf_counter() - start
+            self._wake.set()
+
+    async def replenish(self) -> int:
+        """Run one maintenance pass, returning the number of sessions added."""
+        await self._evict_stale()
+        target = min(self.max_size, self.min_size + self._recent_misses)
+        self._recent_misses = 0
+        needed = max(0, target - len(self._idle) - self._provisioning)
+        if not needed:
+            return 0
+        self._provisioning += needed
+        # Age counts from the request, as the provider's timeout does
+        requested_at = self._clock()
+        try:
+            results = await asyncio.gather(
+                *(
+                    self.steel_service.create_session(self.session_timeout_ms)
+                    for _ in range(needed)
+                ),
+                return_exceptions=True,
+            )
+        finally:
+            self._provisioning -= needed
+        added = 0
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.warning("Failed to provision pooled Steel session: %s", result)
+            elif result and result.get("debugUrl"):
+                self._idle.append(PooledSession(data=result, created_at=requested_at))
+                added += 1
+        return added
+
+    def _pop_fresh(self, keep: int = 0) -> dict | None:
+        deadline = self._clock() - self.idle_ttl
+        while len(self._idle) > keep:
+            pooled = self._idle.popleft()
+            if pooled.created_at > deadline:
+                return pooled.data
+            self._discard(pooled)
+        return None
+
+    async def _evict_stale(self) -> None:
+        deadline = self._clock() - self.idle_ttl
+        for pooled in [p for p in self._idle if p.created_at <= deadline]:
+            self._idle.remove(pooled)
+            self._discard(pooled)
+        # Check a few sessions per pass instead of one provider call per session
+        candidates = sorted(self._idle, key=lambda pooled: pooled.checked_at)[
+            : self.health_check_size
+        ]
+        healthy = await asyncio.gather(
+            *(self._is_healthy(pooled) for pooled in candidates)
+        )
+        checked_at = self._clock()
+        for pooled, ok in zip(candidates, healthy, strict=True):
+            pooled.checked_at = checked_at
+            # The session may have been leased while the checks were in flight
+            if not ok and pooled in self._idle:
+                self._idle.remove(pooled)
+                self._discard(pooled)
+
+    async def _is_healthy(self, pooled: PooledSession) -> bool:
+        if pooled.id is None:
+            return False
+        try:
+            info = await self.steel_service.get_session_info(pooled.id)
+        except Exception as e:  # noqa: BLE001
+            logger.warning("Health check failed for session %s: %s", pooled.id, e)
+            return False
+        if not info:
+            return False
+        return info.get("status", LIVE_SESSION_STATUS) == LIVE_SESSION_STATUS
+
+    def _discard(self, pooled: PooledSession) -> None:
+        self.stats.discarded += 1
+        task = asyncio.create_task(self._release(pooled))
+        self._releases.add(task)
+        task.add_done_callback(self._releases.discard)
+
+    async def _release(self, pooled: PooledSession) -> None:
+        if pooled.id is None:
+            return
+        try:
+            await self.steel_service.release_session(pooled.id)
+        except Exception as e:  # noqa: BLE001
+            logger.warning("Failed to release pooled session %s: %s", pooled.id, e)
+
+    async def _run(self) -> None:
+        while True:
+            self._wake.clear()
+            try:
+                await self.replenish()
+            except Exception:
+                logger.exception("Steel session pool replenishment failed")
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), timeout=self.interval)
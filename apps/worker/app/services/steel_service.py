@@ -1,27 +1,40 @@
 import logging
 from http import HTTPStatus
 
-import httpx
-
 from app.config import settings
+from app.services.steel_http import SteelHttpClient, steel_http_client
 from app.utils.retry import retry_network_operation, should_retry_http_response
 
 logger = logging.getLogger(__name__)
 
+# Provider-side lifetime of a session, counted from its creation
+STEEL_SESSION_TIMEOUT_MS = 30000
+
 
 class SteelService:
     """Service for managing Steel.dev browser sessions."""
 
-    def __init__(self):
-        self.api_key = settings.steel_api_key
+    def __init__(
+        self,
+        api_key: str | None = None,
+        base_url: str | None = None,
+        http_client: SteelHttpClient | None = None,
+    ):
+        self.api_key = api_key or settings.steel_api_key
         self.dev_mode = not bool(self.api_key)
-        self.base_url = "https://api.steel.dev/v1"
+        self.base_url = base_url or settings.steel_base_url
+        self.http = http_client or steel_http_client
         if self.dev_mode:
             logger.warning("Running in development mode - using mock Steel sessions")
 
     @retry_network_operation()
-    async def create_session(self) -> dict | None:
-        """Create a new Steel.dev browser session with retry logic."""
+    async def create_session(
+        self, timeout_ms: int = STEEL_SESSION_TIMEOUT_MS
+    ) -> dict | None:
+        """Create a new Steel.dev browser session with retry logic.
+
+        `timeout_ms` is the session's provider-side lifetime from creation.
+        """
         if self.dev_mode:
             # Development mode: return mock session data
             return {
@@ -33,40 +46,41 @@ class SteelService:
                 "status": "live",
             }
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{self.base_url}/sessions",
-                headers={
-                    "steel-api-key": self.api_key,
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "dimensions": {"width": 1280, "height": 720},
-                    "timeout": 30000,
-                },
+        response = await self.http.request(
+            "create_session",
+            "POST",
+            f"{self.base_url}/sessions",
+            headers={
+                "steel-api-key": self.api_key,
+                "Content-Type": "application/json",
+            },
+            json={
+                "dimensions": {"width": 1280, "height": 720},
+                "timeout": timeout_ms,
+            },
+        )
+
+        if should_retry_http_response(response):
+            response.raise_for_status()
+
+        if response.status_code != HTTPStatus.CREATED:
+            logger.error(
+                "Failed to create Steel session: %s - %s",
+                response.status_code,
+                response.text,
             )
-
-            if should_retry_http_response(response):
-                response.raise_for_status()
-
-            if response.status_code != HTTPStatus.CREATED:
-                logger.error(
-                    "Failed to create Steel session: %s - %s",
-                    response.status_code,
-                    response.text,
-                )
-                return None
-
-            session_data = response.json()
-            session_url = session_data.get("debugUrl")
-            if not session_url:
-                logger.error("Steel session created but missing 'debugUrl'")
-                return None
-            logger.info(
-                "Successfully created Steel session: %s",
-                session_data.get("id"),
-            )
-            return session_data
+            return None
+
+        session_data = response.json()
+        session_url = session_data.get("debugUrl")
+        if not session_url:
+            logger.error("Steel session created but missing 'debugUrl'")
+            return None
+        logger.info(
+            "Successfully created Steel session: %s",
+            session_data.get("id"),
+        )
+        return session_data
 
     @retry_network_operation()
     async def get_session_info(self, session_id: str) -> dict | None:
@@ -85,24 +99,25 @@ class SteelService:
                 "status": "live",
             }
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                f"{self.base_url}/sessions/{session_id}",
-                headers={"steel-api-key": self.api_key},
+        response = await self.http.request(
+            "get_session_info",
+            "GET",
+            f"{self.base_url}/sessions/{session_id}",
+            headers={"steel-api-key": self.api_key},
+        )
+
+        if should_retry_http_response(response):
+            response.raise_for_status()
+
+        if response.status_code != HTTPStatus.OK:
+            logger.error(
+                "Failed to get Steel session info: %s - %s",
+                response.status_code,
+                response.text,
             )
+            return None
 
-            if should_retry_http_response(response):
-                response.raise_for_status()
-
-            if response.status_code != HTTPStatus.OK:
-                logger.error(
-                    "Failed to get Steel session info: %s - %s",
-                    response.status_code,
-                    response.text,
-                )
-                return None
-
-            return response.json()
+        return response.json()
 
     @retry_network_operation()
     async def release_session(self, session_id: str) -> bool:
@@ -112,22 +127,23 @@ class SteelService:
             logger.info("Development mode: mock releasing session %s", session_id)
             return True
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{self.base_url}/sessions/{session_id}/release",
-                headers={"steel-api-key": self.api_key},
+        response = await self.http.request(
+            "release_session",
+            "POST",
+            f"{self.base_url}/sessions/{session_id}/release",
+            headers={"steel-api-key": self.api_key},
+        )
+
+        if not should_retry_http_response(response):
+            response.raise_for_status()
+
+        success = response.status_code in (HTTPStatus.OK, HTTPStatus.NO_CONTENT)
+        if success:
+            logger.info("Successfully released Steel session: %s", session_id)
+        else:
+            logger.warning(
+                "Failed to release Steel session %s: %s",
+                session_id,
+                response.status_code,
             )
-
-            if not should_retry_http_response(response):
-                response.raise_for_status()
-
-            success = response.status_code in (HTTPStatus.OK, HTTPStatus.NO_CONTENT)
-            if success:
-                logger.info("Successfully released Steel session: %s", session_id)
-            else:
-                logger.warning(
-                    "Failed to release Steel session %s: %s",
-                    session_id,
-                    response.status_code,
-                )
-            return success
+        return success
@@ -0,0 +1,29 @@
+"""Weak entity tags for conditional GET requests."""
+
+import hashlib
+from datetime import datetime
+
+from app.utils.pagination import as_utc
+
+
+def weak_etag(*parts: object) -> str:
+    """Build a weak ETag from the values that version a representation."""
+    raw = "|".join(
+        as_utc(part).isoformat() if isinstance(part, datetime) else str(part)
+        for part in parts
+    )
+    digest = hashlib.blake2b(raw.encode(), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an `If-None-Match` header against an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
@@ -0,0 +1,43 @@
+"""Opaque keyset pagination cursors."""
+
+import base64
+import binascii
+from datetime import UTC, datetime
+from uuid import UUID
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+    def __init__(self) -> None:
+        super().__init__("Invalid pagination cursor")
+
+
+def encode_cursor(at: datetime, item_id: UUID) -> str:
+    """Encode a `(timestamp, id)` keyset position as an opaque string."""
+    raw = f"{as_utc(at).isoformat()}|{item_id.hex}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decode a cursor produced by `encode_cursor`.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        at_raw, id_raw = raw.split("|", 1)
+        return datetime.fromisoformat(at_raw), UUID(hex=id_raw)
+    except (ValueError, binascii.Error, UnicodeDecodeError) as e:
+        raise InvalidCursorError from e
+
+
+def as_utc(value: datetime) -> datetime:
+    """Normalize a datetime to UTC, treating naive values as UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
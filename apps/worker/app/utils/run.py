@@ -9,7 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import Run, User, UserRole
 from app.services.run.errors import RunNotFoundError
-from app.services.run.service import RunService
+from app.services.run.service import RunETag, RunService
 
 logger = logging.getLogger(__name__)
 
@@ -49,3 +49,29 @@ async def ensure_run_access(
         ) from e
     else:
         return run
+
+
+async def ensure_run_etag_access(
+    run_id: UUID,
+    user: User,
+    session: AsyncSession,
+    run_service: RunService,
+) -> RunETag:
+    """Like `ensure_run_access`, but only loads the run's ETag and owner.
+
+    Raises:
+        HTTPException: 404 if the run does not exist or is not accessible
+    """
+    try:
+        run_etag = await run_service.get_run_etag(run_id, session)
+    except RunNotFoundError as e:
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND,
+            detail="Run not found",
+        ) from e
+    if run_etag.user_id != user.id and user.role != UserRole.ADMIN:
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND,
+            detail="Run not found",
+        )
+    return run_etag
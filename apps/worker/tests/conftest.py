@@ -21,6 +21,7 @@ from app.constants import API_V1_PREFIX
 from app.db import get_db_session
 from app.main import app
 from app.models import Flow, FlowVisibility, Run, RunStatus, User, UserRole
+from app.services.run.stats import run_stats_cache
 from app.utils.auth import create_access_token, get_password_hash
 
 
@@ -129,14 +130,16 @@ class BaseTestClass:
     def _override_db_dependency(self):
         """Override the database session dependency to use test session."""
         # Create a test session factory that uses our test database
-        self.test_engine = create_async_engine(self.test_db_url, echo=False)
+        self.test_engine = create_async_engine(
+            self.test_db_url,
+            echo=False,
+            connect_args={"timeout": db.SQLITE_BUSY_TIMEOUT_SECONDS},
+        )
 
-        # Enforce SQLite FKs for all conns
+        # Enforce SQLite FKs and WAL for all conns, as the app does
         @event.listens_for(self.test_engine.sync_engine, "connect")
-        def _fk_on(dbapi_connection, connection_record):  # noqa: ARG001
-            cursor = dbapi_connection.cursor()
-            cursor.execute("PRAGMA foreign_keys=ON")
-            cursor.close()
+        def _configure(dbapi_connection, connection_record):  # noqa: ARG001
+            db.configure_sqlite_connection(dbapi_connection)
 
         # Create tables in the test database
         async def create_tables():
@@ -295,9 +298,11 @@ class BaseTestClass:
         self.settings_patcher.stop()
         # Clear dependency overrides
         app.dependency_overrides = {}
+        run_stats_cache.clear()
         # Clean up temporary database file
         # Ensure engine is closed before unlink
         with contextlib.suppress(Exception):
             asyncio.run(self.test_engine.dispose())
-        with contextlib.suppress(OSError, FileNotFoundError):
-            Path(self.temp_db.name).unlink()
+        for suffix in ("", "-wal", "-shm"):
+            with contextlib.suppress(OSError, FileNotFoundError):
+                Path(self.temp_db.name + suffix).unlink()
@@ -0,0 +1,94 @@
+import asyncio
+from http import HTTPStatus
+from uuid import UUID
+
+from sqlmodel import select
+
+from app.constants import MAX_RUN_BATCH_SIZE
+from app.dependencies import get_run_scheduler
+from app.models import Run, RunPriority, RunStatus
+from tests.conftest import BaseTestClass
+
+FLOW_ID = "550e8400-e29b-41d4-a716-446655440000"
+BATCH_SIZE = 25
+
+
+class RecordingBatchScheduler:
+    """Scheduler stand-in that records runs handed over for provisioning."""
+
+    queued = False
+
+    def __init__(self) -> None:
+        self.provisioned: list[UUID] = []
+
+    def provision_many(self, runs, run_service=None, **_kwargs):  # noqa: ARG002
+        self.provisioned.extend(run.id for run in runs)
+
+
+class TestRunsBatchPostContract(BaseTestClass):
+    """Contract tests for POST /runs:batch endpoint."""
+
+    def _post_batch(self, body: dict) -> tuple:
+        scheduler = RecordingBatchScheduler()
+        self.client.app.dependency_overrides[get_run_scheduler] = lambda: scheduler
+        try:
+            response = self.client.post(
+                f"{self.API_PREFIX}/runs:batch",
+                json=body,
+                headers=self.get_user_auth_headers(),
+            )
+        finally:
+            self.client.app.dependency_overrides.pop(get_run_scheduler, None)
+        return response, scheduler
+
+    def _stored_runs(self, run_ids: list[str]) -> dict[str, Run]:
+        async def _load():
+            async with self.TestAsyncSessionLocal() as session:
+                result = await session.execute(
+                    select(Run).where(Run.id.in_([UUID(i) for i in run_ids]))
+                )
+                return {str(run.id): run for run in result.scalars()}
+
+        return asyncio.run(_load())
+
+    def test_post_runs_batch_creates_pending_runs_with_inputs(self):
+        """Each input payload becomes a PENDING run handed to the scheduler."""
+        inputs = [{"row": i} for i in range(BATCH_SIZE)]
+
+        response, scheduler = self._post_batch({"flow_id": FLOW_ID, "inputs": inputs})
+
+        assert response.status_code == HTTPStatus.ACCEPTED
+        data = response.json()
+        assert data["count"] == BATCH_SIZE
+        assert [str(run_id) for run_id in scheduler.provisioned] == data["run_ids"]
+        runs = self._stored_runs(data["run_ids"])
+        assert [runs[run_id].input_payload for run_id in data["run_ids"]] == inputs
+        assert {run.status for run in runs.values()} == {RunStatus.PENDING}
+        assert {run.priority for run in runs.values()} == {RunPriority.BULK}
+
+    def test_post_runs_batch_sets_requested_priority(self):
+        """A batch may opt into a higher priority class than bulk."""
+        response, _ = self._post_batch(
+            {"flow_id": FLOW_ID, "inputs": [{}], "priority": "normal"}
+        )
+
+        assert response.status_code == HTTPStatus.ACCEPTED
+        runs = self._stored_runs(response.json()["run_ids"])
+        assert {run.priority for run in runs.values()} == {RunPriority.NORMAL}
+
+    def test_post_runs_batch_rejects_empty_and_oversized_batches(self):
+        """The batch must hold between 1 and MAX_RUN_BATCH_SIZE inputs."""
+        for inputs in ([], [{}] * (MAX_RUN_BATCH_SIZE + 1)):
+            response, scheduler = self._post_batch(
+                {"flow_id": FLOW_ID, "inputs": inputs}
+            )
+            assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+            assert scheduler.provisioned == []
+
+    def test_post_runs_batch_unknown_flow(self):
+        """An unknown flow is rejected before anything is inserted."""
+        response, scheduler = self._post_batch(
+            {"flow_id": "00000000-0000-0000-0000-000000000000", "inputs": [{}]}
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        assert scheduler.provisioned == []
@@ -0,0 +1,136 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+from http import HTTPStatus
+from uuid import UUID
+
+from sqlmodel import select
+
+from app.dependencies import get_run_scheduler
+from app.models import CheckpointStatus, Event, Run, RunCheckpoint, RunStatus, User
+from app.services.event.broadcaster import event_broadcaster
+from app.services.event.stream import format_sse
+from tests.conftest import BaseTestClass
+
+FLOW_ID = "550e8400-e29b-41d4-a716-446655440000"
+
+
+class RecordingScheduler:
+    """Scheduler stand-in with no live run tasks in this process."""
+
+    def __init__(self) -> None:
+        self.canceled: list[UUID] = []
+
+    async def cancel(self, run_id: UUID) -> bool:
+        self.canceled.append(run_id)
+        return False
+
+
+class TestRunsCancelPostContract(BaseTestClass):
+    """Contract tests for POST /runs/{run_id}/cancel."""
+
+    def setup_method(self):
+        super().setup_method()
+        self.scheduler = RecordingScheduler()
+        self.client.app.dependency_overrides[get_run_scheduler] = lambda: self.scheduler
+
+    def _seed_run(
+        self, status: RunStatus, owner: User | None = None, *, paused: bool = False
+    ) -> str:
+        run = Run(
+            flow_id=UUID(FLOW_ID), user_id=(owner or self.test_user).id, status=status
+        )
+
+        async def _insert():
+            async with self.TestAsyncSessionLocal() as session:
+                session.add(run)
+                if paused:
+                    session.add(
+                        RunCheckpoint(
+                            run_id=run.id,
+                            checkpoint_id="approve",
+                            step_index=1,
+                            reason="Awaiting approval",
+                            expected_action="continue",
+                            expires_at=datetime.now(UTC) + timedelta(minutes=15),
+                        )
+                    )
+                await session.commit()
+
+        asyncio.run(_insert())
+        return str(run.id)
+
+    def _stored(self, run_id: str) -> tuple[list[RunCheckpoint], list[Event]]:
+        async def _load():
+            async with self.TestAsyncSessionLocal() as session:
+                checkpoints = await session.execute(
+                    select(RunCheckpoint).where(RunCheckpoint.run_id == UUID(run_id))
+                )
+                events = await session.execute(
+                    select(Event).where(Event.run_id == UUID(run_id))
+                )
+                return list(checkpoints.scalars()), list(events.scalars())
+
+        return asyncio.run(_load())
+
+    def _cancel(self, run_id: str, headers: dict | None = None):
+        return self.client.post(
+            f"{self.API_PREFIX}/runs/{run_id}/cancel",
+            headers=headers or self.get_user_auth_headers(),
+        )
+
+    def test_cancel_paused_run(self):
+        run_id = self._seed_run(RunStatus.AWAITING_INPUT, paused=True)
+
+        response = self._cancel(run_id)
+
+        assert response.status_code == HTTPStatus.OK
+        data = response.json()
+        assert data["status"] == "canceled"
+        assert data["ended_at"] is not None
+        assert self.scheduler.canceled == [UUID(run_id)]
+        checkpoints, events = self._stored(run_id)
+        assert [c.status for c in checkpoints] == [CheckpointStatus.CANCELED]
+        assert [e.message for e in events] == ["run_canceled"]
+
+    def test_cancel_is_published_to_live_tail_as_a_status_event(self):
+        run_id = self._seed_run(RunStatus.RUNNING)
+        published = []
+        listener = published.append
+        event_broadcaster.add_listener(listener)
+        try:
+            response = self._cancel(run_id)
+        finally:
+            event_broadcaster.remove_listener(listener)
+
+        assert response.status_code == HTTPStatus.OK
+        [message] = [format_sse(e) for e in published if str(e.run_id) == run_id]
+        assert "\nevent: status\n" in message
+        assert '"type":"status"' in message
+        assert '"message":"run_canceled"' in message
+
+    def test_cancel_is_idempotent(self):
+        run_id = self._seed_run(RunStatus.PENDING)
+
+        first = self._cancel(run_id)
+        second = self._cancel(run_id)
+
+        assert first.status_code == HTTPStatus.OK
+        assert second.status_code == HTTPStatus.OK
+        assert second.json()["status"] == "canceled"
+        _, events = self._stored(run_id)
+        assert len(events) == 1
+
+    def test_cancel_finished_run_conflicts(self):
+        run_id = self._seed_run(RunStatus.COMPLETED)
+
+        response = self._cancel(run_id)
+
+        assert response.status_code == HTTPStatus.CONFLICT
+        assert self.scheduler.canceled == []
+
+    def test_cancel_other_users_run_is_not_found(self):
+        run_id = self._seed_run(RunStatus.RUNNING, owner=self.test_admin)
+
+        response = self._cancel(run_id)
+
+        assert response.status_code == HTTPStatus.NOT_FOUND
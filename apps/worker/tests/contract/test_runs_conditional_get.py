@@ -0,0 +1,114 @@
+import asyncio
+from datetime import UTC, datetime
+from http import HTTPStatus
+from uuid import UUID
+
+from app.models import Run, RunStatus, SessionStatus, User
+from app.models import Session as SessionModel
+from tests.conftest import BaseTestClass
+
+FLOW_ID = "550e8400-e29b-41d4-a716-446655440000"
+
+
+class TestRunsConditionalGetContract(BaseTestClass):
+    """Contract tests for ETag / If-None-Match on run resources."""
+
+    def _seed_run(self, owner: User | None = None) -> str:
+        run = Run(flow_id=UUID(FLOW_ID), user_id=(owner or self.test_user).id)
+
+        async def _insert():
+            async with self.TestAsyncSessionLocal() as session:
+                session.add(run)
+                await session.commit()
+
+        asyncio.run(_insert())
+        return str(run.id)
+
+    def _add_session(self, run_id: str, status: SessionStatus) -> None:
+        async def _insert():
+            async with self.TestAsyncSessionLocal() as session:
+                session.add(
+                    SessionModel(
+                        run_id=UUID(run_id),
+                        status=status,
+                        ended_at=(
+                            datetime.now(UTC) if status == SessionStatus.ENDED else None
+                        ),
+                    )
+                )
+                await session.commit()
+
+        asyncio.run(_insert())
+
+    def test_get_run_returns_304_until_the_run_changes(self):
+        run_id = self._seed_run()
+        headers = self.get_user_auth_headers()
+        url = f"{self.API_PREFIX}/runs/{run_id}"
+
+        first = self.client.get(url, headers=headers)
+        etag = first.headers["ETag"]
+        unchanged = self.client.get(url, headers=headers | {"If-None-Match": etag})
+        self.set_run_status(run_id, RunStatus.COMPLETED)
+        changed = self.client.get(url, headers=headers | {"If-None-Match": etag})
+
+        assert first.status_code == HTTPStatus.OK
+        assert etag.startswith('W/"')
+        assert unchanged.status_code == HTTPStatus.NOT_MODIFIED
+        assert unchanged.headers["ETag"] == etag
+        assert not unchanged.content
+        assert changed.status_code == HTTPStatus.OK
+        assert changed.json()["status"] == "completed"
+        assert changed.headers["ETag"] != etag
+
+    def test_if_none_match_accepts_lists_and_strong_form(self):
+        run_id = self._seed_run()
+        headers = self.get_user_auth_headers()
+        url = f"{self.API_PREFIX}/runs/{run_id}"
+        etag = self.client.get(url, headers=headers).headers["ETag"]
+
+        listed = self.client.get(
+            url, headers=headers | {"If-None-Match": f'"other", {etag}'}
+        )
+        strong = self.client.get(
+            url, headers=headers | {"If-None-Match": etag.removeprefix("W/")}
+        )
+
+        assert listed.status_code == HTTPStatus.NOT_MODIFIED
+        assert strong.status_code == HTTPStatus.NOT_MODIFIED
+
+    def test_get_run_sessions_etag_tracks_session_changes(self):
+        run_id = self._seed_run()
+        headers = self.get_user_auth_headers()
+        url = f"{self.API_PREFIX}/runs/{run_id}/sessions"
+
+        empty = self.client.get(url, headers=headers)
+        self._add_session(run_id, SessionStatus.ACTIVE)
+        added = self.client.get(
+            url, headers=headers | {"If-None-Match": empty.headers["ETag"]}
+        )
+        unchanged = self.client.get(
+            url, headers=headers | {"If-None-Match": added.headers["ETag"]}
+        )
+        self._add_session(run_id, SessionStatus.ENDED)
+        ended = self.client.get(
+            url, headers=headers | {"If-None-Match": added.headers["ETag"]}
+        )
+
+        assert empty.json() == []
+        assert added.status_code == HTTPStatus.OK
+        assert len(added.json()) == 1
+        assert unchanged.status_code == HTTPStatus.NOT_MODIFIED
+        assert ended.status_code == HTTPStatus.OK
+        assert len(ended.json()) == 2  # noqa: PLR2004
+
+    def test_conditional_get_still_hides_other_users_runs(self):
+        run_id = self._seed_run(owner=self.test_admin)
+        headers = self.get_user_auth_headers() | {"If-None-Match": "*"}
+
+        run = self.client.get(f"{self.API_PREFIX}/runs/{run_id}", headers=headers)
+        sessions = self.client.get(
+            f"{self.API_PREFIX}/runs/{run_id}/sessions", headers=headers
+        )
+
+        assert run.status_code == HTTPStatus.NOT_FOUND
+        assert sessions.status_code == HTTPStatus.NOT_FOUND
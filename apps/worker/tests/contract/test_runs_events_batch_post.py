@@ -0,0 +1,109 @@
+from http import HTTPStatus
+
+from app.constants import MAX_EVENT_BATCH_SIZE
+from tests.conftest import BaseTestClass
+
+BATCH_SIZE = 250
+
+
+class TestRunsEventsBatchPostContract(BaseTestClass):
+    """Contract tests for POST /runs/{runId}/events:batch endpoint."""
+
+    def _create_run(self, headers: dict) -> str:
+        response = self.client.post(
+            f"{self.API_PREFIX}/runs",
+            json={"flow_id": "550e8400-e29b-41d4-a716-446655440000"},
+            headers=headers,
+        )
+        assert response.status_code == HTTPStatus.CREATED
+        return response.json()["id"]
+
+    def test_post_events_batch_inserts_in_order(self):
+        """A batch is stored in order and readable through the events API."""
+        headers = self.get_user_auth_headers()
+        run_id = self._create_run(headers)
+        batch = [
+            {"type": "log", "message": f"progress {i}", "payload": {"index": i}}
+            for i in range(BATCH_SIZE)
+        ]
+
+        response = self.client.post(
+            f"{self.API_PREFIX}/runs/{run_id}/events:batch",
+            json=batch,
+            headers=headers,
+        )
+        assert response.status_code == HTTPStatus.CREATED
+        data = response.json()
+        assert data["count"] == BATCH_SIZE
+        assert len(data["event_ids"]) == BATCH_SIZE
+
+        events = self.client.get(
+            f"{self.API_PREFIX}/runs/{run_id}/events",
+            params={"type": "log", "limit": 1000},
+            headers=headers,
+        ).json()
+        ingested = [e for e in events if e["message"].startswith("progress")]
+        assert [e["id"] for e in ingested] == data["event_ids"]
+        assert [e["payload"]["index"] for e in ingested] == list(range(BATCH_SIZE))
+
+    def test_post_events_batch_redacts_sensitive_data(self):
+        """Events are redacted with the engine's rules before storage."""
+        headers = self.get_user_auth_headers()
+        run_id = self._create_run(headers)
+
+        response = self.client.post(
+            f"{self.API_PREFIX}/runs/{run_id}/events:batch",
+            json=[
+                {
+                    "type": "log",
+                    "message": "calling api with Bearer abc123",
+                    "payload": {"password": "hunter2", "step": "login"},
+                }
+            ],
+            headers=headers,
+        )
+        assert response.status_code == HTTPStatus.CREATED
+
+        events = self.client.get(
+            f"{self.API_PREFIX}/runs/{run_id}/events",
+            params={"type": "log"},
+            headers=headers,
+        ).json()
+        event = next(e for e in events if e["message"].startswith("calling api"))
+        assert event["message"] == "calling api with ***"
+        assert event["payload"] == {"password": "***", "step": "login"}
+
+    def test_post_events_batch_rejects_invalid_items(self):
+        """One invalid item fails the whole batch with 422."""
+        headers = self.get_user_auth_headers()
+        run_id = self._create_run(headers)
+
+        response = self.client.post(
+            f"{self.API_PREFIX}/runs/{run_id}/events:batch",
+            json=[{"type": "log"}, {"type": "not-a-type"}],
+            headers=headers,
+        )
+        assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+        assert response.json()["detail"][0]["loc"][0] == 1
+
+    def test_post_events_batch_rejects_oversized_batch(self):
+        """Batches above the size limit are rejected."""
+        headers = self.get_user_auth_headers()
+        run_id = self._create_run(headers)
+
+        response = self.client.post(
+            f"{self.API_PREFIX}/runs/{run_id}/events:batch",
+            json=[{"type": "log"}] * (MAX_EVENT_BATCH_SIZE + 1),
+            headers=headers,
+        )
+        assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+    def test_post_events_batch_nonexistent_run_returns_404(self):
+        """Batches for unknown runs are rejected."""
+        headers = self.get_user_auth_headers()
+        response = self.client.post(
+            f"{self.API_PREFIX}/runs/550e8400-e29b-41d4-a716-446655440001/events:batch",
+            json=[{"type": "log"}],
+            headers=headers,
+        )
+        assert response.status_code == HTTPStatus.NOT_FOUND
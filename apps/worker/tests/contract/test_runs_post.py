@@ -1,8 +1,21 @@
 from http import HTTPStatus
 
+from app.dependencies import get_run_scheduler
 from tests.conftest import BaseTestClass
 
 
+class RecordingScheduler:
+    """Scheduler stand-in that records runs handed over for provisioning."""
+
+    queued = False
+
+    def __init__(self) -> None:
+        self.provisioned = []
+
+    def provision(self, run, run_service=None):  # noqa: ARG002
+        self.provisioned.append(run.id)
+
+
 class TestRunsPostContract(BaseTestClass):
     """Contract tests for POST /runs endpoint."""
 
@@ -20,6 +33,7 @@ class TestRunsPostContract(BaseTestClass):
         data = response.json()
         assert "id" in data
         assert data["status"] == "running"
+        assert data["priority"] == "interactive"
         assert "session_url" in data
         assert data["session_url"] is not None
         assert data["session_url"].startswith("http"), (
@@ -92,3 +106,37 @@ class TestRunsPostContract(BaseTestClass):
         assert sessions_response.status_code == HTTPStatus.OK
         sessions = sessions_response.json()
         assert len(sessions) > 0  # Should have at least one session
+
+    def test_post_runs_respond_async_returns_202_pending(self):
+        """`Prefer: respond-async` returns the pending run without a session."""
+        scheduler = RecordingScheduler()
+        self.client.app.dependency_overrides[get_run_scheduler] = lambda: scheduler
+        headers = self.get_user_auth_headers() | {"Prefer": "respond-async, wait=5"}
+        try:
+            response = self.client.post(
+                f"{self.API_PREFIX}/runs",
+                json={"flow_id": "550e8400-e29b-41d4-a716-446655440000"},
+                headers=headers,
+            )
+        finally:
+            self.client.app.dependency_overrides.pop(get_run_scheduler, None)
+
+        assert response.status_code == HTTPStatus.ACCEPTED
+        assert response.headers["Preference-Applied"] == "respond-async"
+        data = response.json()
+        assert data["status"] == "pending"
+        assert data["priority"] == "normal"
+        assert data["session_url"] is None
+        assert response.headers["Location"].endswith(f"/runs/{data['id']}")
+        assert [str(run_id) for run_id in scheduler.provisioned] == [data["id"]]
+
+    def test_post_runs_ignores_other_preferences(self):
+        """Unrelated `Prefer` tokens keep the synchronous 201 behavior."""
+        headers = self.get_user_auth_headers() | {"Prefer": "return=minimal"}
+        response = self.client.post(
+            f"{self.API_PREFIX}/runs",
+            json={"flow_id": "550e8400-e29b-41d4-a716-446655440000"},
+            headers=headers,
+        )
+        assert response.status_code == HTTPStatus.CREATED
+        assert "Preference-Applied" not in response.headers
@@ -0,0 +1,82 @@
+import asyncio
+from http import HTTPStatus
+from uuid import UUID
+
+from app.models import Run, RunStatus, User
+from tests.conftest import BaseTestClass
+
+FLOW_ID = "550e8400-e29b-41d4-a716-446655440000"
+
+
+class TestRunsStatsGetContract(BaseTestClass):
+    """Contract tests for GET /runs/stats."""
+
+    def _create_run(self, user: User, status: RunStatus = RunStatus.RUNNING) -> None:
+        async def _insert():
+            async with self.TestAsyncSessionLocal() as session:
+                session.add(Run(flow_id=UUID(FLOW_ID), user_id=user.id, status=status))
+                await session.commit()
+
+        asyncio.run(_insert())
+
+    def test_counts_current_users_runs_by_status_and_flow(self):
+        headers = self.get_user_auth_headers()
+        self._create_run(self.test_user, RunStatus.COMPLETED)
+        self._create_run(self.test_user)
+
+        response = self.client.get(
+            f"{self.API_PREFIX}/runs/stats",
+            params={"group_by_flow": True, "bucket": "day"},
+            headers=headers,
+        )
+
+        assert response.status_code == HTTPStatus.OK
+        data = response.json()
+        assert data["total"] == 2  # noqa: PLR2004
+        assert {(g["status"], g["flow_id"], g["count"]) for g in data["groups"]} == {
+            ("completed", FLOW_ID, 1),
+            ("running", FLOW_ID, 1),
+        }
+        assert all(g["bucket"] for g in data["groups"])
+        assert "generated_at" in data
+
+    def test_repeat_requests_are_served_from_cache(self):
+        headers = self.get_user_auth_headers()
+        self._create_run(self.test_user)
+        first = self.client.get(f"{self.API_PREFIX}/runs/stats", headers=headers)
+
+        self._create_run(self.test_user)
+        second = self.client.get(f"{self.API_PREFIX}/runs/stats", headers=headers)
+
+        assert second.json() == first.json()
+
+    def test_all_users_requires_admin(self):
+        self._create_run(self.test_user)
+
+        forbidden = self.client.get(
+            f"{self.API_PREFIX}/runs/stats",
+            params={"all_users": True},
+            headers=self.get_user_auth_headers(),
+        )
+        admin = self.client.get(
+            f"{self.API_PREFIX}/runs/stats",
+            params={"all_users": True},
+            headers=self.get_admin_auth_headers(),
+        )
+        admin_own = self.client.get(
+            f"{self.API_PREFIX}/runs/stats", headers=self.get_admin_auth_headers()
+        )
+
+        assert forbidden.status_code == HTTPStatus.FORBIDDEN
+        assert admin.status_code == HTTPStatus.OK
+        assert admin.json()["total"] == 1
+        assert admin_own.json()["total"] == 0
+
+    def test_rejects_unknown_bucket(self):
+        response = self.client.get(
+            f"{self.API_PREFIX}/runs/stats",
+            params={"bucket": "week"},
+            headers=self.get_user_auth_headers(),
+        )
+
+        assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
@@ -1,4 +1,9 @@
+import json
 import os
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 import pytest
 
@@ -23,3 +28,127 @@ def pytest_collection_modifyitems(config, items):  # noqa: ARG001
 def is_ci_mode():
     """Fixture to check if running in CI mode."""
     return os.getenv("CI", "").lower() in ("true", "1", "yes")
+
+
+class FakeSteelHandler(BaseHTTPRequestHandler):
+    """Routes fake Steel.dev API requests to the owning `FakeSteelServer`."""
+
+    def do_POST(self) -> None:
+        fake, parts = self.server.fake, self._parts()
+        if parts is None:
+            return
+        if parts == ["sessions"]:
+            body = json.loads(self._body or b"{}")
+            self._reply(HTTPStatus.CREATED, fake.create_session(body.get("timeout")))
+        elif len(parts) == 3 and parts[2] == "release":  # noqa: PLR2004
+            fake.release_session(parts[1])
+            self._reply(HTTPStatus.OK, {"id": parts[1]})
+        else:
+            self._reply(HTTPStatus.NOT_FOUND, {})
+
+    def do_GET(self) -> None:
+        fake, parts = self.server.fake, self._parts()
+        if parts is None:
+            return
+        if len(parts) == 2:  # noqa: PLR2004
+            self._reply(HTTPStatus.OK, fake.get_session_info(parts[1]))
+        else:
+            self._reply(HTTPStatus.NOT_FOUND, {})
+
+    def _parts(self) -> list[str] | None:
+        fake = self.server.fake
+        self._body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if self.headers.get("steel-api-key") != fake.API_KEY:
+            self._reply(HTTPStatus.UNAUTHORIZED, {})
+            return None
+        time.sleep(fake.latency)
+        return self.path.removeprefix("/v1/").strip("/").split("/")
+
+    def _reply(self, status: HTTPStatus, body: dict) -> None:
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *_args) -> None:
+        pass
+
+
+class FakeSteelServer:
+    """A local stand-in for the Steel.dev sessions API.
+
+    Serves create/info/release over real HTTP on an ephemeral port, with an
+    optional per-request delay to emulate provisioning latency.
+    """
+
+    API_KEY = "fake-steel-key"
+
+    def __init__(self, latency: float = 0.0) -> None:
+        self.latency = latency
+        self.live: set[str] = set()
+        self.released: set[str] = set()
+        self.created = 0
+        self.timeouts: list[int | None] = []
+        self.info_requests = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), FakeSteelHandler)
+        self._server.fake = self
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            daemon=True,
+        )
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def kill(self, session_id: str) -> None:
+        """Make a session report as no longer live."""
+        with self._lock:
+            self.live.discard(session_id)
+
+    def create_session(self, timeout: int | None = None) -> dict:
+        with self._lock:
+            self.created += 1
+            self.timeouts.append(timeout)
+            session_id = f"fake-session-{self.created}"
+            self.live.add(session_id)
+        return self.session_info(session_id)
+
+    def get_session_info(self, session_id: str) -> dict:
+        with self._lock:
+            self.info_requests += 1
+        return self.session_info(session_id)
+
+    def session_info(self, session_id: str) -> dict:
+        return {
+            "id": session_id,
+            "debugUrl": f"{self.base_url}/debug/{session_id}",
+            "websocketUrl": f"ws://fake/{session_id}",
+            "status": "live" if session_id in self.live else "released",
+        }
+
+    def release_session(self, session_id: str) -> None:
+        with self._lock:
+            self.live.discard(session_id)
+            self.released.add(session_id)
+
+
+@pytest.fixture
+def fake_steel_server():
+    """Run a fake Steel.dev API for the duration of a test."""
+    server = FakeSteelServer()
+    server.start()
+    yield server
+    server.stop()
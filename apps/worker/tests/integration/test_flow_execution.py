@@ -5,7 +5,7 @@ from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import pytest
 
-from app.models import Run, RunStatus
+from app.models import CheckpointStatus, Run, RunCheckpoint, RunStatus
 from app.runtime import FlowEngine
 from app.runtime.agents.noop import NoopAgent
 
@@ -54,7 +54,7 @@ class TestFlowExecution:
     def mock_run_service(self):
         """Mock RunService for testing."""
         service = MagicMock()
-        service.update_run = AsyncMock()
+        service.update_active_run = AsyncMock()
         return service
 
     @pytest.fixture
@@ -100,6 +100,9 @@ class TestFlowExecution:
             def cleanup(self, _run_id):  # pragma: no cover
                 return
 
+            def mark_finishing(self, _run_id) -> None:
+                return
+
         return FlowEngine(
             run_service=mock_run_service,
             session_provider=mock_steel_adapter,
@@ -129,19 +132,19 @@ class TestFlowExecution:
         mock_steel_adapter.attach_to_session.assert_called_once_with(run.id)
 
         # Verify run status was updated to running
-        mock_run_service.update_run.assert_any_call(
+        mock_run_service.update_active_run.assert_any_call(
             run.id, {"status": RunStatus.RUNNING}, ANY
         )
 
         # Verify run status was updated to awaiting_input before timeout
-        mock_run_service.update_run.assert_any_call(
+        mock_run_service.update_active_run.assert_any_call(
             run.id, {"status": RunStatus.AWAITING_INPUT}, ANY
         )
 
         # Verify run was NOT marked as completed (should not be in call list)
         completed_calls = [
             call
-            for call in mock_run_service.update_run.call_args_list
+            for call in mock_run_service.update_active_run.call_args_list
             if call[0][1].get("status") == RunStatus.COMPLETED
         ]
         assert len(completed_calls) == 0, (
@@ -149,7 +152,7 @@ class TestFlowExecution:
         )
 
         # Verify run was eventually marked as failed due to timeout
-        mock_run_service.update_run.assert_any_call(
+        mock_run_service.update_active_run.assert_any_call(
             run.id,
             {"status": RunStatus.FAILED, "error": "Run execution timed out"},
             ANY,
@@ -193,7 +196,7 @@ class TestFlowExecution:
         await flow_engine.start(run, simple_flow, {})
 
         # Verify run was marked as completed
-        mock_run_service.update_run.assert_any_call(
+        mock_run_service.update_active_run.assert_any_call(
             run.id, {"status": RunStatus.COMPLETED}, ANY
         )
 
@@ -215,7 +218,7 @@ class TestFlowExecution:
             await flow_engine.start(run, sample_flow_manifest, {})
 
         # Verify run was marked as failed
-        mock_run_service.update_run.assert_any_call(
+        mock_run_service.update_active_run.assert_any_call(
             run.id, {"status": RunStatus.FAILED, "error": "Test error"}, ANY
         )
 
@@ -257,6 +260,32 @@ class TestFlowExecution:
         assert reason == "Please verify the form was filled correctly"
         assert expected_action == "confirm"
 
+    async def test_checkpoint_state_is_staged_with_status_updates(
+        self, flow_engine, sample_flow_manifest
+    ):
+        """The checkpoint row is staged on pause and expired on timeout."""
+        run = Run(
+            id=uuid.uuid4(),
+            flow_id=uuid.uuid4(),
+            user_id=uuid.uuid4(),
+            status=RunStatus.PENDING,
+        )
+
+        await flow_engine.start(run, sample_flow_manifest, {})
+
+        staged = [
+            call.args[0]
+            for call in flow_engine.session.add.call_args_list
+            if isinstance(call.args[0], RunCheckpoint)
+        ]
+        assert staged
+        checkpoint = staged[-1]
+        assert checkpoint.run_id == run.id
+        assert checkpoint.checkpoint_id == "Human verification"
+        assert checkpoint.step_index == 3  # noqa: PLR2004
+        assert checkpoint.status == CheckpointStatus.EXPIRED
+        assert checkpoint.resolved_at is not None
+
     async def test_agent_lifecycle_management(self, flow_engine):
         """Test that browser agent is properly started and stopped on completion."""
         run = Run(
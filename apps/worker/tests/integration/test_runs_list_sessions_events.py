@@ -1,10 +1,23 @@
+import asyncio
+import gzip
+import json
+from datetime import UTC, datetime, timedelta
 from http import HTTPStatus
+from uuid import UUID, uuid4
 
 import pytest
 
-from app.models import EventType
+from app.constants import MAX_EVENT_PAGE_LIMIT, MAX_RUN_LIST_LIMIT
+from app.models import Event, EventType, Run, RunStatus
 from tests.conftest import BaseTestClass
 
+SEEDED_EVENT_COUNT = 25
+EVENT_PAGE_SIZE = 10
+SEEDED_RUN_COUNT = 12
+RUN_PAGE_SIZE = 5
+FLOW_ID = "550e8400-e29b-41d4-a716-446655440000"
+OTHER_FLOW_ID = "550e8400-e29b-41d4-a716-446655440001"
+
 
 @pytest.mark.integration
 class TestRunsListSessionsEventsIntegration(BaseTestClass):
@@ -105,6 +118,102 @@ class TestRunsListSessionsEventsIntegration(BaseTestClass):
                         "Results not sorted by id desc when created_at equal"
                     )
 
+    def _seed_runs(self, count: int = SEEDED_RUN_COUNT) -> list[Run]:
+        """Seed runs in pairs sharing a created_at, alternating status and flow."""
+        base = datetime(2030, 1, 1, tzinfo=UTC)
+        runs = [
+            Run(
+                id=uuid4(),
+                flow_id=UUID(FLOW_ID if i % 3 else OTHER_FLOW_ID),
+                user_id=self.test_user.id,
+                status=RunStatus.COMPLETED if i % 2 else RunStatus.FAILED,
+                created_at=base + timedelta(seconds=i // 2),
+            )
+            for i in range(count)
+        ]
+
+        async def _seed():
+            async with self.TestAsyncSessionLocal() as session:
+                session.add_all(runs)
+                await session.commit()
+
+        asyncio.run(_seed())
+        return sorted(runs, key=lambda r: (r.created_at, r.id.hex), reverse=True)
+
+    def _page_through_runs(self, headers: dict, params: dict) -> list[str]:
+        seen: list[str] = []
+        cursor = None
+        for _ in range(SEEDED_RUN_COUNT):
+            page_params = params | {"limit": RUN_PAGE_SIZE}
+            if cursor:
+                page_params["cursor"] = cursor
+            response = self.client.get(
+                f"{self.API_PREFIX}/runs", params=page_params, headers=headers
+            )
+            assert response.status_code == HTTPStatus.OK
+            page = response.json()
+            assert len(page) <= RUN_PAGE_SIZE
+            seen.extend(r["id"] for r in page)
+            cursor = response.headers.get("X-Next-Cursor")
+            if cursor is None:
+                break
+        return seen
+
+    def test_list_runs_keyset_pagination(self):
+        """Paging with X-Next-Cursor returns every run once, newest first."""
+        headers = self.get_user_auth_headers()
+        expected = [str(run.id) for run in self._seed_runs()]
+
+        assert self._page_through_runs(headers, {}) == expected
+
+    def test_list_runs_at_max_limit_returns_next_cursor(self):
+        """A full page at the maximum limit still advertises the next page."""
+        headers = self.get_user_auth_headers()
+        expected = [str(run.id) for run in self._seed_runs(MAX_RUN_LIST_LIMIT + 6)]
+        params = {"limit": MAX_RUN_LIST_LIMIT}
+
+        first = self.client.get(
+            f"{self.API_PREFIX}/runs", params=params, headers=headers
+        )
+        assert first.status_code == HTTPStatus.OK
+        assert len(first.json()) == MAX_RUN_LIST_LIMIT
+        cursor = first.headers.get("X-Next-Cursor")
+        assert cursor is not None
+
+        second = self.client.get(
+            f"{self.API_PREFIX}/runs",
+            params=params | {"cursor": cursor},
+            headers=headers,
+        )
+        assert second.status_code == HTTPStatus.OK
+        assert "X-Next-Cursor" not in second.headers
+        assert [r["id"] for r in first.json() + second.json()] == expected
+
+    def test_list_runs_filters_by_status_and_flow(self):
+        """Status and flow filters narrow every page server-side."""
+        headers = self.get_user_auth_headers()
+        runs = self._seed_runs()
+        expected = [
+            str(run.id)
+            for run in runs
+            if run.status == RunStatus.COMPLETED and str(run.flow_id) == FLOW_ID
+        ]
+
+        seen = self._page_through_runs(
+            headers, {"status": "completed", "flow_id": FLOW_ID}
+        )
+
+        assert seen == expected
+
+    def test_list_runs_rejects_bad_cursor_usage(self):
+        """A malformed cursor, or a cursor combined with skip, is rejected."""
+        headers = self.get_user_auth_headers()
+        for params in ({"cursor": "not-a-cursor"}, {"cursor": "abc", "skip": 1}):
+            response = self.client.get(
+                f"{self.API_PREFIX}/runs", params=params, headers=headers
+            )
+            assert response.status_code == HTTPStatus.BAD_REQUEST
+
     def test_get_run_sessions_integration(self):
         """Integration test for GET /runs/{runId}/sessions endpoint."""
         # Create a run with authentication
@@ -200,6 +309,213 @@ class TestRunsListSessionsEventsIntegration(BaseTestClass):
             assert "at" in event
             assert event["type"] in allowed_types
 
+    def _create_run_with_events(
+        self, headers: dict, count: int = SEEDED_EVENT_COUNT
+    ) -> tuple[str, list[str]]:
+        """Create a run and seed it with alternating LOG/STEP_START events."""
+        create_response = self.client.post(
+            f"{self.API_PREFIX}/runs",
+            json={"flow_id": "550e8400-e29b-41d4-a716-446655440000"},
+            headers=headers,
+        )
+        assert create_response.status_code == HTTPStatus.CREATED
+        run_id = create_response.json()["id"]
+        base = datetime(2030, 1, 1, tzinfo=UTC)
+        events = [
+            Event(
+                id=uuid4(),
+                run_id=UUID(run_id),
+                type=EventType.LOG if i % 2 == 0 else EventType.STEP_START,
+                message=f"event {i}",
+                payload={"index": i},
+                at=base + timedelta(seconds=i // 2),
+            )
+            for i in range(count)
+        ]
+
+        async def _seed():
+            async with self.TestAsyncSessionLocal() as session:
+                session.add_all(events)
+                await session.commit()
+
+        asyncio.run(_seed())
+        ordered = sorted(events, key=lambda e: (e.at, e.id))
+        return run_id, [str(e.id) for e in ordered]
+
+    def test_get_run_events_keyset_pagination(self):
+        """Paging with X-Next-Cursor returns every seeded event exactly once."""
+        headers = self.get_user_auth_headers()
+        run_id, expected_ids = self._create_run_with_events(headers)
+
+        seen: list[str] = []
+        cursor = None
+        for _ in range(SEEDED_EVENT_COUNT):
+            params = {"limit": EVENT_PAGE_SIZE, "since": "2030-01-01T00:00:00Z"}
+            if cursor:
+                params["cursor"] = cursor
+            response = self.client.get(
+                f"{self.API_PREFIX}/runs/{run_id}/events",
+                params=params,
+                headers=headers,
+            )
+            assert response.status_code == HTTPStatus.OK
+            page = response.json()
+            assert len(page) <= EVENT_PAGE_SIZE
+            seen.extend(e["id"] for e in page)
+            cursor = response.headers.get("X-Next-Cursor")
+            if cursor is None:
+                break
+
+        assert seen == expected_ids
+
+    def test_get_run_events_at_max_limit_returns_next_cursor(self):
+        """A full page at the maximum limit still advertises the next page."""
+        headers = self.get_user_auth_headers()
+        run_id, expected_ids = self._create_run_with_events(
+            headers, MAX_EVENT_PAGE_LIMIT + 5
+        )
+        params = {"limit": MAX_EVENT_PAGE_LIMIT, "since": "2030-01-01T00:00:00Z"}
+
+        first = self.client.get(
+            f"{self.API_PREFIX}/runs/{run_id}/events", params=params, headers=headers
+        )
+        assert first.status_code == HTTPStatus.OK
+        assert len(first.json()) == MAX_EVENT_PAGE_LIMIT
+        cursor = first.headers.get("X-Next-Cursor")
+        assert cursor is not None
+
+        second = self.client.get(
+            f"{self.API_PREFIX}/runs/{run_id}/events",
+            params=params | {"cursor": cursor},
+            headers=headers,
+        )
+        assert second.status_code == HTTPStatus.OK
+        assert "X-Next-Cursor" not in second.headers
+        seen = [e["id"] for e in first.json() + second.json()]
+        assert seen == expected_ids
+
+    def test_get_run_events_filters_by_type_and_since(self):
+        """Type and since filters narrow the page server-side."""
+        headers = self.get_user_auth_headers()
+        run_id, _ = self._create_run_with_events(headers)
+
+        response = self.client.get(
+            f"{self.API_PREFIX}/runs/{run_id}/events",
+            params={"type": "step_start", "since": "2030-01-01T00:00:05Z"},
+            headers=headers,
+        )
+        assert response.status_code == HTTPStatus.OK
+        events = response.json()
+        assert events
+        assert {e["type"] for e in events} == {EventType.STEP_START.value}
+        assert all(e["payload"]["index"] >= 10 for e in events)  # noqa: PLR2004
+        assert "X-Next-Cursor" not in response.headers
+
+    def test_get_run_events_rejects_invalid_cursor(self):
+        """A malformed cursor is a client error."""
+        headers = self.get_user_auth_headers()
+        run_id, _ = self._create_run_with_events(headers)
+
+        response = self.client.get(
+            f"{self.API_PREFIX}/runs/{run_id}/events",
+            params={"cursor": "not-a-cursor"},
+            headers=headers,
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    def test_stream_run_events_replays_finished_run(self):
+        """The SSE stream replays after Last-Event-ID and closes for a done run."""
+        headers = self.get_user_auth_headers()
+        run_id, expected_ids = self._create_run_with_events(headers)
+        self.client.patch(
+            f"{self.API_PREFIX}/runs/{run_id}",
+            json={"status": "completed"},
+            headers=headers,
+        )
+        first_page = self.client.get(
+            f"{self.API_PREFIX}/runs/{run_id}/events",
+            params={"limit": 1, "since": "2030-01-01T00:00:00Z"},
+            headers=headers,
+        )
+        cursor = first_page.headers["X-Next-Cursor"]
+
+        response = self.client.get(
+            f"{self.API_PREFIX}/runs/{run_id}/events/stream",
+            headers={**headers, "Last-Event-ID": cursor},
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert response.headers["content-type"].startswith("text/event-stream")
+        streamed = [
+            line.removeprefix("data: ")
+            for line in response.text.splitlines()
+            if line.startswith("data: ")
+        ]
+        assert expected_ids[1] in streamed[0]
+        assert all(expected_ids[0] not in data for data in streamed)
+
+    def test_stream_run_events_rejects_invalid_last_event_id(self):
+        """A malformed Last-Event-ID is a client error."""
+        headers = self.get_user_auth_headers()
+        run_id, _ = self._create_run_with_events(headers)
+
+        response = self.client.get(
+            f"{self.API_PREFIX}/runs/{run_id}/events/stream",
+            headers={**headers, "Last-Event-ID": "not-a-cursor"},
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    def test_list_runs_includes_event_summary(self):
+        """Listed runs carry their incrementally maintained event summary."""
+        headers = self.get_user_auth_headers()
+        run_id, _ = self._create_run_with_events(headers)
+        response = self.client.post(
+            f"{self.API_PREFIX}/runs/{run_id}/events:batch",
+            json=[{"type": "error", "payload": {"error": "boom"}}],
+            headers=headers,
+        )
+        assert response.status_code == HTTPStatus.CREATED
+
+        response = self.client.get(f"{self.API_PREFIX}/runs", headers=headers)
+        assert response.status_code == HTTPStatus.OK
+        listed = next(run for run in response.json() if run["id"] == run_id)
+        summary = listed["event_summary"]
+        assert summary["event_counts"]["error"] == 1
+        assert summary["event_count"] == sum(summary["event_counts"].values())
+        assert summary["last_error"] == "boom"
+
+    def test_export_run_events_as_ndjson(self):
+        """The export streams every event as one JSON object per line."""
+        headers = self.get_user_auth_headers()
+        run_id, expected_ids = self._create_run_with_events(headers)
+
+        response = self.client.get(
+            f"{self.API_PREFIX}/runs/{run_id}/events/export", headers=headers
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert "attachment" in response.headers["content-disposition"]
+        events = [json.loads(line) for line in response.text.splitlines()]
+        seeded = [e["id"] for e in events if e["at"].startswith("2030")]
+        assert seeded == expected_ids
+        assert all(e["run_id"] == run_id for e in events)
+
+    def test_export_run_events_gzip(self):
+        """With gzip=true the NDJSON body is gzip-compressed on the fly."""
+        headers = self.get_user_auth_headers()
+        run_id, expected_ids = self._create_run_with_events(headers)
+
+        response = self.client.get(
+            f"{self.API_PREFIX}/runs/{run_id}/events/export",
+            params={"gzip": "true"},
+            headers=headers,
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert response.headers["content-type"] == "application/gzip"
+        assert response.headers["content-disposition"].endswith('.ndjson.gz"')
+        lines = gzip.decompress(response.content).decode().splitlines()
+        ids = {json.loads(line)["id"] for line in lines}
+        assert set(expected_ids) <= ids
+
     def test_endpoints_consistency_across_runs(self):
         """Integration test to verify all endpoints work consistently."""
         # Create multiple runs with authentication
@@ -5,13 +5,65 @@ from threading import Event
 from unittest.mock import patch
 from uuid import UUID
 
+import httpx
 import pytest
 
+from app.config import settings
 from app.dependencies.run_scheduler import get_run_scheduler
 from app.runtime.core import RunnerCoordinator
 from app.runtime.scheduler import RunScheduler
+from app.services.steel_service import SteelService
 from tests.conftest import BaseTestClass
 
+BENCHMARK_REQUESTS = 64
+BENCHMARK_CONCURRENCY = 16
+
+
+SLOW_PROVIDER_SECONDS = 0.2
+
+
+class NoopScheduler:
+    """Scheduler stand-in so the benchmark measures run creation alone."""
+
+    queued = False
+    admits_locally = True
+
+    async def admit(self, *_args) -> None:
+        return None
+
+    def release(self, _ticket) -> None:
+        return None
+
+    async def schedule(self, *_args, **_kwargs) -> None:
+        return None
+
+    def provision(self, *_args, **_kwargs) -> None:
+        return None
+
+
+class EngineScheduler(NoopScheduler):
+    """Scheduler stand-in for engine workers that admit runs themselves."""
+
+    admits_locally = False
+
+    def __init__(self) -> None:
+        self.provisioned: list = []
+
+    def provision(self, run, *_args, **_kwargs) -> None:
+        self.provisioned.append(run.id)
+
+
+class SaturatedScheduler(NoopScheduler):
+    """Scheduler stand-in whose concurrency slots never free up."""
+
+    async def admit(self, *_args) -> None:
+        await asyncio.Event().wait()
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    index = min(len(sorted_values) - 1, int(len(sorted_values) * fraction))
+    return sorted_values[index]
+
 
 @pytest.mark.integration
 class TestStartFlowIntegration(BaseTestClass):
@@ -252,3 +304,168 @@ class TestStartFlowIntegration(BaseTestClass):
         finally:
             # Ensure we restore the original dependency wiring even if the test fails.
             self.client.app.dependency_overrides.pop(get_run_scheduler, None)
+
+    def _measure_create_run_latencies(
+        self, *header_sets: dict[str, str]
+    ) -> list[list[tuple[int, float]]]:
+        """Fire concurrent POST /runs rounds, one per header set, in one loop."""
+        self.client.app.dependency_overrides[get_run_scheduler] = NoopScheduler
+
+        async def create_runs(
+            client: httpx.AsyncClient, headers: dict[str, str]
+        ) -> list[tuple[int, float]]:
+            semaphore = asyncio.Semaphore(BENCHMARK_CONCURRENCY)
+
+            async def create_run() -> tuple[int, float]:
+                async with semaphore:
+                    start = time.perf_counter()
+                    response = await client.post(
+                        f"{self.API_PREFIX}/runs",
+                        json={"flow_id": "550e8400-e29b-41d4-a716-446655440000"},
+                        headers=headers,
+                    )
+                    return response.status_code, time.perf_counter() - start
+
+            return await asyncio.gather(
+                *(create_run() for _ in range(BENCHMARK_REQUESTS))
+            )
+
+        async def run_rounds() -> list[list[tuple[int, float]]]:
+            transport = httpx.ASGITransport(app=self.client.app)
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as client:
+                return [await create_runs(client, headers) for headers in header_sets]
+
+        try:
+            return asyncio.run(run_rounds())
+        finally:
+            self.client.app.dependency_overrides.pop(get_run_scheduler, None)
+
+    @pytest.mark.slow
+    def test_benchmark_create_run_latency_under_concurrency(self, record_property):
+        """Report p50/p99 latency of POST /runs with concurrent clients."""
+        [results] = self._measure_create_run_latencies(self.get_user_auth_headers())
+
+        assert all(status == HTTPStatus.CREATED for status, _ in results)
+        latencies = sorted(elapsed for _, elapsed in results)
+        p50, p99 = _percentile(latencies, 0.5), _percentile(latencies, 0.99)
+        record_property("create_run_p50_ms", round(p50 * 1000, 2))
+        record_property("create_run_p99_ms", round(p99 * 1000, 2))
+        assert p50 <= p99
+
+    def test_respond_async_returns_before_provider_is_awaited(self):
+        """With respond-async, 202 is sent without waiting on the provider."""
+        headers = self.get_user_auth_headers()
+        provider_calls = 0
+        original = SteelService.create_session
+
+        async def counting_create_session(service):
+            nonlocal provider_calls
+            provider_calls += 1
+            return await original(service)
+
+        self.client.app.dependency_overrides[get_run_scheduler] = NoopScheduler
+        try:
+            with patch.object(SteelService, "create_session", counting_create_session):
+                accepted = self.client.post(
+                    f"{self.API_PREFIX}/runs",
+                    json={"flow_id": "550e8400-e29b-41d4-a716-446655440000"},
+                    headers=headers | {"Prefer": "respond-async"},
+                )
+                assert accepted.status_code == HTTPStatus.ACCEPTED
+                assert accepted.json()["status"] == "pending"
+                assert provider_calls == 0
+
+                created = self.client.post(
+                    f"{self.API_PREFIX}/runs",
+                    json={"flow_id": "550e8400-e29b-41d4-a716-446655440000"},
+                    headers=headers,
+                )
+                assert created.status_code == HTTPStatus.CREATED
+                assert provider_calls == 1
+        finally:
+            self.client.app.dependency_overrides.pop(get_run_scheduler, None)
+
+    def test_sync_create_is_handed_to_admitting_engine_pending(self):
+        """With remote engines the API never provisions a session itself."""
+        headers = self.get_user_auth_headers()
+        provider_calls = 0
+
+        async def counting_create_session(_service):
+            nonlocal provider_calls
+            provider_calls += 1
+
+        scheduler = EngineScheduler()
+        self.client.app.dependency_overrides[get_run_scheduler] = lambda: scheduler
+        try:
+            with patch.object(SteelService, "create_session", counting_create_session):
+                response = self.client.post(
+                    f"{self.API_PREFIX}/runs",
+                    json={"flow_id": "550e8400-e29b-41d4-a716-446655440000"},
+                    headers=headers,
+                )
+            assert response.status_code == HTTPStatus.ACCEPTED
+            assert response.json()["status"] == "pending"
+            assert "Preference-Applied" not in response.headers
+            assert scheduler.provisioned == [UUID(response.json()["id"])]
+            assert provider_calls == 0
+        finally:
+            self.client.app.dependency_overrides.pop(get_run_scheduler, None)
+
+    def test_sync_create_gives_up_waiting_for_admission(self):
+        """A saturated sync create answers 503 before touching the provider."""
+        headers = self.get_user_auth_headers()
+        provider_calls = 0
+
+        async def counting_create_session(_service):
+            nonlocal provider_calls
+            provider_calls += 1
+
+        self.client.app.dependency_overrides[get_run_scheduler] = SaturatedScheduler
+        try:
+            with (
+                patch.object(settings, "run_admission_timeout_seconds", 0.05),
+                patch.object(SteelService, "create_session", counting_create_session),
+            ):
+                response = self.client.post(
+                    f"{self.API_PREFIX}/runs",
+                    json={"flow_id": "550e8400-e29b-41d4-a716-446655440000"},
+                    headers=headers,
+                )
+            assert response.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+            assert response.headers["Retry-After"] == "1"
+            assert provider_calls == 0
+        finally:
+            self.client.app.dependency_overrides.pop(get_run_scheduler, None)
+
+    @pytest.mark.slow
+    def test_benchmark_respond_async_latency_with_slow_provider(self, record_property):
+        """Report POST /runs latency with and without respond-async."""
+        headers = self.get_user_auth_headers()
+        original = SteelService.create_session
+
+        async def slow_create_session(service):
+            await asyncio.sleep(SLOW_PROVIDER_SECONDS)
+            return await original(service)
+
+        with patch.object(SteelService, "create_session", slow_create_session):
+            sync_results, async_results = self._measure_create_run_latencies(
+                headers, headers | {"Prefer": "respond-async"}
+            )
+
+        assert all(status == HTTPStatus.CREATED for status, _ in sync_results)
+        assert all(status == HTTPStatus.ACCEPTED for status, _ in async_results)
+        sync_latencies = sorted(elapsed for _, elapsed in sync_results)
+        async_latencies = sorted(elapsed for _, elapsed in async_results)
+        record_property(
+            "create_run_sync_p50_ms", round(_percentile(sync_latencies, 0.5) * 1000, 2)
+        )
+        record_property(
+            "create_run_async_p50_ms",
+            round(_percentile(async_latencies, 0.5) * 1000, 2),
+        )
+        record_property(
+            "create_run_async_p99_ms",
+            round(_percentile(async_latencies, 0.99) * 1000, 2),
+        )
@@ -0,0 +1,133 @@
+import asyncio
+
+import pytest
+
+from app.models import RunPriority
+from app.services.steel_pool import SteelSessionPool
+from app.services.steel_service import STEEL_SESSION_TIMEOUT_MS, SteelService
+
+
+def _pool(server, **kwargs) -> SteelSessionPool:
+    steel_service = SteelService(api_key=server.API_KEY, base_url=server.base_url)
+    return SteelSessionPool(steel_service, **kwargs)
+
+
+@pytest.mark.integration
+class TestSteelSessionPool:
+    """Integration tests for the warm session pool against a fake Steel API."""
+
+    async def test_leases_warm_sessions_and_reports_hits(self, fake_steel_server):
+        pool = _pool(fake_steel_server, min_size=2, max_size=4)
+
+        assert await pool.replenish() == 2  # noqa: PLR2004
+        first = await pool.acquire()
+        second = await pool.acquire()
+
+        assert {first["id"], second["id"]} == fake_steel_server.live
+        assert pool.stats.hits == 2  # noqa: PLR2004
+        assert pool.stats.hit_rate == 1.0
+        assert pool.stats.lease_wait_seconds >= 0
+
+    async def test_miss_creates_inline_and_grows_next_refill(self, fake_steel_server):
+        pool = _pool(fake_steel_server, min_size=1, max_size=4)
+
+        leased = await pool.acquire()
+        added = await pool.replenish()
+
+        assert leased["debugUrl"]
+        assert pool.stats.misses == 1
+        assert pool.stats.hit_rate == 0.0
+        # One warm session for min_size plus one for the missed lease
+        assert added == 2  # noqa: PLR2004
+        assert await pool.replenish() == 0
+
+    async def test_reserve_is_kept_for_interactive_runs(self, fake_steel_server):
+        pool = _pool(fake_steel_server, min_size=2, max_size=4, interactive_reserve=1)
+        await pool.replenish()
+
+        await pool.acquire(RunPriority.BULK)
+        await pool.acquire(RunPriority.NORMAL)
+        await pool.acquire(RunPriority.INTERACTIVE)
+
+        assert pool.stats.hits == 2  # noqa: PLR2004
+        assert pool.stats.misses == 1
+        assert pool.stats.reserved == 1
+        assert pool.idle_count == 0
+
+    async def test_refill_is_capped_by_max_size(self, fake_steel_server):
+        pool = _pool(fake_steel_server, min_size=1, max_size=2)
+        for _ in range(3):
+            await pool.acquire()
+
+        await pool.replenish()
+
+        assert pool.idle_count == 2  # noqa: PLR2004
+
+    async def test_discards_dead_and_expired_sessions(self, fake_steel_server):
+        now = 0.0
+        pool = _pool(
+            fake_steel_server, min_size=2, max_size=2, idle_ttl=0.2, clock=lambda: now
+        )
+        await pool.replenish()
+        dead = next(iter(fake_steel_server.live))
+        fake_steel_server.kill(dead)
+
+        await pool.replenish()
+
+        assert pool.idle_count == 2  # noqa: PLR2004
+        assert pool.stats.discarded == 1
+        now = 0.25
+        leased = await pool.acquire()
+        await pool.stop()
+
+        assert pool.stats.discarded == 3  # noqa: PLR2004
+        assert pool.stats.misses == 1
+        assert leased["id"] in fake_steel_server.live
+        assert fake_steel_server.released == {f"fake-session-{i}" for i in range(1, 4)}
+
+    async def test_background_task_keeps_pool_warm(self, fake_steel_server):
+        pool = _pool(fake_steel_server, min_size=2, max_size=2, interval=60)
+        pool.start()
+        try:
+            for _ in range(500):
+                if pool.idle_count == 2:  # noqa: PLR2004
+                    break
+                await asyncio.sleep(0.01)
+            leased = await pool.acquire()
+            # A lease wakes the replenisher without waiting for the interval
+            for _ in range(500):
+                if fake_steel_server.created == 3:  # noqa: PLR2004
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await pool.stop()
+
+        assert fake_steel_server.created == 3  # noqa: PLR2004
+        assert fake_steel_server.live == {leased["id"]}
+
+    async def test_pooled_sessions_outlive_their_idle_time(self, fake_steel_server):
+        pool = _pool(fake_steel_server, min_size=1, max_size=2, idle_ttl=60)
+
+        await pool.replenish()
+        await pool.acquire()
+        await SteelService(
+            api_key=fake_steel_server.API_KEY, base_url=fake_steel_server.base_url
+        ).create_session()
+
+        assert fake_steel_server.timeouts == [
+            STEEL_SESSION_TIMEOUT_MS + 60_000,
+            STEEL_SESSION_TIMEOUT_MS,
+        ]
+
+    async def test_health_checks_are_spread_across_passes(self, fake_steel_server):
+        pool = _pool(fake_steel_server, min_size=4, max_size=4, health_check_size=2)
+        await pool.replenish()
+
+        await pool.replenish()
+        assert fake_steel_server.info_requests == 2  # noqa: PLR2004
+        await pool.replenish()
+        assert fake_steel_server.info_requests == 4  # noqa: PLR2004
+
+        # Every idle session was checked once across the two passes
+        checked = {pooled.checked_at for pooled in pool._idle}  # noqa: SLF001
+        assert float("-inf") not in checked
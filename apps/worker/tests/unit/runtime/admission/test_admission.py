@@ -0,0 +1,165 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.models import Run, RunPriority
+from app.runtime.admission import LIMIT_GLOBAL, LIMIT_USER, AdmissionController
+from app.runtime.core import RunnerCoordinator
+from app.runtime.scheduler import RunScheduler
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class RecordingRunService:
+    """Run service stand-in recording which runs were provisioned."""
+
+    def __init__(self) -> None:
+        self.provisioned: list = []
+
+    async def provision_run(self, run_id, _session):
+        self.provisioned.append(run_id)
+        return Run(id=run_id, flow_id=uuid4(), user_id=uuid4()), "https://viewer"
+
+
+async def _queue(
+    controller, admitted, user_id, flow_id, priority=RunPriority.NORMAL
+) -> asyncio.Task:
+    async def acquire():
+        ticket = await controller.acquire(user_id, flow_id, priority)
+        admitted.append(ticket)
+        return ticket
+
+    task = asyncio.create_task(acquire())
+    await asyncio.sleep(0)
+    return task
+
+
+@pytest.mark.unit
+class TestAdmissionController:
+    """Unit tests for concurrency limits and fair admission order."""
+
+    async def test_waiting_runs_are_interleaved_across_users(self):
+        controller = AdmissionController(max_runs=1)
+        heavy, light, flow = uuid4(), uuid4(), uuid4()
+        admitted: list = []
+        first = await controller.acquire(heavy, flow)
+        for _ in range(3):
+            await _queue(controller, admitted, heavy, flow)
+        await _queue(controller, admitted, light, flow)
+
+        ticket = first
+        for _ in range(4):
+            controller.release(ticket)
+            await asyncio.sleep(0)
+            ticket = admitted[-1]
+
+        # The heavy user already holds a slot, so the light user's run goes first
+        assert [t.user_id for t in admitted] == [light, heavy, heavy, heavy]
+        assert controller.stats.blocked == {LIMIT_GLOBAL: 4}
+        assert controller.running == 1
+
+    async def test_user_limit_does_not_hold_back_other_users(self):
+        controller = AdmissionController(max_runs=3, max_runs_per_user=1)
+        busy, other, flow = uuid4(), uuid4(), uuid4()
+        admitted: list = []
+        busy_ticket = await controller.acquire(busy, flow)
+        waiting = await _queue(controller, admitted, busy, flow)
+
+        other_ticket = await controller.acquire(other, flow)
+
+        assert controller.waiting == 1
+        assert controller.queue_depths() == {busy: 1}
+        assert controller.stats.blocked == {LIMIT_USER: 1}
+        controller.release(busy_ticket)
+        assert (await waiting).user_id == busy
+        assert controller.running == 2  # noqa: PLR2004
+        controller.release(other_ticket)
+
+    async def test_wait_time_and_abandoned_waiters_are_recorded(self):
+        clock = FakeClock()
+        controller = AdmissionController(max_runs_per_flow=1, clock=clock)
+        user, flow = uuid4(), uuid4()
+        admitted: list = []
+        ticket = await controller.acquire(user, flow)
+        abandoned = await _queue(controller, admitted, user, flow)
+        waiting = await _queue(controller, admitted, user, flow)
+
+        abandoned.cancel()
+        await asyncio.sleep(0)
+        clock.now = 2.5
+        controller.release(ticket)
+        controller.release(ticket)
+
+        assert (await waiting).waited == pytest.approx(2.5)
+        assert controller.running == 1
+        assert controller.waiting == 0
+        stats = controller.stats.as_dict()
+        assert stats["queued"] == 2  # noqa: PLR2004
+        assert stats["abandoned"] == 1
+        assert stats["max_wait_seconds"] == pytest.approx(2.5)
+
+    async def test_higher_classes_go_first_and_waiting_runs_age(self):
+        clock = FakeClock()
+        controller = AdmissionController(max_runs=1, aging=10, clock=clock)
+        flow = uuid4()
+        admitted: list = []
+        ticket = await controller.acquire(uuid4(), flow)
+        await _queue(controller, admitted, uuid4(), flow, RunPriority.BULK)
+        clock.now = 5
+        await _queue(controller, admitted, uuid4(), flow, RunPriority.NORMAL)
+        await _queue(controller, admitted, uuid4(), flow, RunPriority.INTERACTIVE)
+
+        controller.release(ticket)
+        await asyncio.sleep(0)
+        # After 25s the bulk run ranks as interactive and was queued first
+        clock.now = 25
+        await _queue(controller, admitted, uuid4(), flow, RunPriority.INTERACTIVE)
+        controller.release(admitted[-1])
+        await asyncio.sleep(0)
+
+        assert [t.priority for t in admitted] == [
+            RunPriority.INTERACTIVE,
+            RunPriority.BULK,
+        ]
+        assert controller.stats.aged == 1
+        assert controller.stats.as_dict()["admitted_by_priority"] == {
+            "normal": 1,
+            "interactive": 1,
+            "bulk": 1,
+        }
+
+
+@pytest.mark.unit
+class TestRunSchedulerAdmission:
+    """Unit tests for admission ahead of background provisioning."""
+
+    async def test_runs_over_the_limit_wait_before_provisioning(
+        self, async_session_maker
+    ):
+        controller = AdmissionController(max_runs=2)
+        scheduler = RunScheduler(
+            RunnerCoordinator(), async_session_maker, admission=controller
+        )
+        run_service = RecordingRunService()
+        runs = [Run(flow_id=uuid4(), user_id=uuid4()) for _ in range(3)]
+
+        with patch.object(RunScheduler, "schedule", new=AsyncMock()) as schedule:
+            task = scheduler.provision_many(runs, run_service)
+            await asyncio.sleep(0.05)
+            assert len(run_service.provisioned) == 2  # noqa: PLR2004
+            assert controller.waiting == 1
+
+            # Runs whose execution ends hand their slot to the waiting run
+            scheduler.release(schedule.await_args_list[0].kwargs["admission"])
+            await task
+
+        assert run_service.provisioned == [run.id for run in runs]
+        assert controller.running == 2  # noqa: PLR2004
@@ -0,0 +1,194 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlmodel import select
+
+from app.models import (
+    CheckpointStatus,
+    Event,
+    Flow,
+    Run,
+    RunCheckpoint,
+    RunStatus,
+    User,
+)
+from app.runtime.core import RunnerCoordinator
+from app.runtime.engine.flow_engine import FlowEngine
+from app.runtime.resume import ResumeListener
+from app.services.run.service import RunService
+
+# Cancellation must not wait for the checkpoint's resume timeout
+CANCEL_BUDGET_SECONDS = 1.0
+
+MANIFEST = {
+    "config": {
+        "steps": [
+            {"type": "checkpoint", "name": "approve", "timeout": 900},
+        ]
+    }
+}
+
+
+async def _create_run(session) -> Run:
+    user = User(email="cancel@example.com", password_hash="hashed")
+    flow = Flow(key="cancel-flow", name="cancel", created_by=user.id)
+    run = Run(flow_id=flow.id, user_id=user.id, status=RunStatus.PENDING)
+    session.add_all([user, flow, run])
+    await session.commit()
+    return run
+
+
+async def _wait_until_paused(emitter: MagicMock) -> None:
+    for _ in range(200):
+        if emitter.emit_checkpoint_reached.await_count:
+            return
+        await asyncio.sleep(0.01)
+    pytest.fail("Run never reached its checkpoint")
+
+
+@pytest.mark.unit
+class TestFlowEngineCancellation:
+    """Unit tests for canceling runs through the coordinator."""
+
+    @pytest.fixture
+    def agent(self):
+        agent = MagicMock()
+        agent.stop = AsyncMock()
+        with patch(
+            "app.runtime.engine.flow_engine.AgentFactory.create",
+            new=AsyncMock(return_value=agent),
+        ):
+            yield agent
+
+    def _engine(self, session, coordinator: RunnerCoordinator):
+        session_provider = MagicMock()
+        session_provider.attach_to_session = AsyncMock()
+        session_provider.close_session = AsyncMock()
+        emitter = MagicMock()
+        for name in (
+            "emit_run_started",
+            "emit_checkpoint_reached",
+            "emit_run_canceled",
+            "emit_run_failed",
+        ):
+            setattr(emitter, name, AsyncMock())
+        engine = FlowEngine(
+            run_service=RunService(),
+            session_provider=session_provider,
+            session=session,
+            event_emitter=emitter,
+            coordinator=coordinator,
+        )
+        return engine, session_provider, emitter
+
+    async def test_cancel_releases_paused_run_promptly(self, session, agent):
+        run = await _create_run(session)
+        coordinator = RunnerCoordinator()
+        engine, session_provider, emitter = self._engine(session, coordinator)
+
+        await engine.start(run, MANIFEST, {})
+        await _wait_until_paused(emitter)
+
+        start = time.perf_counter()
+        canceled = await coordinator.cancel(run.id, timeout_s=5)
+        elapsed = time.perf_counter() - start
+
+        await session.refresh(run)
+        checkpoint = (
+            await session.execute(
+                select(RunCheckpoint).where(RunCheckpoint.run_id == run.id)
+            )
+        ).scalar_one()
+
+        assert canceled
+        assert elapsed < CANCEL_BUDGET_SECONDS
+        assert run.status == RunStatus.CANCELED
+        assert run.ended_at is not None
+        assert checkpoint.status == CheckpointStatus.CANCELED
+        agent.stop.assert_awaited_once()
+        session_provider.close_session.assert_awaited_once_with(run.id)
+        emitter.emit_run_canceled.assert_awaited_once()
+        assert not coordinator.has_task(run.id)
+
+    async def test_task_torn_down_without_cancel_request_keeps_run_state(
+        self, session, agent
+    ):
+        run = await _create_run(session)
+        coordinator = RunnerCoordinator()
+        engine, session_provider, emitter = self._engine(session, coordinator)
+
+        await engine.start(run, MANIFEST, {})
+        await _wait_until_paused(emitter)
+        task = coordinator.get_task(run.id)
+        task.cancel()
+        await asyncio.wait({task})
+        await session.refresh(run)
+
+        assert run.status == RunStatus.AWAITING_INPUT
+        emitter.emit_run_canceled.assert_not_awaited()
+        agent.stop.assert_not_awaited()
+        session_provider.close_session.assert_not_awaited()
+
+    async def test_run_canceled_in_another_process_is_stopped(
+        self, session, async_session_maker, agent
+    ):
+        run = await _create_run(session)
+        coordinator = RunnerCoordinator()
+        engine, session_provider, emitter = self._engine(session, coordinator)
+        listener = ResumeListener(coordinator, async_session_maker)
+
+        await engine.start(run, MANIFEST, {})
+        await _wait_until_paused(emitter)
+        # Accepted by an API process that does not hold the run
+        async with async_session_maker() as other:
+            await RunService().cancel_run(run.id, other)
+
+        assert await listener.check_finished() == [run.id]
+        await session.refresh(run)
+        canceled_events = (
+            await session.execute(
+                select(Event)
+                .where(Event.run_id == run.id)
+                .where(Event.message == "run_canceled")
+            )
+        ).all()
+
+        assert run.status == RunStatus.CANCELED
+        assert len(canceled_events) == 1
+        emitter.emit_run_canceled.assert_not_awaited()
+        agent.stop.assert_awaited_once()
+        session_provider.close_session.assert_awaited_once_with(run.id)
+        assert not coordinator.has_task(run.id)
+        assert await listener.check_finished() == []
+
+    async def test_engine_does_not_reopen_a_run_finished_elsewhere(
+        self, session, async_session_maker, agent
+    ):
+        run = await _create_run(session)
+        coordinator = RunnerCoordinator()
+        engine, session_provider, emitter = self._engine(session, coordinator)
+
+        await engine.start(run, MANIFEST, {})
+        await _wait_until_paused(emitter)
+        # Reaped while paused, then resumed before the listener noticed
+        async with async_session_maker() as other:
+            reaped = await other.get(Run, run.id)
+            reaped.status = RunStatus.FAILED
+            other.add(reaped)
+            await other.commit()
+        task = coordinator.get_task(run.id)
+        coordinator.resume(run.id, {"action": "continue"})
+        await asyncio.wait({task}, timeout=5)
+        await session.refresh(run)
+
+        assert task.done()
+        assert run.status == RunStatus.FAILED
+        emitter.emit_run_failed.assert_not_awaited()
+        agent.stop.assert_awaited_once()
+        session_provider.close_session.assert_awaited_once_with(run.id)
+
+    async def test_cancel_without_task_is_a_no_op(self):
+        assert not await RunnerCoordinator().cancel(uuid4(), timeout_s=1)
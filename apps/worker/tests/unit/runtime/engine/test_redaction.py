@@ -0,0 +1,176 @@
+import time
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from pydantic import ValidationError
+
+from app.config import Settings
+from app.runtime.core import RunContext
+from app.runtime.engine.events import EventEmitter
+from app.runtime.engine.redaction import REDACTED, RedactionPolicy
+
+JWT = (
+    "eyJhbGciOiJIUzI1NiJ9.eyJzdWIiOiIxMjM0NTY3ODkwIn0."
+    "dozjgNryP4J3jVmNHl0w5N_XgL0n3I9PlFUP0THsR8U"
+)
+BENCHMARK_ITERATIONS = 50
+
+
+def _policy() -> RedactionPolicy:
+    return RedactionPolicy(
+        keys=["password", "token", "authorization"],
+        key_patterns=[r"[_-](token|secret)$"],
+        value_detectors=["jwt", "bearer"],
+    )
+
+
+def _legacy_redact(obj):
+    """The per-call traversal the policy replaces, kept as a baseline."""
+    sensitive = {
+        "api_key",
+        "apikey",
+        "password",
+        "secret",
+        "token",
+        "authorization",
+        "cookie",
+        "set-cookie",
+    }
+    if isinstance(obj, dict):
+        return {
+            k: ("***" if k.lower() in sensitive else _legacy_redact(v))
+            for k, v in obj.items()
+        }
+    if isinstance(obj, list):
+        return [_legacy_redact(v) for v in obj]
+    return obj
+
+
+def _nested_payload(depth: int, width: int) -> dict:
+    if depth == 0:
+        return {"value": "plain text", "count": 3, "enabled": True}
+    children = {f"key{i}": _nested_payload(depth - 1, width) for i in range(width)}
+    return children | {"items": [_nested_payload(depth - 1, 1)]}
+
+
+def _context() -> RunContext:
+    return RunContext(
+        run_id=uuid4(),
+        flow_id=uuid4(),
+        user_id=uuid4(),
+        input_payload={},
+        manifest={},
+    )
+
+
+@pytest.mark.unit
+class TestRedactionPolicy:
+    """Unit tests for the compiled redaction policy."""
+
+    def test_masks_exact_and_pattern_keys_case_insensitively(self):
+        payload = {
+            "Password": "hunter2",
+            "nested": [{"access_token": "abc", "client-secret": "xyz"}],
+            "tokens_used": 42,
+        }
+
+        redacted = _policy().redact(payload)
+
+        assert redacted == {
+            "Password": REDACTED,
+            "nested": [{"access_token": REDACTED, "client-secret": REDACTED}],
+            "tokens_used": 42,
+        }
+
+    def test_masks_value_shapes_inside_strings(self):
+        policy = _policy()
+
+        assert policy.redact_text(f"sent {JWT} upstream") == f"sent {REDACTED} upstream"
+        assert policy.redact({"header": "Bearer abc.def"}) == {"header": REDACTED}
+
+    def test_returns_untouched_containers_without_copying(self):
+        payload = {"step": "login", "items": [{"index": 1}], "note": "ok"}
+
+        assert _policy().redact(payload) is payload
+
+    def test_copies_only_when_something_was_redacted(self):
+        payload = {"safe": {"a": 1}, "auth": {"token": "abc"}}
+
+        redacted = _policy().redact(payload)
+
+        assert redacted is not payload
+        assert redacted["safe"] is payload["safe"]
+        assert payload["auth"]["token"] == "abc"
+
+    def test_rejects_unknown_value_detector(self):
+        with pytest.raises(ValueError, match="credit_card"):
+            RedactionPolicy(value_detectors=["credit_card"])
+
+    def test_key_patterns_setting_keeps_commas_inside_a_regex(self):
+        settings = Settings(debug=True, redact_key_patterns=[r"^x{2,4}$", "^pin$"])
+        policy = RedactionPolicy(key_patterns=settings.redact_key_patterns)
+
+        assert policy.is_sensitive_key("xxx")
+        assert policy.is_sensitive_key("PIN")
+        assert not policy.is_sensitive_key("x")
+
+    def test_key_patterns_setting_rejects_invalid_regex(self):
+        with pytest.raises(ValidationError, match="REDACT_KEY_PATTERNS"):
+            Settings(debug=True, redact_key_patterns=["(unclosed"])
+
+    @pytest.mark.slow
+    def test_benchmark_policy_vs_per_call_traversal(self, record_property):
+        """Record redaction time over a deep nested payload."""
+        payload = _nested_payload(depth=5, width=4)
+        policy = _policy()
+
+        start = time.perf_counter()
+        for _ in range(BENCHMARK_ITERATIONS):
+            _legacy_redact(payload)
+        legacy_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(BENCHMARK_ITERATIONS):
+            policy.redact(payload)
+        policy_seconds = time.perf_counter() - start
+
+        record_property("legacy_redact_ms", round(legacy_seconds * 1000, 2))
+        record_property("policy_redact_ms", round(policy_seconds * 1000, 2))
+        # Timings are recorded, not asserted: relative timings are too noisy
+        # under xdist to gate a test run on.
+        assert policy.redact(payload) == _legacy_redact(payload)
+
+
+@pytest.mark.unit
+class TestEventEmitterRedaction:
+    """Unit tests for redaction applied by the event emitter."""
+
+    def _emitter(self, policy: RedactionPolicy) -> tuple[EventEmitter, AsyncMock]:
+        event_service = MagicMock()
+        event_service.create_event = AsyncMock()
+        broadcaster = MagicMock()
+        emitter = EventEmitter(
+            MagicMock(), event_service, broadcaster=broadcaster, redaction=policy
+        )
+        return emitter, event_service.create_event
+
+    async def test_untrusted_events_are_redacted(self):
+        emitter, create_event = self._emitter(_policy())
+        context = _context()
+
+        await emitter.emit_step_failed(context, "login", f"rejected {JWT}")
+
+        kwargs = create_event.await_args.kwargs
+        assert kwargs["payload"]["error"] == f"rejected {REDACTED}"
+
+    async def test_trusted_engine_events_skip_traversal(self):
+        policy = MagicMock(spec=RedactionPolicy)
+        emitter, create_event = self._emitter(policy)
+        context = _context()
+
+        await emitter.emit_step_started(context, "login")
+
+        policy.redact.assert_not_called()
+        policy.redact_text.assert_not_called()
+        assert create_event.await_args.kwargs["payload"]["step"] == "login"
@@ -0,0 +1,253 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+from sqlmodel import select
+
+from app import db
+from app.config import settings
+from app.dependencies import run_scheduler as run_scheduler_dependency
+from app.models import (
+    EventRead,
+    Flow,
+    Run,
+    RunPriority,
+    RunQueueEntry,
+    RunStatus,
+    SessionStatus,
+    User,
+)
+from app.models import Session as SessionModel
+from app.runtime.core import RunnerCoordinator
+from app.runtime.queue import RunQueueDispatcher
+from app.runtime.scheduler import RunScheduler
+from app.services.event.broadcaster import event_broadcaster
+from app.services.run.queue import RunQueueRepository
+from app.services.run.repository import RunRepository
+
+LEASE = timedelta(seconds=60)
+
+
+class RecordingScheduler:
+    """Scheduler stand-in recording the status of each run it provisions."""
+
+    def __init__(self) -> None:
+        self.provisioned: list[tuple] = []
+
+    async def provision(self, run, _run_service=None):
+        self.provisioned.append((run.id, run.status))
+
+
+class RecordingSessionPool:
+    """Session pool stand-in recording the priority of each lease."""
+
+    def __init__(self) -> None:
+        self.leases: list[RunPriority] = []
+
+    async def acquire(self, priority=RunPriority.NORMAL):
+        self.leases.append(priority)
+        return {"id": f"steel-{len(self.leases)}", "debugUrl": "https://viewer"}
+
+
+async def _queue_runs(
+    session, count: int, status=RunStatus.PENDING, priority=RunPriority.NORMAL
+) -> list[Run]:
+    user = User(email=f"{uuid4().hex}@example.com", password_hash="hashed")
+    flow = Flow(key=f"queue-{uuid4().hex}", name="queue", created_by=user.id)
+    session.add_all([user, flow])
+    await session.commit()
+    runs = [
+        Run(flow_id=flow.id, user_id=user.id, status=status, priority=priority)
+        for _ in range(count)
+    ]
+    await RunRepository().create_runs(session, runs, queued=True)
+    return runs
+
+
+async def _drain(dispatcher: RunQueueDispatcher, passes: int = 10) -> None:
+    """Settle delivered runs and deliver newly claimed ones until none are held."""
+    for _ in range(passes):
+        await dispatcher.wait_delivered()
+        await dispatcher.dispatch()
+        if not dispatcher.held:
+            return
+    pytest.fail("Dispatcher never settled its runs")
+
+
+async def _stored(session, run: Run) -> Run:
+    return await session.get(Run, run.id, populate_existing=True)
+
+
+async def _entries(session) -> dict:
+    result = await session.execute(select(RunQueueEntry))
+    return {entry.run_id: entry for entry in result.scalars()}
+
+
+@pytest.mark.unit
+class TestRunQueueLeases:
+    """Unit tests for claiming and renewing run queue leases."""
+
+    async def test_workers_claim_disjoint_entries(self, session):
+        runs = await _queue_runs(session, 5)
+        repository = RunQueueRepository()
+        now = datetime.now(UTC)
+
+        first = await repository.claim(session, "worker-a", now, now + LEASE, 3)
+        second = await repository.claim(session, "worker-b", now, now + LEASE, 5)
+
+        first_ids = {entry.run_id for entry in first}
+        second_ids = {entry.run_id for entry in second}
+        assert len(first_ids) == 3  # noqa: PLR2004
+        assert first_ids.isdisjoint(second_ids)
+        assert first_ids | second_ids == {run.id for run in runs}
+        assert {entry.attempts for entry in first + second} == {1}
+
+    async def test_expired_leases_are_reclaimed_unless_renewed(self, session):
+        runs = await _queue_runs(session, 2)
+        repository = RunQueueRepository()
+        now = datetime.now(UTC)
+        await repository.claim(session, "worker-a", now, now + LEASE, 2)
+
+        later = now + LEASE / 2
+        renewed = await repository.renew(
+            session, [runs[0].id], "worker-a", later + LEASE
+        )
+        expired = now + LEASE + timedelta(seconds=1)
+        reclaimed = await repository.claim(
+            session, "worker-b", expired, expired + LEASE, 5
+        )
+
+        assert renewed == 1
+        assert [entry.run_id for entry in reclaimed] == [runs[1].id]
+        assert reclaimed[0].attempts == 2  # noqa: PLR2004
+        assert reclaimed[0].lease_owner == "worker-b"
+
+    async def test_enqueue_skips_queued_runs(self, session):
+        runs = await _queue_runs(session, 1)
+        repository = RunQueueRepository()
+
+        added = await repository.enqueue(
+            session, [runs[0].id], datetime.now(UTC) + LEASE
+        )
+
+        assert added == 0
+        assert list(await _entries(session)) == [runs[0].id]
+
+
+@pytest.mark.unit
+class TestRunQueueDispatcher:
+    """Unit tests for draining the run queue into the scheduler."""
+
+    def _dispatcher(self, async_session_maker, scheduler, **kwargs):
+        return RunQueueDispatcher(
+            scheduler,
+            RunnerCoordinator(),
+            async_session_maker,
+            worker_id="worker-a",
+            **kwargs,
+        )
+
+    async def test_claims_up_to_capacity_and_settles_finished_runs(
+        self, session, async_session_maker
+    ):
+        runs = await _queue_runs(session, 3)
+        scheduler = RecordingScheduler()
+        dispatcher = self._dispatcher(async_session_maker, scheduler, capacity=2)
+
+        first = await dispatcher.dispatch()
+        await _drain(dispatcher)
+
+        assert len(first.claimed) == 2  # noqa: PLR2004
+        assert {run_id for run_id, _ in scheduler.provisioned} == {
+            run.id for run in runs
+        }
+        assert await _entries(session) == {}
+
+    async def test_abandoned_run_is_reset_before_retry(
+        self, session, async_session_maker
+    ):
+        (run,) = await _queue_runs(session, 1, status=RunStatus.RUNNING)
+        session.add(
+            SessionModel(
+                run_id=run.id,
+                status=SessionStatus.ACTIVE,
+                browser_provider_session_id="steel-dead",
+            )
+        )
+        await session.commit()
+        now = datetime.now(UTC)
+        # Claimed by a worker whose lease has since expired
+        await RunQueueRepository().claim(
+            session, "worker-dead", now, now - timedelta(seconds=1), 1
+        )
+        scheduler = RecordingScheduler()
+        dispatcher = self._dispatcher(async_session_maker, scheduler)
+        published: list = []
+        listener = published.append
+        event_broadcaster.add_listener(listener)
+        try:
+            report = await dispatcher.dispatch()
+            await _drain(dispatcher)
+        finally:
+            event_broadcaster.remove_listener(listener)
+
+        run = await _stored(session, run)
+        db_session = (await session.execute(select(SessionModel))).scalar_one()
+        # Live-tail clients get the reset as an SSE `status` event
+        [requeued] = [event for event in published if event.run_id == run.id]
+        assert isinstance(requeued, EventRead)
+        assert requeued.type == "status"
+        assert requeued.message == "run_requeued"
+        assert report.retried == [run.id]
+        assert scheduler.provisioned == [(run.id, RunStatus.PENDING)]
+        assert run.status == RunStatus.PENDING
+        assert db_session.status == SessionStatus.ENDED
+        assert await _entries(session) == {}
+
+    async def test_run_is_failed_after_max_attempts(self, session, async_session_maker):
+        (run,) = await _queue_runs(session, 1)
+        scheduler = RecordingScheduler()
+        dispatcher = self._dispatcher(async_session_maker, scheduler, max_attempts=1)
+        now = datetime.now(UTC)
+        # Claimed by a worker whose lease has since expired
+        await RunQueueRepository().claim(
+            session, "worker-dead", now, now - timedelta(seconds=1), 1
+        )
+
+        report = await dispatcher.dispatch()
+        await _drain(dispatcher)
+
+        run = await _stored(session, run)
+        assert report.failed == [run.id]
+        assert scheduler.provisioned == []
+        assert run.status == RunStatus.FAILED
+        assert "attempts" in run.error
+
+    async def test_queued_interactive_run_leases_from_session_pool(
+        self, session, async_session_maker, monkeypatch
+    ):
+        (run,) = await _queue_runs(session, 1, priority=RunPriority.INTERACTIVE)
+        pool = RecordingSessionPool()
+        monkeypatch.setattr(db, "AsyncSessionLocal", async_session_maker)
+        monkeypatch.setattr(
+            run_scheduler_dependency, "get_steel_session_pool", lambda: pool
+        )
+        monkeypatch.setattr(run_scheduler_dependency, "_run_queue_dispatcher", None)
+        monkeypatch.setattr(settings, "run_queue_enabled", True)
+        monkeypatch.setattr(RunScheduler, "schedule", AsyncMock())
+
+        # The dispatcher the API lifespan and engine workers start
+        dispatcher = run_scheduler_dependency.start_run_queue()
+        try:
+            async with asyncio.timeout(5):
+                while not pool.leases:
+                    await asyncio.sleep(0.01)
+            await dispatcher.wait_delivered()
+        finally:
+            await run_scheduler_dependency.stop_run_queue()
+
+        run = await _stored(session, run)
+        assert pool.leases == [RunPriority.INTERACTIVE]
+        assert run.status == RunStatus.RUNNING
@@ -0,0 +1,224 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlmodel import select
+
+from app.config import settings
+from app.dependencies import run_reaper as run_reaper_dependency
+from app.dependencies import run_scheduler as run_scheduler_dependency
+from app.models import (
+    CheckpointStatus,
+    Event,
+    Flow,
+    Run,
+    RunCheckpoint,
+    RunStatus,
+    SessionStatus,
+    User,
+)
+from app.models import Session as SessionModel
+from app.runtime.core import RunnerCoordinator
+from app.runtime.reaper import ORPHANED_RUN_ERROR, RunReaper
+from app.utils.pagination import as_utc
+
+WORKER_ID = "worker-a"
+TIMEOUT_SECONDS = 60
+
+
+class RecordingSteelService:
+    """Steel service stand-in that tracks how many releases overlap."""
+
+    def __init__(self, fail: set[str] | None = None) -> None:
+        self.fail = fail or set()
+        self.released: list[str] = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def release_session(self, session_id: str) -> bool:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if session_id in self.fail:
+            msg = "provider down"
+            raise RuntimeError(msg)
+        self.released.append(session_id)
+        return True
+
+
+class LiveCoordinator(RunnerCoordinator):
+    """Coordinator reporting a fixed set of runs as executing here."""
+
+    def __init__(self, run_ids=()) -> None:
+        super().__init__()
+        self.live = list(run_ids)
+
+    def active_run_ids(self):
+        return self.live
+
+
+async def _seed(session, *, count: int, status: RunStatus, heartbeat_age: float):
+    suffix = uuid4().hex
+    user = User(email=f"{suffix}@example.com", password_hash="hashed")
+    flow = Flow(key=f"reaper-{suffix}", name="reaper", created_by=user.id)
+    heartbeat_at = datetime.now(UTC) - timedelta(seconds=heartbeat_age)
+    runs = [
+        Run(
+            flow_id=flow.id,
+            user_id=user.id,
+            status=status,
+            owner_id="worker-dead",
+            heartbeat_at=heartbeat_at,
+        )
+        for _ in range(count)
+    ]
+    sessions = [
+        SessionModel(
+            run_id=run.id,
+            status=SessionStatus.ACTIVE,
+            browser_provider_session_id=f"steel-{run.id}",
+        )
+        for run in runs
+    ]
+    session.add_all([user, flow, *runs, *sessions])
+    await session.commit()
+    return runs
+
+
+def _reaper(async_session_maker, steel, **kwargs) -> RunReaper:
+    kwargs.setdefault("coordinator", LiveCoordinator())
+    return RunReaper(
+        session_factory=async_session_maker,
+        steel_service=steel,
+        worker_id=WORKER_ID,
+        heartbeat_timeout=TIMEOUT_SECONDS,
+        **kwargs,
+    )
+
+
+@pytest.mark.unit
+class TestRunReaper:
+    """Unit tests for heartbeats and orphaned-run reaping."""
+
+    async def test_stale_runs_are_failed_and_sessions_released(
+        self, session, async_session_maker
+    ):
+        stale = await _seed(
+            session, count=3, status=RunStatus.RUNNING, heartbeat_age=300
+        )
+        fresh = await _seed(session, count=1, status=RunStatus.RUNNING, heartbeat_age=5)
+        steel = RecordingSteelService()
+
+        report = await _reaper(async_session_maker, steel, batch_size=2).reap()
+
+        assert sorted(report.reaped) == sorted(run.id for run in stale)
+        assert sorted(steel.released) == sorted(f"steel-{run.id}" for run in stale)
+        for run in stale:
+            await session.refresh(run)
+            assert run.status == RunStatus.FAILED
+            assert run.error == ORPHANED_RUN_ERROR
+            assert run.ended_at is not None
+        await session.refresh(fresh[0])
+        assert fresh[0].status == RunStatus.RUNNING
+        sessions = (await session.execute(select(SessionModel))).scalars().all()
+        ended = {s.run_id for s in sessions if s.status == SessionStatus.ENDED}
+        assert ended == {run.id for run in stale}
+        events = (await session.execute(select(Event))).scalars().all()
+        assert sorted(e.run_id for e in events) == sorted(run.id for run in stale)
+        assert {e.message for e in events} == {"run_failed"}
+
+    async def test_heartbeat_keeps_this_workers_runs_alive(
+        self, session, async_session_maker
+    ):
+        (run,) = await _seed(
+            session, count=1, status=RunStatus.AWAITING_INPUT, heartbeat_age=300
+        )
+        run.owner_id = WORKER_ID
+        session.add(run)
+        await session.commit()
+        steel = RecordingSteelService()
+        reaper = _reaper(
+            async_session_maker, steel, coordinator=LiveCoordinator([run.id])
+        )
+
+        report = await reaper.reap()
+
+        await session.refresh(run)
+        assert report.heartbeats == 1
+        assert report.reaped == []
+        assert run.status == RunStatus.AWAITING_INPUT
+        age = datetime.now(UTC) - as_utc(run.heartbeat_at)
+        assert age < timedelta(seconds=TIMEOUT_SECONDS)
+
+    async def test_requeue_resets_runs_and_provisions_them(
+        self, session, async_session_maker
+    ):
+        (run,) = await _seed(
+            session, count=1, status=RunStatus.AWAITING_INPUT, heartbeat_age=300
+        )
+        session.add(
+            RunCheckpoint(
+                run_id=run.id,
+                checkpoint_id="approve",
+                step_index=1,
+                reason="Awaiting approval",
+                expected_action="continue",
+                expires_at=datetime.now(UTC) + timedelta(minutes=15),
+            )
+        )
+        await session.commit()
+        scheduler = MagicMock()
+        reaper = _reaper(
+            async_session_maker,
+            RecordingSteelService(),
+            action="requeue",
+            scheduler=scheduler,
+        )
+
+        await reaper.reap()
+
+        await session.refresh(run)
+        checkpoint = (await session.execute(select(RunCheckpoint))).scalar_one()
+        assert run.status == RunStatus.PENDING
+        assert run.owner_id is None
+        assert run.heartbeat_at is None
+        assert checkpoint.status == CheckpointStatus.EXPIRED
+        (requeued,) = scheduler.provision_many.call_args.args
+        assert [r.id for r in requeued] == [run.id]
+
+    async def test_releases_are_bounded_and_failures_counted(
+        self, session, async_session_maker
+    ):
+        runs = await _seed(
+            session, count=6, status=RunStatus.RUNNING, heartbeat_age=300
+        )
+        steel = RecordingSteelService(fail={f"steel-{runs[0].id}"})
+
+        report = await _reaper(async_session_maker, steel, release_concurrency=2).reap()
+
+        assert steel.peak == 2  # noqa: PLR2004
+        assert report.released_sessions == len(runs) - 1
+        assert report.failed_releases == 1
+
+    def test_requeue_requires_a_scheduler(self):
+        with pytest.raises(ValueError, match="scheduler"):
+            RunReaper(RunnerCoordinator(), worker_id=WORKER_ID, action="requeue")
+
+    async def test_requeuing_reaper_started_after_the_queue_uses_it(self, monkeypatch):
+        monkeypatch.setattr(run_scheduler_dependency, "_run_queue_dispatcher", None)
+        monkeypatch.setattr(run_reaper_dependency, "_run_reaper", None)
+        monkeypatch.setattr(settings, "run_queue_enabled", True)
+        monkeypatch.setattr(settings, "run_reaper_enabled", True)
+        monkeypatch.setattr(settings, "run_reaper_action", "requeue")
+
+        # The order the API lifespan and engine workers start them in
+        run_scheduler_dependency.start_run_queue()
+        reaper = run_reaper_dependency.start_run_reaper()
+        try:
+            assert reaper._scheduler.queued  # noqa: SLF001
+        finally:
+            await run_reaper_dependency.stop_run_reaper()
+            await run_scheduler_dependency.stop_run_queue()
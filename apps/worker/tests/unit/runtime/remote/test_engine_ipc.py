@@ -0,0 +1,217 @@
+import asyncio
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.models import Flow, Run, RunStatus, User
+from app.runtime.core import RunnerCoordinator
+from app.runtime.ipc import EngineClient, EngineCommandError, EngineServer
+from app.runtime.reaper import RunReaper
+from app.runtime.remote import EngineCommandHandler, RemoteRunScheduler
+
+
+class RecordingScheduler:
+    """Engine-side scheduler stand-in recording the commands it carries out."""
+
+    def __init__(self) -> None:
+        self.provisioned: list[UUID] = []
+        self.scheduled: list[UUID] = []
+        self.resumed: list[tuple[UUID, dict | None]] = []
+
+    def provision(self, run, _run_service=None):
+        self.provisioned.append(run.id)
+
+    def provision_many(self, runs, _run_service=None):
+        self.provisioned.extend(run.id for run in runs)
+
+    async def admit(self, *_args):
+        return None
+
+    async def schedule(self, run, *, input_payload=None, admission=None):  # noqa: ARG002
+        self.scheduled.append(run.id)
+
+    async def resume(self, run_id, input_payload=None):
+        self.resumed.append((run_id, input_payload))
+        return True
+
+    async def cancel(self, _run_id, *, timeout):  # noqa: ARG002
+        return False
+
+
+async def _echo(command, args):
+    if command == "fail":
+        msg = "rejected"
+        raise EngineCommandError(msg)
+    return {"command": command, "args": args}
+
+
+async def _add_run(session, status: RunStatus) -> Run:
+    user = User(email=f"{uuid4().hex}@example.com", password_hash="hashed")
+    flow = Flow(key=f"engine-{uuid4().hex}", name="engine", created_by=user.id)
+    run = Run(flow_id=flow.id, user_id=user.id, status=status, owner_id="api-1")
+    session.add_all([user, flow, run])
+    await session.commit()
+    return run
+
+
+@pytest.mark.unit
+class TestEngineChannel:
+    """Unit tests for the Unix socket command channel."""
+
+    async def test_commands_fail_over_to_a_reachable_engine(self, tmp_path):
+        server = EngineServer(str(tmp_path / "b.sock"), _echo)
+        await server.start()
+        client = EngineClient([str(tmp_path / "a.sock"), server.path], timeout=1)
+        try:
+            first = await client.call("start", {"run_id": "r1"})
+            second = await client.call("start", {"run_id": "r2"})
+            answered = await client.call_all("stats")
+            with pytest.raises(EngineCommandError, match="rejected"):
+                await client.call_path(server.path, "fail")
+        finally:
+            await server.stop()
+
+        assert first == {"command": "start", "args": {"run_id": "r1"}}
+        assert second["args"] == {"run_id": "r2"}
+        assert answered == [{"command": "stats", "args": {}}]
+        with pytest.raises(EngineCommandError, match="No engine"):
+            await client.call("start")
+
+    async def test_sent_commands_are_not_sent_to_another_engine(self, tmp_path):
+        received: list[bytes] = []
+        answered: list[str] = []
+
+        async def drop_reply(reader, writer):
+            received.append(await reader.readline())
+            writer.close()
+
+        async def answer(command, args):
+            answered.append(command)
+            return await _echo(command, args)
+
+        dropping = await asyncio.start_unix_server(
+            drop_reply, path=str(tmp_path / "a.sock")
+        )
+        server = EngineServer(str(tmp_path / "b.sock"), answer)
+        await server.start()
+        client = EngineClient([str(tmp_path / "a.sock"), server.path], timeout=1)
+        try:
+            with pytest.raises(EngineCommandError, match="did not answer"):
+                await client.call("start", {"run_id": "r1"})
+        finally:
+            dropping.close()
+            await server.stop()
+
+        assert len(received) == 1
+        assert answered == []
+
+    async def test_watchers_receive_broadcasts(self, tmp_path):
+        server = EngineServer(str(tmp_path / "engine.sock"), _echo)
+        await server.start()
+        client = EngineClient([server.path], reconnect=0.01)
+        received: list[dict] = []
+        client.watch(received.append)
+        try:
+            for _ in range(100):
+                if server.watching:
+                    break
+                await asyncio.sleep(0.01)
+            server.broadcast({"type": "event", "n": 1})
+            for _ in range(100):
+                if received:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await client.aclose()
+            await server.stop()
+
+        assert received == [{"type": "event", "n": 1}]
+
+
+@pytest.mark.unit
+class TestRemoteRunScheduler:
+    """Unit tests for handing runs from the API to an engine worker."""
+
+    async def test_commands_reach_the_engine_scheduler(
+        self, tmp_path, session, async_session_maker
+    ):
+        pending = await _add_run(session, RunStatus.PENDING)
+        provisioned = await _add_run(session, RunStatus.RUNNING)
+        engine_scheduler = RecordingScheduler()
+        handler = EngineCommandHandler(
+            engine_scheduler,
+            RunnerCoordinator(),
+            async_session_maker,
+            worker_id="engine-1",
+        )
+        server = EngineServer(str(tmp_path / "engine.sock"), handler)
+        await server.start()
+        scheduler = RemoteRunScheduler(EngineClient([server.path], timeout=1))
+        try:
+            await scheduler.provision(pending)
+            await scheduler.schedule(provisioned)
+            resumed = await scheduler.resume(provisioned.id, {"otp": "123"})
+            canceled = await scheduler.cancel(provisioned.id)
+            await asyncio.sleep(0.01)
+        finally:
+            await server.stop()
+
+        stored = await session.get(Run, provisioned.id, populate_existing=True)
+        assert engine_scheduler.provisioned == [pending.id]
+        assert engine_scheduler.scheduled == [provisioned.id]
+        assert engine_scheduler.resumed == [(provisioned.id, {"otp": "123"})]
+        assert resumed
+        assert not canceled
+        # The engine took the run over from the API process that provisioned it
+        assert stored.owner_id == "engine-1"
+
+    async def test_only_one_engine_adopts_a_provisioned_run(
+        self, session, async_session_maker
+    ):
+        run = await _add_run(session, RunStatus.RUNNING)
+        handlers = [
+            EngineCommandHandler(
+                RecordingScheduler(),
+                RunnerCoordinator(),
+                async_session_maker,
+                worker_id=worker_id,
+            )
+            for worker_id in ("engine-1", "engine-2")
+        ]
+
+        started = [
+            await handler.start(str(run.id), provisioned_by="api-1")
+            for handler in handlers
+        ]
+        await asyncio.sleep(0.01)
+        stored = await session.get(Run, run.id, populate_existing=True)
+
+        assert started == [True, False]
+        assert stored.owner_id == "engine-1"
+        assert not await handlers[0].start(str(run.id), provisioned_by="api-2")
+
+    async def test_run_waiting_for_admission_is_heartbeated_and_cancelable(
+        self, session, async_session_maker
+    ):
+        run = await _add_run(session, RunStatus.RUNNING)
+        admitted = asyncio.Event()
+
+        class BlockedScheduler(RecordingScheduler):
+            async def admit(self, *_args):
+                await admitted.wait()
+
+        coordinator = RunnerCoordinator()
+        handler = EngineCommandHandler(
+            BlockedScheduler(), coordinator, async_session_maker, worker_id="engine-1"
+        )
+        reaper = RunReaper(coordinator, async_session_maker, worker_id="engine-1")
+
+        assert await handler.start(str(run.id), provisioned_by="api-1")
+        await asyncio.sleep(0)
+        heartbeats = await reaper.heartbeat()
+        canceled = await coordinator.cancel(run.id, timeout_s=1)
+
+        assert heartbeats == 1
+        assert canceled
+        assert not coordinator.has_task(run.id)
+        assert not admitted.is_set()
@@ -0,0 +1,165 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.models import (
+    Flow,
+    Run,
+    RunCheckpoint,
+    RunContinue,
+    RunStatus,
+    User,
+)
+from app.runtime.core import RunnerCoordinator
+from app.runtime.resume import ResumeListener
+from app.services.run.service import RunService
+
+
+async def _pause_run(session) -> Run:
+    user = User(email=f"{uuid4().hex}@example.com", password_hash="hashed")
+    flow = Flow(key=f"resume-{uuid4().hex}", name="resume", created_by=user.id)
+    run = Run(flow_id=flow.id, user_id=user.id, status=RunStatus.AWAITING_INPUT)
+    session.add_all([user, flow, run])
+    await session.commit()
+    checkpoint = RunCheckpoint(
+        run_id=run.id,
+        checkpoint_id="otp",
+        step_index=2,
+        expires_at=datetime.now(UTC) + timedelta(minutes=5),
+    )
+    session.add(checkpoint)
+    await session.commit()
+    return run
+
+
+async def _until_waiting(coordinator: RunnerCoordinator, run_id) -> None:
+    for _ in range(100):
+        if run_id in coordinator.waiting_runs():
+            return
+        await asyncio.sleep(0.01)
+
+
+class FakeNotifyEngine:
+    """Async engine stand-in whose connections deliver LISTEN callbacks."""
+
+    def __init__(self) -> None:
+        self.closed = False
+        self.listeners: list = []
+
+    async def add_listener(self, _channel, callback) -> None:
+        self.listeners.append(callback)
+
+    async def remove_listener(self, _channel, callback) -> None:
+        self.listeners.remove(callback)
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    @asynccontextmanager
+    async def connect(self):
+        async def get_raw_connection():
+            return SimpleNamespace(driver_connection=self)
+
+        yield SimpleNamespace(get_raw_connection=get_raw_connection)
+
+
+async def _until(predicate) -> None:
+    for _ in range(500):
+        if predicate():
+            return
+        await asyncio.sleep(0.01)
+    pytest.fail("Condition never reached")
+
+
+@pytest.mark.unit
+class TestResumeListener:
+    """Unit tests for delivering resumes accepted by another process."""
+
+    async def test_run_continued_elsewhere_is_resumed_with_its_input(
+        self, session, async_session_maker
+    ):
+        run = await _pause_run(session)
+        coordinator = RunnerCoordinator()
+        listener = ResumeListener(coordinator, async_session_maker)
+        waiter = asyncio.create_task(coordinator.await_resume(run.id, timeout_s=5))
+        await _until_waiting(coordinator, run.id)
+
+        assert await listener.check() == []
+        # Accepted by an API process that does not hold the run
+        async with async_session_maker() as other:
+            await RunService().continue_run(
+                run.id,
+                RunContinue(input_payload={"action": "continue", "otp": "42"}),
+                other,
+            )
+
+        assert await listener.check() == [run.id]
+        assert await waiter
+        assert coordinator.latest_input(run.id) == {"action": "continue", "otp": "42"}
+        assert coordinator.waiting_runs() == {}
+
+    async def test_paused_runs_not_continued_stay_paused(
+        self, session, async_session_maker
+    ):
+        run = await _pause_run(session)
+        coordinator = RunnerCoordinator()
+        listener = ResumeListener(coordinator, async_session_maker)
+        waiter = asyncio.create_task(coordinator.await_resume(run.id, timeout_s=5))
+        await _until_waiting(coordinator, run.id)
+
+        assert await listener.check() == []
+        assert not waiter.done()
+        coordinator.cleanup(run.id)
+        waiter.cancel()
+
+    async def test_late_resume_does_not_skip_the_next_checkpoint(
+        self, session, async_session_maker
+    ):
+        run = await _pause_run(session)
+        await session.refresh(run)
+        run.status = RunStatus.RUNNING
+        session.add(run)
+        await session.commit()
+        coordinator = RunnerCoordinator()
+        listener = ResumeListener(coordinator, async_session_maker)
+
+        first = asyncio.create_task(coordinator.await_resume(run.id, timeout_s=5))
+        await _until_waiting(coordinator, run.id)
+        stale = coordinator.waiting_runs()[run.id]
+        # Resumed directly, then paused again at the next checkpoint
+        coordinator.resume(run.id)
+        assert await asyncio.wait_for(first, timeout=1)
+        second = asyncio.create_task(coordinator.await_resume(run.id, timeout_s=5))
+        await _until_waiting(coordinator, run.id)
+
+        assert not coordinator.resume_waiting(run.id, stale)
+        assert not second.done()
+        # The DB still shows the run continued, so a fresh check resumes it
+        assert await listener.check() == [run.id]
+        assert await asyncio.wait_for(second, timeout=1)
+
+    async def test_polls_slowly_while_notifications_arrive(self, async_session_maker):
+        notify = FakeNotifyEngine()
+        listener = ResumeListener(
+            RunnerCoordinator(),
+            async_session_maker,
+            interval=0.05,
+            sweep_interval=30,
+            notify_engine=notify,
+            reconnect=0.01,
+        )
+        assert listener.wait_interval == 0.05  # noqa: PLR2004
+        listener.start()
+        try:
+            await _until(lambda: listener.notified)
+            assert listener.wait_interval == 30  # noqa: PLR2004
+            # The connection drops: poll at the normal interval again
+            notify.closed = True
+            await _until(lambda: not notify.listeners)
+            assert listener.wait_interval == 0.05  # noqa: PLR2004
+        finally:
+            await listener.stop()
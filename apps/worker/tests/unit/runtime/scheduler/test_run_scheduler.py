@@ -0,0 +1,54 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.models import Run, RunStatus
+from app.runtime.core import RunnerCoordinator
+from app.runtime.scheduler import RunScheduler
+
+
+class SlowRunService:
+    """Run service stand-in that tracks how many provisions overlap."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.peak = 0
+        self.provisioned: list = []
+
+    async def provision_run(self, run_id, _session):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        self.provisioned.append(run_id)
+        return Run(id=run_id, flow_id=uuid4(), user_id=uuid4()), "https://viewer"
+
+
+@pytest.mark.unit
+class TestRunSchedulerProvisioning:
+    """Unit tests for background provisioning of pending runs."""
+
+    async def test_provision_many_bounds_concurrency(self, async_session_maker):
+        scheduler = RunScheduler(RunnerCoordinator(), async_session_maker)
+        run_service = SlowRunService()
+        runs = [Run(flow_id=uuid4(), user_id=uuid4()) for _ in range(10)]
+
+        with patch.object(RunScheduler, "schedule", new=AsyncMock()) as schedule:
+            await scheduler.provision_many(runs, run_service, concurrency=3)
+
+        assert run_service.peak == 3  # noqa: PLR2004
+        assert run_service.provisioned == [run.id for run in runs]
+        assert schedule.await_count == len(runs)
+
+    async def test_failed_provisioning_skips_scheduling(self, async_session_maker):
+        scheduler = RunScheduler(RunnerCoordinator(), async_session_maker)
+        run_service = AsyncMock()
+        run_service.provision_run.side_effect = RuntimeError("provider down")
+        run = Run(flow_id=uuid4(), user_id=uuid4(), status=RunStatus.PENDING)
+
+        with patch.object(RunScheduler, "schedule", new=AsyncMock()) as schedule:
+            await scheduler.provision(run, run_service)
+
+        schedule.assert_not_awaited()
@@ -0,0 +1,68 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.models import CheckpointStatus, Flow, Run, RunStatus, User
+from app.services.checkpoint.service import CheckpointService
+
+
+async def _create_run(session, key: str) -> Run:
+    user = User(email=f"{key}@example.com", password_hash="hashed")
+    flow = Flow(key=key, name=key, created_by=user.id)
+    run = Run(flow_id=flow.id, user_id=user.id, status=RunStatus.AWAITING_INPUT)
+    session.add_all([user, flow, run])
+    await session.commit()
+    return run
+
+
+def _open(service, session, run, expires_at, checkpoint_id="approve"):
+    return service.open_checkpoint(
+        session,
+        run.id,
+        checkpoint_id,
+        step_index=2,
+        reason="Check the form",
+        expected_action="confirm",
+        expires_at=expires_at,
+    )
+
+
+@pytest.mark.unit
+class TestCheckpointService:
+    """Unit tests for indexed active-checkpoint state."""
+
+    async def test_active_checkpoint_is_returned_until_resolved(self, session):
+        service = CheckpointService()
+        run = await _create_run(session, "checkpoint-active")
+        expires_at = datetime.now(UTC) + timedelta(minutes=5)
+        checkpoint = _open(service, session, run, expires_at)
+        await session.commit()
+
+        active = await service.get_active_checkpoint(run.id, session)
+
+        assert active == {
+            "id": "approve",
+            "index": 2,
+            "reason": "Check the form",
+            "expected_action": "confirm",
+            "expires_at": expires_at.isoformat(),
+            "status": "awaiting_input",
+        }
+
+        service.resolve_checkpoint(session, checkpoint, CheckpointStatus.RESUMED)
+        await session.commit()
+
+        assert await service.get_active_checkpoint(run.id, session) is None
+
+    async def test_expired_checkpoints_are_found_by_deadline(self, session):
+        service = CheckpointService()
+        run = await _create_run(session, "checkpoint-expired")
+        other = await _create_run(session, "checkpoint-pending")
+        expired = _open(service, session, run, datetime.now(UTC) - timedelta(1))
+        _open(service, session, other, datetime.now(UTC) + timedelta(1))
+        await session.commit()
+
+        assert await service.get_active_checkpoint(run.id, session) is None
+        assert [c.id for c in await service.get_expired_checkpoints(session)] == [
+            expired.id
+        ]
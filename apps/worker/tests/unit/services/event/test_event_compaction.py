@@ -0,0 +1,120 @@
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlmodel import select
+
+from app.config import parse_retention_days
+from app.models import Event, EventType, Flow, Run, RunEventSummary, RunStatus, User
+from app.services.event.compaction import EventCompactor
+
+NOW = datetime(2030, 6, 1, tzinfo=UTC)
+OLD = NOW - timedelta(days=30)
+
+
+async def _create_run(session, key: str, status: RunStatus) -> Run:
+    user = User(email=f"{key}@example.com", password_hash="hashed")
+    flow = Flow(key=key, name=key, created_by=user.id)
+    run = Run(flow_id=flow.id, user_id=user.id, status=status)
+    session.add_all([user, flow, run])
+    await session.commit()
+    return run
+
+
+def _event(run: Run, event_type: EventType, at: datetime, **payload) -> Event:
+    return Event(
+        id=uuid4(),
+        run_id=run.id,
+        type=event_type,
+        message=event_type.value,
+        payload=payload,
+        at=at,
+    )
+
+
+async def _event_types(session, run: Run) -> list[str]:
+    result = await session.execute(
+        select(Event.type).where(Event.run_id == run.id).order_by(Event.at)
+    )
+    return [EventType(t).value for t in result.scalars()]
+
+
+@pytest.mark.unit
+class TestEventCompactor:
+    """Unit tests for event retention and compaction."""
+
+    async def test_deletes_expired_events_and_keeps_summary(
+        self, session, async_session_maker
+    ):
+        run = await _create_run(session, "compact-done", RunStatus.FAILED)
+        session.add_all(
+            [
+                _event(run, EventType.STATUS, OLD, status="running"),
+                *(
+                    _event(run, EventType.LOG, OLD + timedelta(seconds=i))
+                    for i in range(5)
+                ),
+                _event(run, EventType.ERROR, OLD + timedelta(minutes=1), error="boom"),
+                _event(run, EventType.LOG, NOW - timedelta(hours=1)),
+            ]
+        )
+        await session.commit()
+
+        compactor = EventCompactor(
+            {"log": timedelta(days=7)},
+            session_factory=async_session_maker,
+            batch_size=2,
+            batch_pause=0,
+        )
+        report = await compactor.compact(now=NOW)
+
+        assert report.deleted == 5  # noqa: PLR2004
+        assert report.summarized_runs == 1
+        assert [batch.deleted for batch in report.batches] == [2, 2, 1]
+        assert all(batch.elapsed >= 0 for batch in report.batches)
+        assert await _event_types(session, run) == ["status", "error", "log"]
+
+        summary = await session.get(RunEventSummary, run.id)
+        assert summary.event_counts == {"status": 1, "log": 6, "error": 1}
+        assert summary.event_count == 8  # noqa: PLR2004
+        assert summary.last_error == "boom"
+        assert summary.first_event_at.replace(tzinfo=UTC) == OLD
+        assert summary.last_event_at.replace(tzinfo=UTC) == NOW - timedelta(hours=1)
+
+    async def test_skips_active_runs_and_unlisted_types(
+        self, session, async_session_maker
+    ):
+        active = await _create_run(session, "compact-active", RunStatus.RUNNING)
+        done = await _create_run(session, "compact-kept", RunStatus.COMPLETED)
+        session.add_all(
+            [
+                _event(active, EventType.LOG, OLD),
+                _event(done, EventType.ARTIFACT, OLD),
+            ]
+        )
+        await session.commit()
+
+        compactor = EventCompactor(
+            {"log": timedelta(days=7)}, session_factory=async_session_maker
+        )
+        report = await compactor.compact(now=NOW)
+
+        assert report.deleted == 0
+        assert await _event_types(session, active) == ["log"]
+        assert await _event_types(session, done) == ["artifact"]
+        assert await session.get(RunEventSummary, active.id) is None
+
+
+@pytest.mark.unit
+class TestParseRetentionDays:
+    """Unit tests for the retention setting parser."""
+
+    def test_parses_type_day_pairs(self):
+        assert parse_retention_days("log:7, STEP_END:14") == {
+            "log": timedelta(days=7),
+            "step_end": timedelta(days=14),
+        }
+
+    def test_rejects_malformed_entries(self):
+        with pytest.raises(ValueError, match="log=7"):
+            parse_retention_days("log=7")
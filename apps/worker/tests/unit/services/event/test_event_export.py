@@ -0,0 +1,86 @@
+import gzip
+import json
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from app.models import Event, EventType, Flow, Run, RunStatus, User
+from app.services.event.export import iter_event_ndjson
+
+EXPORT_EVENTS = 25
+CHUNK_SIZE = 10
+
+
+async def _create_run_with_events(session) -> tuple[Run, list[str]]:
+    user = User(email="export@example.com", password_hash="hashed")
+    flow = Flow(key="export-flow", name="Export Flow", created_by=user.id)
+    run = Run(flow_id=flow.id, user_id=user.id, status=RunStatus.COMPLETED)
+    base = datetime(2030, 1, 1, tzinfo=UTC)
+    events = [
+        Event(
+            id=uuid4(),
+            run_id=run.id,
+            type=EventType.LOG,
+            message=f"line {i}",
+            payload={"index": i},
+            at=base + timedelta(seconds=i),
+        )
+        for i in range(EXPORT_EVENTS)
+    ]
+    session.add_all([user, flow, run, *events])
+    await session.commit()
+    return run, [str(event.id) for event in events]
+
+
+@pytest.mark.unit
+class TestEventExport:
+    """Unit tests for the streaming NDJSON export."""
+
+    async def test_yields_one_ndjson_chunk_per_fetched_batch(
+        self, session, async_session_maker
+    ):
+        run, expected_ids = await _create_run_with_events(session)
+        opened = 0
+
+        def counting_session_factory():
+            nonlocal opened
+            opened += 1
+            return async_session_maker()
+
+        chunks = [
+            chunk
+            async for chunk in iter_event_ndjson(
+                run.id, session_factory=counting_session_factory, chunk_size=CHUNK_SIZE
+            )
+        ]
+
+        assert [chunk.count(b"\n") for chunk in chunks] == [10, 10, 5]
+        # Each chunk is read in its own short transaction
+        assert opened == 3  # noqa: PLR2004
+        lines = b"".join(chunks).decode().splitlines()
+        assert [json.loads(line)["id"] for line in lines] == expected_ids
+
+    async def test_gzip_output_decompresses_to_the_same_ndjson(
+        self, session, async_session_maker
+    ):
+        run, _ = await _create_run_with_events(session)
+
+        plain = b"".join(
+            [
+                chunk
+                async for chunk in iter_event_ndjson(
+                    run.id, session_factory=async_session_maker
+                )
+            ]
+        )
+        compressed = b"".join(
+            [
+                chunk
+                async for chunk in iter_event_ndjson(
+                    run.id, gzip=True, session_factory=async_session_maker
+                )
+            ]
+        )
+
+        assert gzip.decompress(compressed) == plain
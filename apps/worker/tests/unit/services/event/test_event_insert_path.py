@@ -0,0 +1,89 @@
+import itertools
+import time
+
+import pytest
+from sqlalchemy import func, select
+
+from app.models import Event, EventCreate, EventRead, EventType, Flow, Run, User
+from app.services.event.repository import EventRepository, next_event_timestamp
+
+BENCHMARK_EVENTS = 300
+
+
+async def _create_run(session, key: str) -> Run:
+    user = User(email=f"{key}@example.com", password_hash="hashed")
+    flow = Flow(key=key, name="Insert Flow", created_by=user.id)
+    run = Run(flow_id=flow.id, user_id=user.id)
+    session.add_all([user, flow, run])
+    await session.commit()
+    return run
+
+
+def _event(run: Run, index: int) -> EventCreate:
+    return EventCreate(
+        run_id=run.id,
+        type=EventType.STEP_START,
+        message=f"step_started: Step {index}",
+        payload={"step": f"Step {index}", "index": index, "status": "running"},
+    )
+
+
+@pytest.mark.unit
+class TestEventInsertPath:
+    """Unit tests for the Core-level event insert fast path."""
+
+    async def test_insert_event_returns_inserted_values(self, session):
+        run = await _create_run(session, "insert-fast")
+        repository = EventRepository()
+
+        created = await repository.insert_event(session, _event(run, 1))
+
+        assert isinstance(created, EventRead)
+        assert created.run_id == run.id
+        assert created.type == EventType.STEP_START.value
+        assert created.payload == {"step": "Step 1", "index": 1, "status": "running"}
+
+        stored = await session.get(Event, created.id)
+        assert stored is not None
+        assert stored.message == "step_started: Step 1"
+
+    async def test_insert_event_preserves_emission_order(self, session):
+        run = await _create_run(session, "insert-order")
+        repository = EventRepository()
+        for i in range(20):
+            await repository.insert_event(session, _event(run, i))
+
+        result = await session.execute(
+            select(Event).where(Event.run_id == run.id).order_by(Event.at, Event.id)
+        )
+        assert [e.payload["index"] for e in result.scalars()] == list(range(20))
+
+    def test_event_timestamps_are_strictly_increasing(self):
+        stamps = [next_event_timestamp() for _ in range(1000)]
+        assert all(a < b for a, b in itertools.pairwise(stamps))
+
+    @pytest.mark.slow
+    async def test_benchmark_insert_event_vs_orm_create(self, session, record_property):
+        """Record events/sec of the ORM path and the Core fast path."""
+        run = await _create_run(session, "insert-bench")
+        repository = EventRepository()
+
+        start = time.perf_counter()
+        for i in range(BENCHMARK_EVENTS):
+            event = await repository.create_event(session, _event(run, i))
+            EventRead.model_validate(event)
+        orm_rate = BENCHMARK_EVENTS / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for i in range(BENCHMARK_EVENTS):
+            await repository.insert_event(session, _event(run, i))
+        core_rate = BENCHMARK_EVENTS / (time.perf_counter() - start)
+
+        record_property("orm_events_per_sec", round(orm_rate))
+        record_property("core_events_per_sec", round(core_rate))
+        # Throughput is recorded, not asserted: relative timings are too noisy
+        # under xdist to gate a test run on.
+        result = await session.execute(
+            select(func.count()).select_from(Event).where(Event.run_id == run.id)
+        )
+        assert result.scalar_one() == BENCHMARK_EVENTS * 2
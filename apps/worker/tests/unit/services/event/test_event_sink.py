@@ -0,0 +1,217 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import func, select
+
+from app.models import Event, EventCreate, EventType, Flow, Run, User
+from app.runtime.core import RunContext
+from app.runtime.engine import EventEmitter
+from app.services.event.repository import EventRepository, build_event_row
+from app.services.event.sink import EventSink
+
+BATCH_SIZE = 5
+
+
+class CountingRepository(EventRepository):
+    """Repository that records the size of every flushed batch."""
+
+    def __init__(self) -> None:
+        self.batches: list[int] = []
+
+    async def create_events(self, session, rows):
+        self.batches.append(len(rows))
+        return await super().create_events(session, rows)
+
+
+async def _create_run(session) -> Run:
+    user = User(email="sink@example.com", password_hash="hashed")
+    flow = Flow(key="sink-flow", name="Sink Flow", created_by=user.id)
+    run = Run(flow_id=flow.id, user_id=user.id)
+    session.add_all([user, flow, run])
+    await session.commit()
+    return run
+
+
+def _row(run: Run, index: int) -> dict:
+    return build_event_row(
+        EventCreate(
+            run_id=run.id,
+            type=EventType.LOG,
+            message=f"log {index}",
+            payload={"index": index},
+        )
+    )
+
+
+async def _count_events(session, run: Run) -> int:
+    result = await session.execute(
+        select(func.count()).select_from(Event).where(Event.run_id == run.id)
+    )
+    return result.scalar_one()
+
+
+@pytest.mark.unit
+class TestEventSink:
+    """Unit tests for the write-behind event sink."""
+
+    async def test_flush_persists_buffered_rows_in_one_batch(
+        self, session, async_session_maker
+    ):
+        run = await _create_run(session)
+        repository = CountingRepository()
+        sink = EventSink(
+            async_session_maker,
+            repository,
+            max_batch_size=100,
+            flush_interval=60,
+        )
+        await sink.start()
+        try:
+            for i in range(3):
+                await sink.enqueue(_row(run, i))
+            await sink.flush()
+        finally:
+            await sink.stop()
+
+        assert repository.batches == [3]
+        assert await _count_events(session, run) == 3  # noqa: PLR2004
+
+    async def test_size_threshold_triggers_flush(self, session, async_session_maker):
+        run = await _create_run(session)
+        repository = CountingRepository()
+        sink = EventSink(
+            async_session_maker,
+            repository,
+            max_batch_size=BATCH_SIZE,
+            flush_interval=60,
+        )
+        await sink.start()
+        try:
+            for i in range(BATCH_SIZE * 2):
+                await sink.enqueue(_row(run, i))
+            for _ in range(50):
+                if sum(repository.batches) == BATCH_SIZE * 2:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await sink.stop()
+
+        assert repository.batches == [BATCH_SIZE, BATCH_SIZE]
+
+    async def test_time_threshold_triggers_flush(self, session, async_session_maker):
+        run = await _create_run(session)
+        repository = CountingRepository()
+        sink = EventSink(
+            async_session_maker,
+            repository,
+            max_batch_size=100,
+            flush_interval=0.02,
+        )
+        await sink.start()
+        try:
+            await sink.enqueue(_row(run, 0))
+            await asyncio.sleep(0.2)
+            assert repository.batches == [1]
+        finally:
+            await sink.stop()
+
+    async def test_stop_flushes_pending_rows_in_order(
+        self, session, async_session_maker
+    ):
+        run = await _create_run(session)
+        sink = EventSink(async_session_maker, max_batch_size=100, flush_interval=60)
+        await sink.start()
+        for i in range(4):
+            await sink.enqueue(_row(run, i))
+        await sink.stop()
+
+        result = await session.execute(
+            select(Event).where(Event.run_id == run.id).order_by(Event.at, Event.id)
+        )
+        assert [e.payload["index"] for e in result.scalars()] == [0, 1, 2, 3]
+        assert not sink.running
+
+    async def test_emitter_forces_flush_on_status_events(
+        self, session, async_session_maker
+    ):
+        run = await _create_run(session)
+        sink = EventSink(async_session_maker, max_batch_size=100, flush_interval=60)
+        await sink.start()
+        try:
+            emitter = EventEmitter(MagicMock(), MagicMock(), sink=sink)
+            context = RunContext(run.id, run.flow_id, run.user_id, {}, {})
+            await emitter.emit_log(context, "buffered")
+            assert await _count_events(session, run) == 0
+
+            await emitter.emit_run_started(context)
+            assert await _count_events(session, run) == 2  # noqa: PLR2004
+        finally:
+            await sink.stop()
+
+    async def test_failed_batch_is_retried_before_giving_up(
+        self, session, async_session_maker
+    ):
+        run = await _create_run(session)
+
+        class FlakyRepository(CountingRepository):
+            async def create_events(self, session, rows):
+                if not self.batches:
+                    self.batches.append(0)
+                    msg = "database is locked"
+                    raise RuntimeError(msg)
+                return await super().create_events(session, rows)
+
+        sink = EventSink(
+            async_session_maker,
+            FlakyRepository(),
+            max_batch_size=100,
+            flush_interval=60,
+            retry_delay=0,
+        )
+        await sink.start()
+        try:
+            for i in range(3):
+                await sink.enqueue(_row(run, i))
+            await sink.flush()
+        finally:
+            await sink.stop()
+
+        assert await _count_events(session, run) == 3  # noqa: PLR2004
+        assert sink.stats.retries == 1
+        assert sink.stats.dropped == 0
+
+    async def test_persistent_failure_falls_back_to_per_row_inserts(
+        self, session, async_session_maker
+    ):
+        run = await _create_run(session)
+        bad = _row(run, 1)
+
+        class PoisonRepository(EventRepository):
+            async def create_events(self, session, rows):
+                if any(row is bad for row in rows):
+                    msg = "constraint violated"
+                    raise RuntimeError(msg)
+                return await super().create_events(session, rows)
+
+        sink = EventSink(
+            async_session_maker,
+            PoisonRepository(),
+            max_batch_size=100,
+            flush_interval=60,
+            retry_attempts=1,
+            retry_delay=0,
+        )
+        await sink.start()
+        try:
+            for row in (_row(run, 0), bad, _row(run, 2)):
+                await sink.enqueue(row)
+            with pytest.raises(RuntimeError, match="constraint violated"):
+                await sink.flush()
+        finally:
+            await sink.stop()
+
+        assert await _count_events(session, run) == 2  # noqa: PLR2004
+        assert sink.stats.fallback_batches == 1
+        assert sink.stats.dropped == 1
+        assert sink.stats.written == 2  # noqa: PLR2004
@@ -0,0 +1,132 @@
+import asyncio
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+
+from app.models import Event, EventRead, EventType, Flow, Run, RunStatus, User
+from app.services.event.broadcaster import EventBroadcaster
+from app.services.event.stream import RunEventStream
+from app.utils.pagination import encode_cursor
+
+
+async def _create_run(session, status: RunStatus = RunStatus.RUNNING) -> Run:
+    user = User(email="stream@example.com", password_hash="hashed")
+    flow = Flow(key="stream-flow", name="Stream Flow", created_by=user.id)
+    run = Run(flow_id=flow.id, user_id=user.id, status=status)
+    session.add_all([user, flow, run])
+    await session.commit()
+    return run
+
+
+def _event(run: Run, event_type: EventType, message: str, **payload) -> Event:
+    return Event(
+        id=uuid4(),
+        run_id=run.id,
+        type=event_type,
+        message=message,
+        payload=payload,
+        at=datetime.now(UTC),
+    )
+
+
+@pytest.mark.unit
+class TestEventBroadcaster:
+    """Unit tests for in-process event fan-out."""
+
+    def test_publish_reaches_only_subscribers_of_the_run(self):
+        broadcaster = EventBroadcaster()
+        run_id = uuid4()
+        subscription = broadcaster.subscribe(run_id)
+        other = broadcaster.subscribe(uuid4())
+        event = EventRead(
+            id=uuid4(),
+            run_id=run_id,
+            type=EventType.LOG,
+            payload={},
+            at=datetime.now(UTC),
+        )
+
+        broadcaster.publish(event)
+
+        assert subscription.get_nowait() == event
+        assert other.get_nowait() is None
+
+    def test_slow_subscriber_is_marked_lagged(self):
+        broadcaster = EventBroadcaster(max_queue_size=2)
+        run_id = uuid4()
+        subscription = broadcaster.subscribe(run_id)
+        for _ in range(3):
+            broadcaster.publish(
+                EventRead(
+                    id=uuid4(),
+                    run_id=run_id,
+                    type=EventType.LOG,
+                    payload={},
+                    at=datetime.now(UTC),
+                )
+            )
+
+        assert subscription.lagged
+        broadcaster.unsubscribe(subscription)
+        assert not broadcaster.has_subscribers(run_id)
+
+
+@pytest.mark.unit
+class TestRunEventStream:
+    """Unit tests for SSE replay and live tail."""
+
+    async def test_replays_after_cursor_and_closes_for_finished_run(
+        self, session, async_session_maker
+    ):
+        run = await _create_run(session, RunStatus.COMPLETED)
+        first = _event(run, EventType.STATUS, "run_started", status="running")
+        second = _event(run, EventType.STATUS, "run_completed", status="completed")
+        session.add_all([first, second])
+        await session.commit()
+
+        stream = RunEventStream(
+            run.id,
+            last_event_id=encode_cursor(first.at, first.id),
+            session_factory=async_session_maker,
+            broadcaster=EventBroadcaster(),
+        )
+        messages = [m async for m in stream]
+
+        assert len(messages) == 1
+        assert "run_completed" in messages[0]
+        assert messages[0].startswith(f"id: {encode_cursor(second.at, second.id)}")
+
+    async def test_tails_live_events_until_run_finishes(
+        self, session, async_session_maker
+    ):
+        run = await _create_run(session)
+        broadcaster = EventBroadcaster()
+        stream = RunEventStream(
+            run.id,
+            session_factory=async_session_maker,
+            broadcaster=broadcaster,
+            heartbeat_interval=0.01,
+        )
+        iterator = stream.__aiter__()
+
+        heartbeat = await asyncio.wait_for(anext(iterator), timeout=1)
+        assert heartbeat == ": keep-alive\n\n"
+
+        log = _event(run, EventType.LOG, "hello")
+        broadcaster.publish(EventRead.model_validate(log))
+        message = await asyncio.wait_for(anext(iterator), timeout=1)
+        while message.startswith(":"):
+            message = await asyncio.wait_for(anext(iterator), timeout=1)
+        assert "hello" in message
+
+        run.status = RunStatus.COMPLETED
+        session.add(run)
+        await session.commit()
+        done = _event(run, EventType.STATUS, "run_completed", status="completed")
+        broadcaster.publish(EventRead.model_validate(done))
+
+        remaining = [m async for m in iterator if not m.startswith(":")]
+        assert len(remaining) == 1
+        assert "run_completed" in remaining[0]
+        assert not broadcaster.has_subscribers(run.id)
@@ -0,0 +1,85 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.models import EventCreate, EventType, Flow, Run, User
+from app.services.event.repository import (
+    EventRepository,
+    _summary_upserts,
+    build_event_row,
+)
+from app.utils.pagination import as_utc
+
+
+async def _create_run(session, key: str) -> Run:
+    user = User(email=f"{key}@example.com", password_hash="hashed")
+    flow = Flow(key=key, name=key, created_by=user.id)
+    run = Run(flow_id=flow.id, user_id=user.id)
+    session.add_all([user, flow, run])
+    await session.commit()
+    return run
+
+
+def _create(run: Run, event_type: EventType, **payload) -> EventCreate:
+    return EventCreate(
+        run_id=run.id, type=event_type, message=event_type.value, payload=payload
+    )
+
+
+@pytest.mark.unit
+class TestRunEventSummary:
+    """Unit tests for per-run summaries maintained on event insert."""
+
+    async def test_every_insert_path_updates_the_summary(self, session):
+        repository = EventRepository()
+        run = await _create_run(session, "summary-paths")
+
+        first = await repository.insert_event(session, _create(run, EventType.STATUS))
+        rows = [
+            build_event_row(_create(run, EventType.LOG)),
+            build_event_row(_create(run, EventType.ERROR, error="timeout")),
+            build_event_row(_create(run, EventType.LOG)),
+        ]
+        await repository.create_events(session, rows)
+        last = await repository.create_event(session, _create(run, EventType.LOG))
+        session.expunge_all()
+
+        summary = (await repository.get_event_summaries(session, [run.id]))[run.id]
+        assert summary.event_counts == {"status": 1, "log": 3, "error": 1}
+        assert summary.event_count == 5  # noqa: PLR2004
+        assert summary.last_error == "timeout"
+        assert as_utc(summary.first_event_at) == as_utc(first.at)
+        assert as_utc(summary.last_event_at) == as_utc(last.at)
+
+    async def test_summaries_for_many_runs_come_from_one_lookup(self, session):
+        repository = EventRepository()
+        runs = [await _create_run(session, f"summary-many-{i}") for i in range(3)]
+        for i, run in enumerate(runs):
+            await repository.create_events(
+                session,
+                [build_event_row(_create(run, EventType.LOG)) for _ in range(i + 1)],
+            )
+
+        summaries = await repository.get_event_summaries(
+            session, [run.id for run in runs]
+        )
+
+        assert [summaries[run.id].event_count for run in runs] == [1, 2, 3]
+
+    def test_postgres_upsert_uses_postgres_json_functions(self):
+        run = Run(flow_id=uuid4(), user_id=uuid4())
+        rows = [
+            build_event_row(_create(run, EventType.LOG)),
+            build_event_row(_create(run, EventType.ERROR, error="timeout")),
+        ]
+
+        [stmt] = _summary_upserts(rows, "postgresql")
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+        assert "ON CONFLICT (run_id) DO UPDATE" in sql
+        assert "jsonb_build_object" in sql
+        assert "greatest(" in sql
+        assert "least(" in sql
+        assert "json_set" not in sql
+        assert "json_extract" not in sql
@@ -0,0 +1,190 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlmodel import select
+
+from app.models import Flow, Run, RunCreate, RunStatus, SessionStatus, User
+from app.models import Session as SessionModel
+from app.services.run.errors import (
+    MissingSessionURLError,
+    RunCanceledError,
+    RunNotPendingError,
+    SessionCreationFailedError,
+)
+from app.services.run.service import RunService
+
+
+async def _create_flow(session, key: str) -> tuple[User, Flow]:
+    user = User(email=f"{key}@example.com", password_hash="hashed")
+    flow = Flow(key=key, name=key, created_by=user.id)
+    session.add_all([user, flow])
+    await session.commit()
+    return user, flow
+
+
+def _service(session_data: dict | None) -> RunService:
+    steel_service = MagicMock()
+    steel_service.create_session = AsyncMock(return_value=session_data)
+    return RunService(steel_service=steel_service)
+
+
+@pytest.mark.unit
+@patch("app.services.run.service.emit_progress", new=AsyncMock())
+class TestCreateRunWithUser:
+    """Unit tests for the run creation pipeline."""
+
+    async def test_run_and_session_are_committed_together(self, session):
+        user, flow = await _create_flow(session, "create-run")
+        service = _service({"id": "browser-1", "debugUrl": "https://viewer/1"})
+
+        with patch.object(session, "commit", wraps=session.commit) as commit:
+            run, session_url = await service.create_run_with_user(
+                RunCreate(flow_id=flow.id), user, session
+            )
+
+        assert commit.await_count == 1
+        assert session_url == "https://viewer/1"
+        assert run.status == RunStatus.RUNNING
+        assert run.started_at is not None
+        result = await session.execute(
+            select(SessionModel).where(SessionModel.run_id == run.id)
+        )
+        browser_session = result.scalar_one()
+        assert browser_session.browser_provider_session_id == "browser-1"
+        assert browser_session.status == SessionStatus.ACTIVE
+
+    async def test_failed_provisioning_records_failed_run(self, session):
+        user, flow = await _create_flow(session, "create-run-failed")
+        flow_id = flow.id
+        service = _service(None)
+
+        with pytest.raises(SessionCreationFailedError):
+            await service.create_run_with_user(
+                RunCreate(flow_id=flow_id), user, session
+            )
+
+        result = await session.execute(select(Run).where(Run.flow_id == flow_id))
+        run = result.scalar_one()
+        assert run.status == RunStatus.FAILED
+        assert run.error == "Failed to create browser session"
+        assert run.ended_at is not None
+        sessions = await session.execute(
+            select(SessionModel).where(SessionModel.run_id == run.id)
+        )
+        assert sessions.first() is None
+
+    async def test_failed_commit_releases_leased_session(self, session):
+        user, flow = await _create_flow(session, "create-run-commit-failed")
+        flow_id = flow.id
+        service = _service({"id": "browser-5", "debugUrl": "https://viewer/5"})
+        service.steel_service.release_session = AsyncMock(return_value=True)
+        service.repository.save_with_session = AsyncMock(
+            side_effect=RuntimeError("database is locked")
+        )
+
+        with pytest.raises(RuntimeError, match="database is locked"):
+            await service.create_run_with_user(
+                RunCreate(flow_id=flow_id), user, session
+            )
+
+        service.steel_service.release_session.assert_awaited_once_with("browser-5")
+        result = await session.execute(select(Run).where(Run.flow_id == flow_id))
+        assert result.first() is None
+
+    async def test_pending_run_is_provisioned_later(self, session):
+        user, flow = await _create_flow(session, "create-run-async")
+        service = _service({"id": "browser-2", "debugUrl": "https://viewer/2"})
+
+        pending = await service.create_pending_run(
+            RunCreate(flow_id=flow.id), user, session
+        )
+        assert pending.status == RunStatus.PENDING
+        service.steel_service.create_session.assert_not_awaited()
+
+        with patch.object(session, "commit", wraps=session.commit) as commit:
+            run, session_url = await service.provision_run(pending.id, session)
+
+        # One commit claims the run, one records its browser session
+        assert commit.await_count == 2  # noqa: PLR2004
+        assert session_url == "https://viewer/2"
+        assert run.status == RunStatus.RUNNING
+        result = await session.execute(
+            select(SessionModel).where(SessionModel.run_id == run.id)
+        )
+        assert result.scalar_one().session_url == "https://viewer/2"
+
+    async def test_failed_background_provisioning_fails_pending_run(self, session):
+        user, flow = await _create_flow(session, "create-run-async-failed")
+        service = _service({"id": "browser-3"})
+        pending = await service.create_pending_run(
+            RunCreate(flow_id=flow.id), user, session
+        )
+
+        with pytest.raises(MissingSessionURLError):
+            await service.provision_run(pending.id, session)
+
+        run = await service.get_run(pending.id, session)
+        assert run.status == RunStatus.FAILED
+        assert run.error == "Session created without viewer URL"
+
+    async def test_run_canceled_during_provisioning_is_not_started(
+        self, session, async_session_maker
+    ):
+        user, flow = await _create_flow(session, "create-run-async-canceled")
+        service = _service(None)
+        service.steel_service.release_session = AsyncMock(return_value=True)
+        pending = await service.create_pending_run(
+            RunCreate(flow_id=flow.id), user, session
+        )
+
+        async def lease_while_canceled():
+            async with async_session_maker() as other:
+                await service.cancel_run(pending.id, other)
+            return {"id": "browser-4", "debugUrl": "https://viewer/4"}
+
+        service.steel_service.create_session.side_effect = lease_while_canceled
+        with pytest.raises(RunCanceledError):
+            await service.provision_run(pending.id, session)
+
+        service.steel_service.release_session.assert_awaited_once_with("browser-4")
+        run = await service.get_run(pending.id, session)
+        assert run.status == RunStatus.CANCELED
+        sessions = await service.get_run_sessions(pending.id, session)
+        assert sessions == []
+
+    async def test_run_is_provisioned_only_once(self, session, async_session_maker):
+        user, flow = await _create_flow(session, "create-run-async-twice")
+        service = _service({"id": "browser-6", "debugUrl": "https://viewer/6"})
+        pending = await service.create_pending_run(
+            RunCreate(flow_id=flow.id), user, session
+        )
+
+        async with async_session_maker() as first, async_session_maker() as second:
+            results = await asyncio.gather(
+                service.provision_run(pending.id, first),
+                service.provision_run(pending.id, second),
+                return_exceptions=True,
+            )
+
+        errors = [r for r in results if isinstance(r, BaseException)]
+        assert len(errors) == 1
+        assert isinstance(errors[0], RunNotPendingError)
+        service.steel_service.create_session.assert_awaited_once()
+        sessions = await service.get_run_sessions(pending.id, session)
+        assert [s.browser_provider_session_id for s in sessions] == ["browser-6"]
+
+    async def test_batch_inserts_all_runs_in_one_commit(self, session):
+        user, flow = await _create_flow(session, "create-run-batch")
+        service = _service(None)
+        inputs = [{"row": i} for i in range(5)]
+
+        with patch.object(session, "commit", wraps=session.commit) as commit:
+            runs = await service.create_pending_runs(flow.id, inputs, user, session)
+
+        assert commit.await_count == 1
+        stored = await session.execute(
+            select(Run.input_payload).where(Run.flow_id == flow.id)
+        )
+        assert sorted(stored.scalars(), key=lambda p: p["row"]) == inputs
+        assert [run.input_payload for run in runs] == inputs
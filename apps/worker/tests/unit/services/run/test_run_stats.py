@@ -0,0 +1,129 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+
+from app.models import Flow, Run, RunStatsBucket, RunStatsRead, RunStatus, User
+from app.services.run.repository import RunRepository, _bucket_start
+from app.services.run.service import RunService
+from app.services.run.stats import RunStatsCache
+
+BASE = datetime(2030, 1, 1, 9, 30, tzinfo=UTC)
+
+
+async def _seed(session) -> tuple[User, Flow, Flow]:
+    user = User(email="stats@example.com", password_hash="hashed")
+    other = User(email="stats-other@example.com", password_hash="hashed")
+    flow = Flow(key="stats-a", name="a", created_by=user.id)
+    other_flow = Flow(key="stats-b", name="b", created_by=user.id)
+    runs = [
+        Run(flow_id=flow.id, user_id=user.id, status=RunStatus.COMPLETED,
+            created_at=BASE),
+        Run(flow_id=flow.id, user_id=user.id, status=RunStatus.COMPLETED,
+            created_at=BASE + timedelta(hours=1)),
+        Run(flow_id=other_flow.id, user_id=user.id, status=RunStatus.FAILED,
+            created_at=BASE + timedelta(hours=1)),
+        Run(flow_id=flow.id, user_id=other.id, status=RunStatus.RUNNING,
+            created_at=BASE),
+    ]  # fmt: skip
+    session.add_all([user, other, flow, other_flow, *runs])
+    await session.commit()
+    return user, flow, other_flow
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.unit
+class TestRunStats:
+    """Unit tests for run status aggregates."""
+
+    async def test_counts_per_status_flow_and_bucket(self, session):
+        user, flow, other_flow = await _seed(session)
+        repository = RunRepository()
+
+        by_status = await repository.count_runs_by_status(session, user_id=user.id)
+        everyone = await repository.count_runs_by_status(session)
+        by_flow_hour = await repository.count_runs_by_status(
+            session, user_id=user.id, group_by_flow=True, bucket=RunStatsBucket.HOUR
+        )
+
+        assert [(r["status"], r["count"]) for r in by_status] == [
+            (RunStatus.COMPLETED, 2),
+            (RunStatus.FAILED, 1),
+        ]
+        assert sum(r["count"] for r in everyone) == 4  # noqa: PLR2004
+        assert sorted(
+            (r["status"].value, r["flow_id"] == flow.id, r["bucket"])
+            for r in by_flow_hour
+        ) == [
+            ("completed", True, "2030-01-01 09:00:00"),
+            ("completed", True, "2030-01-01 10:00:00"),
+            ("failed", False, "2030-01-01 10:00:00"),
+        ]
+        assert other_flow.id in {r["flow_id"] for r in by_flow_hour}
+
+    async def test_grouping_reads_only_the_covering_index(self, session):
+        user, _, _ = await _seed(session)
+        plan = await session.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT status, flow_id, count(*) FROM run "
+                "WHERE user_id = :user_id GROUP BY status, flow_id"
+            ),
+            {"user_id": user.id.hex},
+        )
+
+        details = " ".join(row[-1] for row in plan)
+
+        assert "COVERING INDEX ix_run_user_status_flow_created_at" in details
+
+    async def test_service_serves_repeat_queries_from_cache(self, session):
+        user, flow, _ = await _seed(session)
+        clock = FakeClock()
+        service = RunService(stats_cache=RunStatsCache(ttl=10, clock=clock))
+
+        first = await service.get_run_stats(
+            session, user_id=user.id, bucket=RunStatsBucket.DAY
+        )
+        session.add(Run(flow_id=flow.id, user_id=user.id, status=RunStatus.FAILED))
+        await session.commit()
+        cached = await service.get_run_stats(
+            session, user_id=user.id, bucket=RunStatsBucket.DAY
+        )
+        clock.now = 10
+        refreshed = await service.get_run_stats(
+            session, user_id=user.id, bucket=RunStatsBucket.DAY
+        )
+
+        assert first.total == 3  # noqa: PLR2004
+        assert first.groups[0].bucket == datetime(2030, 1, 1, tzinfo=UTC)
+        assert cached is first
+        assert refreshed.total == 4  # noqa: PLR2004
+
+    def test_postgres_buckets_truncate_in_utc(self):
+        sql = str(
+            _bucket_start(RunStatsBucket.DAY, "postgresql").compile(
+                dialect=postgresql.dialect(),
+                compile_kwargs={"literal_binds": True},
+            )
+        )
+
+        assert "date_trunc('day', timezone('UTC', run.created_at))" in sql
+        assert "strftime" not in sql
+
+    def test_cache_evicts_oldest_entry_when_full(self):
+        cache = RunStatsCache(max_entries=2)
+        stats = RunStatsRead(total=0, groups=[], generated_at=BASE)
+
+        for key in ("a", "b", "c"):
+            cache.set(key, stats)
+
+        assert cache.get("a") is None
+        assert cache.get("b") is stats
+        assert cache.get("c") is stats
@@ -0,0 +1,122 @@
+import asyncio
+import json
+from http import HTTPStatus
+
+import httpx
+import pytest
+
+from app.services.steel_http import RequestTrace, SteelHttpClient
+from app.services.steel_service import SteelService
+
+SESSION = {"id": "steel-1", "debugUrl": "https://steel.dev/debug/steel-1"}
+
+
+async def _serve_keep_alive(reader, writer):
+    """Answer every request on the connection with a small JSON body."""
+    body = json.dumps(SESSION).encode()
+    while True:
+        head = await reader.readuntil(b"\r\n\r\n")
+        length = 0
+        for line in head.decode().split("\r\n"):
+            name, _, value = line.partition(":")
+            if name.lower() == "content-length":
+                length = int(value)
+        await reader.readexactly(length)
+        writer.write(
+            b"HTTP/1.1 201 Created\r\n"
+            b"Content-Type: application/json\r\n"
+            b"Content-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body
+        )
+        await writer.drain()
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.unit
+class TestSteelHttpClient:
+    """Unit tests for the shared, instrumented Steel.dev client."""
+
+    async def test_started_client_reuses_connections(self):
+        server = await asyncio.start_server(_serve_keep_alive, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        client = SteelHttpClient()
+        client.start()
+        try:
+            for _ in range(3):
+                response = await client.request(
+                    "create_session", "POST", f"http://127.0.0.1:{port}/sessions"
+                )
+                assert response.status_code == HTTPStatus.CREATED
+        finally:
+            await client.aclose()
+            server.close()
+            await server.wait_closed()
+
+        stats = client.stats.endpoints["create_session"]
+        assert stats.requests == 3  # noqa: PLR2004
+        assert stats.new_connections == 1
+        assert stats.errors == 0
+        assert stats.max_latency_seconds > 0
+        assert not client.started
+
+    async def test_operation_timeouts_are_applied(self):
+        seen: dict[str, dict] = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen[request.url.path] = request.extensions["timeout"]
+            return httpx.Response(HTTPStatus.OK, json=SESSION)
+
+        client = SteelHttpClient(
+            connect_timeout=2,
+            pool_timeout=3,
+            timeouts={"release_session": 7},
+            transport=httpx.MockTransport(handler),
+        )
+
+        await client.request("release_session", "POST", "https://steel/release")
+        await client.request("get_session_info", "GET", "https://steel/info")
+
+        assert seen["/release"] == {"connect": 2, "read": 7, "write": 7, "pool": 3}
+        assert seen["/info"]["connect"] == 2  # noqa: PLR2004
+        assert set(client.stats.endpoints) == {"release_session", "get_session_info"}
+
+    async def test_trace_measures_pool_wait_and_connect(self):
+        clock = FakeClock()
+        trace = RequestTrace(clock)
+
+        clock.now = 0.25
+        await trace("connection.connect_tcp.started", {})
+        clock.now = 0.3
+        await trace("connection.connect_tcp.complete", {})
+        clock.now = 0.4
+        await trace("connection.start_tls.complete", {})
+        await trace("http11.send_request_headers.started", {})
+        clock.now = 1.0
+        trace.finish()
+
+        assert trace.pool_wait == pytest.approx(0.25)
+        assert trace.connect == pytest.approx(0.15)
+        assert trace.connected
+        assert trace.latency == pytest.approx(1.0)
+
+    async def test_steel_service_requests_are_timed_per_operation(self):
+        client = SteelHttpClient(
+            transport=httpx.MockTransport(
+                lambda _: httpx.Response(HTTPStatus.BAD_REQUEST, text="bad")
+            )
+        )
+        service = SteelService(
+            api_key="key", base_url="https://steel", http_client=client
+        )
+
+        assert await service.create_session() is None
+        stats = client.stats.endpoints["create_session"]
+        assert stats.requests == 1
+        # Client errors are answered, only 5xx responses count as errors
+        assert stats.errors == 0